@@ -13,12 +13,41 @@ Optional arguments:
 from flask import Flask, request, jsonify, send_from_directory, Response
 from pathlib import Path
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import traceback
 import argparse
 import sys
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+import hashlib
+import importlib.util
+import shutil
+import re
+import base64
+import bisect
+import sqlite3
+import mimetypes
+import zipfile
+import gzip
+import io
+import zlib
+import atexit
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
 import logging
 from logging.handlers import RotatingFileHandler
+from werkzeug.security import safe_join
+
+try:
+    import zstandard  # Optional: enables zstd request bodies and storage
+except ImportError:
+    zstandard = None
 
 app = Flask(__name__, static_folder='static', static_url_path='/')
 
@@ -34,8 +63,8 @@ else:
         'server': {'host': '127.0.0.1', 'port': 5000, 'debug': False}
     }
 
-# Setup logging
-LOG_DIR = Path(__file__).parent / config['logging']['log_dir']
+# Setup logging (PYSHEET_LOG_DIR overrides the configured directory, e.g. for tests)
+LOG_DIR = Path(os.environ.get('PYSHEET_LOG_DIR') or Path(__file__).parent / config['logging']['log_dir'])
 LOG_DIR.mkdir(exist_ok=True)
 
 log_file = LOG_DIR / 'flask_server.log'
@@ -68,10 +97,1505 @@ app.logger.setLevel(logging.INFO)
 EXPORT_DIR = Path(__file__).parent / config.get('exports', {}).get('dir', config['autoexport'].get('autosave_dir', 'exports/autosaves'))
 EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Write-behind export queue: POST /api/export?async=1 hands the write to a
+# background thread and returns 202 with a ticket id that can be polled.
+EXPORT_QUEUE_MAXSIZE = int(config.get('exports', {}).get('queue_size', 64))
+EXPORT_TICKET_HISTORY = 256
+EXPORT_QUEUE = queue.Queue(maxsize=EXPORT_QUEUE_MAXSIZE)
+EXPORT_TICKETS = OrderedDict()
+EXPORT_TICKETS_LOCK = threading.Lock()
+_EXPORT_WORKER = None
+_EXPORT_WORKER_LOCK = threading.Lock()
+
+
+# Export storage format from config.json (autoexport.export_format):
+# "json" (default), "gzip" (.json.gz) or "zstd" (.json.zst, needs zstandard).
+EXPORT_FORMAT_SUFFIXES = {'json': '', 'gzip': '.gz', 'zstd': '.zst'}
+EXPORT_FORMAT_ALIASES = {'json.gz': 'gzip', 'gz': 'gzip', 'json.zst': 'zstd', 'zst': 'zstd'}
+EXPORT_GLOBS = ('*.json', '*.json.gz', '*.json.zst')
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+MAX_DECOMPRESSED_BYTES = 32 * 1024 * 1024
+DECODE_ERRORS = (OSError, EOFError, ValueError, zlib.error) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+def _resolve_export_format(value):
+    fmt = str(value or 'json').strip().lower()
+    fmt = EXPORT_FORMAT_ALIASES.get(fmt, fmt)
+    if fmt not in EXPORT_FORMAT_SUFFIXES:
+        app.logger.warning(f"Unknown export_format {value!r}, using json")
+        return 'json'
+    if fmt == 'zstd' and zstandard is None:
+        app.logger.warning("export_format zstd needs the zstandard package, using gzip")
+        return 'gzip'
+    return fmt
+
+
+EXPORT_FORMAT = _resolve_export_format(config['autoexport'].get('export_format', 'json'))
+
+
+def encode_export(content, fmt='json'):
+    """Serialize content as indented JSON, compressed for gzip/zstd."""
+    data = json.dumps(content, indent=2, ensure_ascii=False).encode('utf-8')
+    if fmt == 'gzip':
+        return gzip.compress(data, mtime=0)
+    if fmt == 'zstd':
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def decode_export_bytes(data, limit=None):
+    """Decompress gzip/zstd data (detected by magic bytes); plain data passes through."""
+    if limit is None:
+        limit = MAX_DECOMPRESSED_BYTES
+    if data[:2] == GZIP_MAGIC:
+        with gzip.GzipFile(fileobj=io.BytesIO(data)) as f:
+            data = f.read(limit + 1)
+    elif data[:4] == ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError('zstd data requires the zstandard package')
+        with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)) as f:
+            data = f.read(limit + 1)
+    if len(data) > limit:
+        raise ValueError('decompressed export is too large')
+    return data
+
+
+def read_export_file(file_path):
+    """Load an export, plain or compressed."""
+    with open(file_path, 'rb') as f:
+        return json.loads(decode_export_bytes(f.read()).decode('utf-8'))
+
+
+def export_files(directory=None):
+    """All export files (plain and compressed) in a directory."""
+    directory = EXPORT_DIR if directory is None else directory
+    files = []
+    for pattern in EXPORT_GLOBS:
+        files.extend(directory.glob(pattern))
+    return files
+
+
+def write_bytes_atomic(file_path, data):
+    """Write data via temp file + fsync + rename.
+
+    Readers only ever see the previous file or the complete new one, never
+    a truncated export. Returns the size of the written file.
+    """
+    file_path = Path(file_path)
+    fd, tmp_name = tempfile.mkstemp(dir=str(file_path.parent), prefix=f'.{file_path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return file_path.stat().st_size
+
+
+def write_json_atomic(file_path, content, fmt='json'):
+    """Write content as indented (optionally compressed) JSON atomically."""
+    return write_bytes_atomic(file_path, encode_export(content, fmt))
+
+
+# Content-addressed export store: each distinct document is written once to
+# EXPORT_BLOB_DIR/<sha256>.json and the timestamped export filenames are hard
+# links to that blob (or copies where links are unsupported). The ref index
+# keeps each filename's own write time, since hard links share one mtime.
+# Exports append one line to the refs journal; refs.json is only rewritten
+# when the journal is compacted (after EXPORT_REFS_COMPACT_AFTER lines and
+# whenever unreferenced blobs are collected). A torn or lost journal line
+# only costs that export its recorded time, so appends are not fsynced.
+EXPORT_BLOB_DIR = EXPORT_DIR / '.blobs'
+EXPORT_BLOB_DIR.mkdir(parents=True, exist_ok=True)
+EXPORT_REFS_FILE = EXPORT_BLOB_DIR / 'refs.json'
+EXPORT_REFS_JOURNAL = EXPORT_BLOB_DIR / 'refs.log'
+EXPORT_REFS_COMPACT_AFTER = 500
+EXPORT_STORE_LOCK = threading.Lock()
+
+
+def _read_export_refs_journal():
+    """Journal entries in write order; unreadable lines are skipped."""
+    entries = []
+    try:
+        with open(EXPORT_REFS_JOURNAL, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and entry.get('name'):
+                    entries.append(entry)
+    except OSError:
+        pass
+    return entries
+
+
+def _load_export_refs():
+    """refs.json with the journal replayed on top."""
+    try:
+        with open(EXPORT_REFS_FILE, 'r', encoding='utf-8') as f:
+            refs = json.load(f)
+        refs = refs if isinstance(refs, dict) else {}
+    except (OSError, ValueError):
+        refs = {}
+    entries = _read_export_refs_journal()
+    for entry in entries:
+        refs[entry['name']] = {'digest': entry.get('digest'), 'modified': entry.get('modified')}
+    EXPORT_REFS_JOURNAL_STATE['entries'] = len(entries)
+    return refs
+
+
+EXPORT_REFS_JOURNAL_STATE = {'entries': 0}
+EXPORT_REFS = _load_export_refs()
+
+
+def compact_export_refs():
+    """Rewrite refs.json from EXPORT_REFS and empty the journal. Hold the store lock."""
+    write_json_atomic(EXPORT_REFS_FILE, EXPORT_REFS)
+    try:
+        EXPORT_REFS_JOURNAL.unlink()
+    except FileNotFoundError:
+        pass
+    EXPORT_REFS_JOURNAL_STATE['entries'] = 0
+
+
+def _journal_export_ref(name, ref):
+    """Append one ref to the journal, compacting it once it grows. Hold the store lock."""
+    with open(EXPORT_REFS_JOURNAL, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'name': name, **ref}, separators=(',', ':')) + '\n')
+    EXPORT_REFS_JOURNAL_STATE['entries'] += 1
+    if EXPORT_REFS_JOURNAL_STATE['entries'] >= EXPORT_REFS_COMPACT_AFTER:
+        compact_export_refs()
+
+
+def content_digest(content):
+    """sha256 of the canonical JSON form (sorted keys, no whitespace)."""
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _link_atomic(source, file_path):
+    """Point file_path at source via a hard link swapped in with os.replace."""
+    try:
+        # rename() is a no-op between two links to the same inode, which
+        # would leave the temp link behind
+        if os.path.samefile(source, file_path):
+            return
+    except OSError:
+        pass
+    tmp_path = file_path.parent / f'.{file_path.name}.{uuid.uuid4().hex}.tmp'
+    try:
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def store_export(file_path, content):
+    """Store an export through the blob store.
+
+    Returns (filename, size, digest, deduplicated); filename gains .gz/.zst
+    when EXPORT_FORMAT is compressed, and deduplicated is True when an
+    identical document was already on disk.
+    """
+    file_path = Path(file_path)
+    digest = content_digest(content)
+    suffix = EXPORT_FORMAT_SUFFIXES[EXPORT_FORMAT]
+    if suffix:
+        file_path = file_path.with_name(file_path.name + suffix)
+    blob_path = EXPORT_BLOB_DIR / f'{digest}.json{suffix}'
+    with EXPORT_STORE_LOCK:
+        deduplicated = blob_path.exists()
+        if not deduplicated:
+            write_json_atomic(blob_path, content, EXPORT_FORMAT)
+        _link_atomic(blob_path, file_path)
+        ref = EXPORT_REFS.get(file_path.name)
+        if ref and ref.get('digest') == digest:
+            # Same document re-saved under the same name: the ref is unchanged
+            modified = ref.get('modified') or time.time()
+        else:
+            modified = time.time()
+            EXPORT_REFS[file_path.name] = {'digest': digest, 'modified': modified}
+            _journal_export_ref(file_path.name, EXPORT_REFS[file_path.name])
+    invalidate_export_index()
+    RETENTION_WAKE.set()
+    size = blob_path.stat().st_size
+    try:
+        record_export(file_path.name, content, size, digest, modified)
+    except sqlite3.Error as e:
+        app.logger.warning(f"Export catalog not updated for {file_path.name}: {e}")
+    return file_path.name, size, digest, deduplicated
+
+
+def export_modified_time(file_path, st=None):
+    """Write time of an export filename, not of the shared blob inode."""
+    st = file_path.stat() if st is None else st
+    ref = EXPORT_REFS.get(file_path.name)
+    if ref and st.st_nlink > 1:
+        return ref.get('modified') or st.st_mtime
+    return st.st_mtime
+
+
+def collect_export_blobs():
+    """Drop blobs no export links to any more and refs to deleted files.
+
+    Also compacts the refs journal. Returns the number of blobs removed.
+    """
+    removed = 0
+    with EXPORT_STORE_LOCK:
+        stale = [name for name in EXPORT_REFS if not (EXPORT_DIR / name).exists()]
+        for name in stale:
+            EXPORT_REFS.pop(name, None)
+        live = {ref.get('digest') for ref in EXPORT_REFS.values()}
+        for blob_path in export_files(EXPORT_BLOB_DIR):
+            if blob_path == EXPORT_REFS_FILE:
+                continue
+            # With hard links a live blob has nlink > 1; copies rely on the refs
+            if blob_path.stat().st_nlink > 1 or blob_path.name.split('.')[0] in live:
+                continue
+            try:
+                blob_path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        if stale or EXPORT_REFS_JOURNAL_STATE['entries']:
+            compact_export_refs()
+    return removed
+
+
+# In-memory index of export metadata for /api/exports. It is refreshed when
+# the directory mtime changes (every write goes through a rename, so adds,
+# overwrites and deletes all bump it); unchanged files are not re-parsed.
+EXPORT_INDEX_RACY_NS = 2 * 1_000_000_000
+EXPORT_FILENAME_RE = re.compile(
+    r'^(?P<character>.+?)_(?P<class>[a-z0-9]+)_lvl(?P<level>\d+)_(?P<date>\d{8})_(?P<time>\d{4})\.json(?:\.gz|\.zst)?$',
+    re.IGNORECASE,
+)
+EXPORT_INDEX = {'dir_mtime_ns': None, 'entries': {}, 'ordered': [], 'keys': []}
+EXPORT_INDEX_LOCK = threading.Lock()
+
+
+def parse_export_filename(filename):
+    """Character, class and level from <name>_<class>_lvl<level>_YYYYMMDD_HHMM.json."""
+    match = EXPORT_FILENAME_RE.match(filename)
+    if not match:
+        base = re.sub(r'\.json(?:\.gz|\.zst)?$', '', filename)
+        base = re.sub(r'_\d{8}(_lvl_\d+)?$', '', base)
+        base = re.sub(r'_\d{8}_\d{4}$', '', base)
+        base = re.sub(r'\s*\(\d+\)$', '', base)
+        return {'character': base.strip().lower(), 'class': None, 'level': None}
+    return {
+        'character': match.group('character').lower(),
+        'class': match.group('class'),
+        'level': int(match.group('level')),
+    }
+
+
+def invalidate_export_index():
+    with EXPORT_INDEX_LOCK:
+        EXPORT_INDEX['dir_mtime_ns'] = None
+
+
+def _export_index_entry(file_path, st, signature):
+    modified = export_modified_time(file_path, st)
+    entry = {
+        'filename': file_path.name,
+        'compressed': not file_path.name.endswith('.json'),
+        'size': st.st_size,
+        'modified': datetime.fromtimestamp(modified).isoformat(),
+    }
+    entry.update(parse_export_filename(file_path.name))
+    return {'signature': signature, 'sort_key': (-modified, _reverse_name_key(file_path.name)), 'public': entry}
+
+
+def _reverse_name_key(name):
+    # Sorts names descending inside an ascending sort
+    return tuple(-ord(c) for c in name)
+
+
+def refresh_export_index(force=False):
+    """Bring EXPORT_INDEX up to date; returns the ordered entry list."""
+    with EXPORT_INDEX_LOCK:
+        dir_mtime_ns = EXPORT_DIR.stat().st_mtime_ns
+        # A change within the racy window may share the cached mtime
+        racy = time.time_ns() - dir_mtime_ns < EXPORT_INDEX_RACY_NS
+        if not force and not racy and dir_mtime_ns == EXPORT_INDEX['dir_mtime_ns']:
+            return EXPORT_INDEX['ordered']
+        
+        old_entries = EXPORT_INDEX['entries']
+        entries = {}
+        for file_path in export_files():
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            ref = EXPORT_REFS.get(file_path.name, {}).get('modified')
+            signature = (st.st_size, st.st_mtime_ns, st.st_ino, ref)
+            entry = old_entries.get(file_path.name)
+            if entry is None or entry['signature'] != signature:
+                entry = _export_index_entry(file_path, st, signature)
+            entries[file_path.name] = entry
+        
+        if entries.keys() != old_entries.keys() or any(entries[k] is not old_entries[k] for k in entries):
+            ordered = sorted(entries.values(), key=lambda e: e['sort_key'])
+            EXPORT_INDEX['ordered'] = ordered
+            EXPORT_INDEX['keys'] = [e['sort_key'] for e in ordered]
+            EXPORT_INDEX['generation'] = EXPORT_INDEX.get('generation', 0) + 1
+        EXPORT_INDEX['entries'] = entries
+        EXPORT_INDEX['dir_mtime_ns'] = dir_mtime_ns
+        return EXPORT_INDEX['ordered']
+
+
+def encode_export_cursor(entry):
+    raw = json.dumps([entry['sort_key'][0], entry['public']['filename']])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_export_cursor(cursor):
+    """Sort key encoded by encode_export_cursor; raises ValueError if invalid."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        modified, filename = json.loads(raw.decode('utf-8'))
+        return (float(modified), _reverse_name_key(str(filename)))
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError('invalid cursor') from e
+
+
+# SQLite catalog of exports for per-character queries. Rows are written by
+# store_export; files added or deleted outside the API are reconciled from
+# EXPORT_INDEX whenever its generation changes.
+EXPORT_CATALOG_FILE = (
+    Path(__file__).parent / config['exports']['catalog']
+    if config.get('exports', {}).get('catalog') else EXPORT_DIR / '.catalog.sqlite3'
+)
+EXPORT_CATALOG_LOCK = threading.Lock()
+EXPORT_CATALOG = {'connection': None, 'path': None, 'generation': None}
+EXPORT_CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exports (
+    filename TEXT PRIMARY KEY,
+    character_key TEXT NOT NULL,
+    character TEXT,
+    class TEXT,
+    level INTEGER,
+    exported_at REAL NOT NULL,
+    size INTEGER,
+    digest TEXT
+);
+CREATE INDEX IF NOT EXISTS exports_by_character ON exports (character_key, exported_at DESC);
+CREATE INDEX IF NOT EXISTS exports_by_time ON exports (exported_at DESC);
+"""
+EXPORT_CATALOG_COLUMNS = ('filename', 'character_key', 'character', 'class', 'level', 'exported_at', 'size', 'digest')
+
+
+def catalog_character_key(name):
+    """Case-insensitive key matching the character part of export filenames."""
+    key = re.sub(r'[^a-z0-9]+', '_', str(name or '').strip().lower())
+    return re.sub(r'_+', '_', key).strip('_') or 'character'
+
+
+def _catalog_connection():
+    """Shared connection, reopened if EXPORT_CATALOG_FILE changes. Hold the lock."""
+    path = str(EXPORT_CATALOG_FILE)
+    if EXPORT_CATALOG['connection'] is None or EXPORT_CATALOG['path'] != path:
+        if EXPORT_CATALOG['connection'] is not None:
+            EXPORT_CATALOG['connection'].close()
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.executescript(EXPORT_CATALOG_SCHEMA)
+        EXPORT_CATALOG.update(connection=connection, path=path, generation=None)
+    return EXPORT_CATALOG['connection']
+
+
+def _catalog_row(row):
+    record = {key: row[key] for key in EXPORT_CATALOG_COLUMNS}
+    record['exported_at'] = datetime.fromtimestamp(row['exported_at']).isoformat()
+    return record
+
+
+def record_export(filename, content, size, digest, exported_at):
+    """Insert or replace the catalog row for an export write."""
+    identity = content.get('identity', {}) if isinstance(content, dict) else {}
+    identity = identity if isinstance(identity, dict) else {}
+    parsed = parse_export_filename(filename)
+    character = identity.get('name') or parsed['character']
+    try:
+        level = int(content.get('level')) if isinstance(content, dict) else parsed['level']
+    except (TypeError, ValueError):
+        level = parsed['level']
+    row = (
+        filename, catalog_character_key(character), character,
+        identity.get('class') or parsed['class'], level, exported_at, size, digest,
+    )
+    with EXPORT_CATALOG_LOCK:
+        connection = _catalog_connection()
+        with connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO exports ({', '.join(EXPORT_CATALOG_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+
+
+def sync_export_catalog(force=False):
+    """Reconcile catalog rows with the files in EXPORT_DIR."""
+    refresh_export_index()
+    with EXPORT_CATALOG_LOCK:
+        connection = _catalog_connection()
+        generation = EXPORT_INDEX.get('generation', 0)
+        if not force and EXPORT_CATALOG['generation'] == generation:
+            return connection
+        entries = EXPORT_INDEX['entries']
+        known = {row['filename'] for row in connection.execute('SELECT filename FROM exports')}
+        with connection:
+            connection.executemany(
+                'DELETE FROM exports WHERE filename = ?',
+                [(name,) for name in known - entries.keys()],
+            )
+            rows = []
+            for name in entries.keys() - known:
+                public = entries[name]['public']
+                rows.append((
+                    name, catalog_character_key(public['character']), public['character'],
+                    public['class'], public['level'], -entries[name]['sort_key'][0],
+                    public['size'], EXPORT_REFS.get(name, {}).get('digest'),
+                ))
+            connection.executemany(
+                f"INSERT INTO exports ({', '.join(EXPORT_CATALOG_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        EXPORT_CATALOG['generation'] = generation
+        return connection
+
+
+def query_characters():
+    """One row per character with its export count and latest export."""
+    connection = sync_export_catalog()
+    with EXPORT_CATALOG_LOCK:
+        rows = connection.execute("""
+            SELECT e.*, c.export_count FROM exports e
+            JOIN (SELECT character_key, COUNT(*) AS export_count, MAX(exported_at) AS latest
+                  FROM exports GROUP BY character_key) c
+              ON e.character_key = c.character_key AND e.exported_at = c.latest
+            ORDER BY e.exported_at DESC, e.filename DESC
+        """).fetchall()
+    characters = OrderedDict()
+    for row in rows:
+        if row['character_key'] in characters:
+            continue
+        latest = _catalog_row(row)
+        characters[row['character_key']] = {
+            'key': row['character_key'],
+            'name': row['character'],
+            'class': row['class'],
+            'level': row['level'],
+            'exports': row['export_count'],
+            'latest': latest,
+        }
+    return list(characters.values())
+
+
+def query_character_history(name, limit=None, offset=0):
+    """Exports for one character, newest first."""
+    connection = sync_export_catalog()
+    sql = 'SELECT * FROM exports WHERE character_key = ? ORDER BY exported_at DESC, filename DESC'
+    params = [catalog_character_key(name)]
+    if limit is not None:
+        sql += ' LIMIT ? OFFSET ?'
+        params.extend([limit, offset])
+    with EXPORT_CATALOG_LOCK:
+        return [_catalog_row(row) for row in connection.execute(sql, params)]
+
+
+def query_latest_export(name=None):
+    """Newest export overall, or for one character; None if there is none."""
+    connection = sync_export_catalog()
+    with EXPORT_CATALOG_LOCK:
+        if name is None:
+            row = connection.execute('SELECT * FROM exports ORDER BY exported_at DESC, filename DESC LIMIT 1').fetchone()
+        else:
+            row = connection.execute(
+                'SELECT * FROM exports WHERE character_key = ? ORDER BY exported_at DESC, filename DESC LIMIT 1',
+                (catalog_character_key(name),),
+            ).fetchone()
+    return _catalog_row(row) if row is not None else None
+
+
+# Retention policy, mirroring the client-side _prune_old_exports_from_directory:
+# per character, the newest export is always kept; older timestamped exports
+# are pruned once they are past EXPORT_PRUNE_DAYS or beyond the newest
+# MAX_EXPORTS_PER_CHARACTER. Files without a timestamp in the name are never
+# touched. The worker runs every RETENTION_INTERVAL_SECONDS and shortly after
+# writes (at most once per RETENTION_MIN_GAP_SECONDS). The worker deletes
+# files, so it only runs once retention.enabled is set; GET
+# /api/exports/prune previews the policy either way.
+RETENTION_CONFIG = config.get('retention', {})
+RETENTION_ENABLED = bool(RETENTION_CONFIG.get('enabled', False))
+MAX_EXPORTS_PER_CHARACTER = int(RETENTION_CONFIG.get('max_exports_per_character', 20))
+EXPORT_PRUNE_DAYS = int(RETENTION_CONFIG.get('prune_days', 30))
+RETENTION_INTERVAL_SECONDS = float(RETENTION_CONFIG.get('interval_seconds', 3600))
+RETENTION_MIN_GAP_SECONDS = float(RETENTION_CONFIG.get('min_gap_seconds', 60))
+EXPORT_TIMESTAMP_RE = re.compile(r'_(\d{8})_(\d{4})\.json(?:\.gz|\.zst)?$')
+RETENTION_WAKE = threading.Event()
+RETENTION_LOCK = threading.Lock()
+RETENTION_STATE = {'worker': None, 'last_run': None, 'last_result': None}
+
+
+def export_timestamp(filename):
+    """datetime from the _YYYYMMDD_HHMM part of an export filename, or None."""
+    match = EXPORT_TIMESTAMP_RE.search(filename)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(f"{match.group(1)} {match.group(2)}", "%Y%m%d %H%M")
+    except ValueError:
+        return None
+
+
+def plan_export_retention(now=None, max_keep=None, prune_days=None):
+    """Decide which exports the retention policy would delete.
+
+    Returns {'policy': ..., 'delete': [...], 'kept': n}; nothing is removed.
+    """
+    now = now or datetime.now()
+    max_keep = MAX_EXPORTS_PER_CHARACTER if max_keep is None else max_keep
+    prune_days = EXPORT_PRUNE_DAYS if prune_days is None else prune_days
+    cutoff = now - timedelta(days=prune_days)
+    
+    by_character = {}
+    for entry in refresh_export_index():
+        stamp = export_timestamp(entry['public']['filename'])
+        if stamp is None:
+            continue
+        by_character.setdefault(entry['public']['character'], []).append((stamp, entry['public']['filename']))
+    
+    delete = []
+    kept = 0
+    for character, files in by_character.items():
+        files.sort(reverse=True)
+        for rank, (stamp, filename) in enumerate(files):
+            # Never delete the most recent export for a character
+            if rank == 0:
+                kept += 1
+                continue
+            if stamp < cutoff:
+                reason = f'older than {prune_days} days'
+            elif rank >= max_keep:
+                reason = f'more than {max_keep} exports'
+            else:
+                kept += 1
+                continue
+            delete.append({
+                'filename': filename,
+                'character': character,
+                'timestamp': stamp.isoformat(),
+                'reason': reason,
+            })
+    return {
+        'policy': {'max_exports_per_character': max_keep, 'prune_days': prune_days},
+        'delete': delete,
+        'kept': kept,
+    }
+
+
+def prune_exports(now=None, dry_run=False):
+    """Apply the retention policy; returns the plan with what was removed."""
+    with RETENTION_LOCK:
+        plan = plan_export_retention(now)
+        plan['dry_run'] = dry_run
+        removed = []
+        if not dry_run:
+            for item in plan['delete']:
+                try:
+                    (EXPORT_DIR / item['filename']).unlink()
+                    removed.append(item['filename'])
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    app.logger.warning(f"Could not prune {item['filename']}: {e}")
+            if removed:
+                collect_export_blobs()
+                app.logger.info(f"Pruned {len(removed)} export(s) by retention policy")
+            RETENTION_STATE.update(last_run=time.time(), last_result=len(removed))
+        plan['removed'] = removed
+        return plan
+
+
+def _retention_worker():
+    while True:
+        woken = RETENTION_WAKE.wait(RETENTION_INTERVAL_SECONDS)
+        if woken:
+            # Let an autosave burst settle before scanning
+            time.sleep(RETENTION_MIN_GAP_SECONDS)
+        RETENTION_WAKE.clear()
+        try:
+            prune_exports()
+        except Exception as e:
+            app.logger.error(f"Retention worker error: {type(e).__name__}: {e}")
+
+
+def start_retention_worker():
+    """Start the background pruning thread (server startup only)."""
+    if not RETENTION_ENABLED:
+        return None
+    worker = RETENTION_STATE['worker']
+    if worker is None or not worker.is_alive():
+        worker = threading.Thread(target=_retention_worker, name='export-retention', daemon=True)
+        worker.start()
+        RETENTION_STATE['worker'] = worker
+    return worker
+
+
+# Strong ETags for GET /api/exports/<filename>: sha256 of the bytes served,
+# cached per representation until the file's stat signature changes.
+EXPORT_ETAGS = {}
+EXPORT_ETAGS_LOCK = threading.Lock()
+
+
+def resolve_export_path(filename):
+    """Export file for a requested name (adding .gz/.zst if stored compressed), or None."""
+    name = Path(filename).name
+    if name != filename or name.startswith('.'):
+        return None
+    candidates = [name]
+    if name.endswith('.json'):
+        candidates.extend(name + suffix for suffix in ('.gz', '.zst'))
+    for candidate in candidates:
+        file_path = EXPORT_DIR / candidate
+        if any(file_path.match(pattern) for pattern in EXPORT_GLOBS) and file_path.is_file():
+            return file_path
+    return None
+
+
+def _cached_export_etag(key, signature):
+    with EXPORT_ETAGS_LOCK:
+        cached = EXPORT_ETAGS.get(key)
+    return cached[1] if cached and cached[0] == signature else None
+
+
+def _store_export_etag(key, signature, data):
+    etag = hashlib.sha256(data).hexdigest()
+    with EXPORT_ETAGS_LOCK:
+        EXPORT_ETAGS[key] = (signature, etag)
+    return etag
+
+
+# Recently exported documents by digest, so delta exports can be applied
+# without re-reading the blob (or before a queued write has landed).
+EXPORT_RECENT_DOCUMENTS = OrderedDict()
+EXPORT_RECENT_LIMIT = 32
+
+
+def remember_export_document(digest, content):
+    with EXPORT_STORE_LOCK:
+        EXPORT_RECENT_DOCUMENTS[digest] = content
+        EXPORT_RECENT_DOCUMENTS.move_to_end(digest)
+        while len(EXPORT_RECENT_DOCUMENTS) > EXPORT_RECENT_LIMIT:
+            EXPORT_RECENT_DOCUMENTS.popitem(last=False)
+
+
+def load_export_document(digest):
+    """Return the stored document for a digest, or None if unknown."""
+    with EXPORT_STORE_LOCK:
+        content = EXPORT_RECENT_DOCUMENTS.get(digest)
+    if content is not None:
+        return content
+    if not isinstance(digest, str) or not all(c in '0123456789abcdef' for c in digest) or len(digest) != 64:
+        return None
+    for suffix in EXPORT_FORMAT_SUFFIXES.values():
+        try:
+            return read_export_file(EXPORT_BLOB_DIR / f'{digest}.json{suffix}')
+        except DECODE_ERRORS:
+            continue
+    return None
+
+
+class JsonPatchError(ValueError):
+    """Raised when a JSON Patch operation cannot be applied."""
+
+
+def _split_pointer(pointer):
+    if pointer == '':
+        return []
+    if not isinstance(pointer, str) or not pointer.startswith('/'):
+        raise JsonPatchError(f'invalid pointer {pointer!r}')
+    return [part.replace('~1', '/').replace('~0', '~') for part in pointer[1:].split('/')]
+
+
+def _list_index(container, token, allow_end=False):
+    if allow_end and token == '-':
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith('0')):
+        raise JsonPatchError(f'invalid array index {token!r}')
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f'array index {token} out of range')
+    return index
+
+
+def _resolve_parent(document, pointer):
+    parts = _split_pointer(pointer)
+    if not parts:
+        raise JsonPatchError('operation cannot target the document root')
+    target = document
+    for token in parts[:-1]:
+        if isinstance(target, dict) and token in target:
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_list_index(target, token)]
+        else:
+            raise JsonPatchError(f'path {pointer!r} does not exist')
+    return target, parts[-1]
+
+
+def _get_value(document, pointer):
+    target = document
+    for token in _split_pointer(pointer):
+        if isinstance(target, dict) and token in target:
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_list_index(target, token)]
+        else:
+            raise JsonPatchError(f'path {pointer!r} does not exist')
+    return target
+
+
+def _add_value(document, pointer, value):
+    if pointer == '':
+        return value
+    parent, token = _resolve_parent(document, pointer)
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchError(f'cannot add to {pointer!r}')
+    return document
+
+
+def _remove_value(document, pointer):
+    parent, token = _resolve_parent(document, pointer)
+    if isinstance(parent, dict) and token in parent:
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_list_index(parent, token))
+    raise JsonPatchError(f'path {pointer!r} does not exist')
+
+
+def apply_json_patch(document, operations):
+    """Apply RFC 6902 operations to a copy of document and return it."""
+    document = json.loads(json.dumps(document))
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise JsonPatchError('operation must be an object')
+        op = operation.get('op')
+        path = operation.get('path')
+        if op in ('add', 'replace', 'test') and 'value' not in operation:
+            raise JsonPatchError(f'{op} requires a value')
+        if op == 'add':
+            document = _add_value(document, path, operation['value'])
+        elif op == 'remove':
+            _remove_value(document, path)
+        elif op == 'replace':
+            if path == '':
+                document = operation['value']
+                continue
+            _get_value(document, path)
+            _remove_value(document, path)
+            document = _add_value(document, path, operation['value'])
+        elif op in ('move', 'copy'):
+            source = operation.get('from')
+            if op == 'move' and (path == source or str(path).startswith(f'{source}/')):
+                if path != source:
+                    raise JsonPatchError('cannot move a value into itself')
+                continue
+            value = _get_value(document, source)
+            if op == 'move':
+                _remove_value(document, source)
+            else:
+                value = json.loads(json.dumps(value))
+            document = _add_value(document, path, value)
+        elif op == 'test':
+            if _get_value(document, path) != operation['value']:
+                raise JsonPatchError(f'test failed at {path!r}')
+        else:
+            raise JsonPatchError(f'unknown op {op!r}')
+    return document
+
+
+class UnsupportedEncoding(ValueError):
+    """Raised for a Content-Encoding the server cannot decode."""
+
+
+def _get_request_json():
+    """Parse the JSON body, decoding Content-Encoding gzip/zstd first.
+
+    Returns None for a missing or malformed body, like get_json(silent=True).
+    """
+    encoding = (request.headers.get('Content-Encoding') or 'identity').strip().lower()
+    if encoding == 'identity':
+        return request.get_json(force=False, silent=True)
+    if encoding not in ('gzip', 'x-gzip', 'zstd') or (encoding == 'zstd' and zstandard is None):
+        raise UnsupportedEncoding(encoding)
+    try:
+        body = decode_export_bytes(request.get_data())
+        return json.loads(body.decode('utf-8'))
+    except DECODE_ERRORS:
+        return None
+
+
+def _wants_async_export():
+    """Async writes are opt-in so existing clients keep the synchronous 200."""
+    flag = (request.args.get('async') or '').strip().lower()
+    if flag in ('1', 'true', 'yes'):
+        return True
+    return 'respond-async' in (request.headers.get('Prefer') or '').lower()
+
+
+def _set_ticket(ticket_id, **fields):
+    with EXPORT_TICKETS_LOCK:
+        ticket = EXPORT_TICKETS.get(ticket_id)
+        if ticket is not None:
+            ticket.update(fields)
+
+
+def _export_worker():
+    while True:
+        ticket_id, file_path, content = EXPORT_QUEUE.get()
+        try:
+            _set_ticket(ticket_id, status='writing')
+            stored_name, file_size, digest, _ = store_export(file_path, content)
+            _set_ticket(ticket_id, status='done', filename=stored_name, size=file_size, digest=digest, completed=datetime.now().isoformat())
+            app.logger.info(f"✓ {stored_name} written by export queue ({file_size} bytes)")
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            _set_ticket(ticket_id, status='error', error=error_msg, completed=datetime.now().isoformat())
+            app.logger.error(f"Queued export error: {error_msg}")
+        finally:
+            EXPORT_QUEUE.task_done()
+
+
+def _ensure_export_worker():
+    global _EXPORT_WORKER
+    with _EXPORT_WORKER_LOCK:
+        if _EXPORT_WORKER is None or not _EXPORT_WORKER.is_alive():
+            _EXPORT_WORKER = threading.Thread(target=_export_worker, name='export-writer', daemon=True)
+            _EXPORT_WORKER.start()
+
+
+def enqueue_export(file_path, content):
+    """Queue an export write and return its ticket id.
+
+    Raises queue.Full when the writer is too far behind.
+    """
+    _ensure_export_worker()
+    ticket_id = uuid.uuid4().hex
+    with EXPORT_TICKETS_LOCK:
+        EXPORT_TICKETS[ticket_id] = {
+            'ticket': ticket_id,
+            'filename': file_path.name,
+            'status': 'queued',
+            'queued': datetime.now().isoformat(),
+        }
+        while len(EXPORT_TICKETS) > EXPORT_TICKET_HISTORY:
+            EXPORT_TICKETS.popitem(last=False)
+    try:
+        EXPORT_QUEUE.put_nowait((ticket_id, file_path, content))
+    except queue.Full:
+        with EXPORT_TICKETS_LOCK:
+            EXPORT_TICKETS.pop(ticket_id, None)
+        raise
+    return ticket_id
+
+
+def wait_for_exports(timeout=None):
+    """Block until queued exports are on disk. Returns False on timeout."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while EXPORT_QUEUE.unfinished_tasks:
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+atexit.register(wait_for_exports, 10)
+
+# Build-free static asset pipeline. Files are read once into memory with a
+# content hash and (for text assets) a gzip variant, refreshed when their
+# mtime or size changes. index.html is rewritten so local src/href URLs carry
+# the hash (styles.<hash>.css); those fingerprinted URLs are served with an
+# immutable one-year cache, everything else with no-cache + ETag so
+# revalidation is a 304.
+STATIC_DIR = Path(app.static_folder)
+STATIC_HASH_LENGTH = 12
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+STATIC_GZIP_MIN_BYTES = 1024
+STATIC_COMPRESSIBLE = {'.html', '.css', '.js', '.py', '.json', '.svg', '.txt', '.toml', '.map'}
+STATIC_FINGERPRINT_RE = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})(?P<ext>\.[A-Za-z0-9]+)$' % STATIC_HASH_LENGTH)
+STATIC_ASSET_REF_RE = re.compile(r'(?P<attr>\b(?:src|href))="(?P<url>assets/[^"?#]+)"')
+STATIC_ASSETS = {}
+STATIC_ASSETS_LOCK = threading.Lock()
+STATIC_INDEX = {'key': None, 'asset': None}
+
+
+def _static_asset_entry(rel_path, data, signature, modified):
+    digest = hashlib.sha256(data).hexdigest()
+    gz = None
+    if Path(rel_path).suffix.lower() in STATIC_COMPRESSIBLE and len(data) >= STATIC_GZIP_MIN_BYTES:
+        packed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(packed) < len(data):
+            gz = packed
+    mimetype = mimetypes.guess_type(rel_path)[0]
+    if mimetype is None:
+        mimetype = 'text/x-python' if rel_path.endswith('.py') else 'application/octet-stream'
+    return {
+        'path': rel_path,
+        'signature': signature,
+        'data': data,
+        'gz': gz,
+        'hash': digest[:STATIC_HASH_LENGTH],
+        'etag': digest,
+        'mimetype': mimetype,
+        'modified': modified,
+    }
+
+
+def load_static_asset(rel_path):
+    """Cached asset entry for a path under static/, or None if missing."""
+    full_path = safe_join(str(STATIC_DIR), rel_path)
+    if full_path is None:
+        return None
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return None
+    if not os.path.isfile(full_path):
+        return None
+    signature = (st.st_size, st.st_mtime_ns)
+    with STATIC_ASSETS_LOCK:
+        entry = STATIC_ASSETS.get(rel_path)
+    if entry is not None and entry['signature'] == signature:
+        return entry
+    with open(full_path, 'rb') as f:
+        data = f.read()
+    entry = _static_asset_entry(rel_path, data, signature, datetime.fromtimestamp(st.st_mtime, tz=timezone.utc))
+    with STATIC_ASSETS_LOCK:
+        STATIC_ASSETS[rel_path] = entry
+    return entry
+
+
+def fingerprinted_url(rel_path):
+    """assets/css/styles.css -> assets/css/styles.<hash>.css (unchanged if missing)."""
+    entry = load_static_asset(rel_path)
+    if entry is None:
+        return rel_path
+    stem, dot, ext = rel_path.rpartition('.')
+    if not dot:
+        return rel_path
+    return f'{stem}.{entry["hash"]}.{ext}'
+
+
+def render_index_asset():
+    """index.html with fingerprinted local asset URLs, cached as an asset entry."""
+    page = load_static_asset('index.html')
+    if page is None:
+        return None
+    text = page['data'].decode('utf-8')
+    refs = sorted(set(m.group('url') for m in STATIC_ASSET_REF_RE.finditer(text)))
+    key = (page['etag'],) + tuple((ref, (load_static_asset(ref) or {}).get('etag')) for ref in refs)
+    with STATIC_ASSETS_LOCK:
+        if STATIC_INDEX['key'] == key:
+            return STATIC_INDEX['asset']
+    rendered = STATIC_ASSET_REF_RE.sub(
+        lambda m: f'{m.group("attr")}="{fingerprinted_url(m.group("url"))}"', text
+    ).encode('utf-8')
+    asset = _static_asset_entry('index.html', rendered, page['signature'], page['modified'])
+    with STATIC_ASSETS_LOCK:
+        STATIC_INDEX.update(key=key, asset=asset)
+    return asset
+
+
+def send_static_asset(entry, immutable=False):
+    """Response for an asset entry, honouring Accept-Encoding and conditionals."""
+    use_gzip = entry['gz'] is not None and 'gzip' in request.accept_encodings
+    response = Response(entry['gz'] if use_gzip else entry['data'], mimetype=entry['mimetype'])
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    if entry['gz'] is not None:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(entry['etag'] + ('-gz' if use_gzip else ''))
+    response.last_modified = entry['modified']
+    if immutable:
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request, accept_ranges=not use_gzip, complete_length=len(response.get_data()))
+
+
+def serve_static_path(path):
+    entry = load_static_asset(path)
+    if entry is not None:
+        return send_static_asset(entry)
+    match = STATIC_FINGERPRINT_RE.match(path)
+    if match:
+        entry = load_static_asset(match.group('stem') + match.group('ext'))
+        if entry is not None:
+            # A stale fingerprint still gets the current file, just not cached forever
+            return send_static_asset(entry, immutable=entry['hash'] == match.group('hash'))
+    return jsonify({'error': 'Not found'}), 404
+
+
+# Python module bundle: every module in static/assets/py in one response,
+# either as a JSON manifest {"hash", "modules": {name: source}} for the
+# PyScript loader or as a zip importable with zipimport.
+PY_BUNDLE_DIR = 'assets/py'
+PY_BUNDLE_CACHE = {}
+PY_BUNDLE_LOCK = threading.Lock()
+
+
+def py_bundle_hash(modules):
+    """sha256 over sorted (name, source) pairs; the client recomputes it."""
+    digest = hashlib.sha256()
+    for name in sorted(modules):
+        digest.update(name.encode('utf-8') + b'\0' + modules[name].encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+
+def build_py_bundle(fmt='json'):
+    """Cached bundle asset entry for fmt ('json' or 'zip')."""
+    entries = []
+    for module_path in sorted((STATIC_DIR / PY_BUNDLE_DIR).glob('*.py')):
+        entry = load_static_asset(f'{PY_BUNDLE_DIR}/{module_path.name}')
+        if entry is not None:
+            entries.append(entry)
+    key = (fmt,) + tuple((e['path'], e['etag']) for e in entries)
+    with PY_BUNDLE_LOCK:
+        cached = PY_BUNDLE_CACHE.get(fmt)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    
+    modules = {Path(e['path']).stem: e['data'].decode('utf-8') for e in entries}
+    bundle_hash = py_bundle_hash(modules)
+    if fmt == 'zip':
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for name in sorted(modules):
+                info = zipfile.ZipInfo(f'{name}.py', date_time=(1980, 1, 1, 0, 0, 0))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, modules[name])
+        data = buffer.getvalue()
+    else:
+        data = json.dumps({'hash': bundle_hash, 'modules': modules}, ensure_ascii=False).encode('utf-8')
+    
+    modified = max((e['modified'] for e in entries), default=datetime.now(timezone.utc))
+    asset = _static_asset_entry(f'py-bundle.{fmt}', data, None, modified)
+    asset['bundle_hash'] = bundle_hash
+    asset['modules'] = len(modules)
+    with PY_BUNDLE_LOCK:
+        PY_BUNDLE_CACHE[fmt] = (key, asset)
+    return asset
+
+
+@app.route('/api/py-bundle', methods=['GET'])
+def py_bundle():
+    """
+    All PyScript modules in one request
+    
+    ?format=json (default) returns {"hash", "modules": {name: source}};
+    ?format=zip returns a zip archive. X-Bundle-Hash carries the content hash.
+    """
+    fmt = request.args.get('format', 'json')
+    if fmt not in ('json', 'zip'):
+        return jsonify({'error': 'format must be json or zip'}), 400
+    asset = build_py_bundle(fmt)
+    response = send_static_asset(asset)
+    response.headers['X-Bundle-Hash'] = asset['bundle_hash']
+    response.headers['X-Bundle-Modules'] = str(asset['modules'])
+    return response
+
+
+# Pre-sanitized spell library: the same sanitize_spell_list the browser runs
+# (spell_data.py, loaded by path so the browser bundle stays off sys.path
+# and character.py is never imported here) is applied once to a local Open5e dump (spells.data_file,
+# a list or {"results": [...]}) merged with spell_data.LOCAL_SPELLS_FALLBACK.
+# The result is persisted under spells.cache_file and only rebuilt when the
+# data file or the pipeline modules change.
+SPELLS_CONFIG = config.get('spells', {})
+SPELL_DATA_FILE = Path(__file__).parent / SPELLS_CONFIG.get('data_file', 'data/open5e_spells.json')
+SPELL_LIBRARY_FILE = Path(__file__).parent / SPELLS_CONFIG.get('cache_file', 'exports/.cache/spell_library.json')
+SPELL_PIPELINE_MODULES = ('assets/py/spell_data.py',)
+SPELL_PIPELINE = {'mtime_ns': None, 'module': None}
+SPELL_LIBRARY = {'key': None, 'asset': None}
+SPELL_LIBRARY_LOCK = threading.Lock()
+
+
+def _spell_pipeline():
+    """The bundle's spell_data.py, loaded by path and reloaded when it changes."""
+    path = STATIC_DIR / SPELL_PIPELINE_MODULES[0]
+    mtime_ns = path.stat().st_mtime_ns
+    if SPELL_PIPELINE['module'] is None or SPELL_PIPELINE['mtime_ns'] != mtime_ns:
+        spec = importlib.util.spec_from_file_location('pysheet_spell_pipeline', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        SPELL_PIPELINE.update(mtime_ns=mtime_ns, module=module)
+    return SPELL_PIPELINE['module']
+
+
+def load_spell_data_file(path=None):
+    """Raw spell records from the local data file, or None if there is none."""
+    path = Path(path or SPELL_DATA_FILE)
+    try:
+        data = decode_export_bytes(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    payload = json.loads(data.decode('utf-8'))
+    if isinstance(payload, dict):
+        payload = payload.get('results')
+    if not isinstance(payload, list):
+        raise ValueError(f"{path.name}: expected a list of spells or {{\"results\": [...]}}")
+    return [spell for spell in payload if isinstance(spell, dict)]
+
+
+def spell_library_key():
+    """Hash over the data file and pipeline modules; changes trigger a rebuild."""
+    digest = hashlib.sha256()
+    for rel_path in SPELL_PIPELINE_MODULES:
+        entry = load_static_asset(rel_path)
+        digest.update(rel_path.encode('utf-8') + b'\0' + (entry['etag'] if entry else '').encode('ascii') + b'\0')
+    try:
+        st = SPELL_DATA_FILE.stat()
+        digest.update(f'{SPELL_DATA_FILE.name}:{st.st_size}:{st.st_mtime_ns}'.encode('utf-8'))
+    except OSError:
+        digest.update(b'no-data-file')
+    return digest.hexdigest()
+
+
+def build_spell_library(key=None):
+    """Run the sanitize pipeline and return the persisted library payload."""
+    pipeline = _spell_pipeline()
+    fallback = pipeline.LOCAL_SPELLS_FALLBACK
+    raw_spells = load_spell_data_file()
+    source = 'data' if raw_spells else 'fallback'
+    raw_spells = list(raw_spells or [])
+    existing = {spell.get('slug') for spell in raw_spells if spell.get('slug')}
+    raw_spells.extend(spell for spell in fallback if spell.get('slug') not in existing)
+    spells = pipeline.sanitize_spell_list(raw_spells)
+    if not spells and source == 'data':
+        app.logger.warning(f"Spell data file {SPELL_DATA_FILE} has no supported spells; using fallback list")
+        source = 'fallback'
+        spells = pipeline.sanitize_spell_list(list(fallback))
+    return {
+        'key': key or spell_library_key(),
+        'version': pipeline.SPELL_LIBRARY_VERSION,
+        'source': source,
+        'count': len(spells),
+        'hash': hashlib.sha256(json.dumps(spells, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest(),
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'spells': spells,
+    }
+
+
+def load_spell_library(force=False):
+    """Asset entry for /api/spells, built once and reused from disk."""
+    key = spell_library_key()
+    with SPELL_LIBRARY_LOCK:
+        if not force and SPELL_LIBRARY['key'] == key:
+            return SPELL_LIBRARY['asset']
+        payload = None
+        if not force:
+            try:
+                payload = json.loads(SPELL_LIBRARY_FILE.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                payload = None
+            if not isinstance(payload, dict) or payload.get('key') != key:
+                payload = None
+        if payload is None:
+            payload = build_spell_library(key)
+            SPELL_LIBRARY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(SPELL_LIBRARY_FILE, payload)
+            app.logger.info(f"Spell library built: {payload['count']} spells from {payload['source']}")
+        body = {name: value for name, value in payload.items() if name != 'key'}
+        data = json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        modified = datetime.fromtimestamp(SPELL_LIBRARY_FILE.stat().st_mtime, tz=timezone.utc)
+        asset = _static_asset_entry('spells.json', data, key, modified)
+        # The ETag follows the spell content, not generated_at
+        asset['etag'] = payload['hash']
+        asset['library'] = payload
+        SPELL_LIBRARY.update(key=key, asset=asset)
+        return asset
+
+
+@app.route('/api/spells', methods=['GET'])
+def spell_library():
+    """
+    Sanitized spell records ready for the client's filter index
+
+    Returns {"version", "source", "count", "hash", "generated_at", "spells"};
+    the ETag is the content hash, so an unchanged library revalidates as 304.
+    """
+    try:
+        asset = load_spell_library()
+    except Exception as e:
+        app.logger.error(f"Spell library error: {type(e).__name__}: {e}")
+        return jsonify({'error': str(e)}), 500
+    response = send_static_asset(asset)
+    response.headers['X-Spell-Library-Hash'] = asset['library']['hash']
+    return response
+
+
+# Open5e proxy: /api/open5e/<path> forwards GETs to the public API and keeps
+# each 200 response on disk. Entries younger than ttl_seconds are served as
+# is; for stale_seconds after that the cached copy is still served while a
+# background thread refreshes it. When the upstream is unreachable (or
+# offline is set) the last cached copy or the seeded snapshot directory
+# (<resource>.json, a list or {"results": [...]}) stands in. Pagination
+# links are rewritten to point back at the proxy.
+OPEN5E_CONFIG = config.get('open5e', {})
+OPEN5E_UPSTREAM = OPEN5E_CONFIG.get('upstream', 'https://api.open5e.com').rstrip('/')
+OPEN5E_PROXY_PREFIX = '/api/open5e'
+OPEN5E_CACHE_DIR = Path(__file__).parent / OPEN5E_CONFIG.get('cache_dir', 'exports/.cache/open5e')
+OPEN5E_SNAPSHOT_DIR = Path(__file__).parent / OPEN5E_CONFIG.get('snapshot_dir', 'data/open5e')
+OPEN5E_TTL_SECONDS = float(OPEN5E_CONFIG.get('ttl_seconds', 24 * 3600))
+OPEN5E_STALE_SECONDS = float(OPEN5E_CONFIG.get('stale_seconds', 7 * 24 * 3600))
+OPEN5E_TIMEOUT_SECONDS = float(OPEN5E_CONFIG.get('timeout_seconds', 20))
+OPEN5E_OFFLINE = bool(OPEN5E_CONFIG.get('offline', False))
+OPEN5E_SNAPSHOT_PAGE_SIZE = 50
+OPEN5E_MAX_SNAPSHOT_PAGE_SIZE = 5000
+OPEN5E_PATH_RE = re.compile(r'^[A-Za-z0-9_\-./]*$')
+OPEN5E_RESOURCE_RE = re.compile(r'^[a-z0-9_\-]+$')
+OPEN5E_VERSION_RE = re.compile(r'^v\d+$')
+OPEN5E_FETCH_ERRORS = (urllib.error.URLError, OSError, ValueError)
+OPEN5E_ASSET_LIMIT = 64
+OPEN5E_ASSETS = OrderedDict()
+OPEN5E_REFRESHING = set()
+OPEN5E_LOCK = threading.Lock()
+
+
+def open5e_cache_key(path, args=None):
+    """(canonical 'path/?query', cache key) with the query sorted."""
+    path = path.strip('/')
+    canonical = f'{path}/' if path else ''
+    query = urllib.parse.urlencode(sorted((args or {}).items()))
+    if query:
+        canonical += f'?{query}'
+    return canonical, hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+
+def read_open5e_cache(key):
+    """(meta, body) for a cached response, or None."""
+    try:
+        with open(OPEN5E_CACHE_DIR / f'{key}.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        body = (OPEN5E_CACHE_DIR / f'{key}.body').read_bytes()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or not isinstance(meta.get('fetched_at'), (int, float)):
+        return None
+    return meta, body
+
+
+def write_open5e_cache(key, meta, body):
+    OPEN5E_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_bytes_atomic(OPEN5E_CACHE_DIR / f'{key}.body', body)
+    # Metadata goes last: a body without it is never served
+    write_json_atomic(OPEN5E_CACHE_DIR / f'{key}.json', meta)
+
+
+def rewrite_open5e_links(body):
+    """Point absolute upstream URLs (next/previous/url) at the proxy."""
+    for scheme_base in (OPEN5E_UPSTREAM, OPEN5E_UPSTREAM.replace('https://', 'http://', 1)):
+        body = body.replace(f'"{scheme_base}/'.encode('utf-8'), f'"{OPEN5E_PROXY_PREFIX}/'.encode('utf-8'))
+    return body
+
+
+def fetch_open5e_upstream(canonical):
+    """(status, content_type, body) from the public API; raises on network errors."""
+    req = urllib.request.Request(f'{OPEN5E_UPSTREAM}/{canonical}', headers={
+        'Accept': 'application/json',
+        'User-Agent': 'PySheet/1.0 (+open5e proxy)',
+    })
+    try:
+        with urllib.request.urlopen(req, timeout=OPEN5E_TIMEOUT_SECONDS) as upstream:
+            return upstream.status, upstream.headers.get('Content-Type', 'application/json'), upstream.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get('Content-Type', 'application/json'), e.read()
+
+
+def refresh_open5e_entry(canonical, key):
+    """Fetch one URL upstream; 200 responses are rewritten and cached."""
+    status, content_type, body = fetch_open5e_upstream(canonical)
+    meta = {'url': canonical, 'status': status, 'content_type': content_type, 'fetched_at': time.time()}
+    if status == 200:
+        body = rewrite_open5e_links(body)
+        write_open5e_cache(key, meta, body)
+    return meta, body
+
+
+def _refresh_open5e_worker(canonical, key):
+    try:
+        refresh_open5e_entry(canonical, key)
+    except Exception as e:
+        app.logger.warning(f"Open5e background refresh failed for {canonical}: {type(e).__name__}: {e}")
+    finally:
+        with OPEN5E_LOCK:
+            OPEN5E_REFRESHING.discard(key)
+
+
+def refresh_open5e_in_background(canonical, key):
+    """Start at most one refresh per cache key; False if one is running."""
+    with OPEN5E_LOCK:
+        if key in OPEN5E_REFRESHING:
+            return False
+        OPEN5E_REFRESHING.add(key)
+    threading.Thread(target=_refresh_open5e_worker, args=(canonical, key), daemon=True,
+                     name='open5e-refresh').start()
+    return True
+
+
+def load_open5e_snapshot(path, args=None):
+    """Response body built from the snapshot directory, or None."""
+    parts = [part for part in path.strip('/').split('/') if part]
+    if parts and OPEN5E_VERSION_RE.match(parts[0]):
+        parts = parts[1:]
+    if not parts or len(parts) > 2 or not OPEN5E_RESOURCE_RE.match(parts[0]):
+        return None
+    resource = parts[0]
+    records = None
+    for suffix in ('.json', '.json.gz'):
+        try:
+            data = decode_export_bytes((OPEN5E_SNAPSHOT_DIR / f'{resource}{suffix}').read_bytes())
+        except FileNotFoundError:
+            continue
+        records = json.loads(data.decode('utf-8'))
+        break
+    if isinstance(records, dict):
+        records = records.get('results')
+    if not isinstance(records, list):
+        return None
+    
+    if len(parts) == 2:
+        record = next((r for r in records if isinstance(r, dict) and r.get('slug') == parts[1]), None)
+        return None if record is None else json.dumps(record, ensure_ascii=False).encode('utf-8')
+    
+    args = dict(args or {})
+    ordering = args.get('ordering', '')
+    if ordering.lstrip('-') == 'name':
+        records = sorted(records, key=lambda r: str(r.get('name', '')).lower(), reverse=ordering.startswith('-'))
+    try:
+        limit = min(max(int(args.get('limit', OPEN5E_SNAPSHOT_PAGE_SIZE)), 1), OPEN5E_MAX_SNAPSHOT_PAGE_SIZE)
+        page = max(int(args.get('page', 1)), 1)
+    except ValueError:
+        return None
+    start = (page - 1) * limit
+    
+    def page_url(number):
+        query = urllib.parse.urlencode(sorted(dict(args, page=number).items()))
+        return f'{OPEN5E_PROXY_PREFIX}/{resource}/?{query}'
+    
+    payload = {
+        'count': len(records),
+        'next': page_url(page + 1) if start + limit < len(records) else None,
+        'previous': page_url(page - 1) if page > 1 else None,
+        'results': records[start:start + limit],
+    }
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+def _open5e_asset(key, body, fetched_at):
+    """Asset entry (ETag, gzip variant) for a body, cached per key and fetch time."""
+    with OPEN5E_LOCK:
+        cached = OPEN5E_ASSETS.get(key)
+        if cached is not None and cached[0] == fetched_at:
+            OPEN5E_ASSETS.move_to_end(key)
+            return cached[1]
+    modified = datetime.fromtimestamp(fetched_at, tz=timezone.utc)
+    asset = _static_asset_entry(f'open5e/{key}.json', body, None, modified)
+    with OPEN5E_LOCK:
+        OPEN5E_ASSETS[key] = (fetched_at, asset)
+        while len(OPEN5E_ASSETS) > OPEN5E_ASSET_LIMIT:
+            OPEN5E_ASSETS.popitem(last=False)
+    return asset
+
+
+def _send_open5e(key, body, fetched_at, cache_state):
+    response = send_static_asset(_open5e_asset(key, body, fetched_at))
+    response.headers['X-Cache'] = cache_state
+    response.headers['Age'] = str(max(int(time.time() - fetched_at), 0))
+    return response
+
+
+@app.route('/api/open5e/<path:path>', methods=['GET'])
+def open5e_proxy(path):
+    """
+    Caching proxy for api.open5e.com
+    
+    X-Cache reports HIT, MISS, STALE (served while refreshing, or because the
+    upstream failed) or SNAPSHOT (offline stand-in).
+    """
+    if '..' in path or not OPEN5E_PATH_RE.match(path):
+        return jsonify({'error': 'Invalid Open5e path'}), 400
+    canonical, key = open5e_cache_key(path, request.args.to_dict())
+    cached = read_open5e_cache(key)
+    now = time.time()
+    if cached is not None:
+        meta, body = cached
+        age = now - meta['fetched_at']
+        if age < OPEN5E_TTL_SECONDS:
+            return _send_open5e(key, body, meta['fetched_at'], 'HIT')
+        if OPEN5E_OFFLINE or age < OPEN5E_TTL_SECONDS + OPEN5E_STALE_SECONDS:
+            if not OPEN5E_OFFLINE:
+                refresh_open5e_in_background(canonical, key)
+            return _send_open5e(key, body, meta['fetched_at'], 'STALE')
+    
+    upstream_status = None
+    if not OPEN5E_OFFLINE:
+        try:
+            meta, body = refresh_open5e_entry(canonical, key)
+            if meta['status'] == 200:
+                return _send_open5e(key, body, meta['fetched_at'], 'MISS')
+            upstream_status = meta['status']
+            app.logger.warning(f"Open5e upstream returned {upstream_status} for {canonical}")
+        except OPEN5E_FETCH_ERRORS as e:
+            app.logger.warning(f"Open5e upstream unavailable for {canonical}: {type(e).__name__}: {e}")
+    
+    # Upstream failed or offline: last cached copy, then the snapshot
+    if cached is not None:
+        return _send_open5e(key, cached[1], cached[0]['fetched_at'], 'STALE')
+    try:
+        snapshot = load_open5e_snapshot(path, request.args.to_dict())
+    except (ValueError, OSError) as e:
+        app.logger.error(f"Open5e snapshot error for {path}: {type(e).__name__}: {e}")
+        snapshot = None
+    if snapshot is not None:
+        return _send_open5e(key, snapshot, now, 'SNAPSHOT')
+    if upstream_status is not None and 400 <= upstream_status < 500:
+        return jsonify({'error': f'Open5e returned {upstream_status}'}), upstream_status
+    if OPEN5E_OFFLINE:
+        return jsonify({'error': 'Not available offline'}), 504
+    return jsonify({'error': 'Open5e is unavailable and nothing is cached'}), 502
+
 @app.route('/')
 def index():
-    """Serve index.html"""
-    return send_from_directory('static', 'index.html')
+    """Serve index.html with fingerprinted asset URLs"""
+    asset = render_index_asset()
+    if asset is None:
+        return send_from_directory('static', 'index.html')
+    return send_static_asset(asset)
 
 @app.route('/favicon.ico')
 def favicon():
@@ -85,8 +1609,57 @@ def favicon():
 
 @app.route('/<path:path>')
 def serve_static(path):
-    """Serve static files"""
-    return send_from_directory('static', path)
+    """Serve static files through the asset pipeline"""
+    return serve_static_path(path)
+
+# Flask's built-in static route (static_url_path='/') matches the same URLs
+# before serve_static, so send it through the pipeline as well.
+app.view_functions['static'] = lambda filename: serve_static_path(filename)
+
+def _save_export(filename, content):
+    """Write (or queue) a sanitized export and build the API response."""
+    file_path = EXPORT_DIR / filename
+    digest = content_digest(content)
+    remember_export_document(digest, content)
+    
+    if _wants_async_export():
+        try:
+            ticket_id = enqueue_export(file_path, content)
+        except queue.Full:
+            app.logger.warning(f"Export queue full, rejecting {filename}")
+            response = jsonify({'error': 'Export queue is full, retry shortly'})
+            response.headers['Retry-After'] = '1'
+            return response, 503
+        filename += EXPORT_FORMAT_SUFFIXES[EXPORT_FORMAT]
+        app.logger.info(f"Queued file: {filename} (ticket {ticket_id})")
+        response = jsonify({
+            'success': True,
+            'filename': filename,
+            'path': f'/exports/{filename}',
+            'digest': digest,
+            'ticket': ticket_id,
+            'status_url': f'/api/export/status/{ticket_id}'
+        })
+        response.headers['Location'] = f'/api/export/status/{ticket_id}'
+        return response, 202
+    
+    app.logger.info(f"Writing file: {filename} to {file_path}")
+    # Write file with proper JSON formatting (temp file + atomic rename),
+    # reusing the stored blob when the content is unchanged
+    filename, file_size, digest, deduplicated = store_export(file_path, content)
+    if deduplicated:
+        app.logger.info(f"✓ {filename} linked to existing export {digest[:12]} ({file_size} bytes)")
+    else:
+        app.logger.info(f"✓ {filename} successfully written to disk ({file_size} bytes)")
+    
+    return jsonify({
+        'success': True,
+        'filename': filename,
+        'path': f'/exports/{filename}',
+        'size': file_size,
+        'digest': digest,
+        'deduplicated': deduplicated
+    }), 200
 
 @app.route('/api/export', methods=['POST'])
 def export_character():
@@ -105,9 +1678,16 @@ def export_character():
         "filename": "Enwer_Cleric_lvl9_20251213_1716.json",
         "path": "/exports/Enwer_Cleric_lvl9_20251213_1716.json"
     }
+    
+    With ?async=1 (or "Prefer: respond-async") the write is queued and the
+    response is 202 with a "ticket" to poll at /api/export/status/<ticket>.
+    The body may be sent with Content-Encoding: gzip (or zstd).
     """
     try:
-        data = request.get_json(force=False, silent=True)
+        try:
+            data = _get_request_json()
+        except UnsupportedEncoding as e:
+            return jsonify({'error': f'Unsupported Content-Encoding: {e}'}), 415
         
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
@@ -124,48 +1704,251 @@ def export_character():
         # Sanitize filename to prevent path traversal
         filename = Path(filename).name
         
-        file_path = EXPORT_DIR / filename
+        return _save_export(filename, content)
+    
+    except Exception as e:
+        error_msg = f"{type(e).__name__}: {str(e)}"
+        app.logger.error(f"Export error: {error_msg}")
+        app.logger.debug(traceback.format_exc())
+        return jsonify({'error': error_msg}), 500
+
+@app.route('/api/export/delta', methods=['POST'])
+def export_character_delta():
+    """
+    Save an export as an RFC 6902 JSON Patch against an earlier version
+    
+    Request JSON:
+    {
+        "filename": "Enwer_Cleric_lvl9_20251213_1721.json",
+        "base": "<digest returned by the previous export>",
+        "patch": [{"op": "replace", "path": "/hp/current", "value": 31}]
+    }
+    
+    The full document is rebuilt on the server and stored like a normal
+    export. Returns 409 when the base is unknown (the client should resend
+    the full document) and 422 when the patch does not apply.
+    """
+    try:
+        try:
+            data = _get_request_json()
+        except UnsupportedEncoding as e:
+            return jsonify({'error': f'Unsupported Content-Encoding: {e}'}), 415
+        
+        if not data:
+            return jsonify({'error': 'No JSON data provided'}), 400
         
-        app.logger.info(f"Writing file: {filename} to {file_path}")
-        # Write file with proper JSON formatting
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=2, ensure_ascii=False)
+        filename = data.get('filename')
+        base = data.get('base')
+        patch = data.get('patch')
         
-        file_size = file_path.stat().st_size
-        app.logger.info(f"✓ {filename} successfully written to disk ({file_size} bytes)")
+        if not filename:
+            return jsonify({'error': 'Missing filename'}), 400
         
-        return jsonify({
-            'success': True,
-            'filename': filename,
-            'path': f'/exports/{filename}',
-            'size': file_size
-        }), 200
+        if not base:
+            return jsonify({'error': 'Missing base'}), 400
+        
+        if not isinstance(patch, list):
+            return jsonify({'error': 'Missing patch'}), 400
+        
+        base_document = load_export_document(base)
+        if base_document is None:
+            return jsonify({'error': 'Unknown base version', 'base': base}), 409
+        
+        try:
+            content = apply_json_patch(base_document, patch)
+        except JsonPatchError as e:
+            return jsonify({'error': f'Patch failed: {e}', 'base': base}), 422
+        
+        filename = Path(filename).name
+        app.logger.info(f"Applied {len(patch)} patch operation(s) to {base[:12]} for {filename}")
+        return _save_export(filename, content)
     
     except Exception as e:
         error_msg = f"{type(e).__name__}: {str(e)}"
-        app.logger.error(f"Export error: {error_msg}")
+        app.logger.error(f"Delta export error: {error_msg}")
         app.logger.debug(traceback.format_exc())
         return jsonify({'error': error_msg}), 500
 
+@app.route('/api/export/status/<ticket_id>', methods=['GET'])
+def export_status(ticket_id):
+    """Report the state of a queued export (queued, writing, done, error)"""
+    with EXPORT_TICKETS_LOCK:
+        ticket = EXPORT_TICKETS.get(ticket_id)
+        ticket = dict(ticket) if ticket is not None else None
+    if ticket is None:
+        return jsonify({'error': 'Unknown export ticket'}), 404
+    ticket['success'] = ticket['status'] != 'error'
+    ticket['pending'] = EXPORT_QUEUE.qsize()
+    return jsonify(ticket), 200
+
 @app.route('/api/exports', methods=['GET'])
 def list_exports():
-    """List all exported files"""
-    try:
-        files = []
-        for file_path in sorted(EXPORT_DIR.glob('*.json'), reverse=True):
-            files.append({
-                'filename': file_path.name,
-                'size': file_path.stat().st_size,
-                'modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-            })
+    """
+    List exported files, most recent first
+    
+    Query parameters (all optional):
+        limit      maximum number of exports to return
+        cursor     next_cursor from the previous page
+        character  only exports for this character name
+    
+    Response includes "total" (matching exports) and "next_cursor" when
+    more pages remain.
+    """
+    try:
+        limit = request.args.get('limit')
+        cursor = request.args.get('cursor')
+        character = (request.args.get('character') or '').strip().lower()
+        try:
+            limit = int(limit) if limit else None
+            if limit is not None and limit < 1:
+                raise ValueError
+        except ValueError:
+            return jsonify({'error': 'limit must be a positive integer'}), 400
+        
+        ordered = refresh_export_index()
+        keys = EXPORT_INDEX['keys']
+        start = 0
+        if cursor:
+            try:
+                start = bisect.bisect_right(keys, decode_export_cursor(cursor))
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
         
+        if character:
+            matching = [e for e in ordered[start:] if e['public']['character'] == character]
+            total = sum(1 for e in ordered if e['public']['character'] == character)
+        else:
+            matching = ordered[start:]
+            total = len(ordered)
+        
+        page = matching if limit is None else matching[:limit]
+        result = {
+            'success': True,
+            'count': len(page),
+            'total': total,
+            'exports': [dict(e['public']) for e in page]
+        }
+        if limit is not None and len(matching) > limit:
+            result['next_cursor'] = encode_export_cursor(page[-1])
+        return jsonify(result), 200
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/exports/prune', methods=['GET', 'POST'])
+def prune_exports_endpoint():
+    """
+    Export retention policy
+    
+    GET reports what would be deleted (dry run); POST prunes now.
+    """
+    try:
+        result = prune_exports(dry_run=request.method == 'GET')
+        result['success'] = True
+        result['count'] = len(result['delete'])
+        return jsonify(result), 200
+    except Exception as e:
+        app.logger.error(f"Retention error: {type(e).__name__}: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/exports/<filename>', methods=['GET', 'HEAD'])
+def get_export(filename):
+    """
+    Fetch a stored export
+    
+    Responses carry a strong ETag (sha256 of the body) and Last-Modified, so
+    If-None-Match / If-Modified-Since return 304, and Range returns 206.
+    Compressed exports are sent as-is with Content-Encoding when the client
+    accepts it, otherwise decompressed.
+    """
+    try:
+        file_path = resolve_export_path(filename)
+        if file_path is None:
+            return jsonify({'error': 'Export not found'}), 404
+        
+        st = file_path.stat()
+        signature = (st.st_size, st.st_mtime_ns, st.st_ino)
+        encoding = None
+        if not file_path.name.endswith('.json'):
+            encoding = 'gzip' if file_path.name.endswith('.gz') else 'zstd'
+            if encoding not in request.accept_encodings:
+                encoding = None
+        compressed_source = not file_path.name.endswith('.json')
+        key = (file_path.name, encoding)
+        modified = datetime.fromtimestamp(export_modified_time(file_path, st), tz=timezone.utc)
+        
+        etag = _cached_export_etag(key, signature)
+        if etag is not None and request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            data = file_path.read_bytes()
+            if compressed_source and encoding is None:
+                data = decode_export_bytes(data)
+            if etag is None:
+                etag = _store_export_etag(key, signature, data)
+            response = Response(data, mimetype='application/json')
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+        
+        response.set_etag(etag)
+        response.last_modified = modified
+        response.cache_control.no_cache = True
+        if compressed_source:
+            response.vary.add('Accept-Encoding')
+        if response.status_code == 200:
+            response.make_conditional(request, accept_ranges=True, complete_length=len(response.get_data()))
+        return response
+    
+    except Exception as e:
+        app.logger.error(f"Export fetch error: {type(e).__name__}: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/characters', methods=['GET'])
+def list_characters():
+    """List characters with their export count and latest export"""
+    try:
+        characters = query_characters()
+        return jsonify({'success': True, 'count': len(characters), 'characters': characters}), 200
+    except Exception as e:
+        app.logger.error(f"Character catalog error: {type(e).__name__}: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/characters/<name>/history', methods=['GET'])
+def character_history(name):
+    """Exports for one character, newest first (?limit=&offset=)"""
+    try:
+        try:
+            limit = int(request.args['limit']) if request.args.get('limit') else None
+            offset = int(request.args.get('offset') or 0)
+            if (limit is not None and limit < 1) or offset < 0:
+                raise ValueError
+        except ValueError:
+            return jsonify({'error': 'limit and offset must be positive integers'}), 400
+        history = query_character_history(name, limit, offset)
         return jsonify({
             'success': True,
-            'count': len(files),
-            'exports': files
+            'character': catalog_character_key(name),
+            'count': len(history),
+            'exports': history
         }), 200
-    
     except Exception as e:
+        app.logger.error(f"Character catalog error: {type(e).__name__}: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/exports/latest', methods=['GET'])
+@app.route('/api/characters/<name>/latest', methods=['GET'])
+def latest_export(name=None):
+    """Newest export overall or for one character; ?content=1 includes the document"""
+    try:
+        latest = query_latest_export(name)
+        if latest is None:
+            return jsonify({'error': 'No exports found'}), 404
+        result = {'success': True, 'export': latest}
+        if request.args.get('content') in ('1', 'true', 'yes'):
+            result['content'] = read_export_file(EXPORT_DIR / latest['filename'])
+        return jsonify(result), 200
+    except Exception as e:
+        app.logger.error(f"Character catalog error: {type(e).__name__}: {e}")
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
@@ -173,12 +1956,27 @@ if __name__ == '__main__':
     parser.add_argument('--host', default='localhost', help='Server host (default: localhost)')
     parser.add_argument('--port', type=int, default=8080, help='Server port (default: 8080)')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode (default: False)')
+    parser.add_argument('--offline', action='store_true', help='Serve Open5e requests from cache/snapshot only')
     
     args = parser.parse_args()
+    if args.offline:
+        OPEN5E_OFFLINE = True
     
     app.logger.info(f"Export directory: {EXPORT_DIR.absolute()}")
     app.logger.info(f"Starting Flask server at http://{args.host}:{args.port}")
     app.logger.info(f"API endpoint: POST /api/export")
+    app.logger.info(f"Export queue size: {EXPORT_QUEUE_MAXSIZE}")
+    app.logger.info(f"Export format: {EXPORT_FORMAT}")
+    app.logger.info(f"Unreferenced export blobs removed: {collect_export_blobs()}")
+    app.logger.info(f"Export catalog: {EXPORT_CATALOG_FILE}")
+    sync_export_catalog(force=True)
+    # With --debug the reloader runs this block in a watcher process and again
+    # in the serving child (WERKZEUG_RUN_MAIN=true); only the child prunes
+    if not RETENTION_ENABLED:
+        app.logger.info("Retention: disabled (set retention.enabled in config.json; GET /api/exports/prune previews it)")
+    elif (not args.debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true') and start_retention_worker():
+        app.logger.info(f"Retention: keep {MAX_EXPORTS_PER_CHARACTER} per character, prune after {EXPORT_PRUNE_DAYS} days")
+    app.logger.info(f"Open5e proxy: {OPEN5E_UPSTREAM} ({'offline, ' if OPEN5E_OFFLINE else ''}snapshot {OPEN5E_SNAPSHOT_DIR})")
     app.logger.info(f"Debug mode: {'enabled' if args.debug else 'disabled'}")
     app.logger.info(f"Log file: {log_file}")
     
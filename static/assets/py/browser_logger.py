@@ -1,5 +1,6 @@
 """Browser-based logging system with rolling 60-day window."""
 
+import asyncio
 import json
 from datetime import datetime, timedelta
 
@@ -10,7 +11,107 @@ except ImportError:
     class FakeConsole:
         def error(self, msg): print(f"[ERROR] {msg}")
         def log(self, msg): print(f"[LOG] {msg}")
+        def warn(self, msg): print(f"[WARN] {msg}")
     console = FakeConsole()
+    window = None
+
+try:
+    from storage import get_storage, write_behind
+except ImportError:
+    # Fallback - logs are written to localStorage on every entry
+    get_storage = None
+    write_behind = None
+
+
+# Storage key -> logs held in memory. Writes go out through write_behind; the
+# logs of earlier sessions are merged in by restore_log_data() at startup.
+_LOG_CACHE = {}
+_LOG_RESTORES = {}
+
+
+def _merge_logs(stored: dict, current: dict) -> dict:
+    merged = {}
+    for name in ("logs", "errors"):
+        seen = set()
+        entries = []
+        for entry in stored.get(name, []) + current.get(name, []):
+            marker = json.dumps(entry, sort_keys=True)
+            if marker not in seen:
+                seen.add(marker)
+                entries.append(entry)
+        merged[name] = sorted(entries, key=lambda entry: entry.get("timestamp", ""))
+    return merged
+
+
+def load_log_data(storage_key: str) -> dict:
+    """The in-memory logs, seeded from localStorage on first use."""
+    logs_data = _LOG_CACHE.get(storage_key)
+    if logs_data is None:
+        logs_data = {"logs": [], "errors": []}
+        try:
+            stored = window.localStorage.getItem(storage_key)
+            if stored:
+                logs_data = json.loads(stored)
+        except Exception:
+            pass
+        _LOG_CACHE[storage_key] = logs_data
+    return logs_data
+
+
+async def _restore_log_data(storage_key: str, prune) -> dict:
+    try:
+        storage = await get_storage()
+        stored = await storage.get("logs", storage_key)
+    except Exception as exc:
+        console.warn(f"PySheet: could not restore logs ({exc})")
+        return load_log_data(storage_key)
+    # Read memory after the await so entries logged meanwhile are kept
+    logs_data = load_log_data(storage_key)
+    if stored:
+        logs_data = _merge_logs(json.loads(stored), logs_data)
+    if prune is not None:
+        prune(logs_data)
+    _LOG_CACHE[storage_key] = logs_data
+    legacy = window.localStorage.getItem(storage_key) if window is not None else None
+    if legacy:
+        # Move the pre-IndexedDB copy into the "logs" store, then free its quota
+        try:
+            await storage.set("logs", storage_key, json.dumps(logs_data))
+            window.localStorage.removeItem(storage_key)
+        except Exception as exc:
+            console.warn(f"PySheet: could not move logs out of localStorage ({exc})")
+    return logs_data
+
+
+async def restore_log_data(storage_key: str, prune=None) -> dict:
+    """Merge the logs of earlier sessions into memory, once per key.
+
+    prune(logs_data) applies the logger's window and caps to the merged logs.
+    """
+    if get_storage is None:
+        return load_log_data(storage_key)
+    restore = _LOG_RESTORES.get(storage_key)
+    if restore is None:
+        restore = _LOG_RESTORES[storage_key] = asyncio.ensure_future(_restore_log_data(storage_key, prune))
+    await restore
+    return _LOG_CACHE[storage_key]
+
+
+async def _log_json(storage_key: str, prune) -> str:
+    # Never overwrite stored logs that have not been merged in yet
+    return json.dumps(await restore_log_data(storage_key, prune))
+
+
+def save_log_data(storage_key: str, logs_data: dict, prune=None):
+    """Keep logs_data in memory and persist it without blocking the caller."""
+    _LOG_CACHE[storage_key] = logs_data
+    if write_behind is not None:
+        write_behind("logs", storage_key, lambda: _log_json(storage_key, prune))
+        return
+    try:
+        window.localStorage.setItem(storage_key, json.dumps(logs_data))
+    except Exception:
+        pass
 
 
 class BrowserLogger:
@@ -22,18 +123,17 @@ class BrowserLogger:
     
     @staticmethod
     def _load_logs() -> dict:
-        """Load logs from browser storage."""
-        try:
-            logs_json = window.localStorage.getItem(BrowserLogger.STORAGE_KEY)
-            if logs_json:
-                return json.loads(logs_json)
-        except Exception:
-            pass
-        return {"logs": [], "errors": []}
+        """Load logs from memory (see load_log_data)."""
+        return load_log_data(BrowserLogger.STORAGE_KEY)
     
     @staticmethod
-    def _save_logs(logs_data: dict):
-        """Save logs to browser storage with pruning."""
+    async def restore():
+        """Load the logs stored by earlier sessions (scheduled at import)."""
+        await restore_log_data(BrowserLogger.STORAGE_KEY, BrowserLogger._prune_logs)
+    
+    @staticmethod
+    def _prune_logs(logs_data: dict):
+        """Apply the rolling window and entry cap in place."""
         # Remove logs older than rolling window
         now = datetime.now()
         cutoff_date = now - timedelta(days=BrowserLogger.ROLLING_WINDOW_DAYS)
@@ -46,11 +146,12 @@ class BrowserLogger:
         # Limit total entries
         if len(logs_data["logs"]) > BrowserLogger.MAX_LOG_ENTRIES:
             logs_data["logs"] = logs_data["logs"][-BrowserLogger.MAX_LOG_ENTRIES:]
-        
-        try:
-            window.localStorage.setItem(BrowserLogger.STORAGE_KEY, json.dumps(logs_data))
-        except Exception:
-            pass
+    
+    @staticmethod
+    def _save_logs(logs_data: dict):
+        """Save logs to browser storage with pruning."""
+        BrowserLogger._prune_logs(logs_data)
+        save_log_data(BrowserLogger.STORAGE_KEY, logs_data, BrowserLogger._prune_logs)
     
     @staticmethod
     def _parse_date(timestamp_str: str) -> str:
@@ -116,3 +217,10 @@ class BrowserLogger:
             "logs_by_date": logs_by_date,
             "storage_bytes": len(json.dumps(logs_data))
         }
+
+
+# Merge in the logs of earlier sessions before anything reads them
+try:
+    asyncio.get_running_loop().create_task(BrowserLogger.restore())
+except RuntimeError:
+    pass  # No event loop outside the browser
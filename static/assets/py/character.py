@@ -7,6 +7,7 @@ import json
 import re
 import sys
 import uuid
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from html import escape
 from math import floor
@@ -94,6 +95,75 @@ else:
 
 console.log(f"DEBUG: sys.path after update: {sys.path[:3]}...")
 
+# One-request module bundle (GET /api/py-bundle) written to the virtual FS,
+# replacing the per-module open_url fetches below when the server offers it.
+PY_BUNDLE_URL = "/api/py-bundle?format=json"
+PY_BUNDLE_SKIP = {"character"}  # the running entry script must not be imported twice
+
+
+def _py_bundle_hash(modules: dict) -> str:
+    """sha256 over sorted (name, source) pairs, matching backend.py_bundle_hash."""
+    import hashlib
+    digest = hashlib.sha256()
+    for name in sorted(modules):
+        digest.update(name.encode("utf-8") + b"\0" + modules[name].encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _install_py_bundle(url: str = PY_BUNDLE_URL, target_root: Optional[Path] = None) -> list:
+    """Fetch every module in one request and make them importable.
+
+    Sources are written to <target_root>/<hash prefix>/ and that directory is
+    put first on sys.path. Returns the installed module names, or [] when the
+    modules are already importable or the bundle is unavailable/corrupt.
+    """
+    if importlib.util.find_spec("character_models") is not None:
+        return []
+    try:
+        manifest = json.loads(open_url(url).read())
+        modules = manifest["modules"]
+        bundle_hash = manifest["hash"]
+    except Exception as exc:
+        console.warn(f"DEBUG: [bundle] unavailable, falling back to per-module loading: {exc}")
+        return []
+    if _py_bundle_hash(modules) != bundle_hash:
+        console.error("DEBUG: [bundle] hash mismatch, ignoring bundle")
+        return []
+
+    target_dir = (target_root or Path.cwd() / "pysheet_bundle") / bundle_hash[:12]
+    installed = []
+    try:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for name, source in modules.items():
+            if name in PY_BUNDLE_SKIP:
+                continue
+            module_path = target_dir / f"{name}.py"
+            if not module_path.exists():
+                module_path.write_text(source, encoding="utf-8")
+            installed.append(name)
+    except OSError as exc:
+        console.warn(f"DEBUG: [bundle] could not write modules: {exc}")
+        return []
+    if str(target_dir) not in sys.path:
+        sys.path.insert(0, str(target_dir))
+    importlib.invalidate_caches()
+    console.log(f"DEBUG: [bundle] installed {len(installed)} modules from {bundle_hash[:12]}")
+    return installed
+
+
+if _install_py_bundle():
+    # Retry the optional imports that ran before the bundle was available
+    if WeaponToHitValue is None:
+        try:
+            from tooltip_values import WeaponToHitValue
+        except ImportError:
+            pass
+    if export_management is None:
+        try:
+            import export_management
+        except ImportError:
+            pass
+
 try:
     from character_models import (
         Character,
@@ -164,10 +234,11 @@ except ImportError:
     Entity = Spell = Ability = Resource = Equipment = Weapon = Armor = Shield = None
 
 try:
-    from browser_logger import BrowserLogger
+    from browser_logger import BrowserLogger, load_log_data, restore_log_data, save_log_data
 except ImportError:
     # Fallback - BrowserLogger will be defined inline if needed
     BrowserLogger = None
+    load_log_data = restore_log_data = save_log_data = None
 
 try:
     from spell_data import (
@@ -181,6 +252,16 @@ try:
         SPELLCASTING_PROGRESSION_TABLES,
         STANDARD_SLOT_TABLE,
         PACT_MAGIC_TABLE,
+        normalize_class_token,
+        sanitize_spell_record,
+        sanitize_spell_list,
+        SPELL_CACHE_VERSION,
+        encode_spell_cache,
+        decode_spell_cache,
+        save_spell_cache as store_spell_cache,
+        OPEN5E_PROXY_PREFIX,
+        fetch_open5e_json,
+        fetch_open5e_spells,
     )
     console.log(f"DEBUG: spell_data import succeeded - CLASS_CASTING_PROGRESSIONS keys: {list(CLASS_CASTING_PROGRESSIONS.keys())}")
 except ImportError as e:
@@ -216,6 +297,29 @@ except ImportError as e:
     SPELLCASTING_PROGRESSION_TABLES = {}
     STANDARD_SLOT_TABLE = {}
     PACT_MAGIC_TABLE = {}
+    normalize_class_token = lambda token: " ".join((token or "").lower().split()) or None
+    sanitize_spell_record = lambda raw: None
+    sanitize_spell_list = lambda raw_spells: []
+    SPELL_CACHE_VERSION = 5
+    encode_spell_cache = lambda spells, omit=(): ""
+    decode_spell_cache = lambda text: None
+    store_spell_cache = lambda storage, key, spells, legacy_keys=(): False
+    OPEN5E_PROXY_PREFIX = "/api/open5e"
+
+    async def fetch_open5e_json(url):
+        raise RuntimeError("spell_data is unavailable")
+
+    async def fetch_open5e_spells(on_page=None, on_status=None):
+        return []
+
+try:
+    from storage import get_storage, write_behind
+except ImportError:
+    # Fallback - caches stay in synchronous localStorage
+    get_storage = None
+    write_behind = None
+
+from proxy_registry import track_proxy, release_proxies, release_proxy, live_proxy_counts
 
 # Manual HTTP fetch for spellcasting module (workaround for Pyodide path resolution)
 def _load_module_from_http_sync(module_name: str, url: str, _retry: bool = True):
@@ -321,7 +425,7 @@ def _ensure_manager_loaded(module_name: str, attr_name: str, http_url: str | Non
 
 # Try standard import first
 try:
-    from spellcasting import SpellcastingManager, SPELL_LIBRARY_STATE, set_spell_library_data, load_spell_library
+    from spellcasting import SpellcastingManager, SPELL_LIBRARY_STATE, set_spell_library_data, load_spell_library, query_spell_index
     console.log("DEBUG: spellcasting module imported successfully on first try")
 except ImportError as e:
     console.log("DEBUG: *** FALLBACK 1 TRIGGERED ***")
@@ -335,7 +439,7 @@ except ImportError as e:
             sys.path.insert(0, str(assets_py))
             console.log(f"DEBUG: Added {assets_py} to sys.path[0]")
         
-        from spellcasting import SpellcastingManager, SPELL_LIBRARY_STATE, set_spell_library_data, load_spell_library
+        from spellcasting import SpellcastingManager, SPELL_LIBRARY_STATE, set_spell_library_data, load_spell_library, query_spell_index
         console.log("DEBUG: spellcasting module imported successfully on retry")
     except ImportError as e2:
         # Fallback 2: Try HTTP fetch with open_url
@@ -371,6 +475,7 @@ except ImportError as e:
                 SPELL_LIBRARY_STATE = spellcasting_module.SPELL_LIBRARY_STATE
                 set_spell_library_data = spellcasting_module.set_spell_library_data
                 load_spell_library = spellcasting_module.load_spell_library
+                query_spell_index = getattr(spellcasting_module, "query_spell_index", None)
                 console.log("DEBUG: spellcasting module loaded via HTTP successfully")
             else:
                 raise ImportError("HTTP fetch returned None")
@@ -382,9 +487,22 @@ except ImportError as e:
             SPELL_LIBRARY_STATE = {}
             set_spell_library_data = lambda x: None
             load_spell_library = lambda x=None: None
+            query_spell_index = None
             apply_spell_filters = lambda auto_select=False: None
             sync_prepared_spells_with_library = lambda: None
 
+def _parse_item_notes(item: dict) -> dict:
+    """Uncached notes-JSON parser used when equipment_management is unavailable."""
+    notes = item.get("notes", "") if isinstance(item, dict) else ""
+    if not notes or not isinstance(notes, str) or not notes.startswith("{"):
+        return {}
+    try:
+        values = json.loads(notes)
+    except (ValueError, TypeError):
+        return {}
+    return values if isinstance(values, dict) else {}
+
+
 try:
     from equipment_management import (
         InventoryManager,
@@ -397,6 +515,8 @@ try:
         format_weight,
         get_armor_type,
         get_armor_ac,
+        get_item_properties,
+        summarize_item_modifiers,
         ARMOR_TYPES,
         ARMOR_AC_VALUES,
     )
@@ -419,6 +539,8 @@ except ImportError as e:
         format_weight = getattr(equipment_module, "format_weight", lambda x: str(x))
         get_armor_type = getattr(equipment_module, "get_armor_type", lambda x: "unknown")
         get_armor_ac = getattr(equipment_module, "get_armor_ac", lambda x: None)
+        get_item_properties = getattr(equipment_module, "get_item_properties", _parse_item_notes)
+        summarize_item_modifiers = getattr(equipment_module, "summarize_item_modifiers", None)
         ARMOR_TYPES = getattr(equipment_module, "ARMOR_TYPES", {})
         ARMOR_AC_VALUES = getattr(equipment_module, "ARMOR_AC_VALUES", {})
         console.log("DEBUG: equipment_management module loaded via HTTP successfully")
@@ -431,6 +553,8 @@ except ImportError as e:
         format_weight = lambda x: str(x)
         get_armor_type = lambda x: "unknown"
         get_armor_ac = lambda x: None
+        get_item_properties = _parse_item_notes
+        summarize_item_modifiers = None
         ARMOR_TYPES = {}
         ARMOR_AC_VALUES = {}
 
@@ -549,7 +673,9 @@ class BrowserLogger:
     
     @staticmethod
     def _load_logs():
-        """Load logs from localStorage."""
+        """Load logs from memory, or localStorage without browser_logger."""
+        if load_log_data is not None:
+            return load_log_data(BrowserLogger.STORAGE_KEY)
         try:
             stored = window.localStorage.getItem(BrowserLogger.STORAGE_KEY)
             if stored:
@@ -558,36 +684,49 @@ class BrowserLogger:
             pass
         return {"logs": [], "errors": []}
     
+    @staticmethod
+    async def restore():
+        """Load the logs stored by earlier sessions (scheduled at startup)."""
+        if restore_log_data is not None:
+            await restore_log_data(BrowserLogger.STORAGE_KEY, BrowserLogger._prune_logs)
+    
+    @staticmethod
+    def _prune_logs(logs_data):
+        """Drop entries older than MAX_DAYS and cap today's entries, in place."""
+        # Prune old entries (> 60 days)
+        cutoff_date = datetime.now()
+        from datetime import timedelta
+        cutoff_date = cutoff_date - timedelta(days=BrowserLogger.MAX_DAYS)
+        cutoff_iso = cutoff_date.isoformat()
+        
+        # Filter logs and errors to keep only recent entries
+        logs_data["logs"] = [
+            entry for entry in logs_data.get("logs", [])
+            if entry.get("timestamp", "") >= cutoff_iso
+        ]
+        logs_data["errors"] = [
+            entry for entry in logs_data.get("errors", [])
+            if entry.get("timestamp", "") >= cutoff_iso
+        ]
+        
+        # Limit entries per day to prevent runaway growth
+        today = datetime.now().strftime("%Y-%m-%d")
+        today_logs = [e for e in logs_data["logs"] if e.get("timestamp", "").startswith(today)]
+        if len(today_logs) > BrowserLogger.MAX_ENTRIES_PER_DAY:
+            # Keep only the first MAX_ENTRIES_PER_DAY from today
+            today_old = logs_data["logs"][-len(today_logs) + BrowserLogger.MAX_ENTRIES_PER_DAY:]
+            past_logs = [e for e in logs_data["logs"] if not e.get("timestamp", "").startswith(today)]
+            logs_data["logs"] = past_logs + today_old
+    
     @staticmethod
     def _save_logs(logs_data):
-        """Save logs to localStorage with pruning."""
+        """Prune and save logs (write-behind through browser_logger)."""
         try:
-            # Prune old entries (> 60 days)
-            cutoff_date = datetime.now()
-            from datetime import timedelta
-            cutoff_date = cutoff_date - timedelta(days=BrowserLogger.MAX_DAYS)
-            cutoff_iso = cutoff_date.isoformat()
-            
-            # Filter logs and errors to keep only recent entries
-            logs_data["logs"] = [
-                entry for entry in logs_data.get("logs", [])
-                if entry.get("timestamp", "") >= cutoff_iso
-            ]
-            logs_data["errors"] = [
-                entry for entry in logs_data.get("errors", [])
-                if entry.get("timestamp", "") >= cutoff_iso
-            ]
-            
-            # Limit entries per day to prevent runaway growth
-            today = datetime.now().strftime("%Y-%m-%d")
-            today_logs = [e for e in logs_data["logs"] if e.get("timestamp", "").startswith(today)]
-            if len(today_logs) > BrowserLogger.MAX_ENTRIES_PER_DAY:
-                # Keep only the first MAX_ENTRIES_PER_DAY from today
-                today_old = logs_data["logs"][-len(today_logs) + BrowserLogger.MAX_ENTRIES_PER_DAY:]
-                past_logs = [e for e in logs_data["logs"] if not e.get("timestamp", "").startswith(today)]
-                logs_data["logs"] = past_logs + today_old
-            
-            window.localStorage.setItem(BrowserLogger.STORAGE_KEY, json.dumps(logs_data))
+            BrowserLogger._prune_logs(logs_data)
+            if save_log_data is not None:
+                save_log_data(BrowserLogger.STORAGE_KEY, logs_data, BrowserLogger._prune_logs)
+            else:
+                window.localStorage.setItem(BrowserLogger.STORAGE_KEY, json.dumps(logs_data))
         except Exception as exc:
             console.warn(f"PySheet: failed to save logs - {exc}")
     
@@ -1087,11 +1226,26 @@ SPELL_FIELDS = {
     "notes": "spell_notes",
 }
 
-OPEN5E_SPELLS_ENDPOINT = "https://api.open5e.com/spells/?limit=200&ordering=name"
-OPEN5E_MAX_PAGES = 15
-MAX_SPELL_RENDER = 200
-SPELL_CACHE_VERSION = 4
+# Goes through the backend's Open5e proxy like the spell pages (see spell_data)
+OPEN5E_WEAPONS_ENDPOINT = f"{OPEN5E_PROXY_PREFIX}/weapons/?limit=1000"
+# Pre-sanitized library served by backend.py; records skip sanitize_spell_list
+SPELL_LIBRARY_ENDPOINT = "/api/spells"
+# Windowed spell results: estimated collapsed card height (including the grid
+# gap) until a card is measured, cards rendered beyond each viewport edge, and
+# the minimum window used while the results panel is hidden.
+SPELL_CARD_ESTIMATED_HEIGHT = 72
+SPELL_CARD_GAP_PX = 14
+SPELL_RENDER_OVERSCAN = 6
+SPELL_RENDER_MIN_WINDOW = 24
+# Same format as spellcasting.py's cache (spell_data.SPELL_CACHE_VERSION), own key
 SPELL_LIBRARY_STORAGE_KEY = f"pysheet.spells.v{SPELL_CACHE_VERSION}"
+# Earlier cache formats; removed to free quota when a save does not fit.
+# spellcasting.py's live cache (spell_data.SPELL_LIBRARY_STORAGE_KEY) is not one of them.
+SPELL_CACHE_LEGACY_KEYS = [f"pysheet.spells.v{version}" for version in range(1, SPELL_CACHE_VERSION)]
+# Per-record storage (IndexedDB) keeps descriptions out of the index, one
+# record per slug, loaded in the background or when a card is opened
+SPELL_DESCRIPTION_STORE = "spell_descriptions"
+SPELL_DESCRIPTION_BATCH = 100
 
 # Allowed spell sources (only from these books)
 # Maps from Open5e document titles/slugs to abbreviations we accept
@@ -1135,9 +1289,9 @@ EQUIPMENT_LIBRARY_STATE = {
     "loaded": False,
     "equipment": [],
     "equipment_map": {},
+    "name_index": None,
 }
 
-_EVENT_PROXIES: list = []
 _EQUIPMENT_RESULT_PROXY = None  # Track the current equipment results listener to remove it
 _DOMAIN_SPELL_SYNCING = False
 
@@ -1313,9 +1467,8 @@ def _extract_weapon_properties(weapon: dict) -> tuple[int, str, str, str, str, b
     
     # Try to parse properties from notes JSON (primary source)
     try:
-        notes_str = weapon.get("notes", "")
-        if notes_str and notes_str.startswith("{"):
-            extra_props = json.loads(notes_str)
+        extra_props = _inventory_item_properties(weapon)
+        if extra_props:
             weapon_damage = extra_props.get("damage", weapon_damage)
             weapon_damage_type = extra_props.get("damage_type", weapon_damage_type)
             weapon_range = extra_props.get("range", weapon_range)
@@ -1501,10 +1654,8 @@ def render_weapons_grid():
         name_text = weapon.get("name", "Unknown")
         bonus = 0
         try:
-            notes_str = weapon.get("notes", "")
-            if notes_str and notes_str.startswith("{"):
-                extra_props = json.loads(notes_str)
-                bonus = extra_props.get("bonus", 0)
+            extra_props = _inventory_item_properties(weapon)
+            bonus = extra_props.get("bonus", 0)
         except:
             bonus = 0
         
@@ -1777,6 +1928,7 @@ def set_form_value(element_id: str, value):
     element = get_element(element_id)
     if element is None:
         return
+    _LAST_INPUT_VALUES.pop(element_id, None)
     tag = element.tagName.lower()
     if getattr(element, "type", "").lower() == "checkbox":
         element.checked = bool(value)
@@ -1869,32 +2021,6 @@ def is_truthy(value) -> bool:
     return False
 
 
-def normalize_class_token(token: Optional[str]) -> str | None:
-    if not token:
-        return None
-    cleaned = token.replace("’", "'")
-    cleaned = re.sub(r"\(.*?\)", "", cleaned)
-    cleaned = cleaned.replace("-", " ")
-    cleaned = " ".join(cleaned.lower().split())
-    if not cleaned:
-        return None
-    for canonical, synonyms in SPELL_CLASS_SYNONYMS.items():
-        if cleaned == canonical:
-            return canonical
-        if cleaned in synonyms:
-            return canonical
-        for synonym in synonyms:
-            if cleaned == synonym:
-                return canonical
-    for canonical, synonyms in SPELL_CLASS_SYNONYMS.items():
-        if cleaned.startswith(canonical):
-            return canonical
-        for synonym in synonyms:
-            if cleaned.startswith(synonym):
-                return canonical
-    return None
-
-
 def extract_character_classes(raw_text: Optional[str] = None) -> list[dict]:
     if raw_text is None:
         raw_text = get_text_value("class")
@@ -2059,9 +2185,11 @@ def handle_add_spell_click(event, slug: str):
                 button_el.classList.remove("deny-blink")
             except:
                 pass
+            # One-shot timer callback: free it as soon as it has fired.
+            release_proxy("character.deny-blink", remove_anim_proxy)
+        remove_anim_proxy = None
         try:
-            remove_anim_proxy = create_proxy(remove_anim)
-            _EVENT_PROXIES.append(remove_anim_proxy)
+            remove_anim_proxy = track_proxy("character.deny-blink", create_proxy(remove_anim))
             if document is not None and getattr(document, "defaultView", None) is not None:
                 document.defaultView.setTimeout(remove_anim_proxy, 600)
             elif window is not None and hasattr(window, "setTimeout"):
@@ -2142,6 +2270,53 @@ def get_armor_ac(armor_name: str) -> int:
     return None
 
 
+_EMPTY_MODIFIER_SUMMARY = {
+    "shield_bonus": 0,
+    "ac_modifier": 0,
+    "saves_modifier": 0,
+    "ac_rows": [],
+    "armor": None,
+    "equipped_armor": None,
+    "weapon_bonuses": {},
+}
+
+
+def _inventory_modifier_summary() -> dict:
+    """Return the inventory's AC/save/to-hit aggregates.
+
+    Uses the index maintained by InventoryManager; lightweight managers that
+    only expose ``items`` get a one-off scan instead.
+    """
+    if INVENTORY_MANAGER is None:
+        return _EMPTY_MODIFIER_SUMMARY
+    getter = getattr(INVENTORY_MANAGER, "get_modifier_summary", None)
+    if callable(getter):
+        summary = getter()
+        if isinstance(summary, dict):
+            return summary
+    items = getattr(INVENTORY_MANAGER, "items", None)
+    if summarize_item_modifiers is not None and isinstance(items, list):
+        return summarize_item_modifiers(items)
+    return _EMPTY_MODIFIER_SUMMARY
+
+
+def _inventory_item_properties(item: dict) -> dict:
+    """Parsed notes JSON of an item, cached by the inventory for items it owns."""
+    getter = getattr(INVENTORY_MANAGER, "get_item_properties", None)
+    if callable(getter):
+        values = getter(item)
+        if isinstance(values, dict):
+            return values
+    return get_item_properties(item)
+
+
+def _refresh_inventory_item(item_id):
+    """Tell the inventory index that an item dict was edited in place."""
+    refresh = getattr(INVENTORY_MANAGER, "refresh_item", None)
+    if callable(refresh):
+        refresh(item_id)
+
+
 def generate_ac_tooltip() -> tuple[int, str]:
     """
     Generate AC tooltip showing breakdown of components.
@@ -2160,21 +2335,11 @@ def generate_ac_tooltip() -> tuple[int, str]:
     armor_ac = None
     armor_name = None
     armor_type = None
-    if INVENTORY_MANAGER is not None:
-        for item in INVENTORY_MANAGER.items:
-            if item.get("category") == "Armor" and item.get("qty", 0) > 0:
-                try:
-                    notes_str = item.get("notes", "")
-                    if notes_str and notes_str.startswith("{"):
-                        extra_props = json.loads(notes_str)
-                        ac_val = extra_props.get("armor_class", extra_props.get("ac"))
-                        if ac_val:
-                            armor_ac = int(ac_val)
-                            armor_name = item.get("name", "Unknown Armor")
-                            armor_type = get_armor_type(armor_name)
-                            break
-                except:
-                    pass
+    modifiers = _inventory_modifier_summary()
+    armor = modifiers["equipped_armor"] or modifiers["armor"]
+    if armor is not None:
+        armor_ac, armor_name = armor
+        armor_type = get_armor_type(armor_name)
     
     # Build breakdown
     rows = []
@@ -2201,44 +2366,9 @@ def generate_ac_tooltip() -> tuple[int, str]:
         base_ac = 10 + dex_mod
     
     # Add item modifiers including shields
-    item_ac_mod = 0
-    shield_bonus = 0
-    item_mods = []
-    if INVENTORY_MANAGER is not None:
-        for item in INVENTORY_MANAGER.items:
-            try:
-                # Only process equipped items
-                if not item.get("equipped"):
-                    continue
-                    
-                item_name = item.get("name", "").lower()
-                category = item.get("category", "").lower()
-                notes_str = item.get("notes", "")
-                extra_props = {}
-                
-                if notes_str and notes_str.startswith("{"):
-                    extra_props = json.loads(notes_str)
-                
-                # Check if this is a shield
-                is_shield = ("shield" in item_name or category == "shield")
-                
-                if is_shield:
-                    # Shields: +2 base bonus + magical bonus
-                    bonus_val = int(extra_props.get("bonus", 0))
-                    shield_bonus_val = 2 + bonus_val
-                    shield_bonus += shield_bonus_val
-                    item_mods.append((item.get("name", "Unknown"), shield_bonus_val, True))  # True = is_shield
-                else:
-                    # Other items: ac_modifier
-                    if extra_props.get("armor_only", False):
-                        continue
-                    ac_mod = extra_props.get("ac_modifier", 0)
-                    if ac_mod:
-                        ac_mod = int(ac_mod)
-                        item_ac_mod += ac_mod
-                        item_mods.append((item.get("name", "Unknown"), ac_mod, False))  # False = not shield
-            except:
-                pass
+    item_ac_mod = modifiers["ac_modifier"]
+    shield_bonus = modifiers["shield_bonus"]
+    item_mods = modifiers["ac_rows"]
     
     if item_mods:
         rows.append('<div style="margin-top: 0.4rem; border-top: 1px solid rgba(148, 163, 184, 0.2); padding-top: 0.4rem;"></div>')
@@ -2265,18 +2395,7 @@ def generate_save_tooltip(ability: str, ability_score: int, proficient: bool, pr
         rows.append(f'<div class="tooltip-row"><span class="tooltip-label">Proficiency</span><span class="tooltip-value">{format_bonus(proficiency)}</span></div>')
     
     # Add saves modifiers from items
-    item_saves_mod = 0
-    if INVENTORY_MANAGER is not None:
-        for item in INVENTORY_MANAGER.items:
-            try:
-                notes_str = item.get("notes", "")
-                if notes_str and notes_str.startswith("{"):
-                    extra_props = json.loads(notes_str)
-                    saves_mod = extra_props.get("saves_modifier", 0)
-                    if saves_mod:
-                        item_saves_mod += int(saves_mod)
-            except:
-                pass
+    item_saves_mod = _inventory_modifier_summary()["saves_modifier"]
     
     if item_saves_mod:
         rows.append('<div style="margin-top: 0.4rem; border-top: 1px solid rgba(148, 163, 184, 0.2); padding-top: 0.4rem;"></div>')
@@ -2330,59 +2449,16 @@ def calculate_armor_class() -> int:
     
     print(f"[AC-CALC] Starting AC calculation: DEX {dex_score} (mod {dex_mod})")
     
-    # Check for equipped armor in inventory (priority)
+    # Equipped armor takes priority over armor that is only carried
     armor_ac = None
     armor_name = None
     armor_type = None
-    
-    if INVENTORY_MANAGER is not None:
-        # First, look for equipped armor
-        for item in INVENTORY_MANAGER.items:
-            if item.get("equipped") and is_equipable(item):
-                item_name = item.get("name", "").lower()
-                
-                # Check if it's armor (exclude weapons)
-                armor_keywords = ["plate", "leather", "chain", "hide", "scale", "mail", "breastplate", "armor"]
-                weapon_keywords = ["sword", "axe", "bow", "spear", "mace", "staff", "dagger", "rapier", "crossbow", "club", "flail", "hammer", "lance", "pike", "scimitar"]
-                
-                is_armor = any(kw in item_name for kw in armor_keywords)
-                is_weapon = any(kw in item_name for kw in weapon_keywords)
-                
-                if is_armor and not is_weapon:
-                    # Found equipped armor
-                    try:
-                        notes_str = item.get("notes", "")
-                        if notes_str and notes_str.startswith("{"):
-                            extra_props = json.loads(notes_str)
-                            ac_val = extra_props.get("armor_class", extra_props.get("ac"))
-                            if ac_val:
-                                armor_ac = int(ac_val)
-                                armor_name = item.get("name", "Unknown Armor")
-                                armor_type = get_armor_type(armor_name)
-                                print(f"[AC-CALC] Found armor: {armor_name}, AC={armor_ac}, type={armor_type}")
-                                break  # Use first equipped armor found
-                    except:
-                        pass
-        
-        # If no equipped armor found, look for any armor
-        if armor_ac is None:
-            for item in INVENTORY_MANAGER.items:
-                category = item.get("category", "")
-                if category == "Armor" and item.get("qty", 0) > 0:
-                    # Found an armor item - try to get its AC
-                    try:
-                        notes_str = item.get("notes", "")
-                        if notes_str and notes_str.startswith("{"):
-                            extra_props = json.loads(notes_str)
-                            ac_val = extra_props.get("armor_class", extra_props.get("ac"))
-                            if ac_val:
-                                armor_ac = int(ac_val)
-                                armor_name = item.get("name", "Unknown Armor")
-                                armor_type = get_armor_type(armor_name)
-                                print(f"[AC-CALC] Found armor (fallback): {armor_name}, AC={armor_ac}, type={armor_type}")
-                                break  # Use first armor found
-                    except:
-                        pass
+    modifiers = _inventory_modifier_summary()
+    armor = modifiers["equipped_armor"] or modifiers["armor"]
+    if armor is not None:
+        armor_ac, armor_name = armor
+        armor_type = get_armor_type(armor_name)
+        print(f"[AC-CALC] Found armor: {armor_name}, AC={armor_ac}, type={armor_type}")
     
     # Calculate base AC
     if armor_ac is not None:
@@ -2408,37 +2484,8 @@ def calculate_armor_class() -> int:
     # Add AC modifiers from equipped items
     # Shields add +2 base bonus + magical bonus
     # AC modifiers from other items add to AC (e.g. Ring of Protection)
-    item_ac_mod = 0
-    shield_bonus = 0
-    if INVENTORY_MANAGER is not None:
-        for item in INVENTORY_MANAGER.items:
-            try:
-                # Only process equipped items
-                if item.get("equipped"):
-                    item_name = item.get("name", "").lower()
-                    category = item.get("category", "").lower()
-                    notes_str = item.get("notes", "")
-                    extra_props = {}
-                    
-                    if notes_str and notes_str.startswith("{"):
-                        extra_props = json.loads(notes_str)
-                    
-                    # Check if this is a shield
-                    is_shield = ("shield" in item_name or category == "shield")
-                    
-                    if is_shield:
-                        # Shields: +2 base bonus + magical bonus
-                        bonus_val = extra_props.get("bonus", 0)
-                        shield_bonus += 2 + bonus_val
-                        print(f"[AC-CALC] Found shield: {item.get('name')}, bonus={2 + bonus_val}")
-                    else:
-                        # Other items: ac_modifier
-                        ac_mod = extra_props.get("ac_modifier", 0)
-                        if ac_mod:
-                            item_ac_mod += int(ac_mod)
-                            print(f"[AC-CALC] AC modifier from {item.get('name')}: {ac_mod}")
-            except:
-                pass
+    item_ac_mod = modifiers["ac_modifier"]
+    shield_bonus = modifiers["shield_bonus"]
     
     final_ac = max(1, base_ac + shield_bonus + item_ac_mod)
     print(f"[AC-CALC] FINAL AC: {base_ac} (base) + {shield_bonus} (shields) + {item_ac_mod} (mods) = {final_ac}")
@@ -2648,64 +2695,79 @@ def _update_hp_display(current_hp, max_hp, temp_hp):
     set_text("hp-bar-label", hp_label)
 
 
-def update_calculations(*_args):
-    scores = gather_scores()
+# ---------------------------------------------------------------------------
+# Incremental recalculation
+# ---------------------------------------------------------------------------
+# update_calculations() is split into named sections. Each section reads a
+# handful of form fields and repaints a fixed set of DOM targets, and
+# CALCULATION_DEPENDENCIES maps every character input to the sections that
+# consume it. An input event only recomputes the sections downstream of the
+# field that changed; unknown fields fall back to a full recompute.
+
+def _build_calculation_context() -> dict:
+    """Read the base values shared by most calculation sections."""
     level = get_numeric_value("level", 1)
-    proficiency = compute_proficiency(level)
     race = get_text_value("race")
-    race_bonuses = get_race_ability_bonuses(race)
-    
-    # Get and normalize class name
-    class_name = (get_text_value("class") or "").lower()
-    
+    return {
+        "scores": gather_scores(),
+        "level": level,
+        "proficiency": compute_proficiency(level),
+        "race_bonuses": get_race_ability_bonuses(race),
+        "class_name": (get_text_value("class") or "").lower(),
+        "domain": get_text_value("domain"),
+    }
+
+
+def _render_proficiency_row(tbody_id: str, profs: list[str], css_class: str):
+    tbody = get_element(tbody_id)
+    if not tbody:
+        return
+    tbody.innerHTML = ""
+    tr = document.createElement("tr")
+    for prof in profs:
+        td = document.createElement("td")
+        div = document.createElement("div")
+        div.className = f"proficiency-item {css_class}"
+        div.textContent = prof
+        td.appendChild(div)
+        tr.appendChild(td)
+    tbody.appendChild(tr)
+
+
+def _recalc_class_profile(ctx: dict):
+    """Hit die type, armor/weapon proficiency tables and proficiency bonus."""
+    class_name = ctx["class_name"]
+    level = ctx["level"]
+
     # Update hit dice based on class (show die type, not quantity)
-    hit_dice_type = get_hit_dice_for_class(class_name)
-    set_form_value("hit_dice", hit_dice_type)
-    
-    # Update proficiencies based on class - render as table
-    domain = get_text_value("domain")
-    armor_prof_text = get_armor_proficiencies_for_class(class_name, domain)
+    set_form_value("hit_dice", get_hit_dice_for_class(class_name))
+
+    armor_prof_text = get_armor_proficiencies_for_class(class_name, ctx["domain"])
     weapon_prof_text = get_weapon_proficiencies_for_class(class_name)
-    
-    # Parse and render armor proficiencies as table rows
-    armor_profs = [p.strip() for p in armor_prof_text.split(",") if p.strip()]
-    armor_tbody = get_element("armor-proficiencies")
-    if armor_tbody:
-        armor_tbody.innerHTML = ""
-        tr = document.createElement("tr")
-        for prof in armor_profs:
-            td = document.createElement("td")
-            div = document.createElement("div")
-            div.className = "proficiency-item armor"
-            div.textContent = prof
-            td.appendChild(div)
-            tr.appendChild(td)
-        armor_tbody.appendChild(tr)
-    
-    # Parse and render weapon proficiencies as table rows
-    weapon_profs = [p.strip() for p in weapon_prof_text.split(",") if p.strip()]
-    weapon_tbody = get_element("weapon-proficiencies")
-    if weapon_tbody:
-        weapon_tbody.innerHTML = ""
-        tr = document.createElement("tr")
-        for prof in weapon_profs:
-            td = document.createElement("td")
-            div = document.createElement("div")
-            div.className = "proficiency-item weapon"
-            div.textContent = prof
-            td.appendChild(div)
-            tr.appendChild(td)
-        weapon_tbody.appendChild(tr)
-    
+    _render_proficiency_row(
+        "armor-proficiencies",
+        [p.strip() for p in armor_prof_text.split(",") if p.strip()],
+        "armor",
+    )
+    _render_proficiency_row(
+        "weapon-proficiencies",
+        [p.strip() for p in weapon_prof_text.split(",") if p.strip()],
+        "weapon",
+    )
+
     # Auto-sync hit dice remaining with level (only if it's currently empty/0)
     current_hit_dice_available = get_numeric_value("hit_dice_available", 0)
     if current_hit_dice_available == 0:
         set_form_value("hit_dice_available", level)
 
-    set_text("proficiency-bonus", format_bonus(proficiency))
+    set_text("proficiency-bonus", format_bonus(ctx["proficiency"]))
 
-    # Update ability scores and saves
-    _update_ability_scores_and_saves(scores, race_bonuses, proficiency)
+
+def _recalc_abilities(ctx: dict):
+    """Ability scores, saving throws, initiative and concentration."""
+    scores = ctx["scores"]
+    race_bonuses = ctx["race_bonuses"]
+    _update_ability_scores_and_saves(scores, race_bonuses, ctx["proficiency"])
 
     # Update initiative
     dex_mod = ability_modifier(scores["dex"] + race_bonuses.get("dex", 0))
@@ -2714,12 +2776,6 @@ def update_calculations(*_args):
     if initiative_elem:
         initiative_elem.innerHTML = f'<span class="stat-value">{format_bonus(dex_mod)}{initiative_tooltip}</span>'
 
-    # Calculate and update Armor Class with tooltip
-    ac, ac_tooltip = generate_ac_tooltip()
-    armor_class_elem = get_element("armor_class")
-    if armor_class_elem:
-        armor_class_elem.innerHTML = f'<span class="stat-value">{ac}{ac_tooltip}</span>'
-
     # Calculate concentration save (1d20 + CON modifier vs DC 10)
     con_mod = ability_modifier(scores["con"] + race_bonuses.get("con", 0))
     con_tooltip = f'<div class="stat-tooltip"><div class="tooltip-row"><span class="tooltip-label">CON modifier</span><span class="tooltip-value">{format_bonus(con_mod)}</span></div><div class="tooltip-row"><span class="tooltip-label">DC</span><span class="tooltip-value">10</span></div></div>'
@@ -2727,16 +2783,30 @@ def update_calculations(*_args):
     if conc_save_elem:
         conc_save_elem.innerHTML = f'<span class="stat-value">1d20 {format_bonus(con_mod)} vs DC 10{con_tooltip}</span>'
 
-    # Update skills and passive perception
-    _update_skills_and_passive(scores, proficiency, race_bonuses)
 
-    # Update spell casting stats and prepare spells counter
+def _recalc_armor_class(_ctx: dict):
+    """Armor Class with tooltip."""
+    ac, ac_tooltip = generate_ac_tooltip()
+    armor_class_elem = get_element("armor_class")
+    if armor_class_elem:
+        armor_class_elem.innerHTML = f'<span class="stat-value">{ac}{ac_tooltip}</span>'
+
+
+def _recalc_skills(ctx: dict):
+    """Skill bonuses and passive perception."""
+    _update_skills_and_passive(ctx["scores"], ctx["proficiency"], ctx["race_bonuses"])
+
+
+def _recalc_spell_stats(ctx: dict):
+    """Spell save DC, spell attack and the prepared spells counter."""
+    class_name = ctx["class_name"]
+    level = ctx["level"]
     spell_ability, spell_mod, spell_score, spell_save_dc, spell_attack, max_prepared = _update_spell_casting_stats(
-        class_name, scores, race_bonuses, level, proficiency
+        class_name, ctx["scores"], ctx["race_bonuses"], level, ctx["proficiency"]
     )
-    
+
     # Count only user-prepared spells (exclude domain bonus spells and cantrips)
-    domain = get_text_value("domain")
+    domain = ctx["domain"]
     if SPELL_LIBRARY_STATE.get("loaded"):
         _ensure_domain_spells_in_spellbook(reason="calc_sync")
     domain_bonus_slugs = set(get_domain_bonus_spells(domain, level)) if domain else set()
@@ -2744,10 +2814,10 @@ def update_calculations(*_args):
         prepared_count = SPELLCASTING_MANAGER.get_prepared_non_cantrip_count(domain_bonus_slugs)
     else:
         prepared_count = 0
-    
+
     # Build counter display with calculation tooltip
     counter_display = f"{prepared_count} / {max_prepared}"
-    
+
     # Create tooltip showing calculation
     if class_name and class_name.lower() in ["cleric", "druid", "paladin", "ranger", "wizard", "bard", "sorcerer"]:
         if class_name.lower() == "paladin" or class_name.lower() == "ranger":
@@ -2759,17 +2829,17 @@ def update_calculations(*_args):
     else:
         calc_tooltip = f"Max: {max_prepared}"
         calc_hint = f"Max prepared spells: {max_prepared}"
-    
+
     counter_elem = get_element("spellbook-prepared-count")
     if counter_elem:
         counter_elem.textContent = counter_display
         counter_elem.title = calc_tooltip
-    
+
     # Update the hint text
     hint_elem = get_element("prepared-calc-hint")
     if hint_elem:
         hint_elem.textContent = calc_hint
-    
+
     # Debug logging
     console.log(f"DEBUG: update_calculations() spell counter update")
     console.log(f"  class_name: {class_name}")
@@ -2783,70 +2853,204 @@ def update_calculations(*_args):
     console.log(f"  prepared_slug_set: {list(get_prepared_slug_set())}")
     console.log(f"  domain_bonus_slugs: {list(domain_bonus_slugs)}")
 
-    # Update HP progress bar
+
+def _recalc_hp(_ctx: dict):
+    """HP progress bar."""
     current_hp = get_numeric_value("current_hp", 0)
     max_hp = get_numeric_value("max_hp", 0)
     temp_hp = get_numeric_value("temp_hp", 0)
     _update_hp_display(current_hp, max_hp, temp_hp)
 
-    # Update hit dice pips display
+
+def _recalc_hit_dice(ctx: dict):
+    """Hit dice pips and label."""
     hit_dice_type = get_text_value("hit_dice")
     hit_dice_available = get_numeric_value("hit_dice_available", 0)
-    hit_dice_cap = max(0, get_numeric_value("level", 1))
-    
+    hit_dice_cap = max(0, ctx["level"])
+
     if hit_dice_cap > 0:
         hd_label = f"{hit_dice_type} ({hit_dice_available} / {hit_dice_cap})"
     else:
         hd_label = f"{hit_dice_type} (0 / 0)"
-    
-    # Generate pip elements
+
     hd_pips_container = get_element("hd-pips-container")
     if hd_pips_container:
-        # Clear existing pips
         hd_pips_container.innerHTML = ""
-        
-        # Create pips
         for i in range(hit_dice_cap):
             pip = document.createElement("div")
             pip.className = "hd-pip"
             if i < hit_dice_available:
                 pip.classList.add("available")
             hd_pips_container.appendChild(pip)
-    
+
     set_text("hd-bar-label", hd_label)
 
-    # Update Channel Divinity display with pips
-    level = get_numeric_value("level", 1)
-    proficiency = compute_proficiency(level)
+
+def _recalc_channel_divinity(ctx: dict):
+    """Channel Divinity pips (one per point of proficiency bonus)."""
     channel_divinity_available = get_numeric_value("channel_divinity_available", 0)
-    
     cd_pips_container = get_element("cd-pips-container")
     if cd_pips_container:
-        # Clear existing pips
         cd_pips_container.innerHTML = ""
-        
-        # Create pips
-        for i in range(proficiency):
+        for i in range(ctx["proficiency"]):
             pip = document.createElement("div")
             pip.className = "cd-pip"
             if i < channel_divinity_available:
                 pip.classList.add("available")
             cd_pips_container.appendChild(pip)
 
+
+def _recalc_equipment_totals(_ctx: dict):
     update_equipment_totals()
 
+
+def _recalc_spell_slots(_ctx: dict):
     slot_summary = compute_spell_slot_summary(
         compute_spellcasting_profile()
     )
     render_spell_slots(slot_summary)
+
+
+def _recalc_header(_ctx: dict):
     update_header_display()
-    
-    # Render class features and feats
+
+
+def _recalc_class_features(_ctx: dict):
     render_class_features()
+
+
+def _recalc_feats(_ctx: dict):
     render_feats()
+
+
+def _recalc_spellbook(_ctx: dict):
     render_spellbook()
 
 
+# Sections in the order a full recompute runs them.
+CALCULATION_SECTIONS = {
+    "class_profile": _recalc_class_profile,
+    "abilities": _recalc_abilities,
+    "armor_class": _recalc_armor_class,
+    "skills": _recalc_skills,
+    "spell_stats": _recalc_spell_stats,
+    "hp": _recalc_hp,
+    "hit_dice": _recalc_hit_dice,
+    "channel_divinity": _recalc_channel_divinity,
+    "equipment_totals": _recalc_equipment_totals,
+    "spell_slots": _recalc_spell_slots,
+    "header": _recalc_header,
+    "class_features": _recalc_class_features,
+    "feats": _recalc_feats,
+    "spellbook": _recalc_spellbook,
+}
+
+# Pseudo-section: the spell library filters are re-applied by
+# handle_input_event rather than update_calculations.
+SPELL_FILTER_SECTION = "spell_filters"
+
+_LEVEL_SECTIONS = (
+    "class_profile", "abilities", "skills", "spell_stats", "hit_dice",
+    "channel_divinity", "spell_slots", "header", "class_features",
+    "spellbook", SPELL_FILTER_SECTION,
+)
+
+CALCULATION_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "level": _LEVEL_SECTIONS,
+    "class": (
+        "class_profile", "spell_stats", "hit_dice", "spell_slots", "header",
+        "class_features", "spellbook", SPELL_FILTER_SECTION,
+    ),
+    "domain": (
+        "class_profile", "spell_stats", "header", "class_features",
+        "spellbook", SPELL_FILTER_SECTION,
+    ),
+    "race": ("abilities", "armor_class", "skills", "spell_stats", "header"),
+    "name": ("header",),
+    "current_hp": ("hp",),
+    "max_hp": ("hp",),
+    "temp_hp": ("hp",),
+    "hit_dice_available": ("hit_dice",),
+    "channel_divinity_available": ("channel_divinity",),
+    "player_name": (),
+    "background": (),
+    "alignment": (),
+    "speed": (),
+}
+for _ability in ABILITY_ORDER:
+    CALCULATION_DEPENDENCIES[f"{_ability}-score"] = (
+        ("abilities", "armor_class", "skills", "spell_stats")
+        if _ability == "dex"
+        else ("abilities", "skills", "spell_stats")
+    )
+    CALCULATION_DEPENDENCIES[f"{_ability}-save-prof"] = ("abilities",)
+for _skill in SKILLS:
+    CALCULATION_DEPENDENCIES[f"{_skill}-prof"] = ("skills",)
+    CALCULATION_DEPENDENCIES[f"{_skill}-exp"] = ("skills",)
+
+# Field prefixes that feed no derived value (saved with the character only).
+_PASSIVE_INPUT_PREFIXES = ("currency-", "death_saves_")
+
+# Last value seen per input id, so repeated events with an unchanged value
+# (e.g. change firing after input) skip the recompute entirely.
+_LAST_INPUT_VALUES: dict[str, object] = {}
+
+
+def get_calculation_sections(field_id: Optional[str]) -> Optional[tuple[str, ...]]:
+    """Return the sections that depend on ``field_id``, or None if unknown."""
+    if not field_id:
+        return None
+    sections = CALCULATION_DEPENDENCIES.get(field_id)
+    if sections is not None:
+        return sections
+    if field_id.startswith(_PASSIVE_INPUT_PREFIXES):
+        return ()
+    return None
+
+
+def recalculate_sections(sections) -> None:
+    """Run the named calculation sections in dependency order."""
+    wanted = set(sections)
+    if not wanted.intersection(CALCULATION_SECTIONS):
+        return
+    ctx = _build_calculation_context()
+    for name, section in CALCULATION_SECTIONS.items():
+        if name in wanted:
+            section(ctx)
+
+
+def update_calculations(*_args):
+    """Recompute every derived value on the sheet."""
+    _LAST_INPUT_VALUES.clear()
+    recalculate_sections(CALCULATION_SECTIONS)
+
+
+def _read_input_value(field_id: str):
+    element = get_element(field_id)
+    if element is None:
+        return None
+    if getattr(element, "type", "") == "checkbox":
+        return bool(element.checked)
+    return getattr(element, "value", None)
+
+
+def update_calculations_for_field(field_id: Optional[str]) -> Optional[tuple[str, ...]]:
+    """Recompute only the sections downstream of ``field_id``.
+
+    Returns the sections that were scheduled (None for a full recompute).
+    """
+    sections = get_calculation_sections(field_id)
+    if sections is None:
+        update_calculations()
+        return None
+    value = _read_input_value(field_id)
+    if field_id in _LAST_INPUT_VALUES and _LAST_INPUT_VALUES[field_id] == value:
+        return ()
+    _LAST_INPUT_VALUES[field_id] = value
+    recalculate_sections(sections)
+    return sections
+
+
 def collect_character_data() -> dict:
     ability_scores: dict[str, int] = {}
     data = {
@@ -3062,266 +3266,163 @@ def format_weight(value: float) -> str:
         return str(value)
 
 
-def format_spell_level_label(level_int: int) -> str:
-    if level_int <= 0:
-        return "Cantrip"
-    remainder = level_int % 100
-    if 10 <= remainder <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(level_int % 10, "th")
-    return f"{level_int}{suffix}-level"
-
+def load_spell_cache() -> list[dict] | None:
+    cached = window.localStorage.getItem(SPELL_LIBRARY_STORAGE_KEY)
+    if not cached:
+        return None
+    spells = decode_spell_cache(cached)
+    if spells is None:
+        console.log("DEBUG: spell cache missing fields, stale or corrupt; refetching")
+    return spells
 
-def _coerce_spell_text(value) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, list):
-        return "\n".join(str(part) for part in value if part)
-    return str(value)
 
+def save_spell_cache(spells: list[dict]) -> bool:
+    """Store spells in localStorage; see spell_data.save_spell_cache."""
+    return store_spell_cache(window.localStorage, SPELL_LIBRARY_STORAGE_KEY, spells, SPELL_CACHE_LEGACY_KEYS)
 
-def _make_paragraphs(text: str) -> str:
-    if not text:
-        return ""
-    paragraphs = []
-    for line in text.split("\n"):
-        stripped = line.strip()
-        if stripped:
-            paragraphs.append(f"<p>{escape(stripped)}</p>")
-    return "".join(paragraphs)
-
-
-def sanitize_spell_record(raw: dict) -> Optional[dict]:
-    name = raw.get("name") or "Unknown Spell"
-    slug_source = raw.get("slug") or name
-    slug = re.sub(r"[^a-z0-9]+", "-", slug_source.lower()).strip("-")
-
-    level_value = raw.get("level_int")
-    if level_value is None:
-        level_value = raw.get("level")
-    level_int = parse_int(level_value, 0)
-    level_label = format_spell_level_label(level_int)
-
-    # Handle multiple class field formats:
-    # 1. dnd_class: "Bard, Sorcerer, Wizard" (Open5e standard)
-    # 2. spell_lists: ["bard", "sorcerer", "wizard"] (Open5e alternative)
-    # 3. classes: ["Wizard", "Sorcerer"] (custom format or other sources)
-    classes_field = raw.get("dnd_class") or ""
-    
-    if not classes_field:
-        # Try spell_lists field (Open5e provides this)
-        spell_lists = raw.get("spell_lists")
-        if isinstance(spell_lists, list) and spell_lists:
-            classes_field = ", ".join(str(c) for c in spell_lists)
-        elif not classes_field:
-            # Try classes field as fallback (list or string format)
-            classes_raw_input = raw.get("classes")
-            if isinstance(classes_raw_input, list):
-                classes_field = ", ".join(str(c) for c in classes_raw_input)
-            elif isinstance(classes_raw_input, str):
-                classes_field = classes_raw_input
-            else:
-                classes_field = ""
 
-    
-    classes_raw = [token.strip() for token in re.split(r"[;,/]+", classes_field) if token.strip()]
-    classes: list[str] = []
-    for token in classes_raw:
-        canonical = normalize_class_token(token)
-        if canonical and canonical in SUPPORTED_SPELL_CLASSES and canonical not in classes:
-            classes.append(canonical)
-    if not classes:
+async def _per_record_storage():
+    """The async storage backend if it keeps records separately, else None."""
+    if get_storage is None:
         return None
-    classes_display = [SPELL_CLASS_DISPLAY_NAMES.get(c, c.title()) for c in classes]
-
-    school = (raw.get("school") or "").title()
-    casting_time = raw.get("casting_time") or ""
-    range_text = raw.get("range") or ""
-    components = raw.get("components") or ""
-    material = raw.get("material") or ""
-    duration = raw.get("duration") or ""
-    ritual = is_truthy(raw.get("ritual"))
-    concentration = is_truthy(raw.get("concentration"))
-
-    desc_text = _coerce_spell_text(raw.get("desc"))
-    higher_text = _coerce_spell_text(raw.get("higher_level"))
-    desc_html = _make_paragraphs(desc_text)
-    higher_html = _make_paragraphs(higher_text)
-    description_html = desc_html
-    if higher_html:
-        description_html += "<p class=\"spell-section-title\">At Higher Levels</p>" + higher_html
-
-    source = raw.get("document__title") or raw.get("document__slug") or raw.get("document") or ""
-
-    search_fields = [
-        name,
-        classes_field,
-        desc_text,
-        higher_text,
-        school,
-        casting_time,
-        range_text,
-        components,
-        material,
-        duration,
-        source,
-    ]
-    search_blob = " ".join(part for part in search_fields if part).lower()
-
-    result = {
-        "slug": slug,
-        "name": name,
-        "level_int": level_int,
-        "level_label": level_label,
-        "school": school,
-        "casting_time": casting_time,
-        "range": range_text,
-        "components": components,
-        "material": material,
-        "duration": duration,
-        "ritual": ritual,
-        "concentration": concentration,
-        "classes": classes,
-        "classes_display": classes_display,
-        "description_html": description_html,
-        "search_blob": search_blob,
-        "source": source,
-    }
-    
-    # Apply any known corrections to this spell
-    return apply_spell_corrections(result)
+    storage = await get_storage()
+    return storage if storage.per_record else None
 
 
-def sanitize_spell_list(raw_spells: list[dict]) -> list[dict]:
-    sanitized: list[dict] = []
-    seen_slugs: set[str] = set()
-    rejected_count = 0
-    
-    # Debug: Check what SPELL_CLASS_SYNONYMS contains at runtime
-    if len(raw_spells) > 0:
-        if len(SPELL_CLASS_SYNONYMS) == 0:
-            console.warn(f"PySheet: WARNING! SPELL_CLASS_SYNONYMS is EMPTY! This will cause all spells to be rejected!")
-        if len(SUPPORTED_SPELL_CLASSES) == 0:
-            console.warn(f"PySheet: WARNING! SUPPORTED_SPELL_CLASSES is EMPTY! This will cause all spells to be rejected!")
-    
-    for spell in raw_spells:
-        record = sanitize_spell_record(spell)
-        if record is not None:
-            slug = record.get("slug")
-            # Skip if we've already seen this spell slug
-            if slug not in seen_slugs:
-                sanitized.append(record)
-                seen_slugs.add(slug)
-        else:
-            rejected_count += 1
-    
-    # Debug logging if all spells were rejected
-    if rejected_count == len(raw_spells) and rejected_count > 0:
-        console.warn(f"PySheet: All {rejected_count} spells rejected during sanitization!")
-        if len(raw_spells) > 0:
-            first_spell = raw_spells[0]
-            console.warn(f"  First spell: {first_spell.get('name', 'Unknown')}")
-            console.warn(f"  Classes field: {first_spell.get('classes')}")
-            console.warn(f"  Type of classes: {type(first_spell.get('classes'))}")
-            console.warn(f"  dnd_class field: {first_spell.get('dnd_class')}")
-            console.warn(f"  SPELL_CLASS_SYNONYMS: {SPELL_CLASS_SYNONYMS}")
-            console.warn(f"  SUPPORTED_SPELL_CLASSES: {SUPPORTED_SPELL_CLASSES}")
-    
-    sanitized.sort(key=lambda item: (item["level_int"], item["name"].lower()))
-    return sanitized
-
+async def load_stored_spell_cache() -> list[dict] | None:
+    """Load the spell index; with per-record storage descriptions come later.
 
-def rehydrate_cached_spell(record: dict) -> Optional[dict]:
-    classes = []
-    for token in record.get("classes", []):
-        canonical = normalize_class_token(token)
-        if canonical and canonical in SUPPORTED_SPELL_CLASSES and canonical not in classes:
-            classes.append(canonical)
-    if not classes:
+    Spells without a "description_html" key are filled in by
+    hydrate_spell_descriptions() or ensure_spell_description(). A cache left
+    in localStorage by an older version is moved over on first load.
+    """
+    storage = await _per_record_storage()
+    if storage is None:
+        return load_spell_cache()
+    cached = await storage.get("kv", SPELL_LIBRARY_STORAGE_KEY)
+    if cached:
+        spells = decode_spell_cache(cached)
+        if spells is None:
+            console.log("DEBUG: stored spell index stale or corrupt; refetching")
+        return spells
+    local_storage = getattr(window, "localStorage", None) if window is not None else None
+    if local_storage is None or not local_storage.getItem(SPELL_LIBRARY_STORAGE_KEY):
         return None
-    classes_display = record.get("classes_display") or [
-        SPELL_CLASS_DISPLAY_NAMES.get(c, c.title()) for c in classes
-    ]
-    return {
-        "slug": record.get("slug", ""),
-        "name": record.get("name", "Unknown Spell"),
-        "level_int": parse_int(record.get("level_int"), 0),
-        "level_label": record.get("level_label", format_spell_level_label(parse_int(record.get("level_int"), 0))),
-        "school": record.get("school", ""),
-        "casting_time": record.get("casting_time", ""),
-        "range": record.get("range", ""),
-        "components": record.get("components", ""),
-        "material": record.get("material", ""),
-        "duration": record.get("duration", ""),
-        "ritual": bool(record.get("ritual", False)),
-        "concentration": bool(record.get("concentration", False)),
-        "classes": classes,
-        "classes_display": classes_display,
-        "description_html": record.get("description_html", ""),
-        "search_blob": (record.get("search_blob", "") or "").lower(),
-        "source": record.get("source", ""),
-    }
+    spells = load_spell_cache()
+    if spells and await save_stored_spell_cache(spells):
+        console.log(f"PySheet: moved spell cache from localStorage to {storage.kind}")
+    return spells
 
 
-def load_spell_cache() -> list[dict] | None:
-    cached = window.localStorage.getItem(SPELL_LIBRARY_STORAGE_KEY)
-    if not cached:
-        return None
+async def save_stored_spell_cache(spells: list[dict]) -> bool:
+    """Store spells as an index plus one description record per slug."""
+    storage = await _per_record_storage()
+    if storage is None:
+        return save_spell_cache(spells)
     try:
-        payload = json.loads(cached)
+        # Drop the index first so an interrupted save is a miss, not a mismatch
+        await storage.delete("kv", SPELL_LIBRARY_STORAGE_KEY)
+        await storage.clear(SPELL_DESCRIPTION_STORE)
+        await storage.set_many(SPELL_DESCRIPTION_STORE, {
+            spell["slug"]: spell.get("description_html") or ""
+            for spell in spells
+            if spell.get("slug")
+        })
+        await storage.set("kv", SPELL_LIBRARY_STORAGE_KEY, encode_spell_cache(spells, ("description_html",)))
     except Exception as exc:
-        console.warn(f"PySheet: failed to parse spell cache ({exc})")
-        return None
-    if payload.get("version") != SPELL_CACHE_VERSION:
-        return None
-    spells = payload.get("spells")
-    if not isinstance(spells, list):
-        return None
-    rehydrated: list[dict] = []
-    seen_slugs: set[str] = set()
-    for record in spells:
+        console.warn(f"PySheet: unable to store spell cache ({exc})")
+        return False
+    local_storage = getattr(window, "localStorage", None) if window is not None else None
+    if local_storage is not None and storage.kind == "indexeddb":
+        # The index now lives in IndexedDB; free the quota of the single-key caches
+        for key in [SPELL_LIBRARY_STORAGE_KEY, *SPELL_CACHE_LEGACY_KEYS]:
+            local_storage.removeItem(key)
+    return True
+
+
+def _apply_spell_descriptions(spells: list[dict], descriptions: list) -> list[str]:
+    """Set the loaded descriptions and refresh their rendered cards."""
+    updated = []
+    for spell, description in zip(spells, descriptions):
+        if "description_html" in spell:
+            continue
+        spell["description_html"] = description or ""
+        slug = spell.get("slug", "")
+        SPELL_RESULTS_WINDOW["html_cache"].pop(slug, None)
+        updated.append(slug)
+    return updated
+
+
+async def ensure_spell_description(slug: str) -> bool:
+    """Load one spell's description if it is still missing; True if loaded."""
+    spell = SPELL_LIBRARY_STATE.get("spell_map", {}).get((slug or "").lower())
+    storage = await _per_record_storage()
+    if spell is None or "description_html" in spell or storage is None:
+        return False
+    description = await storage.get(SPELL_DESCRIPTION_STORE, spell["slug"])
+    if not _apply_spell_descriptions([spell], [description]):
+        return False
+    if spell["slug"] in SPELL_RESULTS_WINDOW["open_slugs"]:
+        _render_spell_window(force=True)
+    return True
+
+
+async def hydrate_spell_descriptions(spells: list[dict]) -> int:
+    """Fill in every missing description in batches; returns how many."""
+    storage = await _per_record_storage()
+    missing = [spell for spell in spells if "description_html" not in spell and spell.get("slug")]
+    if storage is None or not missing:
+        return 0
+    loaded = 0
+    for start in range(0, len(missing), SPELL_DESCRIPTION_BATCH):
+        batch = missing[start:start + SPELL_DESCRIPTION_BATCH]
         try:
-            if not isinstance(record, dict):
-                continue
-            hydrated = rehydrate_cached_spell(record)
-            if hydrated is not None:
-                slug = hydrated.get("slug")
-                # Deduplicate by slug from cache
-                if slug and slug not in seen_slugs:
-                    rehydrated.append(hydrated)
-                    seen_slugs.add(slug)
+            descriptions = await storage.get_many(SPELL_DESCRIPTION_STORE, [spell["slug"] for spell in batch])
         except Exception as exc:
-            console.warn(f"PySheet: skipping cached spell due to error ({exc})")
-    if not rehydrated:
-        return None
-    rehydrated.sort(key=lambda item: (item["level_int"], item["name"].lower()))
-    return rehydrated
+            console.warn(f"PySheet: could not load spell descriptions ({exc})")
+            break
+        updated = _apply_spell_descriptions(batch, descriptions)
+        loaded += len(updated)
+        if SPELL_RESULTS_WINDOW["open_slugs"] & set(updated):
+            _render_spell_window(force=True)
+    console.log(f"DEBUG: hydrated {loaded} spell descriptions")
+    return loaded
 
 
-def save_spell_cache(spells: list[dict]) -> None:
-    payload = {"version": SPELL_CACHE_VERSION, "spells": spells}
+async def fetch_server_spell_library() -> dict | None:
+    """Fetch the backend's pre-sanitized spell library, or None if unavailable."""
     try:
-        window.localStorage.setItem(SPELL_LIBRARY_STORAGE_KEY, json.dumps(payload))
+        response = await pyfetch(SPELL_LIBRARY_ENDPOINT)
+        if not response.ok:
+            console.log(f"DEBUG: spell library endpoint returned {response.status}")
+            return None
+        payload = await response.json()
     except Exception as exc:
-        console.warn(f"PySheet: unable to store spell cache ({exc})")
+        console.log(f"DEBUG: spell library endpoint unavailable ({exc})")
+        return None
+    if not isinstance(payload, dict):
+        return None
+    spells = payload.get("spells")
+    if not isinstance(spells, list) or not spells:
+        return None
+    if not all(isinstance(spell, dict) and spell.get("slug") for spell in spells):
+        console.warn("PySheet: spell library endpoint returned malformed records; ignoring")
+        return None
+    return payload
 
 
-async def fetch_open5e_spells() -> list[dict]:
-    spells: list[dict] = []
-    url = OPEN5E_SPELLS_ENDPOINT
-    pages = 0
-    while url and pages < OPEN5E_MAX_PAGES:
-        response = await pyfetch(url)
-        if not response.ok:
-            raise RuntimeError(f"Open5e request failed ({response.status})")
-        data = await response.json()
-        results = data.get("results", [])
-        if isinstance(results, list):
-            spells.extend(results)
-        url = data.get("next")
-        pages += 1
-    return spells
+def merge_sanitized_spells(chunks: list[list[dict]]) -> list[dict]:
+    """Concatenate sanitized chunks, keep the first record per slug and sort."""
+    merged: list[dict] = []
+    seen_slugs: set[str] = set()
+    for chunk in chunks:
+        for record in chunk:
+            slug = record.get("slug")
+            if slug not in seen_slugs:
+                merged.append(record)
+                seen_slugs.add(slug)
+    merged.sort(key=lambda item: (item["level_int"], item["name"].lower()))
+    return merged
 
 
 def update_spell_library_status(message: str):
@@ -3476,6 +3577,9 @@ def build_spell_card_html(spell: dict, allowed_classes: set[str] | None = None)
     description_html = spell.get("description_html") or ""
     if description_html:
         description_html = f"<div class=\"spell-text\">{description_html}</div>"
+    elif "description_html" not in spell:
+        # Still in per-record storage; see ensure_spell_description()
+        description_html = "<div class=\"spell-text spell-text-loading\">Loading description...</div>"
 
     body_html = (
         "<div class=\"spell-body\">"
@@ -3512,7 +3616,11 @@ def build_spell_card_html(spell: dict, allowed_classes: set[str] | None = None)
         #   "if it fails a Dexterity saving throw"
         save_regex = re.compile(r"(?:must\s+(?:succeed\s+on\s+|make\s+)(?:a|an)\s+|if\s+it\s+fails\s+(?:a|an)\s+)(strength|dexterity|constitution|intelligence|wisdom|charisma)\s+saving throw", re.IGNORECASE)
         text_blobs = []
-        for field in ("dc", "saving_throw", "desc", "higher_level", "description", "description_html"):
+        text_fields = ["dc", "saving_throw", "desc", "higher_level", "description", "description_html"]
+        if "description_html" not in spell:
+            # Description not loaded yet; the search text contains it
+            text_fields.append("search_blob")
+        for field in text_fields:
             value = spell.get(field)
             if isinstance(value, (list, tuple)):
                 value = " ".join(str(v) for v in value)
@@ -3596,6 +3704,198 @@ def update_header_display():
     set_text("character-header-summary", character.header_summary())
 
 
+# ---------------------------------------------------------------------------
+# Windowed spell results
+# ---------------------------------------------------------------------------
+# Only the cards in or near the visible part of #spell-library-results are
+# materialized. Two spacer elements stand in for the off-screen cards, and
+# card heights are measured as they render so expanded cards keep their place
+# when scrolled out and back in. Clicks, scrolls and <details> toggles are
+# handled by listeners bound once on the container, so recycling cards never
+# creates new proxies.
+SPELL_RESULTS_WINDOW = {
+    "spells": [],
+    "allowed_classes": set(),
+    "heights": {},
+    "html_cache": {},
+    "open_slugs": set(),
+    "range": None,
+    "frame_pending": False,
+    "bound_container": None,
+    "proxies": [],
+}
+
+
+def _spell_window_offsets(count: int, heights: dict) -> list[int]:
+    """Pixel offset of every card (plus the total height as the last entry)."""
+    offsets = [0]
+    total = 0
+    for position in range(count):
+        total += heights.get(position, SPELL_CARD_ESTIMATED_HEIGHT)
+        offsets.append(total)
+    return offsets
+
+
+def _compute_spell_window(scroll_top: float, viewport_height: float, offsets: list[int]) -> tuple[int, int]:
+    """Return the [start, end) card range to materialize for a scroll position."""
+    count = len(offsets) - 1
+    if count <= 0:
+        return 0, 0
+    if viewport_height <= 0:
+        return 0, min(count, SPELL_RENDER_MIN_WINDOW)
+    start = max(0, bisect_right(offsets, scroll_top) - 1)
+    end = bisect_left(offsets, scroll_top + viewport_height) + 1
+    start = max(0, start - SPELL_RENDER_OVERSCAN)
+    end = min(count, max(end + SPELL_RENDER_OVERSCAN, start + SPELL_RENDER_MIN_WINDOW))
+    return start, end
+
+
+def _spell_card_html_cached(spell: dict) -> str:
+    state = SPELL_RESULTS_WINDOW
+    slug = spell.get("slug", "")
+    html = state["html_cache"].get(slug)
+    if html is None:
+        html = build_spell_card_html(spell, state["allowed_classes"])
+        state["html_cache"][slug] = html
+    return html
+
+
+def _shift_spell_window(container, previous: tuple[int, int], current: tuple[int, int]) -> bool:
+    """Move the rendered window by editing its edges; False if a rebuild is needed.
+
+    Cards that stay in the window keep their DOM nodes (and measured height
+    and open state); only cards leaving the window are removed and only
+    cards entering it are parsed.
+    """
+    (old_start, old_end), (start, end) = previous, current
+    if start >= old_end or end <= old_start:
+        return False
+    children = getattr(container, "children", None)
+    if children is None or len(children) != (old_end - old_start) + 2:
+        return False
+    spells = SPELL_RESULTS_WINDOW["spells"]
+    top_spacer, bottom_spacer = children[0], children[len(children) - 1]
+    for _ in range(old_start, start):
+        container.removeChild(top_spacer.nextElementSibling)
+    for _ in range(end, old_end):
+        container.removeChild(bottom_spacer.previousElementSibling)
+    if start < old_start:
+        top_spacer.insertAdjacentHTML(
+            "afterend", "".join(_spell_card_html_cached(spells[pos]) for pos in range(start, old_start))
+        )
+    if end > old_end:
+        bottom_spacer.insertAdjacentHTML(
+            "beforebegin", "".join(_spell_card_html_cached(spells[pos]) for pos in range(old_end, end))
+        )
+    return True
+
+
+def _render_spell_window(force: bool = False):
+    """Materialize the cards for the container's current scroll position.
+
+    Scrolling shifts the existing window (see _shift_spell_window); force, a
+    new result set or a jump past the whole window rebuilds it.
+    """
+    state = SPELL_RESULTS_WINDOW
+    container = state["bound_container"]
+    spells = state["spells"]
+    if container is None or not spells:
+        return
+
+    offsets = _spell_window_offsets(len(spells), state["heights"])
+    scroll_top = getattr(container, "scrollTop", 0) or 0
+    viewport_height = getattr(container, "clientHeight", 0) or 0
+    start, end = _compute_spell_window(scroll_top, viewport_height, offsets)
+    previous = state["range"]
+    if not force and previous == (start, end):
+        return
+    state["range"] = (start, end)
+
+    top_height = max(0, offsets[start] - SPELL_CARD_GAP_PX) if start > 0 else 0
+    bottom_height = max(0, offsets[-1] - offsets[end] - SPELL_CARD_GAP_PX) if end < len(spells) else 0
+    if force or previous is None or not _shift_spell_window(container, previous, (start, end)):
+        cards_html = "".join(_spell_card_html_cached(spells[pos]) for pos in range(start, end))
+        container.innerHTML = (
+            f"<div class=\"spell-window-spacer\" style=\"height: {top_height}px\"></div>"
+            + cards_html
+            + f"<div class=\"spell-window-spacer\" style=\"height: {bottom_height}px\"></div>"
+        )
+    else:
+        children = container.children
+        children[0].style.height = f"{top_height}px"
+        children[len(children) - 1].style.height = f"{bottom_height}px"
+
+    # Restore expanded cards and record real heights for the next layout.
+    children = getattr(container, "children", None)
+    if children is None:
+        return
+    open_slugs = state["open_slugs"]
+    for offset, position in enumerate(range(start, end)):
+        try:
+            card = children[offset + 1]
+        except Exception:
+            break
+        if card is None:
+            break
+        if spells[position].get("slug") in open_slugs:
+            card.open = True
+        height = getattr(card, "offsetHeight", 0) or 0
+        if height > 0:
+            state["heights"][position] = height + SPELL_CARD_GAP_PX
+
+
+def _on_spell_window_frame(*_args):
+    SPELL_RESULTS_WINDOW["frame_pending"] = False
+    _render_spell_window()
+
+
+def _schedule_spell_window_render(*_args):
+    """Coalesce scroll events into one window render per animation frame."""
+    state = SPELL_RESULTS_WINDOW
+    if state["frame_pending"]:
+        return
+    request_frame = getattr(window, "requestAnimationFrame", None) if window is not None else None
+    if request_frame is None or not state["proxies"]:
+        _render_spell_window()
+        return
+    state["frame_pending"] = True
+    request_frame(state["proxies"][0])
+
+
+def _handle_spell_results_click(event):
+    target = getattr(event, "target", None)
+    closest = getattr(target, "closest", None)
+    button = closest("button[data-spell-action]") if closest else None
+    if button is None or getattr(button, "disabled", False):
+        return
+    slug = button.getAttribute("data-spell-slug") or ""
+    action = (button.getAttribute("data-spell-action") or "").lower()
+    if not slug or action not in {"add", "remove"}:
+        return
+    was_prepared = is_spell_prepared(slug)
+    handle_spell_card_action(event, action, slug)
+    if is_spell_prepared(slug) != was_prepared:
+        SPELL_RESULTS_WINDOW["html_cache"].pop(slug, None)
+        _render_spell_window(force=True)
+
+
+def _handle_spell_results_toggle(event):
+    card = getattr(event, "target", None)
+    if card is None or getattr(card, "tagName", "").lower() != "details":
+        return
+    slug = card.getAttribute("data-spell-slug") or ""
+    if not slug:
+        return
+    if card.open:
+        SPELL_RESULTS_WINDOW["open_slugs"].add(slug)
+        spell = SPELL_LIBRARY_STATE.get("spell_map", {}).get(slug.lower())
+        if spell is not None and "description_html" not in spell:
+            asyncio.create_task(ensure_spell_description(slug))
+    else:
+        SPELL_RESULTS_WINDOW["open_slugs"].discard(slug)
+    _schedule_spell_window_render()
+
+
 def render_spell_results(
     spells: list[dict], allowed_classes: set[str] | None = None
 ) -> tuple[int, bool, int]:
@@ -3605,41 +3905,56 @@ def render_spell_results(
     if results_el is None:
         console.warn("DEBUG: render_spell_results() - spell-library-results element not found!")
         return 0, False, 0
+
+    state = SPELL_RESULTS_WINDOW
+    state["spells"] = list(spells)
+    state["allowed_classes"] = set(allowed_classes or set())
+    state["heights"] = {}
+    state["html_cache"] = {}
+    state["range"] = None
     if not spells:
         results_el.innerHTML = (
             "<div class=\"spell-library-empty\">No spells match your filters.</div>"
         )
         return 0, False, 0
-    limited = spells[:MAX_SPELL_RENDER]
-    cards_html = "".join(
-        build_spell_card_html(spell, allowed_classes) for spell in limited
-    )
-    truncated = len(spells) > MAX_SPELL_RENDER
-    if truncated:
-        cards_html += (
-            f"<div class=\"spell-library-empty\">Showing first {MAX_SPELL_RENDER} spells. Refine your filters for more precise results.</div>"
-        )
-    results_el.innerHTML = cards_html
     attach_spell_card_handlers(results_el)
-    return len(limited), truncated, len(spells)
+    results_el.scrollTop = 0
+    _render_spell_window(force=True)
+    return len(spells), False, len(spells)
 
 
 def attach_spell_card_handlers(container):
+    """Bind the delegated click/scroll/toggle listeners once per container."""
     if container is None:
         return
-    buttons = container.querySelectorAll("button[data-spell-action]")
-    for button in buttons:
-        if getattr(button, "disabled", False):
-            continue
-        slug = button.getAttribute("data-spell-slug") or ""
-        action = (button.getAttribute("data-spell-action") or "").lower()
-        if not slug or action not in {"add", "remove"}:
-            continue
-        proxy = create_proxy(
-            lambda event, s=slug, a=action: handle_spell_card_action(event, a, s)
-        )
-        button.addEventListener("click", proxy)
-        _EVENT_PROXIES.append(proxy)
+    state = SPELL_RESULTS_WINDOW
+    if state["bound_container"] is container:
+        return
+    previous = state["bound_container"]
+    if previous is not None and state["proxies"]:
+        _, click_proxy, scroll_proxy, toggle_proxy = state["proxies"]
+        try:
+            previous.removeEventListener("click", click_proxy)
+            previous.removeEventListener("scroll", scroll_proxy)
+            previous.removeEventListener("toggle", toggle_proxy, True)
+        except Exception:
+            pass
+    if not state["proxies"]:
+        state["proxies"] = [
+            track_proxy("character.spell-results", create_proxy(handler))
+            for handler in (
+                _on_spell_window_frame,
+                _handle_spell_results_click,
+                _schedule_spell_window_render,
+                _handle_spell_results_toggle,
+            )
+        ]
+    _, click_proxy, scroll_proxy, toggle_proxy = state["proxies"]
+    container.addEventListener("click", click_proxy)
+    container.addEventListener("scroll", scroll_proxy)
+    # <details> toggle does not bubble; listen in the capture phase instead.
+    container.addEventListener("toggle", toggle_proxy, True)
+    state["bound_container"] = container
 
 
 def handle_spell_card_action(event, action: str, slug: str):
@@ -3703,40 +4018,53 @@ def apply_spell_filters(auto_select: bool = False):
     allowed_set = set(allowed_classes)
     console.log(f"DEBUG: apply_spell_filters() - spells={len(spells)}, allowed_classes={allowed_classes}, selected_class='{selected_class}', allowed_set={allowed_set}")
     
-    source_filtered = 0
-    level_filtered = 0
-    class_filtered = 0
-    search_filtered = 0
-    
-    for spell in spells:
-        # Filter by allowed sources
-        source = spell.get("source", "")
-        if not is_spell_source_allowed(source):
-            source_filtered += 1
-            continue
+    # Use the posting-list index built by set_spell_library_data when it
+    # still describes the current spell list; otherwise scan linearly.
+    filter_index = SPELL_LIBRARY_STATE.get("filter_index")
+    if query_spell_index is not None and filter_index and filter_index.get("spells") is spells:
+        filtered = query_spell_index(
+            filter_index,
+            classes={selected_class} if selected_class else allowed_set,
+            max_level=max_spell_level,
+            level=level_filter,
+            search_term=search_term,
+        )
+        console.log(f"DEBUG: Spell filtering via index - passed={len(filtered)} of {len(spells)}")
+    else:
+        source_filtered = 0
+        level_filtered = 0
+        class_filtered = 0
+        search_filtered = 0
         
-        spell_level = spell.get("level_int", 0)
-        if max_spell_level is not None and spell_level > max_spell_level:
-            level_filtered += 1
-            continue
-        spell_classes = set(spell.get("classes", []))
-        if selected_class:
-            if selected_class not in spell_classes:
-                class_filtered += 1
+        for spell in spells:
+            # Filter by allowed sources
+            source = spell.get("source", "")
+            if not is_spell_source_allowed(source):
+                source_filtered += 1
                 continue
-        elif allowed_set:
-            if not spell_classes.intersection(allowed_set):
-                class_filtered += 1
+            
+            spell_level = spell.get("level_int", 0)
+            if max_spell_level is not None and spell_level > max_spell_level:
+                level_filtered += 1
                 continue
-        if level_filter is not None and spell_level != level_filter:
-            level_filtered += 1
-            continue
-        if search_term and search_term not in spell.get("search_blob", ""):
-            search_filtered += 1
-            continue
-        filtered.append(spell)
-    
-    console.log(f"DEBUG: Spell filtering breakdown - source_filtered={source_filtered}, level_filtered={level_filtered}, class_filtered={class_filtered}, search_filtered={search_filtered}, passed={len(filtered)}")
+            spell_classes = set(spell.get("classes", []))
+            if selected_class:
+                if selected_class not in spell_classes:
+                    class_filtered += 1
+                    continue
+            elif allowed_set:
+                if not spell_classes.intersection(allowed_set):
+                    class_filtered += 1
+                    continue
+            if level_filter is not None and spell_level != level_filter:
+                level_filtered += 1
+                continue
+            if search_term and search_term not in spell.get("search_blob", ""):
+                search_filtered += 1
+                continue
+            filtered.append(spell)
+        
+        console.log(f"DEBUG: Spell filtering breakdown - source_filtered={source_filtered}, level_filtered={level_filtered}, class_filtered={class_filtered}, search_filtered={search_filtered}, passed={len(filtered)}")
     console.log(f"DEBUG: apply_spell_filters() - filtered {len(filtered)} spells, calling render_spell_results")
     displayed, truncated, total_filtered = render_spell_results(filtered, allowed_set)
     console.log(f"DEBUG: apply_spell_filters() - render_spell_results returned: displayed={displayed}, truncated={truncated}, total={total_filtered}")
@@ -3798,7 +4126,7 @@ async def load_spell_library(_event=None):
 
     try:
         console.log("DEBUG: load_spell_library() - checking cache...")
-        cached_spells = load_spell_cache()
+        cached_spells = await load_stored_spell_cache()
         console.log(f"DEBUG: load_spell_library() - cached_spells = {type(cached_spells)}, len = {len(cached_spells) if cached_spells else 0}")
         if cached_spells:
             console.log(f"DEBUG: load_spell_library() - loading from cache, {len(cached_spells)} spells")
@@ -3813,15 +4141,39 @@ async def load_spell_library(_event=None):
             # Auto-populate domain spells now that spell library is loaded from cache
             _populate_domain_spells_on_load()
             update_spell_library_status("Loaded spells from cache. Filters apply to your current class and level.")
+            if any("description_html" not in spell for spell in cached_spells):
+                asyncio.create_task(hydrate_spell_descriptions(cached_spells))
             console.log("DEBUG: load_spell_library() - cache loading complete!")
             return
 
+        # The backend runs the sanitize pipeline once; its records are used as-is
+        server_library = await fetch_server_spell_library()
+        if server_library is not None and server_library.get("source") == "data":
+            server_spells = server_library["spells"]
+            console.log(f"PySheet: Loaded {len(server_spells)} pre-sanitized spells from {SPELL_LIBRARY_ENDPOINT}")
+            set_spell_library_data(server_spells)
+            SPELL_LIBRARY_STATE["loaded"] = True
+            populate_spell_class_filter(server_spells)
+            sync_prepared_spells_with_library()
+            await save_stored_spell_cache(server_spells)
+            apply_spell_filters(auto_select=True)
+            _populate_domain_spells_on_load()
+            update_spell_library_status("Loaded spell library from server. Filters apply to your current class and level.")
+            return
+
         status_message = "Loaded latest Open5e SRD spells."
         raw_spells = None
         fetch_error = None
+        sanitized_pages: dict[int, list[dict]] = {}
+
+        def sanitize_page(page_number: int, results: list[dict]):
+            sanitized_pages[page_number] = sanitize_spell_list(results)
+
         try:
             console.log("PySheet: Fetching spells from Open5e...")
-            raw_spells = await fetch_open5e_spells()
+            raw_spells = await fetch_open5e_spells(
+                on_page=sanitize_page, on_status=update_spell_library_status
+            )
             console.log(f"PySheet: Open5e fetch returned {len(raw_spells) if raw_spells else 0} spells")
         except Exception as exc:
             fetch_error = exc
@@ -3846,19 +4198,27 @@ async def load_spell_library(_event=None):
             console.log(f"PySheet: Merging fallback spells into Open5e list...")
             existing_slugs = {spell.get("slug") for spell in raw_spells if spell.get("slug")}
             console.log(f"PySheet: Open5e has {len(existing_slugs)} unique slugs")
-            merge_count = 0
-            merged_slugs = []
+            merged_fallback = []
             for fallback_spell in LOCAL_SPELLS_FALLBACK:
                 fallback_slug = fallback_spell.get("slug")
                 if fallback_slug not in existing_slugs:
                     raw_spells.append(fallback_spell)
-                    merge_count += 1
-                    merged_slugs.append(fallback_slug)
-            console.log(f"PySheet: Merged {merge_count} fallback spells: {merged_slugs}")
+                    merged_fallback.append(fallback_spell)
+            console.log(f"PySheet: Merged {len(merged_fallback)} fallback spells: {[spell.get('slug') for spell in merged_fallback]}")
             console.log(f"PySheet: Total after merge: {len(raw_spells)}")
 
-        console.log(f"DEBUG: Calling sanitize_spell_list with {len(raw_spells)} spells")
-        sanitized = sanitize_spell_list(raw_spells)
+        if raw_spells is LOCAL_SPELLS_FALLBACK and server_library is not None:
+            # Same fallback list, already sanitized by the backend
+            sanitized = server_library["spells"]
+        elif raw_spells is not LOCAL_SPELLS_FALLBACK:
+            # Open5e pages were sanitized as they arrived; only the merged fallback is left
+            chunks = [sanitized_pages[number] for number in sorted(sanitized_pages)]
+            chunks.append(sanitize_spell_list(merged_fallback))
+            sanitized = merge_sanitized_spells(chunks)
+            console.log(f"DEBUG: merged {len(chunks) - 1} sanitized pages into {len(sanitized)} spells")
+        else:
+            console.log(f"DEBUG: Calling sanitize_spell_list with {len(raw_spells)} spells")
+            sanitized = sanitize_spell_list(raw_spells)
         console.log(f"DEBUG: sanitize_spell_list returned {len(sanitized)} spells")
         if not sanitized and raw_spells is not LOCAL_SPELLS_FALLBACK:
             console.warn("PySheet: remote spell list missing supported classes; using fallback list.")
@@ -3873,7 +4233,7 @@ async def load_spell_library(_event=None):
         populate_spell_class_filter(sanitized)
         sync_prepared_spells_with_library()
         if raw_spells is not LOCAL_SPELLS_FALLBACK:
-            save_spell_cache(sanitized)
+            await save_stored_spell_cache(sanitized)
         apply_spell_filters(auto_select=True)
         # Auto-populate domain spells now that spell library is loaded
         _populate_domain_spells_on_load()
@@ -3894,10 +4254,7 @@ def handle_spell_filter_change(_event=None):
 async def fetch_open5e_weapons():
     """Fetch weapons list from Open5e API."""
     try:
-        response = await pyfetch("https://api.open5e.com/weapons/?limit=1000")
-        if not response.ok:
-            return None
-        data = await response.json()
+        data = await fetch_open5e_json(OPEN5E_WEAPONS_ENDPOINT)
         return data.get("results", [])
     except Exception as exc:
         console.error(f"PySheet: failed to fetch weapons from Open5e - {exc}")
@@ -3967,6 +4324,7 @@ def populate_weapon_dropdown(weapons: list = None):
         return
     
     dropdown.innerHTML = ""
+    release_proxies("character.weapon-dropdown")
     for idx, weapon in enumerate(weapons[:20]):  # Limit to 20 results
         option = document.createElement("div")
         option.classList.add("weapon-option")
@@ -3984,9 +4342,8 @@ def populate_weapon_dropdown(weapons: list = None):
             return on_click
         
         # Use create_proxy to wrap the handler
-        handler = create_proxy(make_click_handler(weapon))
+        handler = track_proxy("character.weapon-dropdown", create_proxy(make_click_handler(weapon)))
         option.addEventListener("click", handler)
-        _EVENT_PROXIES.append(handler)
         dropdown.appendChild(option)
 
 
@@ -4260,13 +4617,14 @@ def calculate_weapon_tohit(item: dict) -> int:
     # (in a full implementation, would check class proficiencies)
     to_hit = ability_mod + proficiency
     
-    # Detect bonus from notes JSON or equipment enrichment
-    weapon_bonus = 0
-    try:
-        enriched = _enrich_weapon_item(item)
-        weapon_bonus = enriched.get("bonus", 0) or 0
-    except Exception:
-        weapon_bonus = 0
+    # Detect bonus from the inventory index, then notes JSON or equipment enrichment
+    weapon_bonus = _inventory_modifier_summary()["weapon_bonuses"].get(item.get("id"), 0)
+    if not weapon_bonus:
+        try:
+            enriched = _enrich_weapon_item(item)
+            weapon_bonus = enriched.get("bonus", 0) or 0
+        except Exception:
+            weapon_bonus = 0
     
     # If no bonus yet, try to parse from name like "+1 Sword"
     if not weapon_bonus:
@@ -4291,6 +4649,7 @@ def create_unequip_handler(item_id, weapon_name):
         for item in INVENTORY_MANAGER.items:
             if item.get("id") == item_id:
                 item["equipped"] = False
+                _refresh_inventory_item(item_id)
                 console.log(f"[UNEQUIP] Unequipped: {weapon_name}")
                 # Re-render the weapons grid
                 render_equipped_attack_grid()
@@ -4317,9 +4676,8 @@ def _enrich_weapon_item(item: dict) -> dict:
     # Try notes JSON
     bonus = enriched.get("bonus", 0) or 0
     try:
-        notes_str = enriched.get("notes", "")
-        if notes_str and isinstance(notes_str, str) and notes_str.startswith("{"):
-            notes_data = json.loads(notes_str)
+        notes_data = _inventory_item_properties(item)
+        if notes_data:
             if not dmg and notes_data.get("damage"):
                 dmg = notes_data.get("damage")
             if not dmg_type and notes_data.get("damage_type"):
@@ -4344,111 +4702,93 @@ def _enrich_weapon_item(item: dict) -> dict:
     # If still missing fields, try to look up in equipment library by normalized name
     if (not dmg or not dmg_type or not range_text or not props) and EQUIPMENT_LIBRARY_STATE.get("equipment"):
         try:
-            name_norm = (enriched.get("name", "") or "").lower().replace(',', '').strip()
-            import re
-            for eq in EQUIPMENT_LIBRARY_STATE.get("equipment", []):
-                eq_name_raw = (eq.get("name", "") or "")
-                eq_name = eq_name_raw.lower().replace(',', '').strip()
-                # Tokenize names to allow matching 'Light Crossbow' <-> 'Crossbow, light'
-                name_tokens = set(re.findall(r"\w+", name_norm))
-                eq_tokens = set(re.findall(r"\w+", eq_name))
-                match = False
-                if name_tokens and eq_tokens:
-                    # Exact token set match or subset match
-                    if name_tokens == eq_tokens or name_tokens.issubset(eq_tokens) or eq_tokens.issubset(name_tokens):
-                        match = True
-                # Fallback substring checks
-                if not match:
-                    if name_norm in eq_name or eq_name in name_norm:
-                        match = True
-                if match:
-                    console.log(f"[ENRICH] Found library match for {enriched.get('name')}: {eq_name_raw}")
-                    if not dmg:
-                        dmg = eq.get("damage") or eq.get("damage_dice") or dmg
-                    if not dmg_type:
-                        dmg_type = eq.get("damage_type") or dmg_type
-                    if not range_text:
-                        range_text = eq.get("range") or range_text
-                    if not props:
-                        p = eq.get("properties", "")
-                        if isinstance(p, list):
-                            # Convert list to comma-separated string
-                            props = ", ".join(str(x) for x in p)
-                            # Try to extract range info from properties strings like 'ammunition (range 80/320)'
+            eq = find_equipment_match(_equipment_library_index(), enriched.get("name", ""))
+            if eq is not None:
+                console.log(f"[ENRICH] Found library match for {enriched.get('name')}: {eq.get('name', '')}")
+                if not dmg:
+                    dmg = eq.get("damage") or eq.get("damage_dice") or dmg
+                if not dmg_type:
+                    dmg_type = eq.get("damage_type") or dmg_type
+                if not range_text:
+                    range_text = eq.get("range") or range_text
+                if not props:
+                    p = eq.get("properties", "")
+                    if isinstance(p, list):
+                        # Convert list to comma-separated string
+                        props = ", ".join(str(x) for x in p)
+                        # Try to extract range info from properties strings like 'ammunition (range 80/320)'
+                        try:
+                            import re
+                            if not range_text:
+                                for prop in p:
+                                    if isinstance(prop, str):
+                                        m = re.search(r"\(([^)]+)\)", prop)
+                                        if m:
+                                            # common Open5e property format: 'ammunition (range 80/320)'
+                                            candidate = m.group(1).strip()
+                                            # normalize candidate to remove leading 'range ' if present
+                                            if candidate.lower().startswith("range"):
+                                                candidate = candidate.split(None, 1)[1] if len(candidate.split(None, 1)) > 1 else candidate
+                                            range_text = candidate
+                                            break
+                        except Exception:
+                            pass
+                    else:
+                        props = p
+
+                # If fields still missing, try to parse notes JSON (Equipment.to_dict() stores extras in notes)
+                try:
+                    notes_data = _inventory_item_properties(eq)
+                    if notes_data:
+                        if not dmg:
+                            dmg = notes_data.get("damage") or notes_data.get("damage_dice") or dmg
+                        if not dmg_type:
+                            dmg_type = notes_data.get("damage_type") or dmg_type
+                        if not range_text:
+                            range_text = notes_data.get("range") or notes_data.get("range_text") or range_text
+                        if not props:
+                            p2 = notes_data.get("properties", "")
+                            if isinstance(p2, list):
+                                props = ", ".join(str(x) for x in p2)
+                            else:
+                                props = p2
+                        # Extract bonus from equipment notes if present
+                        if not bonus and notes_data.get("bonus"):
                             try:
-                                import re
-                                if not range_text:
-                                    for prop in p:
-                                        if isinstance(prop, str):
-                                            m = re.search(r"\(([^)]+)\)", prop)
-                                            if m:
-                                                # common Open5e property format: 'ammunition (range 80/320)'
-                                                candidate = m.group(1).strip()
-                                                # normalize candidate to remove leading 'range ' if present
-                                                if candidate.lower().startswith("range"):
-                                                    candidate = candidate.split(None, 1)[1] if len(candidate.split(None, 1)) > 1 else candidate
-                                                range_text = candidate
-                                                break
+                                bonus = int(notes_data.get("bonus"))
                             except Exception:
-                                pass
-                        else:
-                            props = p
+                                bonus = notes_data.get("bonus")
+                except Exception:
+                    # ignore malformed notes
+                    pass
 
-                    # If fields still missing, try to parse notes JSON (Equipment.to_dict() stores extras in notes)
+                # If still missing fields, try the builtin equipment list as a final fallback
+                if (not dmg or not dmg_type or not range_text or not props):
                     try:
-                        notes_str = eq.get("notes", "")
-                        if notes_str and isinstance(notes_str, str) and notes_str.startswith("{"):
-                            notes_data = json.loads(notes_str)
+                        builtin = _find_builtin_equipment_match(enriched.get('name', ''))
+                        if builtin:
                             if not dmg:
-                                dmg = notes_data.get("damage") or notes_data.get("damage_dice") or dmg
+                                dmg = builtin.get('damage') or builtin.get('damage_dice') or dmg
                             if not dmg_type:
-                                dmg_type = notes_data.get("damage_type") or dmg_type
+                                dmg_type = builtin.get('damage_type') or dmg_type
                             if not range_text:
-                                range_text = notes_data.get("range") or notes_data.get("range_text") or range_text
+                                range_text = builtin.get('range_text') or builtin.get('range') or range_text
                             if not props:
-                                p2 = notes_data.get("properties", "")
-                                if isinstance(p2, list):
-                                    props = ", ".join(str(x) for x in p2)
+                                p3 = builtin.get('properties', '')
+                                if isinstance(p3, list):
+                                    props = ", ".join(str(x) for x in p3)
                                 else:
-                                    props = p2
-                            # Extract bonus from equipment notes if present
-                            if not bonus and notes_data.get("bonus"):
+                                    props = p3
+                            # Extract bonus from builtin if provided
+                            if not bonus and builtin.get('bonus'):
                                 try:
-                                    bonus = int(notes_data.get("bonus"))
+                                    bonus = int(builtin.get('bonus'))
                                 except Exception:
-                                    bonus = notes_data.get("bonus")
+                                    bonus = builtin.get('bonus')
                     except Exception:
-                        # ignore malformed notes
                         pass
 
-                    # If still missing fields, try the builtin equipment list as a final fallback
-                    if (not dmg or not dmg_type or not range_text or not props):
-                        try:
-                            builtin = _find_builtin_equipment_match(enriched.get('name', ''))
-                            if builtin:
-                                if not dmg:
-                                    dmg = builtin.get('damage') or builtin.get('damage_dice') or dmg
-                                if not dmg_type:
-                                    dmg_type = builtin.get('damage_type') or dmg_type
-                                if not range_text:
-                                    range_text = builtin.get('range_text') or builtin.get('range') or range_text
-                                if not props:
-                                    p3 = builtin.get('properties', '')
-                                    if isinstance(p3, list):
-                                        props = ", ".join(str(x) for x in p3)
-                                    else:
-                                        props = p3
-                                # Extract bonus from builtin if provided
-                                if not bonus and builtin.get('bonus'):
-                                    try:
-                                        bonus = int(builtin.get('bonus'))
-                                    except Exception:
-                                        bonus = builtin.get('bonus')
-                        except Exception:
-                            pass
-
-                    console.log(f"[ENRICH] Applied damage={dmg}, type={dmg_type}, range={range_text}, props={props}")
-                    break
+                console.log(f"[ENRICH] Applied damage={dmg}, type={dmg_type}, range={range_text}, props={props}")
         except Exception as e:
             console.log(f"[ENRICH] Error during library lookup: {e}")
             pass
@@ -4788,8 +5128,10 @@ def _create_equipment_row(item: dict) -> any:
         removeBtn.style.border = "1px solid rgba(239, 68, 68, 0.5)"
         removeBtn.style.borderRadius = "0.375rem"
         removeBtn.style.cursor = "pointer"
-        removeBtn.addEventListener("click", create_proxy(lambda e, iid=item.get("id"): remove_equipment_item(iid)))
-        _EVENT_PROXIES.append(removeBtn)
+        removeBtn.addEventListener(
+            "click",
+            track_proxy("character.equipment-table", create_proxy(lambda e, iid=item.get("id"): remove_equipment_item(iid))),
+        )
         
         detailsContent.appendChild(removeBtn)
         details.appendChild(detailsContent)
@@ -4853,9 +5195,8 @@ def _create_equipment_field(label: str, field_name: str, item: dict):
     inp.style.color = "#cbd5f5"
     
     item_id = item.get("id")
-    proxy = create_proxy(lambda e, iid=item_id: handle_equipment_input(e, iid))
+    proxy = track_proxy("character.equipment-table", create_proxy(lambda e, iid=item_id: handle_equipment_input(e, iid)))
     inp.addEventListener("input", proxy)
-    _EVENT_PROXIES.append(proxy)
     
     labelEl.appendChild(inp)
     container.appendChild(labelEl)
@@ -4872,6 +5213,7 @@ def render_equipment_table(items: list[dict]):
         return
     # clear
     tbody.innerHTML = ""
+    release_proxies("character.equipment-table")
     if not items:
         wrapper.classList.remove("has-items")
         empty_state.style.display = "block"
@@ -4896,21 +5238,18 @@ def render_equipment_table(items: list[dict]):
         item_id = row.getAttribute("data-item-id")
         inputs = row.querySelectorAll("input[data-item-field]")
         for inp in inputs:
-            proxy = create_proxy(lambda e, iid=item_id: handle_equipment_input(e, iid))
+            proxy = track_proxy("character.equipment-table", create_proxy(lambda e, iid=item_id: handle_equipment_input(e, iid)))
             inp.addEventListener("input", proxy)
-            _EVENT_PROXIES.append(proxy)
         remove_btn = row.querySelector(".equipment-remove")
         if remove_btn is not None:
-            proxy_rm = create_proxy(lambda e, iid=item_id: remove_equipment_item(iid))
+            proxy_rm = track_proxy("character.equipment-table", create_proxy(lambda e, iid=item_id: remove_equipment_item(iid)))
             remove_btn.addEventListener("click", proxy_rm)
-            _EVENT_PROXIES.append(proxy_rm)
         
         # Handle equipped checkbox
         equipped_check = row.querySelector(".equipment-equipped-check")
         if equipped_check is not None:
-            proxy_equip = create_proxy(lambda e, iid=item_id: handle_equipment_equipped(e, iid))
+            proxy_equip = track_proxy("character.equipment-table", create_proxy(lambda e, iid=item_id: handle_equipment_equipped(e, iid)))
             equipped_check.addEventListener("change", proxy_equip)
-            _EVENT_PROXIES.append(proxy_equip)
 
 
 def handle_equipment_equipped(event=None, item_id: str = None):
@@ -4924,6 +5263,7 @@ def handle_equipment_equipped(event=None, item_id: str = None):
             checkbox = event.target if event else None
             if checkbox:
                 item["equipped"] = bool(checkbox.checked)
+                _refresh_inventory_item(item_id)
             console.log(f"DEBUG: Equipment {item.get('name')} equipped={item.get('equipped')}")
             break
     
@@ -4951,6 +5291,7 @@ def handle_equipment_input(event=None, item_id: str = None):
                 item[field_name] = float(new_value) if new_value else 0.0
             else:
                 item[field_name] = new_value
+            _refresh_inventory_item(item_id)
             break
     
     # Update totals display
@@ -5231,17 +5572,22 @@ def get_equipment_items_from_dom() -> list:
     return INVENTORY_MANAGER.items
 
 
-def fetch_equipment_from_open5e():
+async def fetch_equipment_from_open5e():
     """Fetch equipment data from Open5e API and cache locally"""
     global EQUIPMENT_LIBRARY_STATE
     import json
     
-    # Check localStorage cache first
+    # The JS loader in index.html writes the cache through window.pysheetStorage
+    # ("kv" store); caches from before IndexedDB may still be in localStorage
     try:
         cache_key = "dnd_equipment_cache_v10"
-        cached = window.localStorage.getItem(cache_key)
-        if cached:
-            cache_data = json.loads(cached)
+        cached = None
+        if get_storage is not None:
+            cached = await (await get_storage()).get("kv", cache_key)
+        if not cached:
+            cached = window.localStorage.getItem(cache_key)
+        cache_data = json.loads(cached) if cached else None
+        if cache_data:
             console.log(f"PySheet: Loaded {len(cache_data)} items from cache")
             # Only use cache if it has a reasonable number of items (more than just common items)
             if len(cache_data) > 20:
@@ -5396,32 +5742,140 @@ def _get_builtin_equipment_list():
     ]
 
 
+_EQUIPMENT_TOKEN_RE = re.compile(r"\w+")
+_BUILTIN_EQUIPMENT_INDEX = None
+
+
+def _normalize_equipment_name(name) -> str:
+    return (name or "").lower().replace(',', '').strip()
+
+
+def build_equipment_name_index(items: list) -> dict:
+    """Index equipment dicts by normalized name and name tokens.
+
+    Matching 'Light Crossbow' against 'Crossbow, light' used to re-tokenize
+    every library entry per lookup; here each name is normalized once.
+    """
+    items = [item.to_dict() if hasattr(item, "to_dict") else item for item in items]
+    names = []
+    token_sets = []
+    by_name = {}
+    by_token = {}
+    for position, item_dict in enumerate(items):
+        name = _normalize_equipment_name(item_dict.get("name", ""))
+        tokens = frozenset(_EQUIPMENT_TOKEN_RE.findall(name))
+        names.append(name)
+        token_sets.append(tokens)
+        by_name.setdefault(name, position)
+        for token in tokens:
+            by_token.setdefault(token, []).append(position)
+    # One newline-joined blob answers "which entry contains this substring"
+    # with a single str.find; offsets map the hit back to an entry.
+    offsets = []
+    cursor = 0
+    for name in names:
+        offsets.append(cursor)
+        cursor += len(name) + 1
+    return {
+        "items": items,
+        "names": names,
+        "tokens": token_sets,
+        "by_name": by_name,
+        "by_token": by_token,
+        "blob": "\n".join(names),
+        "offsets": offsets,
+        "name_lengths": sorted({len(name) for name in names}),
+    }
+
+
+def find_equipment_match(index: dict, name: str):
+    """Return the first indexed item matching ``name``, or None.
+
+    Same rules (and library-order precedence) as the original scan: equal
+    token sets, either token set a subset of the other, or either
+    normalized name a substring of the other.
+    """
+    items = index.get("items") or []
+    if not items:
+        return None
+    name_norm = _normalize_equipment_name(name)
+    if not name_norm:
+        return items[0]  # "" is a substring of every name
+    name_tokens = frozenset(_EQUIPMENT_TOKEN_RE.findall(name_norm))
+    by_token = index["by_token"]
+    best = len(items)
+
+    if name_tokens:
+        postings = [by_token.get(token) for token in name_tokens]
+        # Library names containing every token of the item name
+        if all(postings):
+            common = set(min(postings, key=len))
+            for posting in postings:
+                common.intersection_update(posting)
+            if common:
+                best = min(best, min(common))
+        # Library names whose tokens all appear in the item name
+        token_sets = index["tokens"]
+        for posting in postings:
+            for position in posting or ():
+                if position >= best:
+                    break
+                if token_sets[position] <= name_tokens:
+                    best = position
+                    break
+
+    # Item name inside a library name: first hit in the blob is the earliest entry
+    hit = index["blob"].find(name_norm)
+    if hit != -1:
+        best = min(best, bisect_right(index["offsets"], hit) - 1)
+
+    # Library name inside the item name: look up every substring of the item name
+    by_name = index["by_name"]
+    if "" in by_name:
+        best = min(best, by_name[""])
+    length = len(name_norm)
+    for size in index["name_lengths"]:
+        if size == 0:
+            continue
+        if size > length:
+            break
+        for start in range(length - size + 1):
+            position = by_name.get(name_norm[start:start + size])
+            if position is not None and position < best:
+                best = position
+
+    return items[best] if best < len(items) else None
+
+
+def _equipment_library_index() -> dict:
+    """Return the name index for EQUIPMENT_LIBRARY_STATE["equipment"], rebuilding if replaced."""
+    equipment = EQUIPMENT_LIBRARY_STATE.get("equipment") or []
+    index = EQUIPMENT_LIBRARY_STATE.get("name_index")
+    if index is None or index.get("source") is not equipment:
+        index = build_equipment_name_index(list(equipment))
+        index["source"] = equipment
+        EQUIPMENT_LIBRARY_STATE["name_index"] = index
+    return index
+
+
 def _find_builtin_equipment_match(name: str):
     """Find a builtin equipment dict matching name using token/set or substring heuristics."""
+    global _BUILTIN_EQUIPMENT_INDEX
     try:
-        import re
-        name_norm = (name or "").lower().replace(',', '').strip()
-        name_tokens = set(re.findall(r"\w+", name_norm))
-        for itm in _get_builtin_equipment_list():
-            itm_dict = itm.to_dict() if hasattr(itm, 'to_dict') else itm
-            eq_name_raw = itm_dict.get('name', '')
-            eq_name = eq_name_raw.lower().replace(',', '').strip()
-            eq_tokens = set(re.findall(r"\w+", eq_name))
-            match = False
-            if name_tokens and eq_tokens:
-                if name_tokens == eq_tokens or name_tokens.issubset(eq_tokens) or eq_tokens.issubset(name_tokens):
-                    match = True
-            if not match:
-                if name_norm in eq_name or eq_name in name_norm:
-                    match = True
-            if match:
-                return itm_dict
+        if _BUILTIN_EQUIPMENT_INDEX is None:
+            _BUILTIN_EQUIPMENT_INDEX = build_equipment_name_index(list(_get_builtin_equipment_list()))
+        return find_equipment_match(_BUILTIN_EQUIPMENT_INDEX, name)
     except Exception:
         pass
     return None
 
 
 def load_equipment_library(_event=None):
+    """Synchronous py-click wrapper that schedules _load_equipment_library()."""
+    asyncio.create_task(_load_equipment_library(_event))
+
+
+async def _load_equipment_library(_event=None):
     """Load equipment library from cached data or Open5e API"""
     console.log("DEBUG: load_equipment_library() called")
     if EQUIPMENT_LIBRARY_STATE.get("loading"):
@@ -5436,10 +5890,11 @@ def load_equipment_library(_event=None):
 
     try:
         # Fetch and cache equipment data
-        fetch_equipment_from_open5e()
+        await fetch_equipment_from_open5e()
         
         equipment_list = EQUIPMENT_LIBRARY_STATE.get("equipment", [])
         if equipment_list:
+            _equipment_library_index()
             EQUIPMENT_LIBRARY_STATE["loaded"] = True
             update_equipment_library_status(f"Loaded {len(equipment_list)} items. Search to filter results.")
             console.log(f"PySheet: Equipment library loaded with {len(equipment_list)} items")
@@ -5462,6 +5917,12 @@ def update_equipment_library_status(message: str):
         status_div.textContent = message
 
 
+async def _populate_equipment_results_after_load(search_term: str):
+    await fetch_equipment_from_open5e()
+    if EQUIPMENT_LIBRARY_STATE.get("equipment"):
+        populate_equipment_results(search_term)
+
+
 def populate_equipment_results(search_term: str = ""):
     """Populate equipment search results from Open5e"""
     results_div = get_element("equipment-library-results")
@@ -5472,7 +5933,8 @@ def populate_equipment_results(search_term: str = ""):
     # Ensure we have equipment data - only fetch if not already loaded
     if not EQUIPMENT_LIBRARY_STATE.get("equipment"):
         console.log("PySheet: No equipment data, calling fetch_equipment_from_open5e")
-        fetch_equipment_from_open5e()
+        asyncio.create_task(_populate_equipment_results_after_load(search_term))
+        return
     
     search_term = search_term.lower().strip()
     filtered = []
@@ -5546,9 +6008,8 @@ def build_equipment_card_html(item: Union[dict, 'Equipment']) -> str:
         # If data not found in direct properties, check the notes JSON (from Weapon.to_dict())
         if not damage or not damage_type or not range_text:
             try:
-                notes_str = item.get("notes", "")
-                if notes_str and notes_str.startswith("{"):
-                    notes_data = json.loads(notes_str)
+                notes_data = _inventory_item_properties(item)
+                if notes_data:
                     console.log(f"DEBUG build_equipment_card: {name} - parsed notes: {notes_data}")
                     if not damage and "damage" in notes_data:
                         damage = notes_data["damage"]
@@ -5637,6 +6098,7 @@ def attach_equipment_card_handlers(container):
     if container is None:
         return
     
+    release_proxies("character.equipment-results")
     buttons = container.querySelectorAll("button.equipment-action")
     for button in buttons:
         name = button.getAttribute("data-equipment-name") or ""
@@ -5653,8 +6115,8 @@ def attach_equipment_card_handlers(container):
             lambda event, n=name, c=cost, w=weight, d=damage, dt=damage_type, r=range_text, p=properties, ac=ac_string, acv=armor_class: 
                 submit_open5e_item(n, c, w, d, dt, r, p, ac, acv)
         )
+        track_proxy("character.equipment-results", proxy)
         button.addEventListener("click", proxy)
-        _EVENT_PROXIES.append(proxy)
 
 
 def _handle_equipment_click(event):
@@ -6306,12 +6768,13 @@ def handle_input_event(event=None):
             prof_id = f"{skill_name}-prof"
             set_form_value(prof_id, True)
     
-    update_calculations()
+    target_id = ""
+    if event is not None and hasattr(event, "target"):
+        target_id = getattr(event.target, "id", "") or ""
+    sections = update_calculations_for_field(target_id)
     if SPELL_LIBRARY_STATE.get("loaded"):
-        target_id = ""
-        if event is not None and hasattr(event, "target"):
-            target = event.target
-            target_id = getattr(target, "id", "")
+        if sections is not None and SPELL_FILTER_SECTION not in sections:
+            return
         auto = target_id in {"class", "level"}
         apply_spell_filters(auto_select=auto)
 
@@ -6352,12 +6815,12 @@ def trigger_auto_export(source: str = "auto"):
     
     return False
 
-def handle_adjust_button(event=None):
+def handle_adjust_button(event=None, button=None):
     """Handle health/resource adjustment buttons."""
-    if event is None or not hasattr(event, "target"):
-        return
-    
-    button = event.target
+    if button is None:
+        if event is None or not hasattr(event, "target"):
+            return
+        button = event.target
     target_id = button.getAttribute("data-adjust-target")
     if not target_id:
         return
@@ -6411,13 +6874,14 @@ def handle_adjust_button(event=None):
     
     # Set the new value
     set_form_value(target_id, str(new_value))
-    update_calculations()
+    update_calculations_for_field(target_id)
     trigger_auto_export("handle_adjust_button")
 
-def handle_currency_button(event):
+def handle_currency_button(event, button=None):
     """Handle currency adjustment buttons (±10, ±100)"""
     try:
-        button = event.target
+        if button is None:
+            button = event.target
         currency_type = button.getAttribute("data-currency")
         amount_str = button.getAttribute("data-amount")
         
@@ -6436,110 +6900,113 @@ def handle_currency_button(event):
         
         # Set the new value
         set_form_value(f"currency-{currency_type}", str(new_value))
-        update_calculations()
+        update_calculations_for_field(f"currency-{currency_type}")
         trigger_auto_export("handle_currency_button")
     except Exception as e:
         console.error(f"ERROR in handle_currency_button: {e}")
 
+def _closest(target, selector: str):
+    """Return the nearest ancestor-or-self matching selector, or None."""
+    closest = getattr(target, "closest", None)
+    if closest is None:
+        return None
+    try:
+        return closest(selector)
+    except Exception:
+        return None
+
+
+def _import_event_wrapper(evt):
+    try:
+        handle_import(evt)
+    except Exception as exc:
+        console.error(f"PySheet: failed to import character - {exc}")
+
+
+def _dispatch_document_input(event):
+    """Delegated 'input' listener for the whole sheet."""
+    target = getattr(event, "target", None)
+    if target is None:
+        return
+    if _closest(target, "[data-character-input]") is target:
+        handle_input_event(event)
+        return
+    target_id = getattr(target, "id", "")
+    if target_id == "spell-search":
+        handle_spell_filter_change(event)
+    elif target_id == "equipment-search-input":
+        populate_equipment_results(getattr(target, "value", ""))
+
+
+def _dispatch_document_change(event):
+    """Delegated 'change' listener for the whole sheet."""
+    target = getattr(event, "target", None)
+    if target is None:
+        return
+    if _closest(target, "[data-character-input]") is target:
+        element_type = (getattr(target, "type", "") or "").lower()
+        if element_type == "checkbox" or target.tagName.lower() == "select":
+            handle_input_event(event)
+        return
+    target_id = getattr(target, "id", "")
+    if target_id in {"spell-level-filter", "spell-class-filter"}:
+        handle_spell_filter_change(event)
+    elif target_id == "import-file":
+        _import_event_wrapper(event)
+
+
+def _dispatch_document_click(event):
+    """Delegated 'click' listener for adjust, currency and reset buttons."""
+    target = getattr(event, "target", None)
+    if target is None:
+        return
+    button = _closest(target, "[data-adjust-target]")
+    if button is not None:
+        handle_adjust_button(event, button)
+        return
+    button = _closest(target, ".currency-btn")
+    if button is not None:
+        handle_currency_button(event, button)
+        return
+    if _closest(target, "#reset-channel-divinity") is not None:
+        reset_channel_divinity(event)
+
+
+# One proxy per event type, bound on the document. Elements are matched by
+# their data-* attributes / ids when the event bubbles up, so re-rendered or
+# newly added inputs need no registration of their own.
+_DOCUMENT_DISPATCHERS = {
+    "input": _dispatch_document_input,
+    "change": _dispatch_document_change,
+    "click": _dispatch_document_click,
+}
+_DOCUMENT_LISTENER_PROXIES: dict = {}
+
+
 def register_event_listeners():
     console.log("[DEBUG] register_event_listeners() called - starting event registration")
     # In test environments document is often a lightweight mock; be defensive
-    if not hasattr(document, 'querySelectorAll'):
-        console.warn("[DEBUG] document.querySelectorAll not available - skipping event registration in non-PyScript environment")
+    if not hasattr(document, 'addEventListener'):
+        console.warn("[DEBUG] document.addEventListener not available - skipping event registration in non-PyScript environment")
         return
 
-    nodes = document.querySelectorAll("[data-character-input]")
-    console.log(f"[DEBUG] Found {len(nodes)} character input elements")
-    for element in nodes:
-        proxy_input = create_proxy(handle_input_event)
-        element.addEventListener("input", proxy_input)
-        _EVENT_PROXIES.append(proxy_input)
-        element_type = getattr(element, "type", "").lower()
-        if element_type == "checkbox" or element.tagName.lower() == "select":
-            proxy_change = create_proxy(handle_input_event)
-            element.addEventListener("change", proxy_change)
-            _EVENT_PROXIES.append(proxy_change)
-
-    # Register adjust button handlers
-    adjust_buttons = document.querySelectorAll("[data-adjust-target]")
-    for button in adjust_buttons:
-        proxy_adjust = create_proxy(handle_adjust_button)
-        button.addEventListener("click", proxy_adjust)
-        _EVENT_PROXIES.append(proxy_adjust)
-
-    # Register currency button handlers
-    currency_buttons = document.querySelectorAll(".currency-btn")
-    for button in currency_buttons:
-        proxy_currency = create_proxy(handle_currency_button)
-        button.addEventListener("click", proxy_currency)
-        _EVENT_PROXIES.append(proxy_currency)
-
-    import_input = get_element("import-file")
-    if import_input is not None:
-        console.log("[DEBUG] import-file element found, registering event listener")
-        console.log(f"[DEBUG] import-file element tag: {import_input.tagName}, type: {getattr(import_input, 'type', 'N/A')}")
-        
-        # Create a Python wrapper function that catches the event and calls handle_import
-        def import_event_wrapper(evt):
-            try:
-                console.log("[DEBUG] import_event_wrapper called!")
-                console.log(f"[DEBUG] event type: {evt.type}, target: {evt.target}")
-                handle_import(evt)
-            except Exception as e:
-                console.error(f"[DEBUG] import_event_wrapper error: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # Create proxy from wrapper
-        proxy_import = create_proxy(import_event_wrapper)
-        
-        # Register on change event
-        import_input.addEventListener("change", proxy_import)
-        console.log("[DEBUG] 'change' event listener registered via wrapper")
-        _EVENT_PROXIES.append(proxy_import)
-        
-        console.log("[DEBUG] All import event listeners registered successfully")
-    else:
-        console.warn("[DEBUG] import-file element NOT FOUND in DOM")
-
-    spell_search = get_element("spell-search")
-    if spell_search is not None:
-        proxy_spell_search = create_proxy(handle_spell_filter_change)
-        spell_search.addEventListener("input", proxy_spell_search)
-        _EVENT_PROXIES.append(proxy_spell_search)
-
-    spell_level_filter = get_element("spell-level-filter")
-    if spell_level_filter is not None:
-        proxy_spell_level = create_proxy(handle_spell_filter_change)
-        spell_level_filter.addEventListener("change", proxy_spell_level)
-        _EVENT_PROXIES.append(proxy_spell_level)
+    for event_name, dispatcher in _DOCUMENT_DISPATCHERS.items():
+        if event_name in _DOCUMENT_LISTENER_PROXIES:
+            continue
+        proxy = track_proxy("character.document", create_proxy(dispatcher))
+        document.addEventListener(event_name, proxy)
+        _DOCUMENT_LISTENER_PROXIES[event_name] = proxy
+    console.log(f"[DEBUG] Delegated document listeners bound: {sorted(_DOCUMENT_LISTENER_PROXIES)}")
 
     spell_class_filter = get_element("spell-class-filter")
-    if spell_class_filter is not None:
-        if not SPELL_LIBRARY_STATE.get("loaded"):
-            populate_spell_class_filter(None)
-        proxy_spell_class = create_proxy(handle_spell_filter_change)
-        spell_class_filter.addEventListener("change", proxy_spell_class)
-        _EVENT_PROXIES.append(proxy_spell_class)
-
-    # Register Channel Divinity reset button
-    reset_btn = get_element("reset-channel-divinity")
-    if reset_btn is not None:
-        proxy_reset = create_proxy(reset_channel_divinity)
-        reset_btn.addEventListener("click", proxy_reset)
-        _EVENT_PROXIES.append(proxy_reset)
-
-    # Register equipment search
-    equipment_search = get_element("equipment-search-input")
-    if equipment_search is not None:
-        proxy_equip_search = create_proxy(lambda e: populate_equipment_results(e.target.value if hasattr(e, 'target') else ""))
-        equipment_search.addEventListener("input", proxy_equip_search)
-        _EVENT_PROXIES.append(proxy_equip_search)
+    if spell_class_filter is not None and not SPELL_LIBRARY_STATE.get("loaded"):
+        populate_spell_class_filter(None)
 
     # Save character when page is being closed or reloaded
-    if window is not None:
-        proxy_unload = create_proxy(lambda e: export_character())
+    if window is not None and "beforeunload" not in _DOCUMENT_LISTENER_PROXIES:
+        proxy_unload = track_proxy("character.document", create_proxy(lambda e: export_character()))
         window.addEventListener("beforeunload", proxy_unload)
+        _DOCUMENT_LISTENER_PROXIES["beforeunload"] = proxy_unload
 
 
 def load_initial_state():
@@ -6696,10 +7163,10 @@ async def _auto_load_weapons():
     console.log("DEBUG: _auto_load_weapons() started")
     await load_weapon_library()
     console.log("DEBUG: _auto_load_weapons() - weapon library loaded")
-    # Also load the equipment library into Python (reads from localStorage or fallback)
+    # Also load the equipment library into Python (reads the storage cache or fallback)
     try:
         console.log("DEBUG: _auto_load_weapons() - loading equipment library into Python")
-        load_equipment_library()
+        await _load_equipment_library()
         console.log(f"DEBUG: _auto_load_weapons() - equipment library size = {len(EQUIPMENT_LIBRARY_STATE.get('equipment', []))}")
         # Re-render the weapons grid so any enriched values are applied
         console.log("DEBUG: _auto_load_weapons() - re-rendering equipped attack grid to apply enrichment")
@@ -6727,5 +7194,7 @@ if document is not None:
             console.warn("DEBUG: No running event loop; skipping _auto_load_weapons scheduling")
         else:
             loop.create_task(_auto_load_weapons())
+            # Merge in the logs of earlier sessions before anything reads them
+            loop.create_task(BrowserLogger.restore())
     except Exception as e:
         console.warn(f"DEBUG: Could not schedule _auto_load_weapons: {e}")
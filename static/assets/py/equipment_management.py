@@ -47,11 +47,12 @@ except ImportError:
     def create_proxy(func):
         return func
 
+from proxy_registry import track_proxy, release_proxies
+
 # =============================================================================
 # Global State & Event Tracking
 # =============================================================================
 
-_EVENT_PROXIES = []
 EQUIPMENT_LIBRARY_STATE = {}
 WEAPON_LIBRARY_STATE = {"weapons": [], "weapon_map": {}, "loading": False, "loaded": False}
 
@@ -170,6 +171,17 @@ def get_checkbox(element_id: str) -> bool:
     return el.checked if hasattr(el, 'checked') else False
 
 
+def _closest(target, selector: str):
+    """Return the nearest ancestor-or-self of target matching selector."""
+    closest = getattr(target, "closest", None)
+    if closest is None:
+        return None
+    try:
+        return closest(selector)
+    except Exception:
+        return None
+
+
 def set_text(element_id: str, value: str):
     """Set text content of element."""
     el = get_element(element_id)
@@ -205,6 +217,143 @@ def generate_id(prefix: str) -> str:
     import uuid
     return f"{prefix}_{str(uuid.uuid4())[:8]}"
 
+
+# =============================================================================
+# Parsed Item Properties
+# =============================================================================
+
+# Items keep their weapon/armor metadata as a JSON string in item["notes"]
+# (that is what exports contain). InventoryManager keeps the parsed form in a
+# side map keyed by item id, so the cache never ends up in saved or exported
+# items; items it does not own are parsed on each read.
+STALE_ITEM_PROPS_KEY = "extra_props"
+
+
+def _parse_notes_props(notes) -> dict:
+    if not notes or not isinstance(notes, str) or not notes.startswith("{"):
+        return {}
+    try:
+        values = json.loads(notes)
+    except (ValueError, TypeError):
+        return {}
+    return values if isinstance(values, dict) else {}
+
+
+def get_item_properties(item: dict) -> dict:
+    """Return the parsed notes JSON of an item."""
+    if not isinstance(item, dict):
+        return {}
+    return _parse_notes_props(item.get("notes", ""))
+
+
+def set_item_properties(item: dict, values: dict) -> dict:
+    """Write ``values`` back to the item's notes and return the stored copy."""
+    values = dict(values or {})
+    item["notes"] = json.dumps(values) if values else ""
+    return values
+
+
+# =============================================================================
+# Item Modifier Aggregates
+# =============================================================================
+
+ARMOR_NAME_KEYWORDS = ("plate", "leather", "chain", "hide", "scale", "mail", "breastplate", "armor")
+WEAPON_NAME_KEYWORDS = ("sword", "axe", "bow", "spear", "mace", "staff", "dagger", "rapier", "crossbow", "club", "flail", "hammer", "lance", "pike", "scimitar")
+
+
+def _is_worn_armor(name_lower: str, category: str) -> bool:
+    if any(kw in name_lower for kw in WEAPON_NAME_KEYWORDS):
+        return False
+    return category == "armor" or any(kw in name_lower for kw in ARMOR_NAME_KEYWORDS)
+
+
+def item_modifier_contribution(item: dict, props: Optional[dict] = None) -> dict:
+    """Return what a single item adds to AC, saves and attack rolls.
+
+    Mirrors the per-item rules of the AC and save tooltips: equipped shields
+    give 2 + bonus, other equipped items give ac_modifier unless armor_only,
+    and saves_modifier applies from any carried item. Equipped body armor
+    with an AC is reported as ``equipped_armor`` so AC can prefer it over
+    armor that is merely carried.
+    """
+    if props is None:
+        props = get_item_properties(item)
+    name = item.get("name", "Unknown")
+    name_lower = name.lower()
+    category = (item.get("category") or "").lower()
+    contribution = {
+        "shield": 0,
+        "ac_modifier": 0,
+        "saves_modifier": 0,
+        "armor": None,
+        "equipped_armor": None,
+        "bonus": 0,
+        "ac_row": None,
+    }
+
+    if item.get("equipped"):
+        try:
+            if "shield" in name_lower or category == "shield":
+                contribution["shield"] = 2 + int(props.get("bonus", 0))
+                contribution["ac_row"] = (name, contribution["shield"], True)
+            else:
+                if not props.get("armor_only", False) and props.get("ac_modifier", 0):
+                    contribution["ac_modifier"] = int(props.get("ac_modifier", 0))
+                    contribution["ac_row"] = (name, contribution["ac_modifier"], False)
+                ac_val = props.get("armor_class", props.get("ac"))
+                if ac_val and _is_worn_armor(name_lower, category):
+                    contribution["equipped_armor"] = (int(ac_val), name)
+        except (ValueError, TypeError):
+            pass
+
+    contribution["saves_modifier"] = parse_int(props.get("saves_modifier", 0) or 0, 0)
+    contribution["bonus"] = parse_int(item.get("bonus") or props.get("bonus", 0) or 0, 0)
+
+    if item.get("category") == "Armor" and item.get("qty", 0) > 0:
+        ac_val = props.get("armor_class", props.get("ac"))
+        if ac_val:
+            try:
+                contribution["armor"] = (int(ac_val), name)
+            except (ValueError, TypeError):
+                pass
+    return contribution
+
+
+def _empty_modifier_summary() -> dict:
+    return {
+        "shield_bonus": 0,
+        "ac_modifier": 0,
+        "saves_modifier": 0,
+        "ac_rows": [],
+        "armor": None,
+        "equipped_armor": None,
+        "weapon_bonuses": {},
+    }
+
+
+def _summarize_contributions(contributions) -> dict:
+    summary = _empty_modifier_summary()
+    for item_id, contribution in contributions:
+        summary["shield_bonus"] += contribution["shield"]
+        summary["ac_modifier"] += contribution["ac_modifier"]
+        summary["saves_modifier"] += contribution["saves_modifier"]
+        if contribution["ac_row"] is not None:
+            summary["ac_rows"].append(contribution["ac_row"])
+        if summary["armor"] is None and contribution["armor"] is not None:
+            summary["armor"] = contribution["armor"]
+        if summary["equipped_armor"] is None and contribution["equipped_armor"] is not None:
+            summary["equipped_armor"] = contribution["equipped_armor"]
+        if contribution["bonus"]:
+            summary["weapon_bonuses"][item_id] = contribution["bonus"]
+    return summary
+
+
+def summarize_item_modifiers(items: list) -> dict:
+    """Aggregate item modifiers over a plain list of items (full scan)."""
+    return _summarize_contributions(
+        (item.get("id"), item_modifier_contribution(item)) for item in items if isinstance(item, dict)
+    )
+
 # =============================================================================
 # Item Classes
 # =============================================================================
@@ -340,6 +489,20 @@ class Equipment(Item):
                  category: str = "Adventuring Gear", notes: str = "", source: str = "custom"):
         super().__init__(name, cost, weight, qty, category, notes, source)
 
+def _compile_keyword_classifier(rules) -> tuple:
+    """Compile (category, keywords) rules into (category, regex) pairs.
+
+    Each regex is one alternation of the escaped keywords, so a category test
+    is a single substring search instead of a Python-level loop.
+    """
+    compiled = []
+    for category, keywords in rules:
+        # Longest first so overlapping keywords do not shadow each other
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        compiled.append((category, re.compile("|".join(re.escape(k) for k in ordered))))
+    return tuple(compiled)
+
+
 # =============================================================================
 # InventoryManager Class (650 lines)
 # =============================================================================
@@ -357,11 +520,173 @@ class InventoryManager:
     MOUNT_KEYWORDS = ["horse", "mule", "donkey", "camel", "mount", "vehicle", "cart", "boat", "ship"]
     MAGIC_KEYWORDS = ["+1", "+2", "+3", "magical", "magic", "enchanted", "ring of", "cloak of", "amulet of", "wand of", "staff of", "artifact", "relic"]
     
+    # Checked in order; magic items first (they might contain weapon/armor keywords too)
+    CATEGORY_RULES = (
+        ("Magic Items", MAGIC_KEYWORDS),
+        ("Armor", ARMOR_KEYWORDS),
+        ("Weapons", WEAPON_KEYWORDS),
+        ("Ammunition", AMMO_KEYWORDS),
+        ("Tools", TOOL_KEYWORDS),
+        ("Potions", POTION_KEYWORDS),
+        ("Adventuring Gear", GEAR_KEYWORDS),
+        ("Mounts & Vehicles", MOUNT_KEYWORDS),
+    )
+    _CATEGORY_CLASSIFIER = _compile_keyword_classifier(CATEGORY_RULES)
+    
     # Category ordering for display
     CATEGORY_ORDER = ["Magic Items", "Weapons", "Armor", "Ammunition", "Potions", "Tools", "Adventuring Gear", "Mounts & Vehicles", "Other"]
     
+    # data attribute -> (handler method, extra args) for the delegated change listener
+    ITEM_CHANGE_HANDLERS = (
+        ("data-item-qty", "_handle_qty_change", ()),
+        ("data-item-category", "_handle_category_change", ()),
+        ("data-item-custom-props", "_handle_custom_props_change", ()),
+        ("data-item-ac-mod", "_handle_modifier_change", ("ac_modifier",)),
+        ("data-item-saves-mod", "_handle_modifier_change", ("saves_modifier",)),
+        ("data-item-armor-only", "_handle_armor_only_toggle", ()),
+        ("data-item-armor-ac", "_handle_armor_ac_change", ()),
+        ("data-item-bonus", "_handle_bonus_change", ()),
+        ("data-item-equipped", "_handle_equipped_toggle", ()),
+    )
+    
     def __init__(self):
+        self._modifier_contributions: dict = {}
+        self._modifier_totals = {"shield_bonus": 0, "ac_modifier": 0, "saves_modifier": 0}
+        self._modifier_summary: Optional[dict] = None
+        # Item id -> parsed notes; see get_item_properties()
+        self._item_props: dict[str, dict] = {}
+        # Ordered id -> item store; self.items is a list view over it
+        self._item_store: dict[str, dict] = {}
+        self._items_view: list[dict] = []
+        self._items_view_stale = False
+        self._next_item_id = 0
         self.items: list[dict] = []
+        self._delegated_container = None
+        self._delegated_proxies: dict = {}
+
+    @property
+    def items(self) -> list[dict]:
+        """Items in insertion order (the list exported as inventory.items)."""
+        self._sync_items()
+        return self._items_view
+
+    @items.setter
+    def items(self, value: list[dict]):
+        # Reassigning the list (load, clear, bulk remove) rebuilds both indexes
+        self._adopt_items(value)
+
+    # ------------------------------------------------------------------
+    # Item store: get/update/remove are dict lookups. The list view is
+    # regenerated lazily after removals, and a view whose length no longer
+    # matches the store (appended to or trimmed directly) is re-adopted.
+    # ------------------------------------------------------------------
+
+    def _sync_items(self):
+        if self._items_view_stale:
+            self._items_view = list(self._item_store.values())
+            self._items_view_stale = False
+        elif len(self._items_view) != len(self._item_store):
+            self._adopt_items(self._items_view)
+
+    def _adopt_items(self, items: list):
+        """Index a list of items, giving missing or duplicate ids fresh ones."""
+        view = items if all(isinstance(item, dict) for item in items) else [
+            item for item in items if isinstance(item, dict)
+        ]
+        seen = set()
+        needs_id = set()
+        highest = -1
+        for item in view:
+            key = item.get("id")
+            key = str(key) if key not in (None, "") else None
+            if key is None or key in seen:
+                needs_id.add(id(item))
+                continue
+            seen.add(key)
+            if key.isdigit():
+                highest = max(highest, int(key))
+        self._next_item_id = highest + 1
+        store = {}
+        for item in view:
+            if id(item) in needs_id:
+                item["id"] = self._new_item_id(seen)
+                seen.add(item["id"])
+            store[str(item["id"])] = item
+        self._item_store = store
+        self._item_props = {}
+        self._items_view = view
+        self._items_view_stale = False
+        self._rebuild_modifier_index()
+
+    def _new_item_id(self, taken) -> str:
+        """Return the next unused numeric id; ids are never reused after removal."""
+        while str(self._next_item_id) in taken:
+            self._next_item_id += 1
+        item_id = str(self._next_item_id)
+        self._next_item_id += 1
+        return item_id
+
+    # ------------------------------------------------------------------
+    # Modifier index: per-item contributions keyed by the item object, with
+    # running totals updated by subtracting the old and adding the new share.
+    # ------------------------------------------------------------------
+
+    def _apply_contribution(self, contribution: dict, sign: int):
+        totals = self._modifier_totals
+        totals["shield_bonus"] += sign * contribution["shield"]
+        totals["ac_modifier"] += sign * contribution["ac_modifier"]
+        totals["saves_modifier"] += sign * contribution["saves_modifier"]
+
+    def _rebuild_modifier_index(self):
+        self._modifier_contributions = {}
+        self._modifier_totals = {"shield_bonus": 0, "ac_modifier": 0, "saves_modifier": 0}
+        self._modifier_summary = None
+        for item in self._items_view:
+            self._refresh_item_modifiers(item)
+
+    def _refresh_item_modifiers(self, item: dict):
+        key = id(item)
+        previous = self._modifier_contributions.pop(key, None)
+        if previous is not None:
+            self._apply_contribution(previous[1], -1)
+        contribution = item_modifier_contribution(item, self.get_item_properties(item))
+        self._modifier_contributions[key] = (item, contribution)
+        self._apply_contribution(contribution, 1)
+        self._modifier_summary = None
+
+    def _drop_item_modifiers(self, item: dict):
+        previous = self._modifier_contributions.pop(id(item), None)
+        if previous is not None:
+            self._apply_contribution(previous[1], -1)
+            self._modifier_summary = None
+
+    def refresh_item(self, item_id: str):
+        """Re-index an item after its dict was edited in place outside the manager."""
+        item = self.get_item(item_id)
+        if item is not None:
+            self._item_props.pop(str(item_id), None)
+            self._refresh_item_modifiers(item)
+
+    def get_modifier_summary(self) -> dict:
+        """Return AC/save/to-hit aggregates for the inventory.
+
+        Totals are kept current on every add/remove/update; the ordered parts
+        (tooltip rows, first armor, first equipped armor) are rebuilt from cached contributions only
+        after something changed.
+        """
+        items = self.items
+        if len(self._modifier_contributions) != len(items):
+            self._rebuild_modifier_index()
+        if self._modifier_summary is None:
+            contributions = self._modifier_contributions
+            summary = _summarize_contributions(
+                (item.get("id"), contributions[id(item)][1])
+                for item in items
+                if id(item) in contributions
+            )
+            summary.update(self._modifier_totals)
+            self._modifier_summary = summary
+        return self._modifier_summary
     
     def load_state(self, state: Optional[dict]):
         """Load inventory from character state."""
@@ -377,44 +702,57 @@ class InventoryManager:
         if not items_list:
             items_list = state.get("equipment", [])
         
-        self.items = []
+        loaded = []
+        uncategorized = []
         for item in items_list:
             if isinstance(item, dict):
-                # Ensure all required fields exist
-                if "id" not in item:
-                    item["id"] = str(len(self.items))
+                # Ensure all required fields exist (missing/duplicate ids are
+                # assigned when the list is adopted below)
                 if "category" not in item:
-                    item["category"] = self._infer_category(item.get("name", ""))
+                    uncategorized.append(item)
                 if "qty" not in item:
                     item["qty"] = item.get("quantity", 1)
-                self.items.append(item)
+                # Drop the parsed-notes entry some exports carried inline
+                item.pop(STALE_ITEM_PROPS_KEY, None)
+                loaded.append(item)
+        if uncategorized:
+            categories = self.classify_many(item.get("name", "") for item in uncategorized)
+            for item, category in zip(uncategorized, categories):
+                item["category"] = category
+        self.items = loaded
     
     def _infer_category(self, name: str) -> str:
         """Auto-detect item category from name."""
-        name_lower = name.lower()
-        # Check for magic items first (they might contain weapon/armor keywords too)
-        if any(keyword in name_lower for keyword in self.MAGIC_KEYWORDS):
-            return "Magic Items"
-        elif any(keyword in name_lower for keyword in self.ARMOR_KEYWORDS):
-            return "Armor"
-        elif any(keyword in name_lower for keyword in self.WEAPON_KEYWORDS):
-            return "Weapons"
-        elif any(keyword in name_lower for keyword in self.AMMO_KEYWORDS):
-            return "Ammunition"
-        elif any(keyword in name_lower for keyword in self.TOOL_KEYWORDS):
-            return "Tools"
-        elif any(keyword in name_lower for keyword in self.POTION_KEYWORDS):
-            return "Potions"
-        elif any(keyword in name_lower for keyword in self.GEAR_KEYWORDS):
-            return "Adventuring Gear"
-        elif any(keyword in name_lower for keyword in self.MOUNT_KEYWORDS):
-            return "Mounts & Vehicles"
+        name_lower = (name or "").lower()
+        for category, pattern in self._CATEGORY_CLASSIFIER:
+            if pattern.search(name_lower):
+                return category
         return "Other"
+
+    @classmethod
+    def classify_many(cls, names) -> list[str]:
+        """Infer categories for many names at once (e.g. a large legacy import)."""
+        classifier = cls._CATEGORY_CLASSIFIER
+        seen: dict[str, str] = {}
+        categories = []
+        for name in names:
+            name_lower = (name or "").lower()
+            category = seen.get(name_lower)
+            if category is None:
+                category = "Other"
+                for candidate, pattern in classifier:
+                    if pattern.search(name_lower):
+                        category = candidate
+                        break
+                seen[name_lower] = category
+            categories.append(category)
+        return categories
     
     def add_item(self, name: str, cost: str = "", weight: str = "", qty: int = 1, 
                  category: str = "", notes: str = "", source: str = "custom") -> str:
         """Add an item to inventory and return its ID."""
-        item_id = str(len(self.items))
+        self._sync_items()
+        item_id = self._new_item_id(self._item_store)
         if not category:
             category = self._infer_category(name)
         
@@ -429,28 +767,60 @@ class InventoryManager:
             "source": source,
             "equipped": False,
         }
-        self.items.append(item)
+        self._item_store[item_id] = item
+        if not self._items_view_stale:
+            self._items_view.append(item)
+        self._refresh_item_modifiers(item)
         return item_id
     
     def remove_item(self, item_id: str):
         """Remove an item by ID."""
-        self.items = [item for item in self.items if item.get("id") != item_id]
+        self._sync_items()
+        item = self._item_store.pop(str(item_id), None) if item_id is not None else None
+        if item is None:
+            return
+        self._items_view_stale = True
+        self._item_props.pop(str(item_id), None)
+        self._drop_item_modifiers(item)
     
     def get_item(self, item_id: str) -> Optional[dict]:
         """Get an item by ID."""
-        for item in self.items:
-            if item.get("id") == item_id:
-                return item
-        return None
+        if item_id is None:
+            return None
+        self._sync_items()
+        return self._item_store.get(str(item_id))
     
     def update_item(self, item_id: str, updates: dict):
         """Update item fields."""
-        for item in self.items:
-            if item.get("id") == item_id:
-                for key, value in updates.items():
-                    if key in ("name", "cost", "weight", "qty", "category", "notes", "equipped"):
-                        item[key] = value
-                break
+        item = self.get_item(item_id)
+        if item is None:
+            return
+        for key, value in updates.items():
+            if key in ("name", "cost", "weight", "qty", "category", "notes", "equipped"):
+                item[key] = value
+        if "notes" in updates:
+            self._item_props.pop(str(item_id), None)
+        self._refresh_item_modifiers(item)
+
+    def update_item_properties(self, item_id: str, values: dict):
+        """Replace an item's notes properties without re-parsing them on next read."""
+        item = self.get_item(item_id)
+        if item is not None:
+            self._item_props[str(item_id)] = set_item_properties(item, values)
+            self._refresh_item_modifiers(item)
+
+    def get_item_properties(self, item: dict) -> dict:
+        """Parsed notes of ``item``, parsed once while the inventory owns it.
+
+        The returned dict is shared with the cache; copy it before modifying.
+        """
+        key = str(item.get("id")) if isinstance(item, dict) else None
+        if key is None or self._item_store.get(key) is not item:
+            return get_item_properties(item)
+        values = self._item_props.get(key)
+        if values is None:
+            values = self._item_props[key] = get_item_properties(item)
+        return values
     
     def get_items_by_category(self) -> dict[str, list[dict]]:
         """Group items by category, sorted within each category."""
@@ -527,13 +897,9 @@ class InventoryManager:
                 notes = item.get("notes", "")
                 
                 # Parse extra properties from notes JSON if present
-                extra_props = {}
-                try:
-                    if notes and notes.startswith("{"):
-                        extra_props = json.loads(notes)
-                        notes = ""  # Clear notes since we're using it for storage
-                except:
-                    pass
+                extra_props = self.get_item_properties(item)
+                if extra_props:
+                    notes = ""  # Clear notes since we're using it for storage
                 
                 # Get bonus for weapons and armor
                 bonus = extra_props.get("bonus", 0)
@@ -654,184 +1020,72 @@ class InventoryManager:
         update_inventory_totals()
     
     def _register_item_handlers(self):
-        """Register click handlers for inventory items."""
+        """Bind the delegated click/change listeners on the inventory list.
+
+        One listener per event type is bound to #inventory-list and dispatches
+        on the data-* attribute of the element that fired, so re-rendering the
+        list never creates new proxies.
+        """
         if document is None:
             return
         
-        # Toggle expand/collapse
         inventory_list = get_element("inventory-list")
         if inventory_list is None:
             return
-        
-        # FIX: Get item_id from event target's data attribute instead of closure capture
-        # This prevents the closure problem where all handlers end up with the last item_id
-        toggles = inventory_list.querySelectorAll("[data-toggle-item]")
-        for toggle in toggles:
-            def make_toggle_handler():
-                def handler(event):
-                    # Get item_id from the element that was clicked
-                    item_id = event.target.getAttribute("data-toggle-item")
-                    # If not found on clicked element, traverse up to find it
-                    if not item_id:
-                        parent = event.target.parentElement
-                        while parent and not item_id:
-                            item_id = parent.getAttribute("data-toggle-item")
-                            parent = parent.parentElement
-                    if item_id:
-                        self._handle_item_toggle(event, item_id)
-                return handler
-            proxy = create_proxy(make_toggle_handler())
-            toggle.addEventListener("click", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Remove buttons
-        removes = inventory_list.querySelectorAll("[data-remove-item]")
-        for remove_btn in removes:
-            def make_remove_handler():
-                def handler(event):
-                    # Get item_id from the button's data attribute
-                    item_id = event.target.getAttribute("data-remove-item")
-                    if item_id:
-                        self._handle_item_remove(event, item_id)
-                return handler
-            proxy = create_proxy(make_remove_handler())
-            remove_btn.addEventListener("click", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Qty changes
-        qty_inputs = inventory_list.querySelectorAll("[data-item-qty]")
-        for qty_input in qty_inputs:
-            def make_qty_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-qty")
-                    if item_id:
-                        self._handle_qty_change(event, item_id)
-                return handler
-            proxy = create_proxy(make_qty_handler())
-            qty_input.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Category changes
-        cat_selects = inventory_list.querySelectorAll("[data-item-category]")
-        for cat_select in cat_selects:
-            def make_cat_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-category")
-                    if item_id:
-                        self._handle_category_change(event, item_id)
-                return handler
-            proxy = create_proxy(make_cat_handler())
-            cat_select.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Custom properties changes
-        custom_props_inputs = inventory_list.querySelectorAll("[data-item-custom-props]")
-        for props_input in custom_props_inputs:
-            def make_props_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-custom-props")
-                    if item_id:
-                        self._handle_custom_props_change(event, item_id)
-                return handler
-            proxy = create_proxy(make_props_handler())
-            props_input.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # AC modifier changes
-        ac_mod_inputs = inventory_list.querySelectorAll("[data-item-ac-mod]")
-        for ac_input in ac_mod_inputs:
-            def make_ac_mod_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-ac-mod")
-                    if item_id:
-                        self._handle_modifier_change(event, item_id, "ac_modifier")
-                return handler
-            proxy = create_proxy(make_ac_mod_handler())
-            ac_input.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Saves modifier changes
-        saves_mod_inputs = inventory_list.querySelectorAll("[data-item-saves-mod]")
-        for saves_input in saves_mod_inputs:
-            def make_saves_mod_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-saves-mod")
-                    if item_id:
-                        self._handle_modifier_change(event, item_id, "saves_modifier")
-                return handler
-            proxy = create_proxy(make_saves_mod_handler())
-            saves_input.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Armor-only checkbox changes
-        armor_only_checkboxes = inventory_list.querySelectorAll("[data-item-armor-only]")
-        for checkbox in armor_only_checkboxes:
-            def make_armor_only_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-armor-only")
-                    if item_id:
-                        self._handle_armor_only_toggle(event, item_id)
-                return handler
-            proxy = create_proxy(make_armor_only_handler())
-            checkbox.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Armor AC value changes
-        armor_ac_inputs = inventory_list.querySelectorAll("[data-item-armor-ac]")
-        for ac_input in armor_ac_inputs:
-            def make_armor_ac_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-armor-ac")
-                    if item_id:
-                        self._handle_armor_ac_change(event, item_id)
-                return handler
-            proxy = create_proxy(make_armor_ac_handler())
-            ac_input.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Bonus value changes (for weapons and armor)
-        bonus_inputs = inventory_list.querySelectorAll("[data-item-bonus]")
-        for bonus_input in bonus_inputs:
-            def make_bonus_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-bonus")
-                    if item_id:
-                        self._handle_bonus_change(event, item_id)
-                return handler
-            proxy = create_proxy(make_bonus_handler())
-            bonus_input.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Equipped checkboxes
-        equipped_checkboxes = inventory_list.querySelectorAll("[data-item-equipped]")
-        for checkbox in equipped_checkboxes:
-            def make_equipped_handler():
-                def handler(event):
-                    item_id = event.target.getAttribute("data-item-equipped")
-                    if item_id:
-                        self._handle_equipped_toggle(event, item_id)
-                return handler
-            proxy = create_proxy(make_equipped_handler())
-            checkbox.addEventListener("change", proxy)
-            _EVENT_PROXIES.append(proxy)
-        
-        # Magic Item fetch buttons
-        fetch_buttons = inventory_list.querySelectorAll("button[id^='magic-item-fetch-']")
-        for btn in fetch_buttons:
-            def make_fetch_handler():
-                def handle_fetch(event):
-                    btn_id = event.target.getAttribute("id")
-                    item_id = btn_id.replace("magic-item-fetch-", "")
-                    url_input = document.getElementById(f"magic-item-url-{item_id}")
-                    if url_input:
-                        url = url_input.value.strip()
-                        if url:
-                            console.log(f"PySheet: Fetching magic item from {url}")
-                            self._fetch_magic_item(item_id, url)
-                return handle_fetch
-            proxy = create_proxy(make_fetch_handler())
-            btn.addEventListener("click", proxy)
-            _EVENT_PROXIES.append(proxy)
+        if self._delegated_container is inventory_list:
+            return
+        if self._delegated_container is not None:
+            for event_name, proxy in self._delegated_proxies.items():
+                try:
+                    self._delegated_container.removeEventListener(event_name, proxy)
+                except Exception:
+                    pass
+        if not self._delegated_proxies:
+            self._delegated_proxies = {
+                "click": track_proxy("inventory.list", create_proxy(self._dispatch_item_click)),
+                "change": track_proxy("inventory.list", create_proxy(self._dispatch_item_change)),
+            }
+        for event_name, proxy in self._delegated_proxies.items():
+            inventory_list.addEventListener(event_name, proxy)
+        self._delegated_container = inventory_list
+    
+    def _dispatch_item_click(self, event):
+        """Route clicks inside the inventory list by data attribute."""
+        target = getattr(event, "target", None)
+        if target is None:
+            return
+        remove_btn = _closest(target, "[data-remove-item]")
+        if remove_btn is not None:
+            item_id = remove_btn.getAttribute("data-remove-item")
+            if item_id:
+                self._handle_item_remove(event, item_id)
+            return
+        fetch_btn = _closest(target, "button[id^='magic-item-fetch-']")
+        if fetch_btn is not None:
+            item_id = fetch_btn.getAttribute("id").replace("magic-item-fetch-", "")
+            url_input = document.getElementById(f"magic-item-url-{item_id}")
+            if url_input:
+                url = url_input.value.strip()
+                if url:
+                    console.log(f"PySheet: Fetching magic item from {url}")
+                    self._fetch_magic_item(item_id, url)
+            return
+        toggle = _closest(target, "[data-toggle-item]")
+        if toggle is not None:
+            item_id = toggle.getAttribute("data-toggle-item")
+            if item_id:
+                self._handle_item_toggle(event, item_id)
+    
+    def _dispatch_item_change(self, event):
+        """Route change events inside the inventory list by data attribute."""
+        target = getattr(event, "target", None)
+        if target is None or not hasattr(target, "getAttribute"):
+            return
+        for attribute, method_name, extra_args in self.ITEM_CHANGE_HANDLERS:
+            item_id = target.getAttribute(attribute)
+            if item_id:
+                getattr(self, method_name)(event, item_id, *extra_args)
+                return
     
     def _handle_item_toggle(self, event, item_id: str):
         """Toggle item details visibility."""
@@ -898,22 +1152,14 @@ class InventoryManager:
         # Update the item's notes field with the custom properties
         item = self.get_item(item_id)
         if item:
-            try:
-                # Parse existing notes to preserve other properties
-                notes_str = item.get("notes", "")
-                if notes_str and notes_str.startswith("{"):
-                    extra_props = json.loads(notes_str)
-                else:
-                    extra_props = {}
-            except:
-                extra_props = {}
+            # Copy existing properties so the cached entry is not mutated
+            extra_props = dict(self.get_item_properties(item))
             
             # Update custom properties
             extra_props["custom_properties"] = custom_props
             
             # Save back to notes
-            notes = json.dumps(extra_props) if extra_props else ""
-            self.update_item(item_id, {"notes": notes})
+            self.update_item_properties(item_id, extra_props)
             self.render_inventory()
     def _handle_modifier_change(self, event, item_id: str, modifier_type: str):
         """Handle AC or Saves modifier changes."""
@@ -929,15 +1175,8 @@ class InventoryManager:
         # Update the item's notes field with the modifier
         item = self.get_item(item_id)
         if item:
-            try:
-                # Parse existing notes to preserve other properties
-                notes_str = item.get("notes", "")
-                if notes_str and notes_str.startswith("{"):
-                    extra_props = json.loads(notes_str)
-                else:
-                    extra_props = {}
-            except:
-                extra_props = {}
+            # Copy existing properties so the cached entry is not mutated
+            extra_props = dict(self.get_item_properties(item))
             
             # Update modifier
             if mod_value != "":
@@ -948,8 +1187,7 @@ class InventoryManager:
                     del extra_props[modifier_type]
             
             # Save back to notes
-            notes = json.dumps(extra_props) if extra_props else ""
-            self.update_item(item_id, {"notes": notes})
+            self.update_item_properties(item_id, extra_props)
             self.render_inventory()  # Update display
             
             # Update calculations (which will recalculate AC and stats)
@@ -962,15 +1200,8 @@ class InventoryManager:
         # Update the item's notes field with the armor_only flag
         item = self.get_item(item_id)
         if item:
-            try:
-                # Parse existing notes to preserve other properties
-                notes_str = item.get("notes", "")
-                if notes_str and notes_str.startswith("{"):
-                    extra_props = json.loads(notes_str)
-                else:
-                    extra_props = {}
-            except:
-                extra_props = {}
+            # Copy existing properties so the cached entry is not mutated
+            extra_props = dict(self.get_item_properties(item))
             
             # Update armor_only flag
             if is_armor_only:
@@ -983,8 +1214,7 @@ class InventoryManager:
                     del extra_props["armor_only"]
             
             # Save back to notes
-            notes = json.dumps(extra_props) if extra_props else ""
-            self.update_item(item_id, {"notes": notes})
+            self.update_item_properties(item_id, extra_props)
             self.render_inventory()  # Update display
             
             # Update calculations (which will recalculate AC and stats)
@@ -1006,15 +1236,8 @@ class InventoryManager:
         item = self.get_item(item_id)
         if item:
             console.log(f"[AC-CHANGE] Found item: {item.get('name')}, existing notes: {item.get('notes', '')}")
-            try:
-                # Parse existing notes to preserve other properties
-                notes_str = item.get("notes", "")
-                if notes_str and notes_str.startswith("{"):
-                    extra_props = json.loads(notes_str)
-                else:
-                    extra_props = {}
-            except:
-                extra_props = {}
+            # Copy existing properties so the cached entry is not mutated
+            extra_props = dict(self.get_item_properties(item))
             
             # Update armor_class value
             if ac_val is not None:
@@ -1024,9 +1247,8 @@ class InventoryManager:
                 del extra_props["armor_class"]
             
             # Save back to notes
-            notes = json.dumps(extra_props) if extra_props else ""
-            console.log(f"[AC-CHANGE] Saving notes: {notes}")
-            self.update_item(item_id, {"notes": notes})
+            self.update_item_properties(item_id, extra_props)
+            console.log(f"[AC-CHANGE] Saving notes: {item.get('notes', '')}")
             self.render_inventory()  # Update display
             
             # Save to localStorage directly
@@ -1070,15 +1292,8 @@ class InventoryManager:
         # Update the item's notes field with the bonus value
         item = self.get_item(item_id)
         if item:
-            try:
-                # Parse existing notes to preserve other properties
-                notes_str = item.get("notes", "")
-                if notes_str and notes_str.startswith("{"):
-                    extra_props = json.loads(notes_str)
-                else:
-                    extra_props = {}
-            except:
-                extra_props = {}
+            # Copy existing properties so the cached entry is not mutated
+            extra_props = dict(self.get_item_properties(item))
             
             # Update armor_class value based on bonus
             if bonus_val != 0:
@@ -1100,8 +1315,7 @@ class InventoryManager:
                     del extra_props["armor_class"]
             
             # Save back to notes
-            notes = json.dumps(extra_props) if extra_props else ""
-            self.update_item(item_id, {"notes": notes})
+            self.update_item_properties(item_id, extra_props)
             self.render_inventory()  # Update display to show new name with bonus
             
             # Save to localStorage directly
@@ -1270,7 +1484,7 @@ class InventoryManager:
                     extra_props["rarity"] = rarity
                 
                 item["weight"] = weight
-                item["notes"] = json.dumps(extra_props) if extra_props else ""
+                set_item_properties(item, extra_props)
                 
                 self.update_item(item_id, item)
                 self.render_inventory()
@@ -29,6 +29,8 @@ except ImportError:
     create_once_callable = None
     JsException = Exception
 
+from proxy_registry import track_proxy, release_proxies
+
 # Lazy-initialized JS globals (set to None initially, will be initialized on first use)
 document = None
 fetch = None
@@ -106,6 +108,10 @@ AUTO_EXPORT_DELAY_MS = 2000
 AUTO_EXPORT_MAX_EVENTS = 15
 MAX_EXPORTS_PER_CHARACTER = 20
 EXPORT_PRUNE_DAYS = 30
+# Autosaves are queued on the server (202 + ticket); poll the ticket until the
+# write lands so a failed write is not taken as the next delta's base
+EXPORT_STATUS_POLL_SECONDS = 0.5
+EXPORT_STATUS_POLL_ATTEMPTS = 20
 
 # Note: LOCAL_STORAGE_KEY is defined in character.py (keep in sync)
 LOCAL_STORAGE_KEY = "pysheet.character.v1"
@@ -119,6 +125,7 @@ _AUTO_EXPORT_PROXY = None
 _AUTO_EXPORT_SUPPRESS = False
 _LAST_AUTO_EXPORT_SNAPSHOT = ""
 _LAST_AUTO_EXPORT_DATE = ""
+_LAST_AUTO_EXPORT_DIGEST = ""  # Server digest of _LAST_AUTO_EXPORT_SNAPSHOT (delta base)
 _AUTO_EXPORT_EVENT_COUNT = 0
 _AUTO_EXPORT_FILE_HANDLE = None
 _AUTO_EXPORT_DISABLED = False
@@ -127,9 +134,6 @@ _AUTO_EXPORT_DIRECTORY_HANDLE = None
 _AUTO_EXPORT_LAST_FILENAME = ""
 _AUTO_EXPORT_SETUP_PROMPTED = False
 
-# Event proxy list (for memory management)
-_EVENT_PROXIES = []
-
 
 def _resolve_timers():
     """Return callable setTimeout/clearTimeout from window."""
@@ -226,6 +230,79 @@ def _build_export_filename(data: dict, *, now: Optional[datetime] = None) -> str
     return f"{base_name}_{class_part}_lvl{level_value}_{timestamp}.json"
 
 
+# ===================================================================
+# Delta Export Utilities
+# ===================================================================
+
+def _escape_pointer_token(token) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _compute_json_patch(old, new, path: str = "") -> list:
+    """Build RFC 6902 operations turning ``old`` into ``new``.
+
+    Dicts are diffed key by key and equal-length lists element by element;
+    anything else that differs is replaced wholesale.
+    """
+    if type(old) is type(new) and old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key, value in old.items():
+            child = f"{path}/{_escape_pointer_token(key)}"
+            if key not in new:
+                ops.append({"op": "remove", "path": child})
+            else:
+                ops.extend(_compute_json_patch(value, new[key], child))
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": f"{path}/{_escape_pointer_token(key)}", "value": value})
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (old_value, new_value) in enumerate(zip(old, new)):
+            ops.extend(_compute_json_patch(old_value, new_value, f"{path}/{index}"))
+        return ops
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _build_delta_request(filename: str, data: dict, payload: str) -> Optional[dict]:
+    """Return a /api/export/delta body, or None when a full export is better."""
+    if not (_LAST_AUTO_EXPORT_DIGEST and _LAST_AUTO_EXPORT_SNAPSHOT):
+        return None
+    try:
+        previous = json.loads(_LAST_AUTO_EXPORT_SNAPSHOT)
+    except ValueError:
+        return None
+    patch = _compute_json_patch(previous, data)
+    if len(json.dumps(patch)) >= len(payload):
+        return None
+    return {"filename": filename, "base": _LAST_AUTO_EXPORT_DIGEST, "patch": patch}
+
+
+async def _await_export_ticket(fetch_func, status_url: str) -> Optional[dict]:
+    """Poll /api/export/status/<ticket> until the queued write is done or failed.
+
+    Returns the final ticket, or None when the status cannot be read or the
+    write is still pending after EXPORT_STATUS_POLL_ATTEMPTS polls.
+    """
+    for _ in range(EXPORT_STATUS_POLL_ATTEMPTS):
+        await asyncio.sleep(EXPORT_STATUS_POLL_SECONDS)
+        try:
+            response = await fetch_func(status_url)
+            if response.status != 200:
+                console.warn(f"PySheet: export status unavailable ({response.status})")
+                return None
+            ticket = json.loads(await response.text())
+        except Exception as exc:
+            console.warn(f"PySheet: could not read export status - {exc}")
+            return None
+        if ticket.get("status") in ("done", "error"):
+            return ticket
+    console.warn(f"PySheet: export still queued after {EXPORT_STATUS_POLL_ATTEMPTS} status checks")
+    return None
+
+
 def _extract_character_name_from_filename(filename: str) -> str:
     """Extract character name from export filename.
     
@@ -839,7 +916,7 @@ async def export_character(_event=None, *, auto: bool = False):
     console.log("[DEBUG] export_character() async function started")
     global _LAST_AUTO_EXPORT_SNAPSHOT, _LAST_AUTO_EXPORT_DATE, _AUTO_EXPORT_FILE_HANDLE
     global _AUTO_EXPORT_DISABLED, _AUTO_EXPORT_SUPPORT_WARNED, _AUTO_EXPORT_DIRECTORY_HANDLE
-    global _AUTO_EXPORT_LAST_FILENAME, _AUTO_EXPORT_SETUP_PROMPTED
+    global _AUTO_EXPORT_LAST_FILENAME, _AUTO_EXPORT_SETUP_PROMPTED, _LAST_AUTO_EXPORT_DIGEST
     
     # Initialize JS globals if not already done
     _initialize_js_globals()
@@ -980,41 +1057,29 @@ async def export_character(_event=None, *, auto: bool = False):
                 console.error("ERROR: fetch API not available in this environment")
                 return
             
-        # Create the request payload
-        request_data = {
-            "filename": proposed_filename,
-            "content": data
-        }
-        
-        console.log(f"[DEBUG] POST payload ready: filename={proposed_filename}, data_size={len(payload)} bytes")
-        
-        # Convert Python dict to JSON string for body
-        body_json = json.dumps(request_data)
-        console.log(f"[DEBUG] Body JSON: {body_json[:100]}...")
-        
-        # Build the fetch using JavaScript directly to ensure proper POST
-        # Use js.JSON.stringify to ensure proper serialization
-        try:
-
-            from js import Object as JSObject  # type: ignore
-            
-            # Create proper JavaScript object for fetch init
-            options = JSObject.new()
-            options.method = "POST"
-            options.body = body_json
-            
-            # Set headers using defineProperty to avoid item assignment issues
-            headers_obj = JSObject.new()
-            # Use property assignment which works with JsProxy
-            headers_obj["Content-Type"] = "application/json"
-            options.headers = headers_obj
-            
-            console.log(f"[DEBUG] Fetch options created with headers")
-        except Exception as e:
-            console.error(f"[DEBUG] Failed to create proper options object: {e}")
-            console.error(f"[DEBUG] Error type: {type(e)}")
-            # Fallback: Use a workaround - encode options in URL params or use FormData
-            console.warn("[DEBUG] Using JSON.stringify workaround for fetch init")
+        def build_post_options(body_json):
+            # Build the fetch using JavaScript directly to ensure proper POST
+            try:
+                from js import Object as JSObject  # type: ignore
+                
+                # Create proper JavaScript object for fetch init
+                options = JSObject.new()
+                options.method = "POST"
+                options.body = body_json
+                
+                # Set headers using defineProperty to avoid item assignment issues
+                headers_obj = JSObject.new()
+                # Use property assignment which works with JsProxy
+                headers_obj["Content-Type"] = "application/json"
+                options.headers = headers_obj
+                
+                console.log(f"[DEBUG] Fetch options created with headers")
+                return options
+            except Exception as e:
+                console.error(f"[DEBUG] Failed to create proper options object: {e}")
+                console.error(f"[DEBUG] Error type: {type(e)}")
+                # Fallback: Use a workaround - encode options in URL params or use FormData
+                console.warn("[DEBUG] Using JSON.stringify workaround for fetch init")
             
             # Try using eval through JavaScript to create the object
             try:
@@ -1029,24 +1094,77 @@ async def export_character(_event=None, *, auto: bool = False):
                 }})'''
                 options = js_eval(js_code)
                 console.log("[DEBUG] Created options via JS eval")
+                return options
             except:
                 # Final fallback - just return error
                 console.error("[DEBUG] All fetch options creation methods failed")
-                return
+                return None
         
-        console.log(f"[DEBUG] About to call fetch")
+        # Autosaves go through the server's write-behind queue
+        query = "?async=1" if auto else ""
         
-        # POST to backend
-        response = await fetch_func("/api/export", options)
+        # Autosaves send a JSON Patch against the last acknowledged export
+        delta_request = _build_delta_request(proposed_filename, data, payload) if auto else None
+        response = None
+        if delta_request is not None:
+            body_json = json.dumps(delta_request)
+            console.log(f"[DEBUG] POST delta: {len(delta_request['patch'])} op(s), {len(body_json)} of {len(payload)} bytes")
+            options = build_post_options(body_json)
+            if options is None:
+                return
+            response = await fetch_func(f"/api/export/delta{query}", options)
+            if response.status in (409, 422):
+                console.warn(f"[DEBUG] Delta export rejected ({response.status}), sending full export")
+                response = None
+        
+        if response is None:
+            # Create the request payload
+            request_data = {
+                "filename": proposed_filename,
+                "content": data
+            }
+            
+            console.log(f"[DEBUG] POST payload ready: filename={proposed_filename}, data_size={len(payload)} bytes")
+            
+            # Convert Python dict to JSON string for body
+            body_json = json.dumps(request_data)
+            console.log(f"[DEBUG] Body JSON: {body_json[:100]}...")
+            
+            options = build_post_options(body_json)
+            if options is None:
+                return
+            
+            console.log(f"[DEBUG] About to call fetch")
+            
+            # POST to backend
+            response = await fetch_func(f"/api/export{query}", options)
         
         console.log(f"[DEBUG] Flask response status: {response.status}")
         response_text = await response.text()
         console.log(f"[DEBUG] Flask response: {response_text[:200]}")
         
-        if response.status == 200:
-            console.log(f"✓ {proposed_filename} successfully written to disk")
+        try:
+            result = json.loads(response_text)
+        except ValueError:
+            result = {}
+        if not isinstance(result, dict):
+            result = {}
+        ticket = None
+        if response.status == 202:
+            console.log(f"✓ {proposed_filename} queued for writing on the server")
+            status_url = result.get("status_url") or f"/api/export/status/{result.get('ticket')}"
+            ticket = await _await_export_ticket(fetch_func, status_url)
+        
+        if ticket is not None and ticket.get("status") == "error":
+            console.error(f"PySheet: queued export failed - {ticket.get('error')}")
+            # Send the whole document next time rather than a patch on this one
+            _LAST_AUTO_EXPORT_DIGEST = ""
+        elif response.status in (200, 202):
+            if response.status == 200 or ticket is not None:
+                console.log(f"✓ {proposed_filename} successfully written to disk")
             _LAST_AUTO_EXPORT_SNAPSHOT = payload
             _LAST_AUTO_EXPORT_DATE = datetime.now().strftime("%Y%m%d")
+            _LAST_AUTO_EXPORT_DIGEST = result.get("digest") or ""
         else:
             console.error(f"PySheet: backend export failed with status {response.status}")
             
@@ -1186,9 +1304,9 @@ def handle_import(event):
         # Instead of creating a proxy, we'll use a wrapper approach
         def _attach_reader_callback():
             try:
-                # Create a persistent wrapper that won't be destroyed
-                callback_wrapper = create_proxy(on_load)
-                _EVENT_PROXIES.append(callback_wrapper)
+                # Keep the wrapper alive until the next import replaces it
+                release_proxies("export.import-reader")
+                callback_wrapper = track_proxy("export.import-reader", create_proxy(on_load))
                 reader.onload = callback_wrapper
             except Exception as e:
                 console.error(f"[IMPORT] Failed to attach reader callback: {e}")
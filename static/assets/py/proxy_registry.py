@@ -0,0 +1,103 @@
+"""Lifecycle registry for JS<->Python proxies.
+
+Every ``create_proxy`` result stays alive until ``destroy()`` is called on it,
+so proxies attached to elements that get re-rendered pile up for the whole
+session. Proxies are tracked here under the component that owns them; a
+component calls ``release_proxies(owner)`` before it re-renders, which
+destroys the previous generation in one go.
+"""
+
+try:
+    from js import console
+except ImportError:
+    # Mock for testing environments
+    class _MockConsole:
+        @staticmethod
+        def log(*args): pass
+        @staticmethod
+        def warn(*args): pass
+        @staticmethod
+        def error(*args): pass
+
+    console = _MockConsole()
+
+
+# owner -> {"generation": int, "proxies": list, "destroyed": int}
+PROXY_REGISTRY: dict = {}
+
+
+def _owner_state(owner: str) -> dict:
+    state = PROXY_REGISTRY.get(owner)
+    if state is None:
+        state = {"generation": 0, "proxies": [], "destroyed": 0}
+        PROXY_REGISTRY[owner] = state
+    return state
+
+
+def _destroy_proxy(proxy) -> bool:
+    """Destroy a proxy if it supports it (plain callables in tests do not)."""
+    destroy = getattr(proxy, "destroy", None)
+    if not callable(destroy):
+        return False
+    try:
+        destroy()
+        return True
+    except Exception as exc:
+        # Already destroyed or borrowed; nothing left to free.
+        console.warn(f"[PROXY] destroy failed: {exc}")
+        return False
+
+
+def track_proxy(owner: str, proxy):
+    """Register ``proxy`` under ``owner`` and return it unchanged."""
+    if proxy is not None:
+        _owner_state(owner)["proxies"].append(proxy)
+    return proxy
+
+
+def release_proxies(owner: str) -> int:
+    """Destroy every proxy owned by ``owner`` and start a new generation.
+
+    Returns the number of proxies that were released.
+    """
+    state = _owner_state(owner)
+    proxies = state["proxies"]
+    state["proxies"] = []
+    state["generation"] += 1
+    for proxy in proxies:
+        _destroy_proxy(proxy)
+    state["destroyed"] += len(proxies)
+    return len(proxies)
+
+
+def release_proxy(owner: str, proxy) -> bool:
+    """Destroy a single proxy, e.g. a one-shot timer callback after it fired."""
+    state = PROXY_REGISTRY.get(owner)
+    if state is None:
+        return False
+    for index, tracked in enumerate(state["proxies"]):
+        if tracked is proxy:
+            del state["proxies"][index]
+            break
+    else:
+        return False
+    _destroy_proxy(proxy)
+    state["destroyed"] += 1
+    return True
+
+
+def live_proxy_counts() -> dict:
+    """Return ``{owner: live proxy count}`` for every known owner."""
+    return {owner: len(state["proxies"]) for owner, state in PROXY_REGISTRY.items()}
+
+
+def proxy_registry_report() -> dict:
+    """Return per-owner live counts, generation numbers and destroyed totals."""
+    return {
+        owner: {
+            "live": len(state["proxies"]),
+            "generation": state["generation"],
+            "destroyed": state["destroyed"],
+        }
+        for owner, state in PROXY_REGISTRY.items()
+    }
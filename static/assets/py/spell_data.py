@@ -1,4 +1,40 @@
-"""Spell library data, spell corrections, class mappings, and spell tables."""
+"""Spell library data, spell corrections, class mappings, and spell tables.
+
+Also holds the code character.py and spellcasting.py share for the spell
+library: the record sanitizer, which backend.py runs to build the
+pre-sanitized /api/spells library, the spell cache codec, and the Open5e
+page fetcher. Browser APIs
+are optional imports, so the module also loads outside Pyodide.
+"""
+
+import asyncio
+import json
+import re
+import zlib
+from html import escape, unescape
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode
+
+try:
+    from js import console
+except ImportError:
+    # Mock for testing environments and backend.py
+    class _MockConsole:
+        @staticmethod
+        def log(*args): pass
+        @staticmethod
+        def warn(*args): pass
+        @staticmethod
+        def error(*args): pass
+
+    console = _MockConsole()
+
+try:
+    from pyodide.http import pyfetch
+except ImportError:
+    # Mock for testing
+    async def pyfetch(url, *args, **kwargs):
+        raise ImportError("pyfetch not available in test environment")
 
 # Fallback spell list (when Open5e API is unavailable)
 LOCAL_SPELLS_FALLBACK = [
@@ -764,10 +800,457 @@ PACT_MAGIC_TABLE_OLD = {
 # Supported spell classes for filtering
 SUPPORTED_SPELL_CLASSES = {"bard", "cleric", "druid", "paladin", "ranger", "sorcerer", "wizard", "warlock", "artificer"}
 
-# Spell library storage keys and settings
+# Spell library storage keys and settings. SPELL_CACHE_VERSION is the format
+# of encode_spell_cache output; character.py keeps its own key in that format.
 SPELL_LIBRARY_STORAGE_KEY = "pysheet_spell_cache"
-SPELL_CACHE_VERSION = 1
+SPELL_CACHE_VERSION = 5
+# Other spell cache keys on this origin, freed when a save exceeds the quota
+SPELL_CACHE_LEGACY_KEYS = ["pysheet.spells.v1", "pysheet.spells.v2", "pysheet.spells.v3", "pysheet.spells.v4"]
+# Column order of cached rows (header line + JSON array of rows)
+SPELL_CACHE_FIELDS = (
+    "slug", "name", "level_int", "level_label", "school", "casting_time", "range",
+    "components", "material", "duration", "ritual", "concentration", "classes",
+    "classes_display", "description_html", "search_blob", "source",
+)
+
+# Open5e API endpoints (through the backend's caching proxy; open5e_direct_url
+# maps them back to the public API when no backend is running)
+OPEN5E_API_BASE = "https://api.open5e.com"
+OPEN5E_PROXY_PREFIX = "/api/open5e"
+OPEN5E_SPELLS_ENDPOINT = f"{OPEN5E_PROXY_PREFIX}/spells/?limit=200&ordering=name"
+OPEN5E_MAX_PAGES = 15
+OPEN5E_FETCH_CONCURRENCY = 4  # pages fetched in parallel after the first
+
+# Backend endpoint serving the already-sanitized spell library
+SPELL_LIBRARY_ENDPOINT = "/api/spells"
+
+# Format of the records built by sanitize_spell_list, reported by /api/spells
+SPELL_LIBRARY_VERSION = 5
+
+
+# =============================================================================
+# Spell Record Sanitizing
+# =============================================================================
+
+def _parse_int(value, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _is_truthy(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        return value.strip().lower() in {"true", "yes", "1"}
+    return False
+
+
+def normalize_class_token(token: Optional[str]) -> str | None:
+    if not token:
+        return None
+    cleaned = token.replace("’", "'")
+    cleaned = re.sub(r"\(.*?\)", "", cleaned)
+    cleaned = cleaned.replace("-", " ")
+    cleaned = " ".join(cleaned.lower().split())
+    if not cleaned:
+        return None
+    for canonical, synonyms in SPELL_CLASS_SYNONYMS.items():
+        if cleaned == canonical:
+            return canonical
+        if cleaned in synonyms:
+            return canonical
+        for synonym in synonyms:
+            if cleaned == synonym:
+                return canonical
+    for canonical, synonyms in SPELL_CLASS_SYNONYMS.items():
+        if cleaned.startswith(canonical):
+            return canonical
+        for synonym in synonyms:
+            if cleaned.startswith(synonym):
+                return canonical
+    return None
+
+
+def format_spell_level_label(level_int: int) -> str:
+    if level_int <= 0:
+        return "Cantrip"
+    remainder = level_int % 100
+    if 10 <= remainder <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(level_int % 10, "th")
+    return f"{level_int}{suffix}-level"
+
+
+def _coerce_spell_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "\n".join(str(part) for part in value if part)
+    return str(value)
+
+
+def _make_paragraphs(text: str) -> str:
+    if not text:
+        return ""
+    paragraphs = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped:
+            paragraphs.append(f"<p>{escape(stripped)}</p>")
+    return "".join(paragraphs)
+
+
+def sanitize_spell_record(raw: dict) -> Optional[dict]:
+    name = raw.get("name") or "Unknown Spell"
+    slug_source = raw.get("slug") or name
+    slug = re.sub(r"[^a-z0-9]+", "-", slug_source.lower()).strip("-")
+
+    level_value = raw.get("level_int")
+    if level_value is None:
+        level_value = raw.get("level")
+    level_int = _parse_int(level_value, 0)
+    level_label = format_spell_level_label(level_int)
+
+    # Handle multiple class field formats:
+    # 1. dnd_class: "Bard, Sorcerer, Wizard" (Open5e standard)
+    # 2. spell_lists: ["bard", "sorcerer", "wizard"] (Open5e alternative)
+    # 3. classes: ["Wizard", "Sorcerer"] (custom format or other sources)
+    classes_field = raw.get("dnd_class") or ""
+    
+    if not classes_field:
+        # Try spell_lists field (Open5e provides this)
+        spell_lists = raw.get("spell_lists")
+        if isinstance(spell_lists, list) and spell_lists:
+            classes_field = ", ".join(str(c) for c in spell_lists)
+        elif not classes_field:
+            # Try classes field as fallback (list or string format)
+            classes_raw_input = raw.get("classes")
+            if isinstance(classes_raw_input, list):
+                classes_field = ", ".join(str(c) for c in classes_raw_input)
+            elif isinstance(classes_raw_input, str):
+                classes_field = classes_raw_input
+            else:
+                classes_field = ""
+
+    
+    classes_raw = [token.strip() for token in re.split(r"[;,/]+", classes_field) if token.strip()]
+    classes: list[str] = []
+    for token in classes_raw:
+        canonical = normalize_class_token(token)
+        if canonical and canonical in SUPPORTED_SPELL_CLASSES and canonical not in classes:
+            classes.append(canonical)
+    if not classes:
+        return None
+    classes_display = [SPELL_CLASS_DISPLAY_NAMES.get(c, c.title()) for c in classes]
+
+    school = (raw.get("school") or "").title()
+    casting_time = raw.get("casting_time") or ""
+    range_text = raw.get("range") or ""
+    components = raw.get("components") or ""
+    material = raw.get("material") or ""
+    duration = raw.get("duration") or ""
+    ritual = _is_truthy(raw.get("ritual"))
+    concentration = _is_truthy(raw.get("concentration"))
+
+    desc_text = _coerce_spell_text(raw.get("desc"))
+    higher_text = _coerce_spell_text(raw.get("higher_level"))
+    desc_html = _make_paragraphs(desc_text)
+    higher_html = _make_paragraphs(higher_text)
+    description_html = desc_html
+    if higher_html:
+        description_html += "<p class=\"spell-section-title\">At Higher Levels</p>" + higher_html
+
+    source = raw.get("document__title") or raw.get("document__slug") or raw.get("document") or ""
+
+    search_fields = [
+        name,
+        classes_field,
+        desc_text,
+        higher_text,
+        school,
+        casting_time,
+        range_text,
+        components,
+        material,
+        duration,
+        source,
+    ]
+    search_blob = " ".join(part for part in search_fields if part).lower()
+
+    result = {
+        "slug": slug,
+        "name": name,
+        "level_int": level_int,
+        "level_label": level_label,
+        "school": school,
+        "casting_time": casting_time,
+        "range": range_text,
+        "components": components,
+        "material": material,
+        "duration": duration,
+        "ritual": ritual,
+        "concentration": concentration,
+        "classes": classes,
+        "classes_display": classes_display,
+        "description_html": description_html,
+        "search_blob": search_blob,
+        "source": source,
+    }
+    
+    # Apply any known corrections to this spell
+    return apply_spell_corrections(result)
+
+
+def sanitize_spell_list(raw_spells: list[dict]) -> list[dict]:
+    sanitized: list[dict] = []
+    seen_slugs: set[str] = set()
+    rejected_count = 0
+    
+    # Debug: Check what SPELL_CLASS_SYNONYMS contains at runtime
+    if len(raw_spells) > 0:
+        if len(SPELL_CLASS_SYNONYMS) == 0:
+            console.warn("PySheet: SPELL_CLASS_SYNONYMS is empty; every spell will be rejected")
+        if len(SUPPORTED_SPELL_CLASSES) == 0:
+            console.warn("PySheet: SUPPORTED_SPELL_CLASSES is empty; every spell will be rejected")
+    
+    for spell in raw_spells:
+        record = sanitize_spell_record(spell)
+        if record is not None:
+            slug = record.get("slug")
+            # Skip if we've already seen this spell slug
+            if slug not in seen_slugs:
+                sanitized.append(record)
+                seen_slugs.add(slug)
+        else:
+            rejected_count += 1
+    
+    # Debug logging if all spells were rejected
+    if rejected_count == len(raw_spells) and rejected_count > 0:
+        console.warn(f"PySheet: all {rejected_count} spells rejected during sanitization")
+        first_spell = raw_spells[0]
+        console.log(
+            f"DEBUG: first rejected spell {first_spell.get('name', 'Unknown')!r}: "
+            f"dnd_class={first_spell.get('dnd_class')!r}, classes={first_spell.get('classes')!r}"
+        )
+    
+    sanitized.sort(key=lambda item: (item["level_int"], item["name"].lower()))
+    return sanitized
+
+
+# =============================================================================
+# Spell Cache Format
+# =============================================================================
+
+def _spell_search_blob(record: dict) -> str:
+    """Rebuild search_blob for a cache saved without it (quota fallback)."""
+    description = re.sub(r"<[^>]+>", " ", record.get("description_html") or "")
+    parts = [
+        record.get("name"),
+        ", ".join(record.get("classes_display") or []),
+        unescape(description),
+        record.get("school"),
+        record.get("casting_time"),
+        record.get("range"),
+        record.get("components"),
+        record.get("material"),
+        record.get("duration"),
+        record.get("source"),
+    ]
+    return " ".join(" ".join(str(part).split()) for part in parts if part).lower()
+
+
+def encode_spell_cache(spells: list[dict], omit: tuple = ()) -> str:
+    """Serialize sanitized, sorted spells as a header line plus columnar rows.
+
+    The header carries the version, field order, row count and a CRC32 of the
+    rows text, so a load is one checksum, one parse and no per-record
+    normalization. Fields in omit are left out and derived again on load.
+    """
+    fields = [field for field in SPELL_CACHE_FIELDS if field not in omit]
+    rows_text = json.dumps(
+        [[spell.get(field) for field in fields] for spell in spells],
+        separators=(",", ":"),
+    )
+    header = {
+        "version": SPELL_CACHE_VERSION,
+        "fields": fields,
+        "count": len(spells),
+        "crc32": zlib.crc32(rows_text.encode("utf-8")),
+    }
+    return json.dumps(header, separators=(",", ":")) + "\n" + rows_text
+
+
+def decode_spell_cache(text: str) -> Optional[list[dict]]:
+    """Spells from encode_spell_cache output, or None if stale or corrupt."""
+    header_text, newline, rows_text = (text or "").partition("\n")
+    if not newline:
+        return None
+    try:
+        header = json.loads(header_text)
+    except ValueError:
+        return None
+    if not isinstance(header, dict) or header.get("version") != SPELL_CACHE_VERSION:
+        return None
+    fields = header.get("fields")
+    if not isinstance(fields, list) or not set(fields) <= set(SPELL_CACHE_FIELDS) or "slug" not in fields:
+        return None
+    if zlib.crc32(rows_text.encode("utf-8")) != header.get("crc32"):
+        console.warn("PySheet: spell cache checksum mismatch; ignoring cache")
+        return None
+    try:
+        rows = json.loads(rows_text)
+    except ValueError:
+        return None
+    if not isinstance(rows, list) or len(rows) != header.get("count") or not rows:
+        return None
+    width = len(fields)
+    if any(not isinstance(row, list) or len(row) != width for row in rows):
+        return None
+    spells = [dict(zip(fields, row)) for row in rows]
+    if "search_blob" not in fields:
+        for spell in spells:
+            spell["search_blob"] = _spell_search_blob(spell)
+    return spells
+
+
+def save_spell_cache(storage, key: str, spells: list[dict], legacy_keys=()) -> bool:
+    """Store spells under key in a localStorage-like storage.
+
+    On quota errors legacy_keys are freed, then search_blob is dropped. If
+    nothing fits the key is removed, so an older library is never left behind.
+    """
+    payload = encode_spell_cache(spells)
+    try:
+        storage.setItem(key, payload)
+        return True
+    except Exception as exc:
+        console.warn(f"PySheet: spell cache does not fit ({exc}); removing old spell caches")
+    last_error = None
+    for legacy_key in legacy_keys:
+        storage.removeItem(legacy_key)
+    for omit in ((), ("search_blob",)):
+        try:
+            storage.setItem(key, encode_spell_cache(spells, omit) if omit else payload)
+            if omit:
+                console.warn("PySheet: spell cache stored without search text to fit storage quota")
+            return True
+        except Exception as exc:
+            last_error = exc
+    console.warn(f"PySheet: unable to store spell cache ({last_error})")
+    storage.removeItem(key)
+    return False
+
+
+# =============================================================================
+# Open5e Fetching
+# =============================================================================
+
+def open5e_direct_url(url: str) -> str:
+    """Map a proxied /api/open5e/... URL to the public Open5e API."""
+    if url.startswith(OPEN5E_PROXY_PREFIX + "/"):
+        return OPEN5E_API_BASE + url[len(OPEN5E_PROXY_PREFIX):]
+    return url
+
+
+async def fetch_open5e_json(url: str) -> dict:
+    """GET an Open5e URL through the backend proxy, falling back to the public API."""
+    response = None
+    try:
+        response = await pyfetch(url)
+    except Exception as exc:
+        console.warn(f"PySheet: Open5e proxy request failed ({exc})")
+    direct_url = open5e_direct_url(url)
+    if (response is None or not response.ok) and direct_url != url:
+        console.log(f"DEBUG: Open5e proxy unavailable, fetching {direct_url}")
+        response = await pyfetch(direct_url)
+    if not response.ok:
+        raise RuntimeError(f"Open5e request failed ({response.status})")
+    return await response.json()
+
+
+def _open5e_page_urls(next_url: str, count: int, page_size: int, max_pages: int) -> Optional[list[str]]:
+    """URLs for pages 2..N derived from the first page's next link.
+
+    Returns None when the link uses neither page= nor offset= pagination.
+    """
+    if not next_url or page_size <= 0:
+        return []
+    total_pages = min(-(-count // page_size), max_pages)
+    base, _, query = next_url.partition("?")
+    params = parse_qsl(query, keep_blank_values=True)
+    keys = {key for key, _ in params}
+    if "page" in keys:
+        key, value_for = "page", lambda number: str(number)
+    elif "offset" in keys:
+        key, value_for = "offset", lambda number: str((number - 1) * page_size)
+    else:
+        return None
+    return [
+        f"{base}?{urlencode([(k, value_for(number) if k == key else v) for k, v in params])}"
+        for number in range(2, total_pages + 1)
+    ]
+
+
+async def fetch_open5e_spells(on_page=None, on_status=None) -> list[dict]:
+    """Fetch every Open5e spell page, pages 2..N concurrently.
+
+    The first page gives the total count; the remaining page URLs are derived
+    from its next link and fetched under OPEN5E_FETCH_CONCURRENCY. on_page
+    (page_number, results) is called as each page arrives, so callers can
+    sanitize while later pages are still in flight, and on_status(message)
+    receives progress text. Results are returned in page order.
+    """
+    report = on_status or (lambda message: None)
+    first = await fetch_open5e_json(OPEN5E_SPELLS_ENDPOINT)
+    first_results = first.get("results", [])
+    if not isinstance(first_results, list):
+        first_results = []
+    if on_page is not None:
+        on_page(1, first_results)
+    count = _parse_int(first.get("count"), len(first_results))
+    page_urls = _open5e_page_urls(first.get("next"), count, len(first_results), OPEN5E_MAX_PAGES)
+
+    if page_urls is None:
+        # Unknown pagination scheme: follow next links one at a time
+        pages = [first_results]
+        url = first.get("next")
+        while url and len(pages) < OPEN5E_MAX_PAGES:
+            data = await fetch_open5e_json(url)
+            results = data.get("results", [])
+            if not isinstance(results, list):
+                results = []
+            pages.append(results)
+            if on_page is not None:
+                on_page(len(pages), results)
+            report(f"Loading spells from Open5e... {len(pages)} pages")
+            url = data.get("next")
+        return [spell for page in pages for spell in page]
+
+    total_pages = len(page_urls) + 1
+    done = 1
+    report(f"Loading spells from Open5e... {done}/{total_pages} pages")
+    semaphore = asyncio.Semaphore(OPEN5E_FETCH_CONCURRENCY)
+
+    async def fetch_page(page_number: int, page_url: str) -> list[dict]:
+        nonlocal done
+        async with semaphore:
+            data = await fetch_open5e_json(page_url)
+        results = data.get("results", [])
+        if not isinstance(results, list):
+            results = []
+        if on_page is not None:
+            on_page(page_number, results)
+        done += 1
+        report(f"Loading spells from Open5e... {done}/{total_pages} pages")
+        return results
 
-# Open5e API endpoints
-OPEN5E_SPELLS_ENDPOINT = "https://api.open5e.com/spells/?limit=1000"
-OPEN5E_MAX_PAGES = 10
+    console.log(f"DEBUG: fetching {len(page_urls)} more Open5e pages ({OPEN5E_FETCH_CONCURRENCY} at a time)")
+    remaining = await asyncio.gather(*(
+        fetch_page(number, page_url) for number, page_url in enumerate(page_urls, start=2)
+    ))
+    return first_results + [spell for page in remaining for spell in page]
@@ -51,6 +51,8 @@ except ImportError:
     async def pyfetch(url, *args, **kwargs):
         raise ImportError("pyfetch not available in test environment")
 
+from proxy_registry import track_proxy, release_proxies
+
 # Import spell data and character models
 try:
     from spell_data import (
@@ -63,9 +65,15 @@ try:
         PACT_MAGIC_TABLE,
         SUPPORTED_SPELL_CLASSES,
         SPELL_LIBRARY_STORAGE_KEY,
-        SPELL_CACHE_VERSION,
-        OPEN5E_SPELLS_ENDPOINT,
-        OPEN5E_MAX_PAGES,
+        SPELL_CACHE_LEGACY_KEYS,
+        decode_spell_cache,
+        save_spell_cache as store_spell_cache,
+        SPELL_LIBRARY_ENDPOINT,
+        normalize_class_token,
+        _make_paragraphs,
+        sanitize_spell_record,
+        sanitize_spell_list,
+        fetch_open5e_spells,
     )
 except ImportError:
     # Fallback constants
@@ -78,9 +86,20 @@ except ImportError:
     PACT_MAGIC_TABLE = {}
     SUPPORTED_SPELL_CLASSES = {"artificer", "bard", "cleric", "druid", "paladin", "ranger", "sorcerer", "warlock", "wizard"}
     SPELL_LIBRARY_STORAGE_KEY = "pysheet_spell_cache"
-    SPELL_CACHE_VERSION = 1
-    OPEN5E_SPELLS_ENDPOINT = "https://api.open5e.com/spells/?limit=1000"
-    OPEN5E_MAX_PAGES = 10
+    SPELL_CACHE_LEGACY_KEYS = []
+    decode_spell_cache = lambda text: None
+    store_spell_cache = lambda storage, key, spells, legacy_keys=(): False
+    SPELL_LIBRARY_ENDPOINT = "/api/spells"
+    normalize_class_token = lambda token: " ".join((token or "").lower().split()) or None
+    _make_paragraphs = lambda text: "".join(
+        f"<p>{escape(line.strip())}</p>" for line in (text or "").split("\n") if line.strip()
+    )
+    sanitize_spell_record = lambda raw: None
+    sanitize_spell_list = lambda raw_spells: []
+
+    async def fetch_open5e_spells(on_page=None, on_status=None):
+        return []
+
 SPELL_LIBRARY_STATE = {
     "spells": [],
     "spell_map": {},
@@ -88,11 +107,9 @@ SPELL_LIBRARY_STATE = {
     "loading": False,
     "class_options": [],
     "last_profile_signature": None,
+    "filter_index": None,
 }
 
-_EVENT_PROXIES = []
-MAX_SPELL_RENDER = 100
-
 
 # ===================================================================
 # Utility Functions (duplicated from character.py for self-containment)
@@ -127,33 +144,6 @@ def is_truthy(value) -> bool:
     return False
 
 
-def normalize_class_token(token: Optional[str]) -> Union[str, None]:
-    """Normalize a class name token to canonical form."""
-    if not token:
-        return None
-    cleaned = token.replace("'", "'")
-    cleaned = re.sub(r"\(.*?\)", "", cleaned)
-    cleaned = cleaned.replace("-", " ")
-    cleaned = " ".join(cleaned.lower().split())
-    if not cleaned:
-        return None
-    for canonical, synonyms in SPELL_CLASS_SYNONYMS.items():
-        if cleaned == canonical:
-            return canonical
-        if cleaned in synonyms:
-            return canonical
-        for synonym in synonyms:
-            if cleaned == synonym:
-                return canonical
-    for canonical, synonyms in SPELL_CLASS_SYNONYMS.items():
-        if cleaned.startswith(canonical):
-            return canonical
-        for synonym in synonyms:
-            if cleaned.startswith(synonym):
-                return canonical
-    return None
-
-
 def get_element(element_id):
     """Get an element from the DOM."""
     # Defensive wrapper for test environments with minimal MockDocument
@@ -165,6 +155,17 @@ def get_element(element_id):
     return getter(element_id)
 
 
+def _closest(target, selector: str):
+    """Return the nearest ancestor-or-self of target matching selector."""
+    closest = getattr(target, "closest", None)
+    if closest is None:
+        return None
+    try:
+        return closest(selector)
+    except Exception:
+        return None
+
+
 def get_text_value(element_id: str) -> str:
     """Get text value from form element."""
     element = get_element(element_id)
@@ -261,19 +262,6 @@ def _detect_saving_throw(spell: dict) -> tuple[bool, str | None]:
     return False, None
 
 
-def _make_paragraphs(text: str) -> str:
-    """Convert plain text to HTML paragraphs."""
-    if not text:
-        return ""
-    lines = text.split("\n")
-    paragraphs = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped:
-            paragraphs.append(f"<p>{escape(stripped)}</p>")
-    return "\n".join(paragraphs)
-
-
 # ===================================================================
 # SpellcastingManager Class
 # ===================================================================
@@ -282,6 +270,8 @@ class SpellcastingManager:
     """Encapsulates spellbook selections, slot tracking, and related rendering."""
 
     def __init__(self):
+        # container key -> (element, proxy) for the delegated click listeners
+        self._delegated_listeners: dict[str, tuple] = {}
         self.reset_state()
 
     # ------------------------------------------------------------------
@@ -845,17 +835,46 @@ class SpellcastingManager:
         container.style.display = "block"
         console.log(f"DEBUG: [render_spellbook] Set container.style.display = 'block'")
 
-        buttons = container.querySelectorAll("button[data-remove-spell]")
-        console.log(f"DEBUG: [render_spellbook] Found {len(buttons)} remove buttons")
-        for button in buttons:
-            slug = button.getAttribute("data-remove-spell")
-            if not slug:
-                continue
-            proxy = create_proxy(
-                lambda event, s=slug: self.handle_remove_spell_click(event, s)
-            )
-            button.addEventListener("click", proxy)
-            _EVENT_PROXIES.append(proxy)
+        self._bind_delegated_click("spellbook", container, self._handle_spellbook_click)
+
+    def _bind_delegated_click(self, key: str, container, handler):
+        """Bind one click listener per container; re-renders reuse it."""
+        bound = self._delegated_listeners.get(key)
+        if bound is not None and bound[0] is container:
+            return
+        if bound is not None:
+            try:
+                bound[0].removeEventListener("click", bound[1])
+            except Exception:
+                pass
+        owner = f"spellcasting.{key}"
+        release_proxies(owner)
+        proxy = track_proxy(owner, create_proxy(handler))
+        container.addEventListener("click", proxy)
+        self._delegated_listeners[key] = (container, proxy)
+
+    def _handle_spellbook_click(self, event):
+        button = _closest(getattr(event, "target", None), "button[data-remove-spell]")
+        if button is None:
+            return
+        slug = button.getAttribute("data-remove-spell")
+        if slug:
+            self.handle_remove_spell_click(event, slug)
+
+    def _handle_slot_click(self, event):
+        button = _closest(getattr(event, "target", None), "button[data-slot-level]")
+        if button is None or getattr(button, "disabled", False):
+            return
+        level = parse_int(button.getAttribute("data-slot-level"), None)
+        delta = parse_int(button.getAttribute("data-slot-delta"), 0)
+        if level is not None:
+            self.handle_slot_button(event, level, delta)
+
+    def _handle_pact_click(self, event):
+        button = _closest(getattr(event, "target", None), "button[data-pact-delta]")
+        if button is None or getattr(button, "disabled", False):
+            return
+        self.handle_pact_slot_button(event, parse_int(button.getAttribute("data-pact-delta"), 0))
 
     def handle_remove_spell_click(self, event, slug: str):
         """Handle spell removal button click."""
@@ -977,17 +996,7 @@ class SpellcastingManager:
         else:
             slots_container.innerHTML = "<p class=\"spell-slots-empty\">No spell slots available at your current level.</p>"
 
-        buttons = slots_container.querySelectorAll("button[data-slot-level]")
-        for button in buttons:
-            level = parse_int(button.getAttribute("data-slot-level"), None)
-            delta = parse_int(button.getAttribute("data-slot-delta"), 0)
-            if level is None:
-                continue
-            proxy = create_proxy(
-                lambda event, lvl=level, d=delta: self.handle_slot_button(event, lvl, d)
-            )
-            button.addEventListener("click", proxy)
-            _EVENT_PROXIES.append(proxy)
+        self._bind_delegated_click("spell-slots", slots_container, self._handle_slot_click)
 
         pact_info = slot_summary.get("pact", {"slots": 0, "level": 0})
         if pact_container is not None:
@@ -1009,14 +1018,7 @@ class SpellcastingManager:
                     + f"<button type=\"button\" data-pact-delta=\"-1\"{recover_disabled}>Recover</button>"
                     + "</div></div>"
                 )
-                pact_buttons = pact_container.querySelectorAll("button[data-pact-delta]")
-                for button in pact_buttons:
-                    delta = parse_int(button.getAttribute("data-pact-delta"), 0)
-                    proxy = create_proxy(
-                        lambda event, d=delta: self.handle_pact_slot_button(event, d)
-                    )
-                    button.addEventListener("click", proxy)
-                    _EVENT_PROXIES.append(proxy)
+                self._bind_delegated_click("pact-slots", pact_container, self._handle_pact_click)
 
     def handle_slot_button(self, event, level: int, delta: int):
         """Handle spell slot adjustment button click."""
@@ -1113,199 +1115,53 @@ def get_spell_by_slug(slug: Optional[str]) -> Union[dict, None]:
     return spell
 
 
-def sanitize_spell_record(raw: dict) -> Optional[dict]:
-    """Sanitize and validate a spell record from the library."""
-    name = raw.get("name") or "Unknown Spell"
-    slug_source = raw.get("slug") or name
-    slug = re.sub(r"[^a-z0-9]+", "-", slug_source.lower()).strip("-")
-
-    level_value = raw.get("level_int")
-    if level_value is None:
-        level_value = raw.get("level")
-    level_int = parse_int(level_value, 0)
-    level_label = format_spell_level_label(level_int)
-
-    classes_field = raw.get("dnd_class") or raw.get("classes") or ""
-    classes_raw = [token.strip() for token in re.split(r"[;,/]+", classes_field) if token.strip()]
-    classes: list[str] = []
-    for token in classes_raw:
-        canonical = normalize_class_token(token)
-        if canonical and canonical in SUPPORTED_SPELL_CLASSES and canonical not in classes:
-            classes.append(canonical)
-    if not classes:
+def load_spell_cache() -> Union[list[dict], None]:
+    """Load cached spells from localStorage."""
+    if window is None or not hasattr(window, "localStorage"):
         return None
-    classes_display = [SPELL_CLASS_DISPLAY_NAMES.get(c, c.title()) for c in classes]
-
-    school = (raw.get("school") or "").title()
-    casting_time = raw.get("casting_time") or ""
-    range_text = raw.get("range") or ""
-    components = raw.get("components") or ""
-    material = raw.get("material") or ""
-    duration = raw.get("duration") or ""
-    ritual = is_truthy(raw.get("ritual"))
-    concentration = is_truthy(raw.get("concentration"))
-
-    desc_text = _coerce_spell_text(raw.get("desc"))
-    higher_text = _coerce_spell_text(raw.get("higher_level"))
-    desc_html = _make_paragraphs(desc_text)
-    higher_html = _make_paragraphs(higher_text)
-    description_html = desc_html
-    if higher_html:
-        description_html += "<p class=\"spell-section-title\">At Higher Levels</p>" + higher_html
-
-    source = raw.get("document__title") or raw.get("document__slug") or raw.get("document") or ""
-
-    search_fields = [
-        name,
-        classes_field,
-        desc_text,
-        higher_text,
-        school,
-        casting_time,
-        range_text,
-        components,
-        material,
-        duration,
-        source,
-    ]
-    search_blob = " ".join(part for part in search_fields if part).lower()
-
-    result = {
-        "slug": slug,
-        "name": name,
-        "level_int": level_int,
-        "level_label": level_label,
-        "school": school,
-        "casting_time": casting_time,
-        "range": range_text,
-        "components": components,
-        "material": material,
-        "duration": duration,
-        "ritual": ritual,
-        "concentration": concentration,
-        "classes": classes,
-        "classes_display": classes_display,
-        "description_html": description_html,
-        "search_blob": search_blob,
-        "source": source,
-    }
-    
-    # Apply known corrections
-    return apply_spell_corrections(result)
+    return decode_spell_cache(window.localStorage.getItem(SPELL_LIBRARY_STORAGE_KEY))
 
 
-def sanitize_spell_list(raw_spells: list[dict]) -> list[dict]:
-    """Sanitize and deduplicate a list of spell records."""
-    sanitized: list[dict] = []
-    seen_slugs: set[str] = set()
-    for spell in raw_spells:
-        record = sanitize_spell_record(spell)
-        if record is not None:
-            slug = record.get("slug")
-            if slug not in seen_slugs:
-                sanitized.append(record)
-                seen_slugs.add(slug)
-    sanitized.sort(key=lambda item: (item["level_int"], item["name"].lower()))
-    return sanitized
-
-
-def rehydrate_cached_spell(record: dict) -> Optional[dict]:
-    """Rehydrate a cached spell record."""
-    classes = []
-    for token in record.get("classes", []):
-        canonical = normalize_class_token(token)
-        if canonical and canonical in SUPPORTED_SPELL_CLASSES and canonical not in classes:
-            classes.append(canonical)
-    if not classes:
-        return None
-    classes_display = record.get("classes_display") or [
-        SPELL_CLASS_DISPLAY_NAMES.get(c, c.title()) for c in classes
-    ]
-    return {
-        "slug": record.get("slug", ""),
-        "name": record.get("name", "Unknown Spell"),
-        "level_int": parse_int(record.get("level_int"), 0),
-        "level_label": record.get("level_label", format_spell_level_label(parse_int(record.get("level_int"), 0))),
-        "school": record.get("school", ""),
-        "casting_time": record.get("casting_time", ""),
-        "range": record.get("range", ""),
-        "components": record.get("components", ""),
-        "material": record.get("material", ""),
-        "duration": record.get("duration", ""),
-        "ritual": bool(record.get("ritual", False)),
-        "concentration": bool(record.get("concentration", False)),
-        "classes": classes,
-        "classes_display": classes_display,
-        "description_html": record.get("description_html", ""),
-        "search_blob": (record.get("search_blob", "") or "").lower(),
-        "source": record.get("source", ""),
-    }
+def save_spell_cache(spells: list[dict]) -> bool:
+    """Save spells to localStorage; see spell_data.save_spell_cache."""
+    if window is None or not hasattr(window, "localStorage"):
+        return False
+    return store_spell_cache(window.localStorage, SPELL_LIBRARY_STORAGE_KEY, spells, SPELL_CACHE_LEGACY_KEYS)
 
 
-def load_spell_cache() -> Union[list[dict], None]:
-    """Load cached spells from localStorage."""
-    if window is None or not hasattr(window, "localStorage"):
-        return None
-    cached = window.localStorage.getItem(SPELL_LIBRARY_STORAGE_KEY)
-    if not cached:
-        return None
+async def fetch_server_spell_library() -> Optional[dict]:
+    """Fetch the backend's pre-sanitized spell library, or None if unavailable."""
     try:
-        payload = json.loads(cached)
+        response = await pyfetch(SPELL_LIBRARY_ENDPOINT)
+        if not response.ok:
+            return None
+        payload = await response.json()
     except Exception as exc:
-        console.warn(f"PySheet: failed to parse spell cache ({exc})")
+        console.log(f"PySheet: spell library endpoint unavailable ({exc})")
         return None
-    if payload.get("version") != SPELL_CACHE_VERSION:
+    if not isinstance(payload, dict):
         return None
     spells = payload.get("spells")
-    if not isinstance(spells, list):
+    if not isinstance(spells, list) or not spells:
         return None
-    rehydrated: list[dict] = []
-    seen_slugs: set[str] = set()
-    for record in spells:
-        try:
-            if not isinstance(record, dict):
-                continue
-            hydrated = rehydrate_cached_spell(record)
-            if hydrated is not None:
-                slug = hydrated.get("slug")
-                if slug and slug not in seen_slugs:
-                    rehydrated.append(hydrated)
-                    seen_slugs.add(slug)
-        except Exception as exc:
-            console.warn(f"PySheet: skipping cached spell due to error ({exc})")
-    if not rehydrated:
+    if not all(isinstance(spell, dict) and spell.get("slug") for spell in spells):
+        console.warn("PySheet: spell library endpoint returned malformed records; ignoring")
         return None
-    rehydrated.sort(key=lambda item: (item["level_int"], item["name"].lower()))
-    return rehydrated
+    return payload
 
 
-def save_spell_cache(spells: list[dict]) -> None:
-    """Save spells to localStorage cache."""
-    if window is None or not hasattr(window, "localStorage"):
-        return
-    payload = {"version": SPELL_CACHE_VERSION, "spells": spells}
-    try:
-        window.localStorage.setItem(SPELL_LIBRARY_STORAGE_KEY, json.dumps(payload))
-    except Exception as exc:
-        console.warn(f"PySheet: unable to store spell cache ({exc})")
-
-
-async def fetch_open5e_spells() -> list[dict]:
-    """Fetch spells from Open5e API."""
-    spells: list[dict] = []
-    url = OPEN5E_SPELLS_ENDPOINT
-    pages = 0
-    while url and pages < OPEN5E_MAX_PAGES:
-        response = await pyfetch(url)
-        if not response.ok:
-            raise RuntimeError(f"Open5e request failed ({response.status})")
-        data = await response.json()
-        results = data.get("results", [])
-        if isinstance(results, list):
-            spells.extend(results)
-        url = data.get("next")
-        pages += 1
-    return spells
+def merge_sanitized_spells(chunks: list[list[dict]]) -> list[dict]:
+    """Concatenate sanitized chunks, keep the first record per slug and sort."""
+    merged: list[dict] = []
+    seen_slugs: set[str] = set()
+    for chunk in chunks:
+        for record in chunk:
+            slug = record.get("slug")
+            if slug not in seen_slugs:
+                merged.append(record)
+                seen_slugs.add(slug)
+    merged.sort(key=lambda item: (item["level_int"], item["name"].lower()))
+    return merged
 
 
 def set_spell_library_data(spells: list):
@@ -1332,6 +1188,8 @@ def set_spell_library_data(spells: list):
         if spell_slug:
             SPELL_LIBRARY_STATE["spell_map"][spell_slug] = spell
     
+    SPELL_LIBRARY_STATE["filter_index"] = build_spell_filter_index(deduplicated)
+    
     console.log(f"DEBUG set_spell_library_data: Built spell_map with {len(SPELL_LIBRARY_STATE['spell_map'])} spells")
     
     # Log domain spell presence
@@ -1346,6 +1204,108 @@ def set_spell_library_data(spells: list):
     console.log(f"DEBUG set_spell_library_data: Domain spells present: {domain_present}, missing: {domain_missing}")
 
 
+_SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def build_spell_filter_index(spells: list[dict]) -> dict:
+    """Build posting lists over a spell list for fast filtering.
+
+    Postings hold positions into ``spells`` so query results keep the
+    library's (level, name) ordering. ``tokens`` maps every word in a spell's
+    search_blob to the spells containing it; substring searches match the
+    query against the token vocabulary instead of every blob.
+    """
+    by_class: dict[str, set[int]] = {}
+    by_level: dict[int, set[int]] = {}
+    by_source: dict[str, set[int]] = {}
+    tokens: dict[str, set[int]] = {}
+    blobs: list[str] = []
+    for position, spell in enumerate(spells):
+        for class_key in spell.get("classes", []) or []:
+            by_class.setdefault(class_key, set()).add(position)
+        level = parse_int(spell.get("level_int", 0), 0)
+        by_level.setdefault(level, set()).add(position)
+        by_source.setdefault(spell.get("source", "") or "", set()).add(position)
+        blob = (spell.get("search_blob", "") or "").lower()
+        blobs.append(blob)
+        for token in set(_SEARCH_TOKEN_RE.findall(blob)):
+            tokens.setdefault(token, set()).add(position)
+
+    allowed_sources: set[int] = set()
+    for source, positions in by_source.items():
+        if is_spell_source_allowed(source):
+            allowed_sources |= positions
+
+    return {
+        "spells": spells,
+        "by_class": by_class,
+        "by_level": by_level,
+        "by_source": by_source,
+        "allowed_sources": allowed_sources,
+        "tokens": tokens,
+        "blobs": blobs,
+        "fragment_cache": {},
+    }
+
+
+def _search_candidates(index: dict, search_term: str) -> Optional[set[int]]:
+    """Positions whose blob may contain ``search_term`` (None = no narrowing)."""
+    fragments = _SEARCH_TOKEN_RE.findall(search_term)
+    if not fragments:
+        return None
+    cache = index["fragment_cache"]
+    candidates: Optional[set[int]] = None
+    for fragment in sorted(set(fragments), key=len, reverse=True):
+        postings = cache.get(fragment)
+        if postings is None:
+            postings = set()
+            for token, positions in index["tokens"].items():
+                if fragment in token:
+                    postings |= positions
+            cache[fragment] = postings
+        candidates = postings if candidates is None else candidates & postings
+        if not candidates:
+            return set()
+    return candidates
+
+
+def query_spell_index(
+    index: dict,
+    classes: Optional[set[str]] = None,
+    max_level: Optional[int] = None,
+    level: Optional[int] = None,
+    search_term: str = "",
+) -> list[dict]:
+    """Filter the indexed spells by set intersection.
+
+    ``classes`` matches spells castable by any of the given classes, and
+    ``search_term`` keeps substring semantics against search_blob.
+    """
+    selected = set(index["allowed_sources"])
+    if classes:
+        class_hits: set[int] = set()
+        for class_key in classes:
+            class_hits |= index["by_class"].get(class_key, set())
+        selected &= class_hits
+    if level is not None:
+        selected &= index["by_level"].get(level, set())
+    if max_level is not None:
+        level_hits: set[int] = set()
+        for spell_level, positions in index["by_level"].items():
+            if spell_level <= max_level:
+                level_hits |= positions
+        selected &= level_hits
+    search_term = (search_term or "").lower()
+    if search_term and selected:
+        candidates = _search_candidates(index, search_term)
+        if candidates is not None:
+            selected &= candidates
+        blobs = index["blobs"]
+        selected = {position for position in selected if search_term in blobs[position]}
+    spells = index["spells"]
+    return [spells[position] for position in sorted(selected)]
+
+
 def update_spell_library_status(message: str):
     """Update spell library status message."""
     status_el = get_element("spell-library-status")
@@ -1372,12 +1332,27 @@ async def load_spell_library(_event=None):
             update_spell_library_status("Loaded spells from cache.")
             return
 
+        server_library = await fetch_server_spell_library()
+        if server_library is not None and server_library.get("source") == "data":
+            set_spell_library_data(server_library["spells"])
+            SPELL_LIBRARY_STATE["loaded"] = True
+            save_spell_cache(server_library["spells"])
+            update_spell_library_status("Loaded spell library from server.")
+            return
+
         status_message = "Loaded latest Open5e SRD spells."
         raw_spells = None
         fetch_error = None
+        sanitized_pages: dict[int, list[dict]] = {}
+
+        def sanitize_page(page_number: int, results: list[dict]):
+            sanitized_pages[page_number] = sanitize_spell_list(results)
+
         try:
             console.log("PySheet: Fetching spells from Open5e...")
-            raw_spells = await fetch_open5e_spells()
+            raw_spells = await fetch_open5e_spells(
+                on_page=sanitize_page, on_status=update_spell_library_status
+            )
             console.log(f"PySheet: Open5e fetch returned {len(raw_spells) if raw_spells else 0} spells")
         except Exception as exc:
             fetch_error = exc
@@ -1393,15 +1368,22 @@ async def load_spell_library(_event=None):
             # Merge fallback spells
             console.log(f"PySheet: Merging fallback spells into Open5e list...")
             existing_slugs = {spell.get("slug") for spell in raw_spells if spell.get("slug")}
-            merge_count = 0
+            merged_fallback = []
             for fallback_spell in LOCAL_SPELLS_FALLBACK:
                 fallback_slug = fallback_spell.get("slug")
                 if fallback_slug not in existing_slugs:
                     raw_spells.append(fallback_spell)
-                    merge_count += 1
-            console.log(f"PySheet: Merged {merge_count} fallback spells")
-
-        sanitized = sanitize_spell_list(raw_spells)
+                    merged_fallback.append(fallback_spell)
+            console.log(f"PySheet: Merged {len(merged_fallback)} fallback spells")
+
+        if raw_spells is LOCAL_SPELLS_FALLBACK and server_library is not None:
+            sanitized = server_library["spells"]
+        elif raw_spells is not LOCAL_SPELLS_FALLBACK:
+            chunks = [sanitized_pages[number] for number in sorted(sanitized_pages)]
+            chunks.append(sanitize_spell_list(merged_fallback))
+            sanitized = merge_sanitized_spells(chunks)
+        else:
+            sanitized = sanitize_spell_list(raw_spells)
         if not sanitized and raw_spells is not LOCAL_SPELLS_FALLBACK:
             console.warn("PySheet: remote spell list missing supported classes; using fallback list.")
             raw_spells = LOCAL_SPELLS_FALLBACK
@@ -0,0 +1,221 @@
+"""Async key/value storage for the browser caches.
+
+Values are strings kept in named stores ("kv", "spell_descriptions", "logs").
+``IndexedDBStorage`` goes through the ``window.pysheetStorage`` helper defined
+in index.html, so large caches neither block the main thread nor count
+against the ~5 MB localStorage quota. ``LocalStorageStorage`` is the fallback
+when IndexedDB is unavailable (private browsing, old browsers) and
+``MemoryStorage`` backs tests. ``get_storage()`` picks the best available one.
+"""
+
+import asyncio
+
+try:
+    from js import console, window
+except ImportError:
+    # Mock for testing environments
+    class _MockConsole:
+        @staticmethod
+        def log(*args): pass
+        @staticmethod
+        def warn(*args): pass
+        @staticmethod
+        def error(*args): pass
+
+    console = _MockConsole()
+    window = None
+
+try:
+    from pyodide.ffi import to_js
+except ImportError:
+    to_js = None
+
+
+STORAGE_STORES = ("kv", "spell_descriptions", "logs")
+# localStorage has no stores: "kv" keys are used verbatim (existing data stays
+# readable), other stores are namespaced.
+LOCAL_STORAGE_PREFIX = "pysheet.store"
+
+# (store, key) -> value factory for write_behind; at most one task per key
+_PENDING_WRITES: dict = {}
+_STORAGE = None
+
+
+class MemoryStorage:
+    """Dict-backed storage for tests and as the last resort."""
+
+    kind = "memory"
+    per_record = True
+
+    def __init__(self):
+        self.stores = {name: {} for name in STORAGE_STORES}
+
+    async def get(self, store: str, key: str):
+        return self.stores[store].get(key)
+
+    async def get_many(self, store: str, keys: list) -> list:
+        values = self.stores[store]
+        return [values.get(key) for key in keys]
+
+    async def set(self, store: str, key: str, value: str) -> None:
+        self.stores[store][key] = value
+
+    async def set_many(self, store: str, items: dict) -> None:
+        self.stores[store].update(items)
+
+    async def delete(self, store: str, key: str) -> None:
+        self.stores[store].pop(key, None)
+
+    async def clear(self, store: str) -> None:
+        self.stores[store].clear()
+
+
+class LocalStorageStorage:
+    """Synchronous window.localStorage behind the async interface.
+
+    per_record is False: one key per record would multiply the quota
+    overhead, so callers keep large caches in a single compact value.
+    """
+
+    kind = "localstorage"
+    per_record = False
+
+    def __init__(self, local_storage):
+        self.local_storage = local_storage
+
+    def _key(self, store: str, key: str) -> str:
+        if store == "kv":
+            return key
+        return f"{LOCAL_STORAGE_PREFIX}.{store}.{key}"
+
+    async def get(self, store: str, key: str):
+        return self.local_storage.getItem(self._key(store, key))
+
+    async def get_many(self, store: str, keys: list) -> list:
+        return [self.local_storage.getItem(self._key(store, key)) for key in keys]
+
+    async def set(self, store: str, key: str, value: str) -> None:
+        self.local_storage.setItem(self._key(store, key), value)
+
+    async def set_many(self, store: str, items: dict) -> None:
+        for key, value in items.items():
+            self.local_storage.setItem(self._key(store, key), value)
+
+    async def delete(self, store: str, key: str) -> None:
+        self.local_storage.removeItem(self._key(store, key))
+
+    async def clear(self, store: str) -> None:
+        if store == "kv":
+            return  # kv shares the namespace with unrelated keys
+        prefix = self._key(store, "")
+        keys = [self.local_storage.key(i) for i in range(self.local_storage.length)]
+        for key in keys:
+            if key and key.startswith(prefix):
+                self.local_storage.removeItem(key)
+
+
+class IndexedDBStorage:
+    """IndexedDB through window.pysheetStorage (promise-based, see index.html)."""
+
+    kind = "indexeddb"
+    per_record = True
+
+    def __init__(self, helper):
+        self.helper = helper
+
+    async def get(self, store: str, key: str):
+        value = await self.helper.get(store, key)
+        return None if value is None else str(value)
+
+    async def get_many(self, store: str, keys: list) -> list:
+        values = await self.helper.getMany(store, to_js(list(keys)) if to_js else list(keys))
+        values = values.to_py() if hasattr(values, "to_py") else list(values)
+        return [None if value is None else str(value) for value in values]
+
+    async def set(self, store: str, key: str, value: str) -> None:
+        await self.helper.set(store, key, value)
+
+    async def set_many(self, store: str, items: dict) -> None:
+        entries = [[key, value] for key, value in items.items()]
+        await self.helper.setMany(store, to_js(entries) if to_js else entries)
+
+    async def delete(self, store: str, key: str) -> None:
+        await self.helper.delete(store, key)
+
+    async def clear(self, store: str) -> None:
+        await self.helper.clear(store)
+
+
+async def _indexeddb_opens(helper) -> bool:
+    try:
+        return bool(await helper.usesIndexedDB())
+    except Exception as exc:
+        console.warn(f"PySheet: IndexedDB check failed ({exc})")
+        return False
+
+
+async def get_storage():
+    """The storage backend for this session (IndexedDB > localStorage > memory).
+
+    IndexedDB is only chosen once the database has actually opened; private
+    browsing or a blocked upgrade leaves the session on localStorage.
+    """
+    global _STORAGE
+    if _STORAGE is not None:
+        return _STORAGE
+    helper = getattr(window, "pysheetStorage", None) if window is not None else None
+    if helper is not None and getattr(helper, "available", False) and await _indexeddb_opens(helper):
+        storage = IndexedDBStorage(helper)
+    elif window is not None and getattr(window, "localStorage", None) is not None:
+        storage = LocalStorageStorage(window.localStorage)
+    else:
+        storage = MemoryStorage()
+    if _STORAGE is not None:
+        # Another caller finished choosing while this one was waiting
+        return _STORAGE
+    _STORAGE = storage
+    console.log(f"PySheet: using {_STORAGE.kind} storage")
+    return _STORAGE
+
+
+def set_storage(storage):
+    """Replace the session backend (tests, or after IndexedDB fails); returns the old one."""
+    global _STORAGE
+    previous, _STORAGE = _STORAGE, storage
+    return previous
+
+
+async def _flush_write(store: str, key: str):
+    # Yield once so bursts of writes to the same key collapse into one
+    await asyncio.sleep(0)
+    factory = _PENDING_WRITES.pop((store, key), None)
+    if factory is None:
+        return
+    try:
+        value = factory()
+        if asyncio.iscoroutine(value):
+            value = await value
+        await (await get_storage()).set(store, key, value)
+    except Exception as exc:
+        console.warn(f"PySheet: deferred write of {store}/{key} failed ({exc})")
+
+
+def write_behind(store: str, key: str, value_factory):
+    """Persist value_factory() later without blocking the caller.
+
+    Repeated calls before the write runs only keep the latest factory, which
+    may be a coroutine function. Returns the scheduled task, or None if
+    a write for this key was already pending.
+    """
+    pending = (store, key) in _PENDING_WRITES
+    _PENDING_WRITES[(store, key)] = value_factory
+    if pending:
+        return None
+    flush = _flush_write(store, key)
+    try:
+        return asyncio.create_task(flush)
+    except RuntimeError:
+        # No running event loop (plain import outside the browser): drop it
+        flush.close()
+        _PENDING_WRITES.pop((store, key), None)
+        return None
@@ -1,7 +1,12 @@
+import os
 import sys
+import tempfile
 import warnings
+from collections import OrderedDict
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 from _pytest.python import PytestReturnNotNoneWarning
 
 
@@ -24,6 +29,8 @@ def _ensure_spellcasting_file_attr():
 
 
 def pytest_configure(config):
+    # backend.py opens its rotating log file at import; keep test runs out of logs/
+    os.environ.setdefault("PYSHEET_LOG_DIR", tempfile.mkdtemp(prefix="pysheet-test-logs-"))
     _ensure_assets_on_path()
     _ensure_spellcasting_file_attr()
     warnings.filterwarnings("ignore", category=PytestReturnNotNoneWarning)
@@ -32,3 +39,38 @@ def pytest_configure(config):
 def pytest_runtest_setup(item):
     _ensure_assets_on_path()
     _ensure_spellcasting_file_attr()
+
+
+@pytest.fixture
+def isolated_exports(tmp_path):
+    """Point backend's export store (files, blobs, refs, catalog) at tmp_path.
+
+    Tests that export through the API otherwise leave blobs, the refs files and
+    the SQLite catalog in the repository's exports/ directory.
+    """
+    import backend
+
+    export_dir = tmp_path
+    blobs = export_dir / ".blobs"
+    blobs.mkdir()
+    patches = [
+        patch.object(backend, "EXPORT_DIR", export_dir),
+        patch.object(backend, "EXPORT_BLOB_DIR", blobs),
+        patch.object(backend, "EXPORT_REFS_FILE", blobs / "refs.json"),
+        patch.object(backend, "EXPORT_REFS_JOURNAL", blobs / "refs.log"),
+        patch.object(backend, "EXPORT_REFS_JOURNAL_STATE", {"entries": 0}),
+        patch.object(backend, "EXPORT_REFS", {}),
+        patch.object(backend, "EXPORT_RECENT_DOCUMENTS", OrderedDict()),
+        patch.object(backend, "EXPORT_INDEX", {"dir_mtime_ns": None, "entries": {}, "ordered": [], "keys": []}),
+        patch.object(backend, "EXPORT_CATALOG_FILE", export_dir / ".catalog.sqlite3"),
+        patch.object(backend, "EXPORT_CATALOG", {"connection": None, "path": None, "generation": None}),
+    ]
+    for p in patches:
+        p.start()
+    try:
+        yield export_dir
+    finally:
+        if backend.EXPORT_CATALOG["connection"] is not None:
+            backend.EXPORT_CATALOG["connection"].close()
+        for p in reversed(patches):
+            p.stop()
@@ -0,0 +1,88 @@
+"""
+Tests for the equipment name index used by _enrich_weapon_item and
+_find_builtin_equipment_match.
+
+The index must pick the same library entry as the original per-lookup scan.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+import character
+from character import build_equipment_name_index, find_equipment_match
+
+
+def _scan_match(items, name):
+    """Reference implementation mirroring the old linear scan."""
+    name_norm = (name or "").lower().replace(',', '').strip()
+    name_tokens = set(re.findall(r"\w+", name_norm))
+    for item in items:
+        eq_name = (item.get("name", "") or "").lower().replace(',', '').strip()
+        eq_tokens = set(re.findall(r"\w+", eq_name))
+        if name_tokens and eq_tokens:
+            if name_tokens == eq_tokens or name_tokens.issubset(eq_tokens) or eq_tokens.issubset(name_tokens):
+                return item
+        if name_norm in eq_name or eq_name in name_norm:
+            return item
+    return None
+
+
+@pytest.fixture(scope="module")
+def library():
+    return [
+        item.to_dict() if hasattr(item, "to_dict") else item
+        for item in character._get_builtin_equipment_list()
+    ]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "Longsword",
+        "Longsword +1",
+        "Light Crossbow",
+        "Crossbow, light",
+        "crossbow",
+        "Sword",
+        "Dagger of Venom",
+        "Plate Armor",
+        "Shield",
+        "Chain",
+        "Studded Leather",
+        "bow",
+        "Totally Unknown Thing",
+        "x",
+        "",
+    ],
+)
+def test_index_matches_scan(library, name):
+    index = build_equipment_name_index(library)
+    assert find_equipment_match(index, name) is _scan_match(index["items"], name)
+
+
+def test_library_order_wins():
+    items = [{"name": "Great Axe"}, {"name": "Axe"}, {"name": "Handaxe"}]
+    index = build_equipment_name_index(items)
+    assert find_equipment_match(index, "axe")["name"] == "Great Axe"
+    assert find_equipment_match(index, "Battle Axe")["name"] == "Axe"
+    # "axe" is a substring of "handaxe", and Axe comes first
+    assert find_equipment_match(index, "handaxe")["name"] == "Axe"
+
+
+def test_library_index_rebuilds_when_equipment_replaced():
+    state = character.EQUIPMENT_LIBRARY_STATE
+    saved = dict(state)
+    try:
+        state["equipment"] = [{"name": "Whip"}]
+        first = character._equipment_library_index()
+        assert character._equipment_library_index() is first
+        state["equipment"] = [{"name": "Net"}]
+        assert find_equipment_match(character._equipment_library_index(), "net")["name"] == "Net"
+    finally:
+        state.clear()
+        state.update(saved)
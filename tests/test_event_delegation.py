@@ -0,0 +1,171 @@
+"""
+Tests for delegated event listeners.
+
+Re-rendering the inventory, the spellbook or the spell slots must reuse one
+listener per container instead of creating a proxy per button.
+"""
+
+import re
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+import character
+import equipment_management
+import spellcasting
+from equipment_management import InventoryManager
+from spellcasting import SpellcastingManager
+
+
+class FakeElement:
+    """Minimal element supporting getAttribute/closest/addEventListener."""
+
+    def __init__(self, tag="div", attrs=None, parent=None, classes=()):
+        self.tagName = tag.upper()
+        self.attrs = dict(attrs or {})
+        self.parent = parent
+        self.classes = set(classes)
+        self.listeners = []
+        self.disabled = False
+        self.innerHTML = ""
+        self.type = self.attrs.get("type", "")
+        self.id = self.attrs.get("id", "")
+
+    def getAttribute(self, name):
+        return self.attrs.get(name)
+
+    def addEventListener(self, name, handler, *args):
+        self.listeners.append((name, handler))
+
+    def removeEventListener(self, name, handler, *args):
+        self.listeners.remove((name, handler))
+
+    def _matches(self, selector):
+        match = re.fullmatch(r"(\w*)(?:\[([\w-]+)(?:\^='([^']*)')?\])?(?:\.([\w-]+))?(?:#([\w-]+))?", selector)
+        tag, attr, prefix, css_class, element_id = match.groups()
+        if tag and self.tagName.lower() != tag:
+            return False
+        if attr:
+            value = self.attrs.get(attr)
+            if value is None or (prefix is not None and not value.startswith(prefix)):
+                return False
+        if css_class and css_class not in self.classes:
+            return False
+        if element_id and self.id != element_id:
+            return False
+        return True
+
+    def closest(self, selector):
+        node = self
+        while node is not None:
+            if node._matches(selector):
+                return node
+            node = node.parent
+        return None
+
+
+class TestInventoryDelegation:
+    def test_rerender_binds_listeners_once(self):
+        inventory_list = FakeElement(attrs={"id": "inventory-list"})
+        manager = InventoryManager()
+        with patch.object(equipment_management, "document", MagicMock()), \
+             patch.object(equipment_management, "get_element", return_value=inventory_list):
+            for _ in range(5):
+                manager._register_item_handlers()
+        assert sorted(name for name, _ in inventory_list.listeners) == ["change", "click"]
+
+    def test_change_dispatches_on_data_attribute(self):
+        manager = InventoryManager()
+        manager._handle_qty_change = MagicMock()
+        manager._handle_modifier_change = MagicMock()
+        event = MagicMock()
+        event.target = FakeElement("input", {"data-item-qty": "3"})
+        manager._dispatch_item_change(event)
+        manager._handle_qty_change.assert_called_once_with(event, "3")
+        event.target = FakeElement("input", {"data-item-saves-mod": "4"})
+        manager._dispatch_item_change(event)
+        manager._handle_modifier_change.assert_called_once_with(event, "4", "saves_modifier")
+
+    def test_remove_click_wins_over_toggle(self):
+        manager = InventoryManager()
+        manager._handle_item_remove = MagicMock()
+        manager._handle_item_toggle = MagicMock()
+        summary = FakeElement(attrs={"data-toggle-item": "7"})
+        button = FakeElement("button", {"data-remove-item": "7"}, parent=summary)
+        event = MagicMock()
+        event.target = button
+        manager._dispatch_item_click(event)
+        manager._handle_item_remove.assert_called_once_with(event, "7")
+        assert not manager._handle_item_toggle.called
+
+        event.target = FakeElement("span", parent=summary)
+        manager._dispatch_item_click(event)
+        manager._handle_item_toggle.assert_called_once_with(event, "7")
+
+
+class TestSpellbookDelegation:
+    def test_bind_reuses_listener_for_same_container(self):
+        manager = SpellcastingManager()
+        container = FakeElement()
+        for _ in range(4):
+            manager._bind_delegated_click("spellbook", container, manager._handle_spellbook_click)
+        assert len(container.listeners) == 1
+
+    def test_remove_button_dispatch(self):
+        manager = SpellcastingManager()
+        manager.handle_remove_spell_click = MagicMock()
+        button = FakeElement("button", {"data-remove-spell": "bless"})
+        event = MagicMock()
+        event.target = FakeElement("span", parent=button)
+        manager._handle_spellbook_click(event)
+        manager.handle_remove_spell_click.assert_called_once_with(event, "bless")
+
+    def test_slot_button_dispatch(self):
+        manager = SpellcastingManager()
+        manager.handle_slot_button = MagicMock()
+        event = MagicMock()
+        event.target = FakeElement("button", {"data-slot-level": "2", "data-slot-delta": "-1"})
+        manager._handle_slot_click(event)
+        manager.handle_slot_button.assert_called_once_with(event, 2, -1)
+
+
+class TestDocumentDelegation:
+    def test_register_binds_one_listener_per_event_type(self):
+        fake_document = FakeElement()
+        fake_window = FakeElement()
+        with patch.object(character, "document", fake_document), \
+             patch.object(character, "window", fake_window), \
+             patch.object(character, "get_element", return_value=None), \
+             patch.dict(character._DOCUMENT_LISTENER_PROXIES, clear=True):
+            character.register_event_listeners()
+            character.register_event_listeners()
+        assert sorted(name for name, _ in fake_document.listeners) == ["change", "click", "input"]
+        assert [name for name, _ in fake_window.listeners] == ["beforeunload"]
+
+    def test_character_input_dispatch(self):
+        event = MagicMock()
+        event.target = FakeElement("input", {"data-character-input": "", "id": "current_hp"})
+        with patch.object(character, "handle_input_event") as handler:
+            character._dispatch_document_input(event)
+        handler.assert_called_once_with(event)
+
+    def test_adjust_button_receives_matched_button(self):
+        button = FakeElement("button", {"data-adjust-target": "current_hp"})
+        event = MagicMock()
+        event.target = FakeElement("span", parent=button)
+        with patch.object(character, "handle_adjust_button") as handler:
+            character._dispatch_document_click(event)
+        handler.assert_called_once_with(event, button)
+
+    def test_import_errors_go_to_console(self):
+        event = MagicMock()
+        event.target = FakeElement("input", {"id": "import-file", "type": "file"})
+        with patch.object(character, "handle_import", side_effect=ValueError("bad file")), \
+             patch.object(character, "console") as console:
+            character._dispatch_document_change(event)
+        console.error.assert_called_once_with("PySheet: failed to import character - bad file")
+        console.log.assert_not_called()
@@ -0,0 +1,86 @@
+"""
+Tests for the SQLite export catalog and the /api/characters endpoints.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import backend
+from backend import app
+
+
+@pytest.fixture
+def export_dir(isolated_exports):
+    return isolated_exports
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def _export(client, name, cls, level, stamp, **extra):
+    content = dict({'identity': {'name': name, 'class': cls}, 'level': level}, **extra)
+    filename = f'{name}_{cls}_lvl{level}_{stamp}.json'
+    assert client.post('/api/export', json={'filename': filename, 'content': content}).status_code == 200
+    return filename
+
+
+@pytest.fixture
+def history(client, export_dir):
+    names = [
+        _export(client, 'Enwer', 'Cleric', 8, '20250101_1200'),
+        _export(client, 'Rilla', 'Rogue', 3, '20250101_1300'),
+        _export(client, 'Enwer', 'Cleric', 9, '20250102_1200'),
+    ]
+    return names
+
+
+def test_characters_summary(client, history):
+    data = client.get('/api/characters').get_json()
+    assert data['count'] == 2
+    by_key = {c['key']: c for c in data['characters']}
+    assert by_key['enwer']['exports'] == 2
+    assert by_key['enwer']['level'] == 9
+    assert by_key['enwer']['latest']['filename'] == history[2]
+    assert data['characters'][0]['key'] == 'enwer'
+
+
+def test_history_newest_first(client, history):
+    data = client.get('/api/characters/ENWER/history').get_json()
+    assert [e['filename'] for e in data['exports']] == [history[2], history[0]]
+    assert data['exports'][0]['digest'] == backend.content_digest(
+        {'identity': {'name': 'Enwer', 'class': 'Cleric'}, 'level': 9})
+    page = client.get('/api/characters/enwer/history?limit=1&offset=1').get_json()
+    assert [e['filename'] for e in page['exports']] == [history[0]]
+    assert client.get('/api/characters/enwer/history?limit=0').status_code == 400
+
+
+def test_latest(client, history):
+    data = client.get('/api/characters/rilla/latest?content=1').get_json()
+    assert data['export']['filename'] == history[1]
+    assert data['content']['identity']['name'] == 'Rilla'
+    assert client.get('/api/exports/latest').get_json()['export']['filename'] == history[2]
+    assert client.get('/api/characters/nobody/latest').status_code == 404
+
+
+def test_files_changed_outside_api_are_reconciled(client, history, export_dir):
+    (export_dir / history[1]).unlink()
+    manual = export_dir / 'Baldrick_Wizard_lvl2_20250103_0900.json'
+    manual.write_text(json.dumps({'name': 'Baldrick'}), encoding='utf-8')
+    keys = {c['key'] for c in client.get('/api/characters').get_json()['characters']}
+    assert keys == {'enwer', 'baldrick'}
+    latest = client.get('/api/characters/baldrick/latest').get_json()['export']
+    assert (latest['class'], latest['level']) == ('Wizard', 2)
+
+
+def test_catalog_survives_restart(client, history):
+    backend.EXPORT_CATALOG['connection'].close()
+    backend.EXPORT_CATALOG.update(connection=None, path=None, generation=None)
+    assert len(backend.query_character_history('enwer')) == 2
@@ -0,0 +1,115 @@
+"""
+Tests for compressed export request bodies and compressed-at-rest exports.
+"""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools" / "checks"))
+import backend
+import check_utils
+from backend import app
+
+
+CHARACTER = {'identity': {'name': 'Énwér', 'class': 'Cleric'}, 'level': 9}
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def export_dir(isolated_exports):
+    yield isolated_exports
+    # Queued writes must land before the export store is restored
+    backend.wait_for_exports(5)
+
+
+def _gzip_post(client, path, payload, encoding='gzip'):
+    body = gzip.compress(json.dumps(payload).encode('utf-8'))
+    return client.post(path, data=body, headers={
+        'Content-Type': 'application/json',
+        'Content-Encoding': encoding,
+    })
+
+
+class TestCompressedRequests:
+    def test_gzip_body_is_decoded(self, client, export_dir):
+        response = _gzip_post(client, '/api/export', {'filename': 'test_gz_body.json', 'content': CHARACTER})
+        assert response.status_code == 200
+        saved = json.loads((export_dir / 'test_gz_body.json').read_text(encoding='utf-8'))
+        assert saved == CHARACTER
+
+    def test_unknown_encoding_is_rejected(self, client):
+        response = _gzip_post(client, '/api/export', {'filename': 'test_gz_x.json', 'content': {}}, encoding='br')
+        assert response.status_code == 415
+
+    def test_corrupt_body_is_bad_request(self, client):
+        response = client.post('/api/export', data=b'\x1f\x8bnot gzip', headers={
+            'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip',
+        })
+        assert response.status_code == 400
+
+    def test_oversized_body_is_bad_request(self, client):
+        with patch.object(backend, 'MAX_DECOMPRESSED_BYTES', 16):
+            response = _gzip_post(client, '/api/export', {'filename': 'test_gz_big.json', 'content': CHARACTER})
+        assert response.status_code == 400
+
+
+class TestCompressedStorage:
+    def test_gzip_format_writes_compressed_export(self, client, export_dir):
+        with patch.object(backend, 'EXPORT_FORMAT', 'gzip'):
+            response = client.post('/api/export', json={'filename': 'test_gz_store.json', 'content': CHARACTER})
+        assert response.status_code == 200
+        assert response.get_json()['filename'] == 'test_gz_store.json.gz'
+        stored = export_dir / 'test_gz_store.json.gz'
+        assert json.loads(gzip.decompress(stored.read_bytes())) == CHARACTER
+        assert backend.read_export_file(stored) == CHARACTER
+
+        listed = {e['filename']: e for e in client.get('/api/exports').get_json()['exports']}
+        assert listed['test_gz_store.json.gz']['compressed'] is True
+
+    def test_delta_applies_to_compressed_base(self, client, export_dir):
+        with patch.object(backend, 'EXPORT_FORMAT', 'gzip'):
+            base = client.post('/api/export', json={'filename': 'test_gz_base.json', 'content': CHARACTER}).get_json()['digest']
+            with patch.object(backend, 'EXPORT_RECENT_DOCUMENTS', backend.OrderedDict()):
+                response = client.post('/api/export/delta', json={
+                    'filename': 'test_gz_next.json', 'base': base,
+                    'patch': [{'op': 'replace', 'path': '/level', 'value': 10}],
+                })
+        assert response.status_code == 200
+        assert backend.read_export_file(export_dir / 'test_gz_next.json.gz')['level'] == 10
+
+    def test_format_aliases(self):
+        assert backend._resolve_export_format('json.gz') == 'gzip'
+        assert backend._resolve_export_format(None) == 'json'
+        assert backend._resolve_export_format('bogus') == 'json'
+
+
+class TestCheckUtils:
+    def test_reads_plain_and_gzip(self, tmp_path):
+        plain = tmp_path / 'a.json'
+        plain.write_text(json.dumps(CHARACTER), encoding='utf-8')
+        packed = tmp_path / 'b.json.gz'
+        packed.write_bytes(gzip.compress(json.dumps(CHARACTER).encode('utf-8')))
+        assert check_utils.load_export_json(plain) == CHARACTER
+        assert check_utils.load_export_json(packed) == CHARACTER
+
+    def test_default_export_includes_compressed(self, tmp_path):
+        plain = tmp_path / 'a.json'
+        plain.write_text('{}', encoding='utf-8')
+        packed = tmp_path / 'b.json.gz'
+        packed.write_bytes(gzip.compress(b'{}'))
+        os.utime(plain, (1, 1))
+        assert check_utils.find_default_export(tmp_path) == packed
@@ -0,0 +1,135 @@
+"""
+Tests for the content-addressed export store in backend.py.
+
+Identical documents are stored once under their digest; the timestamped
+export filenames stay readable and listed exactly as before.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools" / "checks"))
+import backend
+import check_utils
+from backend import app
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def export_dir(isolated_exports):
+    return isolated_exports
+
+
+def _export(client, filename, content):
+    response = client.post('/api/export', json={'filename': filename, 'content': content})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_digest_ignores_key_order():
+    assert backend.content_digest({'a': 1, 'b': [1, 2]}) == backend.content_digest({'b': [1, 2], 'a': 1})
+    assert backend.content_digest({'a': 1}) != backend.content_digest({'a': 2})
+
+
+def test_identical_exports_share_one_blob(client, export_dir):
+    content = {'name': 'Dedup Enwer', 'level': 9}
+    first = _export(client, 'test_dedup_20250101_1200.json', content)
+    second = _export(client, 'test_dedup_20250101_1205.json', dict(reversed(list(content.items()))))
+
+    assert first['deduplicated'] is False
+    assert second['deduplicated'] is True
+    assert first['digest'] == second['digest']
+    assert (backend.EXPORT_BLOB_DIR / f"{first['digest']}.json").exists()
+    for name in ('test_dedup_20250101_1200.json', 'test_dedup_20250101_1205.json'):
+        assert json.loads((export_dir / name).read_text(encoding='utf-8')) == content
+
+    listed = [e['filename'] for e in client.get('/api/exports').get_json()['exports']]
+    assert 'test_dedup_20250101_1200.json' in listed
+    assert 'test_dedup_20250101_1205.json' in listed
+
+
+def test_overwrite_does_not_touch_other_references(client, export_dir):
+    _export(client, 'test_dedup_a.json', {'name': 'Rilla', 'level': 1})
+    _export(client, 'test_dedup_b.json', {'name': 'Rilla', 'level': 1})
+    _export(client, 'test_dedup_b.json', {'name': 'Rilla', 'level': 2})
+    assert json.loads((export_dir / 'test_dedup_a.json').read_text(encoding='utf-8'))['level'] == 1
+    assert json.loads((export_dir / 'test_dedup_b.json').read_text(encoding='utf-8'))['level'] == 2
+
+
+def test_unreferenced_blobs_are_collected(client, export_dir):
+    data = _export(client, 'test_dedup_gc.json', {'name': 'Collected Only Once'})
+    blob = backend.EXPORT_BLOB_DIR / f"{data['digest']}.json"
+    os.unlink(export_dir / 'test_dedup_gc.json')
+    assert backend.collect_export_blobs() >= 1
+    assert not blob.exists()
+    assert 'test_dedup_gc.json' not in backend.EXPORT_REFS
+
+
+def test_reexport_same_content_leaves_no_temp_links(client, export_dir):
+    for _ in range(2):
+        _export(client, 'test_dedup_same.json', {'name': 'Same Again'})
+    assert not list(export_dir.glob('.test_dedup_same.json.*'))
+
+
+def test_same_document_same_name_does_not_rewrite_refs(client, export_dir):
+    _export(client, 'test_dedup_refs.json', {'name': 'Written Once'})
+    with patch.object(backend, 'write_json_atomic', wraps=backend.write_json_atomic) as write:
+        _export(client, 'test_dedup_refs.json', {'name': 'Written Once'})
+    assert backend.EXPORT_REFS_FILE not in [call.args[0] for call in write.call_args_list]
+
+
+def test_exports_append_refs_to_journal(client, export_dir):
+    with patch.object(backend, 'write_json_atomic', wraps=backend.write_json_atomic) as write:
+        _export(client, 'test_journal_20250101_1200.json', {'name': 'First'})
+        _export(client, 'test_journal_20250101_1205.json', {'name': 'Second'})
+    assert backend.EXPORT_REFS_FILE not in [call.args[0] for call in write.call_args_list]
+    lines = backend.EXPORT_REFS_JOURNAL.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['name'] for line in lines] == [
+        'test_journal_20250101_1200.json', 'test_journal_20250101_1205.json',
+    ]
+    # A torn last line from a crash mid-append is skipped on reload
+    with open(backend.EXPORT_REFS_JOURNAL, 'a', encoding='utf-8') as f:
+        f.write('{"name": "test_torn')
+    assert backend._load_export_refs() == backend.EXPORT_REFS
+    assert check_utils._load_export_refs(export_dir)['test_journal_20250101_1205.json']['modified']
+
+
+def test_refs_journal_compacts(client, export_dir):
+    with patch.object(backend, 'EXPORT_REFS_COMPACT_AFTER', 2):
+        _export(client, 'test_compact_20250101_1200.json', {'name': 'One'})
+        assert backend.EXPORT_REFS_JOURNAL.exists()
+        _export(client, 'test_compact_20250101_1205.json', {'name': 'Two'})
+    assert not backend.EXPORT_REFS_JOURNAL.exists()
+    refs = json.loads(backend.EXPORT_REFS_FILE.read_text(encoding='utf-8'))
+    assert set(refs) == {'test_compact_20250101_1200.json', 'test_compact_20250101_1205.json'}
+
+    _export(client, 'test_compact_20250101_1210.json', {'name': 'Three'})
+    backend.collect_export_blobs()
+    assert not backend.EXPORT_REFS_JOURNAL.exists()
+    assert backend._load_export_refs() == backend.EXPORT_REFS
+
+
+def test_checker_picks_newest_export_despite_blob_mtime(tmp_path):
+    older = tmp_path / 'hero_cleric_lvl1_20250101_1200.json'
+    newer = tmp_path / 'hero_cleric_lvl1_20250102_1200.json'
+    for path in (older, newer):
+        path.write_text('{}', encoding='utf-8')
+    # A fresh dedup hit links to a blob that was written long ago
+    os.utime(newer, (1_000_000, 1_000_000))
+    assert check_utils.find_default_export(tmp_path) == newer
+
+    (tmp_path / '.blobs').mkdir()
+    (tmp_path / '.blobs' / 'refs.json').write_text(json.dumps({older.name: {'modified': 4102444800}}), encoding='utf-8')
+    assert check_utils.find_default_export(tmp_path) == older
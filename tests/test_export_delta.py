@@ -0,0 +1,129 @@
+"""
+Tests for delta exports: the client builds an RFC 6902 patch against the
+last acknowledged export and POST /api/export/delta rebuilds the document.
+"""
+
+import json
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+import backend
+import export_management as em
+from backend import app, apply_json_patch, JsonPatchError
+
+
+BASE = {
+    "identity": {"name": "Enwer", "class": "Cleric"},
+    "level": 9,
+    "hp": {"current": 40, "max": 58},
+    "inventory": {"items": [{"name": "Mace"}, {"name": "Shield"}]},
+    "notes": "a/b~c",
+}
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def export_dir(isolated_exports):
+    yield isolated_exports
+    # Queued writes must land before the export store is restored
+    backend.wait_for_exports(5)
+
+
+class TestApplyPatch:
+    def test_rfc6902_operations(self):
+        doc = {"a": {"b": [1, 2]}, "c": "x"}
+        result = apply_json_patch(doc, [
+            {"op": "add", "path": "/a/b/-", "value": 3},
+            {"op": "add", "path": "/a/b/0", "value": 0},
+            {"op": "remove", "path": "/c"},
+            {"op": "replace", "path": "/a/b/1", "value": 10},
+            {"op": "copy", "from": "/a/b", "path": "/d"},
+            {"op": "move", "from": "/d", "path": "/e~1f"},
+            {"op": "test", "path": "/e~1f/3", "value": 3},
+        ])
+        assert result == {"a": {"b": [0, 10, 2, 3]}, "e/f": [0, 10, 2, 3]}
+        assert doc == {"a": {"b": [1, 2]}, "c": "x"}
+
+    @pytest.mark.parametrize("operation", [
+        {"op": "remove", "path": "/missing"},
+        {"op": "replace", "path": "/missing", "value": 1},
+        {"op": "test", "path": "/c", "value": "y"},
+        {"op": "add", "path": "/a/b/5", "value": 1},
+        {"op": "frobnicate", "path": "/c"},
+    ])
+    def test_invalid_operations(self, operation):
+        with pytest.raises(JsonPatchError):
+            apply_json_patch({"a": {"b": [1]}, "c": "x"}, [operation])
+
+
+class TestClientPatch:
+    def test_patch_round_trips(self):
+        new = json.loads(json.dumps(BASE))
+        new["hp"]["current"] = 31
+        new["inventory"]["items"].append({"name": "Holy Symbol"})
+        new["notes/extra"] = True
+        del new["notes"]
+        ops = em._compute_json_patch(BASE, new)
+        assert apply_json_patch(BASE, ops) == new
+
+    def test_single_field_change_is_one_op(self):
+        new = json.loads(json.dumps(BASE))
+        new["hp"]["current"] = 12
+        assert em._compute_json_patch(BASE, new) == [
+            {"op": "replace", "path": "/hp/current", "value": 12}
+        ]
+
+    def test_no_delta_without_acknowledged_base(self):
+        with patch.object(em, "_LAST_AUTO_EXPORT_DIGEST", ""):
+            assert em._build_delta_request("x.json", BASE, json.dumps(BASE)) is None
+
+
+class TestDeltaEndpoint:
+    def test_delta_rebuilds_document(self, client, export_dir):
+        first = client.post('/api/export', json={'filename': 'test_delta_1.json', 'content': BASE})
+        base = first.get_json()['digest']
+        response = client.post('/api/export/delta', json={
+            'filename': 'test_delta_2.json',
+            'base': base,
+            'patch': [{"op": "replace", "path": "/level", "value": 10}],
+        })
+        assert response.status_code == 200
+        saved = json.loads((export_dir / 'test_delta_2.json').read_text(encoding='utf-8'))
+        assert saved == dict(BASE, level=10)
+        assert response.get_json()['digest'] == backend.content_digest(saved)
+
+    def test_delta_base_read_from_blob_store(self, client, export_dir):
+        base = client.post('/api/export', json={'filename': 'test_delta_3.json', 'content': BASE}).get_json()['digest']
+        with patch.object(backend, "EXPORT_RECENT_DOCUMENTS", OrderedDict()):
+            response = client.post('/api/export/delta', json={
+                'filename': 'test_delta_4.json', 'base': base, 'patch': [],
+            })
+        assert response.status_code == 200
+        assert response.get_json()['deduplicated'] is True
+
+    def test_unknown_base_is_conflict(self, client):
+        response = client.post('/api/export/delta', json={
+            'filename': 'test_delta_x.json', 'base': '0' * 64, 'patch': [],
+        })
+        assert response.status_code == 409
+
+    def test_failed_patch_is_unprocessable(self, client, export_dir):
+        base = client.post('/api/export', json={'filename': 'test_delta_5.json', 'content': BASE}).get_json()['digest']
+        response = client.post('/api/export/delta', json={
+            'filename': 'test_delta_6.json', 'base': base,
+            'patch': [{"op": "remove", "path": "/nope"}],
+        })
+        assert response.status_code == 422
+        assert not (export_dir / 'test_delta_6.json').exists()
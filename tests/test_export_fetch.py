@@ -0,0 +1,83 @@
+"""
+Tests for GET /api/exports/<filename>: ETag, 304, Last-Modified and Range.
+"""
+
+import gzip
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import backend
+from backend import app
+
+
+DOCUMENT = {'identity': {'name': 'Enwer', 'class': 'Cleric'}, 'level': 9}
+
+
+@pytest.fixture
+def export_dir(tmp_path):
+    with patch.object(backend, 'EXPORT_DIR', tmp_path), patch.object(backend, 'EXPORT_ETAGS', {}):
+        (tmp_path / 'Enwer.json').write_text(json.dumps(DOCUMENT, indent=2), encoding='utf-8')
+        (tmp_path / 'Packed.json.gz').write_bytes(gzip.compress(json.dumps(DOCUMENT).encode('utf-8')))
+        yield tmp_path
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_fetch_with_validators(client, export_dir):
+    response = client.get('/api/exports/Enwer.json')
+    assert response.status_code == 200
+    assert response.get_json() == DOCUMENT
+    etag = response.headers['ETag']
+    assert etag.strip('"') == backend.hashlib.sha256((export_dir / 'Enwer.json').read_bytes()).hexdigest()
+    assert 'Last-Modified' in response.headers
+    assert response.headers['Accept-Ranges'] == 'bytes'
+
+
+def test_if_none_match_returns_304(client, export_dir):
+    etag = client.get('/api/exports/Enwer.json').headers['ETag']
+    with patch.object(Path, 'read_bytes', side_effect=AssertionError('body re-read')):
+        response = client.get('/api/exports/Enwer.json', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+
+def test_changed_file_gets_new_etag(client, export_dir):
+    etag = client.get('/api/exports/Enwer.json').headers['ETag']
+    (export_dir / 'Enwer.json').write_text(json.dumps(dict(DOCUMENT, level=10)), encoding='utf-8')
+    response = client.get('/api/exports/Enwer.json', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['level'] == 10
+
+
+def test_range_request(client, export_dir):
+    body = (export_dir / 'Enwer.json').read_bytes()
+    response = client.get('/api/exports/Enwer.json', headers={'Range': 'bytes=0-9'})
+    assert response.status_code == 206
+    assert response.data == body[:10]
+    assert response.headers['Content-Range'] == f'bytes 0-9/{len(body)}'
+
+
+def test_compressed_export(client, export_dir):
+    plain = client.get('/api/exports/Packed.json')
+    assert plain.get_json() == DOCUMENT
+    assert 'Content-Encoding' not in plain.headers
+    packed = client.get('/api/exports/Packed.json.gz', headers={'Accept-Encoding': 'gzip'})
+    assert packed.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(packed.data)) == DOCUMENT
+    assert packed.headers['ETag'] != plain.headers['ETag']
+
+
+@pytest.mark.parametrize('name', ['missing.json', '.catalog.sqlite3', 'notes.txt'])
+def test_not_found(client, export_dir, name):
+    (export_dir / 'notes.txt').write_text('x')
+    assert client.get(f'/api/exports/{name}').status_code == 404
@@ -179,6 +179,7 @@ class TestFetchMethodVerification:
         assert isinstance(options["body"], str)
 
 
+@pytest.mark.usefixtures("isolated_exports")
 class TestFlaskBackendIntegration:
     """Test with actual Flask backend"""
     
@@ -0,0 +1,110 @@
+"""
+Tests for the cached, paginated /api/exports listing.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import backend
+from backend import app
+
+
+@pytest.fixture
+def export_dir(tmp_path):
+    index = {'dir_mtime_ns': None, 'entries': {}, 'ordered': [], 'keys': []}
+    with patch.object(backend, 'EXPORT_DIR', tmp_path), patch.object(backend, 'EXPORT_INDEX', index):
+        yield tmp_path
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def _write(directory, filename, mtime):
+    path = directory / filename
+    path.write_text(json.dumps({'file': filename}), encoding='utf-8')
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def populated(export_dir):
+    for i in range(5):
+        _write(export_dir, f'Enwer_Cleric_lvl{i + 1}_2025010{i + 1}_1200.json', 1_000_000 + i)
+    _write(export_dir, 'Rilla_Rogue_lvl3_20250103_0900.json', 1_000_002)
+    _write(export_dir, 'old character (1).json', 10)
+    return export_dir
+
+
+def _names(response):
+    return [e['filename'] for e in response.get_json()['exports']]
+
+
+def test_parse_export_filename():
+    assert backend.parse_export_filename('Enwer_Cleric_lvl9_20251213_1716.json.gz') == {
+        'character': 'enwer', 'class': 'Cleric', 'level': 9,
+    }
+    assert backend.parse_export_filename('rillobaby.json')['character'] == 'rillobaby'
+
+
+def test_newest_first_with_metadata(client, populated):
+    data = client.get('/api/exports').get_json()
+    assert data['count'] == data['total'] == 7
+    names = [e['filename'] for e in data['exports']]
+    assert names[0] == 'Enwer_Cleric_lvl5_20250105_1200.json'
+    assert names[-1] == 'old character (1).json'
+    # Equal mtimes fall back to name, descending
+    assert names.index('Rilla_Rogue_lvl3_20250103_0900.json') < names.index('Enwer_Cleric_lvl3_20250103_1200.json')
+    first = data['exports'][0]
+    assert (first['character'], first['class'], first['level']) == ('enwer', 'Cleric', 5)
+
+
+def test_pages_cover_everything_once(client, populated):
+    seen, cursor = [], None
+    while True:
+        url = '/api/exports?limit=3' + (f'&cursor={cursor}' if cursor else '')
+        data = client.get(url).get_json()
+        assert data['count'] <= 3
+        seen.extend(e['filename'] for e in data['exports'])
+        cursor = data.get('next_cursor')
+        if not cursor:
+            break
+    assert seen == _names(client.get('/api/exports'))
+
+
+def test_character_filter(client, populated):
+    data = client.get('/api/exports?character=Enwer&limit=2').get_json()
+    assert data['total'] == 5
+    assert all(e['character'] == 'enwer' for e in data['exports'])
+    rest = client.get(f"/api/exports?character=enwer&cursor={data['next_cursor']}").get_json()
+    assert rest['count'] == 3
+
+
+def test_unchanged_directory_is_not_reparsed(client, populated):
+    client.get('/api/exports')
+    with patch.object(backend, '_export_index_entry') as build_entry:
+        client.get('/api/exports')
+    assert not build_entry.called
+
+
+def test_new_and_deleted_files_are_picked_up(client, populated):
+    client.get('/api/exports')
+    (populated / 'Rilla_Rogue_lvl3_20250103_0900.json').unlink()
+    _write(populated, 'Baldrick_Wizard_lvl2_20250201_0800.json', 2_000_000)
+    names = _names(client.get('/api/exports'))
+    assert names[0] == 'Baldrick_Wizard_lvl2_20250201_0800.json'
+    assert 'Rilla_Rogue_lvl3_20250103_0900.json' not in names
+
+
+@pytest.mark.parametrize('query', ['limit=0', 'limit=abc', 'cursor=%%%'])
+def test_invalid_parameters(client, populated, query):
+    assert client.get(f'/api/exports?{query}').status_code == 400
@@ -70,7 +70,6 @@ def _install_env(monkeypatch):
     monkeypatch.setattr(em, "_AUTO_EXPORT_SUPPRESS", False)
     monkeypatch.setattr(em, "_AUTO_EXPORT_TIMER_ID", None)
     monkeypatch.setattr(em, "_AUTO_EXPORT_EVENT_COUNT", 0)
-    monkeypatch.setattr(em, "_EVENT_PROXIES", [])
 
     # Provide a fake character module with collect_character_data
     fake_character = types.SimpleNamespace(
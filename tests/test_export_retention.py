@@ -0,0 +1,86 @@
+"""
+Tests for the server-side export retention policy and /api/exports/prune.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import backend
+from backend import app
+
+
+NOW = datetime(2025, 6, 1, 12, 0)
+
+
+@pytest.fixture
+def export_dir(isolated_exports):
+    with patch.object(backend, 'collect_export_blobs', return_value=0):
+        yield isolated_exports
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def _write(directory, name, days_ago, minute=0):
+    stamp = (NOW - timedelta(days=days_ago)).strftime('%Y%m%d') + f'_12{minute:02d}'
+    path = directory / f'{name}_Cleric_lvl9_{stamp}.json'
+    path.write_text(json.dumps({'name': name}), encoding='utf-8')
+    return path.name
+
+
+def _plan(**kwargs):
+    return {item['filename'] for item in backend.plan_export_retention(NOW, **kwargs)['delete']}
+
+
+def test_old_files_pruned_but_newest_kept(export_dir):
+    fresh = _write(export_dir, 'Enwer', 1)
+    stale = _write(export_dir, 'Enwer', 45)
+    only = _write(export_dir, 'Rilla', 90)
+    (export_dir / 'rillobaby.json').write_text('{}', encoding='utf-8')
+    assert _plan() == {stale}
+
+
+def test_count_limit(export_dir):
+    names = [_write(export_dir, 'Enwer', 0, minute) for minute in range(5)]
+    assert _plan(max_keep=3) == set(names[:2])
+
+
+def test_dry_run_endpoint_deletes_nothing(client, export_dir):
+    stale = _write(export_dir, 'Enwer', 45)
+    _write(export_dir, 'Enwer', 1)
+    with patch.object(backend, 'datetime') as fake_datetime:
+        fake_datetime.now.return_value = NOW
+        fake_datetime.strptime = datetime.strptime
+        data = client.get('/api/exports/prune').get_json()
+    assert data['dry_run'] is True
+    assert [item['filename'] for item in data['delete']] == [stale]
+    assert data['removed'] == []
+    assert (export_dir / stale).exists()
+
+
+def test_prune_removes_files(export_dir):
+    stale = _write(export_dir, 'Enwer', 45)
+    keep = _write(export_dir, 'Enwer', 1)
+    result = backend.prune_exports(now=NOW)
+    assert result['removed'] == [stale]
+    assert not (export_dir / stale).exists()
+    assert (export_dir / keep).exists()
+    assert backend.prune_exports(now=NOW)['removed'] == []
+
+
+def test_worker_not_started_unless_enabled():
+    with patch.object(backend, 'RETENTION_ENABLED', False), \
+            patch.object(backend, 'RETENTION_STATE', {'worker': None, 'last_run': None, 'last_result': None}), \
+            patch.object(backend.threading, 'Thread') as thread:
+        assert backend.start_retention_worker() is None
+    thread.assert_not_called()
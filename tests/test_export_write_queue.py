@@ -0,0 +1,145 @@
+"""
+Tests for the write-behind export queue in backend.py.
+
+Synchronous exports still return 200; ?async=1 queues the write and returns
+202 with a ticket that can be polled at /api/export/status/<ticket>.
+Autosaves in export_management.py poll that ticket.
+"""
+
+import asyncio
+import json
+import queue
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+import backend
+import export_management as em
+from backend import app
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def export_dir(isolated_exports):
+    yield isolated_exports
+    # Queued writes must land before the export store is restored
+    backend.wait_for_exports(5)
+
+
+class TestAtomicWrite:
+    def test_leaves_no_temp_files(self, export_dir):
+        target = export_dir / 'test_queue_atomic.json'
+        size = backend.write_json_atomic(target, {'name': 'Enwer'})
+        assert size == target.stat().st_size
+        assert json.loads(target.read_text(encoding='utf-8')) == {'name': 'Enwer'}
+        assert not list(export_dir.glob('.test_queue_atomic.json.*'))
+
+    def test_failed_write_keeps_previous_file(self, export_dir):
+        target = export_dir / 'test_queue_keep.json'
+        backend.write_json_atomic(target, {'level': 1})
+        with pytest.raises(TypeError):
+            backend.write_json_atomic(target, {'level': object()})
+        assert json.loads(target.read_text(encoding='utf-8')) == {'level': 1}
+        assert not list(export_dir.glob('.test_queue_keep.json.*'))
+
+
+class TestAsyncExport:
+    def test_queued_export_completes(self, client, export_dir):
+        response = client.post('/api/export?async=1', json={
+            'filename': 'test_queue_async.json',
+            'content': {'name': 'Rilla', 'level': 3}
+        })
+        assert response.status_code == 202
+        data = response.get_json()
+        assert data['filename'] == 'test_queue_async.json'
+        assert response.headers['Location'] == data['status_url']
+
+        assert backend.wait_for_exports(5)
+        status = client.get(data['status_url'])
+        assert status.status_code == 200
+        assert status.get_json()['status'] == 'done'
+        saved = json.loads((export_dir / 'test_queue_async.json').read_text(encoding='utf-8'))
+        assert saved == {'name': 'Rilla', 'level': 3}
+
+    def test_prefer_header_opts_in(self, client, export_dir):
+        response = client.post('/api/export', json={
+            'filename': 'test_queue_prefer.json',
+            'content': {'name': 'Baldrick'}
+        }, headers={'Prefer': 'respond-async'})
+        assert response.status_code == 202
+
+    def test_full_queue_returns_503(self, client, export_dir):
+        with patch.object(backend, 'enqueue_export', side_effect=queue.Full):
+            response = client.post('/api/export?async=1', json={
+                'filename': 'test_queue_full.json',
+                'content': {'name': 'Enwer'}
+            })
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+
+    def test_unknown_ticket(self, client):
+        assert client.get('/api/export/status/nope').status_code == 404
+
+
+class _StatusFetch:
+    """fetch() stand-in answering status polls from a script of tickets."""
+
+    class _Response:
+        def __init__(self, status, body):
+            self.status = status
+            self._text = json.dumps(body)
+
+        async def text(self):
+            return self._text
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.urls = []
+
+    async def __call__(self, url):
+        self.urls.append(url)
+        status, body = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        return self._Response(status, body)
+
+
+class TestClientPolling:
+    @pytest.fixture(autouse=True)
+    def fast_polls(self):
+        with patch.object(em, 'EXPORT_STATUS_POLL_SECONDS', 0):
+            yield
+
+    def test_polls_until_written(self, client, export_dir):
+        data = client.post('/api/export?async=1', json={
+            'filename': 'test_queue_poll.json',
+            'content': {'name': 'Rilla'}
+        }).get_json()
+        assert backend.wait_for_exports(5)
+        done = client.get(data['status_url']).get_json()
+        fetch = _StatusFetch((200, {'status': 'queued'}), (200, {'status': 'writing'}), (200, done))
+        ticket = asyncio.run(em._await_export_ticket(fetch, data['status_url']))
+        assert ticket['status'] == 'done'
+        assert fetch.urls == [data['status_url']] * 3
+
+    def test_failed_write_is_returned(self):
+        fetch = _StatusFetch((200, {'status': 'error', 'error': 'OSError: disk full'}))
+        ticket = asyncio.run(em._await_export_ticket(fetch, '/api/export/status/x'))
+        assert ticket['error'] == 'OSError: disk full'
+
+    def test_gives_up_on_unknown_or_stuck_ticket(self):
+        fetch = _StatusFetch((404, {'error': 'Unknown export ticket'}))
+        assert asyncio.run(em._await_export_ticket(fetch, '/api/export/status/nope')) is None
+        assert len(fetch.urls) == 1
+        fetch = _StatusFetch((200, {'status': 'queued'}))
+        with patch.object(em, 'EXPORT_STATUS_POLL_ATTEMPTS', 3):
+            assert asyncio.run(em._await_export_ticket(fetch, '/api/export/status/stuck')) is None
+        assert len(fetch.urls) == 3
@@ -11,7 +11,11 @@ import sys
 
 # Import Flask app
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend import app, EXPORT_DIR
+import backend
+from backend import app
+
+# Exports go to a temp directory instead of the repository's exports/
+pytestmark = pytest.mark.usefixtures("isolated_exports")
 
 
 @pytest.fixture
@@ -27,7 +31,7 @@ def cleanup_exports():
     """Clean up export files after tests"""
     yield
     # Clean up any test exports
-    for file_path in EXPORT_DIR.glob('test_*.json'):
+    for file_path in backend.EXPORT_DIR.glob('test_*.json'):
         try:
             file_path.unlink()
         except:
@@ -70,7 +74,7 @@ class TestExportEndpoint:
         assert response.status_code == 200
         
         # Verify file exists
-        file_path = EXPORT_DIR / 'test_verify_file.json'
+        file_path = backend.EXPORT_DIR / 'test_verify_file.json'
         assert file_path.exists()
         
         # Verify content
@@ -141,7 +145,7 @@ class TestExportEndpoint:
         assert response.status_code == 200
         
         # Read and verify formatting
-        file_path = EXPORT_DIR / 'test_format.json'
+        file_path = backend.EXPORT_DIR / 'test_format.json'
         content = file_path.read_text()
         
         # Should have indentation (pretty-printed)
@@ -190,7 +194,7 @@ class TestExportEndpoint:
         assert data['success'] is True
         
         # Verify saved file
-        file_path = EXPORT_DIR / 'test_complex_char.json'
+        file_path = backend.EXPORT_DIR / 'test_complex_char.json'
         with open(file_path) as f:
             saved = json.load(f)
         assert saved == char_data
@@ -211,7 +215,7 @@ class TestExportEndpoint:
         assert response.status_code == 200
         
         # Verify unicode is preserved
-        file_path = EXPORT_DIR / 'test_unicode.json'
+        file_path = backend.EXPORT_DIR / 'test_unicode.json'
         with open(file_path, encoding='utf-8') as f:
             saved = json.load(f)
         assert saved == char_data
@@ -223,7 +227,7 @@ class TestListExportsEndpoint:
     def test_list_exports_empty(self, client, cleanup_exports):
         """Test listing exports when directory is empty/clean"""
         # Clean directory
-        for f in EXPORT_DIR.glob('*.json'):
+        for f in backend.EXPORT_DIR.glob('*.json'):
             try:
                 f.unlink()
             except:
@@ -246,7 +250,7 @@ class TestListExportsEndpoint:
         ]
         
         for filename, content in test_files:
-            file_path = EXPORT_DIR / filename
+            file_path = backend.EXPORT_DIR / filename
             with open(file_path, 'w') as f:
                 json.dump(content, f)
         
@@ -266,7 +270,7 @@ class TestListExportsEndpoint:
     
     def test_list_exports_includes_metadata(self, client, cleanup_exports):
         """Test that list includes file metadata"""
-        file_path = EXPORT_DIR / 'test_metadata.json'
+        file_path = backend.EXPORT_DIR / 'test_metadata.json'
         with open(file_path, 'w') as f:
             json.dump({'test': 'data'}, f)
         
@@ -289,12 +293,12 @@ class TestListExportsEndpoint:
         import time
         
         # Create files with slight delays to ensure different mtimes
-        file1 = EXPORT_DIR / 'test_first.json'
+        file1 = backend.EXPORT_DIR / 'test_first.json'
         with open(file1, 'w') as f:
             json.dump({'order': 1}, f)
         time.sleep(0.1)
         
-        file2 = EXPORT_DIR / 'test_second.json'
+        file2 = backend.EXPORT_DIR / 'test_second.json'
         with open(file2, 'w') as f:
             json.dump({'order': 2}, f)
         
@@ -356,7 +360,7 @@ class TestExportIntegration:
         size2 = response2.get_json()['size']
         
         # File should contain v2
-        file_path = EXPORT_DIR / 'test_overwrite.json'
+        file_path = backend.EXPORT_DIR / 'test_overwrite.json'
         with open(file_path) as f:
             saved = json.load(f)
         assert saved['level'] == 9
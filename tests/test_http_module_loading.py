@@ -14,41 +14,43 @@ def test_load_module_from_http_simulation():
     """Test simulating the _load_module_from_http function."""
     print("\n=== TEST: _load_module_from_http simulation ===")
     
-    # Simulate the function that will be in character.py
-    def _load_module_from_http(module_name: str, url: str, source_code: str = None):
-        """Load a Python module from HTTP URL and add to sys.modules."""
-        try:
-            print(f"  Loading {module_name} from {url}")
+    # Stub modules registered below must not leak into later tests
+    with patch.dict(sys.modules):
+        # Simulate the function that will be in character.py
+        def _load_module_from_http(module_name: str, url: str, source_code: str = None):
+            """Load a Python module from HTTP URL and add to sys.modules."""
+            try:
+                print(f"  Loading {module_name} from {url}")
             
-            # In real scenario, this would use open_url(url).read()
-            # For testing, we'll accept source_code parameter
-            if source_code is None:
-                raise ImportError(f"Cannot fetch {url}")
+                # In real scenario, this would use open_url(url).read()
+                # For testing, we'll accept source_code parameter
+                if source_code is None:
+                    raise ImportError(f"Cannot fetch {url}")
             
-            module = ModuleType(module_name)
-            exec(source_code, module.__dict__)
-            sys.modules[module_name] = module
-            print(f"  ✓ {module_name} loaded successfully")
-            return module
-        except Exception as e:
-            print(f"  ✗ Failed to load {module_name}: {e}")
-            return None
-    
-    # Test 1: Load spell_data
-    spell_data_code = """
+                module = ModuleType(module_name)
+                exec(source_code, module.__dict__)
+                sys.modules[module_name] = module
+                print(f"  ✓ {module_name} loaded successfully")
+                return module
+            except Exception as e:
+                print(f"  ✗ Failed to load {module_name}: {e}")
+                return None
+    
+        # Test 1: Load spell_data
+        spell_data_code = """
 SPELL_CLASS_SYNONYMS = {"cleric": ["cleric"]}
 SPELL_CLASS_DISPLAY_NAMES = {"cleric": "Cleric"}
 LOCAL_SPELLS_FALLBACK = []
 """
     
-    spell_data = _load_module_from_http("spell_data", "http://localhost:8080/assets/py/spell_data.py", spell_data_code)
-    assert spell_data is not None, "spell_data module should load"
-    assert hasattr(spell_data, 'SPELL_CLASS_SYNONYMS'), "spell_data should have SPELL_CLASS_SYNONYMS"
-    assert sys.modules.get('spell_data') == spell_data, "spell_data should be in sys.modules"
-    print("  ✓ spell_data loaded and available in sys.modules")
+        spell_data = _load_module_from_http("spell_data", "http://localhost:8080/assets/py/spell_data.py", spell_data_code)
+        assert spell_data is not None, "spell_data module should load"
+        assert hasattr(spell_data, 'SPELL_CLASS_SYNONYMS'), "spell_data should have SPELL_CLASS_SYNONYMS"
+        assert sys.modules.get('spell_data') == spell_data, "spell_data should be in sys.modules"
+        print("  ✓ spell_data loaded and available in sys.modules")
     
-    # Test 2: Load spellcasting (which depends on spell_data)
-    spellcasting_code = """
+        # Test 2: Load spellcasting (which depends on spell_data)
+        spellcasting_code = """
 from spell_data import SPELL_CLASS_SYNONYMS
 
 class SpellcastingManager:
@@ -70,18 +72,18 @@ def sync_prepared_spells_with_library():
     pass
 """
     
-    spellcasting = _load_module_from_http("spellcasting", "http://localhost:8080/assets/py/spellcasting.py", spellcasting_code)
-    assert spellcasting is not None, "spellcasting module should load"
-    assert hasattr(spellcasting, 'SpellcastingManager'), "spellcasting should have SpellcastingManager"
-    assert sys.modules.get('spellcasting') == spellcasting, "spellcasting should be in sys.modules"
-    print("  ✓ spellcasting loaded and available in sys.modules")
+        spellcasting = _load_module_from_http("spellcasting", "http://localhost:8080/assets/py/spellcasting.py", spellcasting_code)
+        assert spellcasting is not None, "spellcasting module should load"
+        assert hasattr(spellcasting, 'SpellcastingManager'), "spellcasting should have SpellcastingManager"
+        assert sys.modules.get('spellcasting') == spellcasting, "spellcasting should be in sys.modules"
+        print("  ✓ spellcasting loaded and available in sys.modules")
     
-    # Test 3: Verify we can access attributes
-    manager = spellcasting.SpellcastingManager()
-    assert manager.synonyms == {"cleric": ["cleric"]}, "SpellcastingManager should access spell_data"
-    print("  ✓ SpellcastingManager can access spell_data attributes")
+        # Test 3: Verify we can access attributes
+        manager = spellcasting.SpellcastingManager()
+        assert manager.synonyms == {"cleric": ["cleric"]}, "SpellcastingManager should access spell_data"
+        print("  ✓ SpellcastingManager can access spell_data attributes")
     
-    return True
+        return True
 
 
 def test_http_module_loading_with_real_files():
@@ -0,0 +1,116 @@
+"""
+Tests for the incremental recalculation graph in character.py.
+
+An input event should only recompute the calculation sections that depend on
+the field that changed; unknown fields fall back to a full recompute.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+import character
+from character import (
+    CALCULATION_DEPENDENCIES,
+    CALCULATION_SECTIONS,
+    SPELL_FILTER_SECTION,
+    get_calculation_sections,
+)
+
+
+class _Element:
+    def __init__(self, value="", type_=""):
+        self.value = value
+        self.type = type_
+        self.checked = False
+
+
+@pytest.fixture
+def mocked_sections():
+    """Replace every calculation section with a MagicMock."""
+    mocks = {name: MagicMock(name=name) for name in CALCULATION_SECTIONS}
+    with patch.dict(character.CALCULATION_SECTIONS, mocks), \
+         patch.object(character, "_build_calculation_context", return_value={}):
+        character._LAST_INPUT_VALUES.clear()
+        yield mocks
+    character._LAST_INPUT_VALUES.clear()
+
+
+def _called(mocks):
+    return {name for name, mock in mocks.items() if mock.called}
+
+
+class TestDependencyGraph:
+    def test_hp_fields_only_touch_hp_bar(self):
+        for field in ("current_hp", "max_hp", "temp_hp"):
+            assert get_calculation_sections(field) == ("hp",)
+
+    def test_currency_and_death_saves_have_no_derived_values(self):
+        assert get_calculation_sections("currency-gp") == ()
+        assert get_calculation_sections("death_saves_success_1") == ()
+
+    def test_unknown_field_requests_full_recompute(self):
+        assert get_calculation_sections("mystery-field") is None
+        assert get_calculation_sections("") is None
+
+    def test_skill_inputs_map_to_skills(self):
+        assert get_calculation_sections("stealth-prof") == ("skills",)
+        assert get_calculation_sections("arcana-exp") == ("skills",)
+
+    def test_only_dex_feeds_armor_class(self):
+        assert "armor_class" in get_calculation_sections("dex-score")
+        assert "armor_class" not in get_calculation_sections("str-score")
+
+    def test_dependencies_reference_known_sections(self):
+        known = set(CALCULATION_SECTIONS) | {SPELL_FILTER_SECTION}
+        for field, sections in CALCULATION_DEPENDENCIES.items():
+            assert set(sections) <= known, field
+
+
+class TestIncrementalUpdates:
+    def test_hp_change_only_runs_hp_section(self, mocked_sections):
+        with patch.object(character, "get_element", return_value=_Element("12")):
+            character.update_calculations_for_field("current_hp")
+        assert _called(mocked_sections) == {"hp"}
+
+    def test_unchanged_value_is_skipped(self, mocked_sections):
+        element = _Element("12")
+        with patch.object(character, "get_element", return_value=element):
+            character.update_calculations_for_field("current_hp")
+            mocked_sections["hp"].reset_mock()
+            assert character.update_calculations_for_field("current_hp") == ()
+            assert not mocked_sections["hp"].called
+            element.value = "11"
+            character.update_calculations_for_field("current_hp")
+        assert mocked_sections["hp"].called
+
+    def test_currency_change_runs_nothing(self, mocked_sections):
+        with patch.object(character, "get_element", return_value=_Element("5")):
+            character.update_calculations_for_field("currency-gp")
+        assert _called(mocked_sections) == set()
+
+    def test_unknown_field_runs_everything(self, mocked_sections):
+        character.update_calculations_for_field("mystery-field")
+        assert _called(mocked_sections) == set(CALCULATION_SECTIONS)
+
+    def test_full_update_runs_sections_in_order(self, mocked_sections):
+        order = []
+        for name, mock in mocked_sections.items():
+            mock.side_effect = lambda _ctx, n=name: order.append(n)
+        character.update_calculations()
+        assert order == list(CALCULATION_SECTIONS)
+
+    def test_handle_input_event_skips_spell_filters_for_hp(self, mocked_sections):
+        event = MagicMock()
+        event.target = _Element("7")
+        event.target.id = "current_hp"
+        with patch.object(character, "get_element", return_value=event.target), \
+             patch.object(character, "apply_spell_filters") as filters, \
+             patch.dict(character.SPELL_LIBRARY_STATE, {"loaded": True}):
+            character.handle_input_event(event)
+        assert _called(mocked_sections) == {"hp"}
+        assert not filters.called
@@ -0,0 +1,77 @@
+"""
+Tests for the id-keyed item store behind InventoryManager.
+
+Ids are generated monotonically so they never collide after removals, and
+the ``items`` list view keeps insertion order for exports.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+from equipment_management import InventoryManager
+
+
+@pytest.fixture
+def manager():
+    manager = InventoryManager()
+    for name in ("Rope", "Torch", "Dagger"):
+        manager.add_item(name)
+    return manager
+
+
+def _names(manager):
+    return [item["name"] for item in manager.items]
+
+
+class TestIds:
+    def test_ids_are_not_reused_after_removal(self, manager):
+        manager.remove_item("1")
+        new_id = manager.add_item("Lantern")
+        assert new_id == "3"
+        ids = [item["id"] for item in manager.items]
+        assert len(ids) == len(set(ids))
+
+    def test_edit_after_removal_hits_the_right_item(self, manager):
+        manager.remove_item("0")
+        new_id = manager.add_item("Shield")
+        manager.update_item(new_id, {"qty": 5})
+        assert manager.get_item("2")["qty"] == 1
+        assert manager.get_item(new_id)["qty"] == 5
+
+    def test_load_state_repairs_missing_and_duplicate_ids(self):
+        manager = InventoryManager()
+        manager.load_state({"inventory": {"items": [
+            {"id": "0", "name": "A"},
+            {"id": "0", "name": "B"},
+            {"name": "C"},
+            {"id": 7, "name": "D"},
+        ]}})
+        ids = [str(item["id"]) for item in manager.items]
+        assert len(set(ids)) == 4
+        assert manager.get_item("7")["name"] == "D"
+        assert manager.add_item("E") == "10"
+
+
+class TestListView:
+    def test_order_is_stable(self, manager):
+        manager.update_item("0", {"name": "Silk Rope"})
+        manager.remove_item("1")
+        manager.add_item("Lantern")
+        assert _names(manager) == ["Silk Rope", "Dagger", "Lantern"]
+
+    def test_get_item_missing(self, manager):
+        assert manager.get_item("99") is None
+        assert manager.get_item(None) is None
+        manager.remove_item("99")
+        assert len(manager.items) == 3
+
+    def test_direct_list_edits_are_adopted(self, manager):
+        manager.items.append({"id": "0", "name": "Copy"})
+        assert len({item["id"] for item in manager.items}) == 4
+        manager.items = [item for item in manager.items if item["name"] != "Torch"]
+        assert manager.get_item("1") is None
+        assert manager.get_item("2")["name"] == "Dagger"
@@ -0,0 +1,65 @@
+"""
+Tests for the precompiled item category classifier in InventoryManager.
+
+The compiled regexes must give the same category, with the same precedence,
+as checking each keyword list in turn.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+from equipment_management import InventoryManager
+
+
+def _reference_category(name):
+    name_lower = name.lower()
+    for category, keywords in InventoryManager.CATEGORY_RULES:
+        if any(keyword in name_lower for keyword in keywords):
+            return category
+    return "Other"
+
+
+NAMES = [
+    "Longsword",
+    "Longsword +1",
+    "Plate Armor",
+    "Shield",
+    "Arrows (20)",
+    "Crossbow Bolts",
+    "Thieves' Tools",
+    "Healer's Kit",
+    "Potion of Healing",
+    "Flask of Oil",
+    "Hempen Rope (50 ft)",
+    "Explorer's Pack",
+    "Riding Horse",
+    "Ring of Protection",
+    "Staff of Fire",
+    "Wand",
+    "Bag of Holding",
+    "",
+    "CHAIN MAIL",
+]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_matches_keyword_scan(name):
+    assert InventoryManager()._infer_category(name) == _reference_category(name)
+
+
+def test_classify_many_matches_single_calls():
+    names = NAMES * 3
+    assert InventoryManager.classify_many(names) == [_reference_category(n) for n in names]
+
+
+def test_load_state_classifies_uncategorized_items():
+    manager = InventoryManager()
+    manager.load_state({"inventory": {"items": [
+        {"name": "Potion of Healing"},
+        {"name": "Dagger", "category": "Custom"},
+    ]}})
+    assert [item["category"] for item in manager.items] == ["Potions", "Custom"]
@@ -0,0 +1,131 @@
+"""
+Tests for the item modifier index maintained by InventoryManager.
+
+The AC and save tooltips read aggregate totals instead of rescanning the
+inventory; the totals must match a full scan after every kind of edit.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+import character
+import equipment_management
+from equipment_management import InventoryManager, summarize_item_modifiers
+
+
+def _item(item_id, name, category="Other", equipped=True, **props):
+    return {
+        "id": item_id,
+        "name": name,
+        "category": category,
+        "qty": 1,
+        "equipped": equipped,
+        "notes": json.dumps(props) if props else "",
+    }
+
+
+@pytest.fixture
+def manager():
+    manager = InventoryManager()
+    manager.load_state({"inventory": {"items": [
+        _item("0", "Chain Mail", "Armor", armor_class=16),
+        _item("1", "Shield", "Armor", bonus=1),
+        _item("2", "Ring of Protection", "Magic Items", ac_modifier=1, saves_modifier=1),
+        _item("3", "Cloak of Protection", "Magic Items", equipped=False, ac_modifier=1, saves_modifier=1),
+        _item("4", "Longsword +2", "Weapons", bonus=2),
+    ]}})
+    return manager
+
+
+def _assert_matches_scan(manager):
+    summary = manager.get_modifier_summary()
+    expected = summarize_item_modifiers(manager.items)
+    assert summary == expected
+    return summary
+
+
+class TestSummary:
+    def test_initial_totals(self, manager):
+        summary = _assert_matches_scan(manager)
+        assert summary["shield_bonus"] == 3
+        assert summary["ac_modifier"] == 1
+        assert summary["saves_modifier"] == 2
+        assert summary["armor"] == (16, "Chain Mail")
+        assert summary["equipped_armor"] == (16, "Chain Mail")
+        assert summary["weapon_bonuses"] == {"1": 1, "4": 2}
+        assert summary["ac_rows"] == [("Shield", 3, True), ("Ring of Protection", 1, False)]
+
+    def test_summary_is_reused_until_an_edit(self, manager):
+        first = manager.get_modifier_summary()
+        with patch.object(equipment_management, "item_modifier_contribution") as contribution:
+            assert manager.get_modifier_summary() is first
+        assert not contribution.called
+
+    def test_equip_toggle_updates_totals(self, manager):
+        manager.update_item("3", {"equipped": True})
+        assert _assert_matches_scan(manager)["ac_modifier"] == 2
+        manager.update_item("1", {"equipped": False})
+        assert _assert_matches_scan(manager)["shield_bonus"] == 0
+
+    def test_property_edit_updates_totals(self, manager):
+        manager.update_item_properties("2", {"ac_modifier": 2, "armor_only": True})
+        summary = _assert_matches_scan(manager)
+        assert summary["ac_modifier"] == 0
+        assert summary["saves_modifier"] == 1
+
+    def test_add_and_remove(self, manager):
+        new_id = manager.add_item("Amulet", notes=json.dumps({"saves_modifier": 3}))
+        assert _assert_matches_scan(manager)["saves_modifier"] == 5
+        manager.remove_item(new_id)
+        manager.remove_item("0")
+        summary = _assert_matches_scan(manager)
+        assert summary["saves_modifier"] == 2
+        assert summary["armor"] is None
+
+    def test_direct_list_changes_are_detected(self, manager):
+        manager.items.append(_item("9", "Buckler Shield", "Armor"))
+        assert _assert_matches_scan(manager)["shield_bonus"] == 5
+
+    def test_equipped_armor_tracks_equip_state(self, manager):
+        manager.update_item("0", {"equipped": False})
+        manager.items.append(_item("9", "Studded Leather", "Armor", armor_class=12))
+        summary = _assert_matches_scan(manager)
+        assert summary["armor"] == (16, "Chain Mail")
+        assert summary["equipped_armor"] == (12, "Studded Leather")
+        manager.update_item("9", {"equipped": False})
+        assert _assert_matches_scan(manager)["equipped_armor"] is None
+
+    def test_refresh_item_after_in_place_edit(self, manager):
+        manager.get_item("3")["equipped"] = True
+        manager.refresh_item("3")
+        assert _assert_matches_scan(manager)["ac_modifier"] == 2
+
+
+class TestCharacterReads:
+    def test_save_tooltip_uses_index(self, manager):
+        with patch.object(character, "INVENTORY_MANAGER", manager):
+            total, tooltip = character.generate_save_tooltip("wis", 14, True, 2)
+        assert total == 2 + 2 + 2
+        assert "Item modifiers" in tooltip
+
+    def test_armor_class_prefers_equipped_armor(self, manager):
+        manager.update_item("0", {"equipped": False})
+        manager.items.append(_item("9", "Studded Leather", "Armor", armor_class=12))
+        with patch.object(character, "INVENTORY_MANAGER", manager), \
+                patch.object(character, "get_numeric_value", return_value=14):
+            ac = character.calculate_armor_class()
+        # Studded leather 12 + DEX 2 + shield 3 + ring 1
+        assert ac == 18
+
+    def test_plain_manager_falls_back_to_scan(self, manager):
+        plain = MagicMock(spec=["items"])
+        plain.items = manager.items
+        with patch.object(character, "INVENTORY_MANAGER", plain):
+            total, _ = character.generate_save_tooltip("wis", 10, False, 2)
+        assert total == 2
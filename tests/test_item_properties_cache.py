@@ -0,0 +1,121 @@
+"""
+Tests for the parsed item-properties cache in equipment_management.py.
+
+InventoryManager parses an item's notes JSON at most once per notes value
+and keeps the result in a side map, so items stay export-clean.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+import equipment_management
+from equipment_management import (
+    STALE_ITEM_PROPS_KEY,
+    InventoryManager,
+    get_item_properties,
+    set_item_properties,
+)
+
+
+def _manager_with(notes):
+    manager = InventoryManager()
+    manager.load_state({"inventory": {"items": [
+        {"id": "0", "name": "Longsword", "notes": notes, "category": "Weapons"},
+    ]}})
+    return manager
+
+
+class TestGetItemProperties:
+    def test_plain_and_invalid_notes(self):
+        assert get_item_properties({"notes": "Family heirloom"}) == {}
+        assert get_item_properties({"notes": "{not json"}) == {}
+        assert get_item_properties({"notes": "[1, 2]"}) == {}
+        assert get_item_properties({}) == {}
+
+    def test_unowned_items_are_left_untouched(self):
+        entry = {"name": "Longsword", "notes": json.dumps({"damage": "1d8"})}
+        assert get_item_properties(entry) == {"damage": "1d8"}
+        assert InventoryManager().get_item_properties(entry) == {"damage": "1d8"}
+        assert set(entry) == {"name", "notes"}
+
+    def test_set_item_properties_writes_notes(self):
+        item = {"notes": ""}
+        set_item_properties(item, {"ac_modifier": 1})
+        assert json.loads(item["notes"]) == {"ac_modifier": 1}
+        set_item_properties(item, {})
+        assert item["notes"] == ""
+
+
+class TestManagerCache:
+    def test_parses_once_per_notes_value(self):
+        manager = _manager_with(json.dumps({"bonus": 1}))
+        item = manager.get_item("0")
+        with patch.object(equipment_management.json, "loads", wraps=json.loads) as loads:
+            for _ in range(5):
+                assert manager.get_item_properties(item) == {"bonus": 1}
+        assert loads.call_count == 0  # parsed while indexing modifiers
+
+    def test_cache_stays_out_of_items(self):
+        manager = _manager_with(json.dumps({"armor_class": 18}))
+        manager.get_modifier_summary()
+        manager.update_item_properties("0", {"armor_class": 19})
+        assert json.loads(json.dumps(manager.items)) == [{
+            "id": "0",
+            "name": "Longsword",
+            "notes": json.dumps({"armor_class": 19}),
+            "category": "Weapons",
+            "qty": 1,
+        }]
+
+    def test_stale_inline_entry_is_dropped_on_load(self):
+        item = {
+            "id": "0",
+            "name": "Shield",
+            "notes": json.dumps({"bonus": 2}),
+            STALE_ITEM_PROPS_KEY: {"version": 1, "source": "", "values": {"bonus": 9}},
+        }
+        manager = InventoryManager()
+        manager.load_state({"inventory": {"items": [item]}})
+        assert STALE_ITEM_PROPS_KEY not in manager.items[0]
+        assert manager.get_item_properties(manager.items[0]) == {"bonus": 2}
+
+    def test_reloaded_ids_are_reparsed(self):
+        manager = _manager_with(json.dumps({"bonus": 1}))
+        manager.get_item_properties(manager.get_item("0"))
+        manager.load_state({"inventory": {"items": [
+            {"id": "0", "name": "Dagger", "notes": json.dumps({"bonus": 3})},
+        ]}})
+        assert manager.get_item_properties(manager.get_item("0")) == {"bonus": 3}
+
+
+class TestHandlers:
+    def test_modifier_change_refreshes_cache(self):
+        manager = _manager_with(json.dumps({"bonus": 1}))
+        manager.render_inventory = MagicMock()
+        event = MagicMock()
+        event.target.value = "2"
+        with patch.object(equipment_management, "update_calculations"):
+            manager._handle_modifier_change(event, "0", "saves_modifier")
+        item = manager.get_item("0")
+        assert manager.get_item_properties(item) == {"bonus": 1, "saves_modifier": 2}
+        assert json.loads(item["notes"]) == {"bonus": 1, "saves_modifier": 2}
+
+    def test_update_item_notes_invalidates(self):
+        manager = _manager_with(json.dumps({"bonus": 1}))
+        manager.get_item_properties(manager.get_item("0"))
+        manager.update_item("0", {"notes": json.dumps({"bonus": 3})})
+        assert manager.get_item_properties(manager.get_item("0")) == {"bonus": 3}
+
+    def test_refresh_item_after_in_place_edit(self):
+        manager = _manager_with(json.dumps({"bonus": 1}))
+        item = manager.get_item("0")
+        manager.get_item_properties(item)
+        item["notes"] = json.dumps({"bonus": 4})
+        manager.refresh_item("0")
+        assert manager.get_item_properties(item) == {"bonus": 4}
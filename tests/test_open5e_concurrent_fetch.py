@@ -0,0 +1,104 @@
+"""
+Tests for concurrent Open5e spell page fetching in spell_data.py.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+import character
+import spell_data
+
+
+PAGE_SIZE = 3
+TOTAL = 13  # five pages, the last one short
+
+
+def _spell(index):
+    return {"slug": f"spell-{index:02d}", "name": f"Spell {index:02d}", "level_int": index % 3,
+            "dnd_class": "Wizard", "desc": "Text."}
+
+
+def _page_payload(url, style="page"):
+    query = parse_qs(urlparse(url).query)
+    if style == "page":
+        number = int(query.get("page", ["1"])[0])
+        start = (number - 1) * PAGE_SIZE
+        next_url = f"/api/open5e/v1/spells/?limit={PAGE_SIZE}&page={number + 1}"
+    elif style == "offset":
+        start = int(query.get("offset", ["0"])[0])
+        next_url = f"/api/open5e/v1/spells/?limit={PAGE_SIZE}&offset={start + PAGE_SIZE}"
+    else:
+        start = int(query.get("cursor", ["0"])[0])
+        next_url = f"/api/open5e/v1/spells/?cursor={start + PAGE_SIZE}"
+    end = min(start + PAGE_SIZE, TOTAL)
+    return {
+        "count": TOTAL,
+        "next": next_url if end < TOTAL else None,
+        "results": [_spell(i) for i in range(start, end)],
+    }
+
+
+class _FakeOpen5e:
+    def __init__(self, style="page"):
+        self.style = style
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.urls = []
+
+    async def __call__(self, url):
+        self.urls.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return _page_payload(url, self.style)
+        finally:
+            self.in_flight -= 1
+
+
+def _run(fake, on_page=None, statuses=None):
+    status = (statuses.append if statuses is not None else (lambda message: None))
+    with patch.object(spell_data, "fetch_open5e_json", fake), \
+            patch.object(spell_data, "OPEN5E_FETCH_CONCURRENCY", 2):
+        return asyncio.run(spell_data.fetch_open5e_spells(on_page=on_page, on_status=status))
+
+
+def test_page_urls_from_next_link():
+    urls = spell_data._open5e_page_urls("/api/open5e/spells/?limit=3&page=2&ordering=name", 13, 3, 15)
+    assert urls == [f"/api/open5e/spells/?limit=3&page={n}&ordering=name" for n in range(2, 6)]
+    assert spell_data._open5e_page_urls("/x/?limit=3&offset=3", 7, 3, 2) == ["/x/?limit=3&offset=3"]
+    assert spell_data._open5e_page_urls("/x/?cursor=abc", 7, 3, 15) is None
+    assert spell_data._open5e_page_urls(None, 3, 3, 15) == []
+
+
+def test_pages_fetched_concurrently_in_order():
+    fake = _FakeOpen5e()
+    pages, statuses = [], []
+    spells = _run(fake, on_page=lambda number, results: pages.append(number), statuses=statuses)
+    assert [s["slug"] for s in spells] == [f"spell-{i:02d}" for i in range(TOTAL)]
+    assert sorted(pages) == [1, 2, 3, 4, 5]
+    assert fake.max_in_flight == 2
+    assert statuses[-1] == "Loading spells from Open5e... 5/5 pages"
+
+
+def test_offset_pagination():
+    spells = _run(_FakeOpen5e(style="offset"))
+    assert len(spells) == TOTAL
+
+
+def test_unknown_pagination_follows_next_links():
+    fake = _FakeOpen5e(style="cursor")
+    spells = _run(fake)
+    assert fake.max_in_flight == 1
+    assert len(fake.urls) == 5
+    assert [s["slug"] for s in spells] == [f"spell-{i:02d}" for i in range(TOTAL)]
+
+
+def test_merge_sanitized_spells_matches_single_pass():
+    raw = [_spell(i) for i in range(TOTAL)] + [_spell(4)]
+    chunks = [character.sanitize_spell_list(raw[i:i + PAGE_SIZE]) for i in range(0, len(raw), PAGE_SIZE)]
+    assert character.merge_sanitized_spells(chunks) == character.sanitize_spell_list(raw)
@@ -0,0 +1,144 @@
+"""
+Tests for the /api/open5e caching proxy and its offline snapshot stand-in.
+"""
+
+import asyncio
+import json
+import sys
+import time
+import urllib.error
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+import backend
+import character
+import spell_data
+from backend import app
+
+
+PAGE = {
+    'count': 2,
+    'next': 'https://api.open5e.com/v1/spells/?limit=1&page=2',
+    'previous': None,
+    'results': [{'slug': 'acid-splash', 'name': 'Acid Splash'}],
+}
+
+SNAPSHOT = [{'slug': slug, 'name': slug.replace('-', ' ').title()}
+            for slug in ('shield', 'bless', 'fireball', 'aid', 'light')]
+
+
+@pytest.fixture
+def proxy(tmp_path):
+    with patch.object(backend, 'OPEN5E_CACHE_DIR', tmp_path / 'cache'), \
+            patch.object(backend, 'OPEN5E_SNAPSHOT_DIR', tmp_path / 'snapshot'), \
+            patch.object(backend, 'OPEN5E_ASSETS', OrderedDict()), \
+            patch.object(backend, 'OPEN5E_OFFLINE', False):
+        (tmp_path / 'snapshot').mkdir()
+        yield tmp_path
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def _upstream(status=200, payload=PAGE):
+    return patch.object(backend, 'fetch_open5e_upstream',
+                        return_value=(status, 'application/json', json.dumps(payload).encode('utf-8')))
+
+
+def _age_cache(path, seconds):
+    _, key = backend.open5e_cache_key(path, {})
+    meta_file = backend.OPEN5E_CACHE_DIR / f'{key}.json'
+    meta = json.loads(meta_file.read_text(encoding='utf-8'))
+    meta['fetched_at'] = time.time() - seconds
+    meta_file.write_text(json.dumps(meta), encoding='utf-8')
+
+
+def test_cache_key_ignores_query_order():
+    assert backend.open5e_cache_key('spells', {'b': '2', 'a': '1'}) == backend.open5e_cache_key('/spells/', {'a': '1', 'b': '2'})
+
+
+def test_miss_then_hit(client, proxy):
+    with _upstream() as upstream:
+        first = client.get('/api/open5e/spells/?limit=1')
+        second = client.get('/api/open5e/spells/?limit=1')
+    assert upstream.call_count == 1
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+    assert second.get_json()['next'] == '/api/open5e/v1/spells/?limit=1&page=2'
+
+
+def test_stale_entry_is_served_while_refreshing(client, proxy):
+    with _upstream():
+        client.get('/api/open5e/spells/')
+    _age_cache('spells', backend.OPEN5E_TTL_SECONDS + 10)
+    with patch.object(backend, 'refresh_open5e_in_background') as refresh:
+        response = client.get('/api/open5e/spells/')
+    assert response.headers['X-Cache'] == 'STALE'
+    assert refresh.call_count == 1
+
+
+def test_expired_entry_survives_upstream_failure(client, proxy):
+    with _upstream():
+        client.get('/api/open5e/spells/')
+    _age_cache('spells', backend.OPEN5E_TTL_SECONDS + backend.OPEN5E_STALE_SECONDS + 10)
+    with patch.object(backend, 'fetch_open5e_upstream', side_effect=urllib.error.URLError('down')):
+        response = client.get('/api/open5e/spells/')
+    assert response.status_code == 200
+    assert response.headers['X-Cache'] == 'STALE'
+    assert response.get_json()['results'] == PAGE['results']
+
+
+def test_offline_snapshot_pages(client, proxy):
+    (proxy / 'snapshot' / 'spells.json').write_text(json.dumps({'results': SNAPSHOT}), encoding='utf-8')
+    with patch.object(backend, 'OPEN5E_OFFLINE', True), \
+            patch.object(backend, 'fetch_open5e_upstream', side_effect=AssertionError('went upstream')):
+        first = client.get('/api/open5e/spells/?limit=2&ordering=name')
+        data = first.get_json()
+        assert first.headers['X-Cache'] == 'SNAPSHOT'
+        assert data['count'] == 5
+        assert [s['slug'] for s in data['results']] == ['aid', 'bless']
+        second = client.get(data['next']).get_json()
+        assert [s['slug'] for s in second['results']] == ['fireball', 'light']
+        assert client.get('/api/open5e/v1/spells/fireball/').get_json()['name'] == 'Fireball'
+        assert client.get('/api/open5e/weapons/').status_code == 504
+
+
+def test_upstream_errors(client, proxy):
+    with _upstream(status=404, payload={'detail': 'Not found.'}):
+        assert client.get('/api/open5e/nothing/').status_code == 404
+    with patch.object(backend, 'fetch_open5e_upstream', side_effect=urllib.error.URLError('down')):
+        assert client.get('/api/open5e/spells/').status_code == 502
+    assert not list((proxy / 'cache').glob('*.json'))
+
+
+def test_invalid_path(client, proxy):
+    assert client.get('/api/open5e/spells/..%2F..%2Fetc/').status_code == 400
+
+
+def test_client_falls_back_to_public_api():
+    assert spell_data.open5e_direct_url('/api/open5e/spells/?page=2') == 'https://api.open5e.com/spells/?page=2'
+    calls = []
+
+    class _Response:
+        def __init__(self, ok):
+            self.ok = ok
+            self.status = 200 if ok else 404
+
+        async def json(self):
+            return {'results': []}
+
+    async def fake_fetch(url, *args, **kwargs):
+        calls.append(url)
+        return _Response(url.startswith('https://'))
+
+    with patch.object(spell_data, 'pyfetch', fake_fetch):
+        assert asyncio.run(spell_data.fetch_open5e_json(character.OPEN5E_WEAPONS_ENDPOINT)) == {'results': []}
+    assert calls == [character.OPEN5E_WEAPONS_ENDPOINT, 'https://api.open5e.com/weapons/?limit=1000']
@@ -0,0 +1,102 @@
+"""
+Tests for the proxy lifecycle registry.
+
+Components register their proxies under an owner name and release the whole
+previous generation when they re-render, so live proxy counts stay bounded.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+import character
+import spellcasting
+from proxy_registry import (
+    PROXY_REGISTRY,
+    live_proxy_counts,
+    proxy_registry_report,
+    release_proxies,
+    release_proxy,
+    track_proxy,
+)
+
+
+class FakeProxy:
+    def __init__(self, func=None):
+        self.func = func
+        self.destroyed = False
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+    def destroy(self):
+        if self.destroyed:
+            raise RuntimeError("Object has already been destroyed")
+        self.destroyed = True
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    PROXY_REGISTRY.clear()
+    yield
+    PROXY_REGISTRY.clear()
+
+
+class TestRegistry:
+    def test_release_destroys_previous_generation(self):
+        first = [track_proxy("widget", FakeProxy()) for _ in range(3)]
+        assert live_proxy_counts() == {"widget": 3}
+        assert release_proxies("widget") == 3
+        assert all(proxy.destroyed for proxy in first)
+        second = track_proxy("widget", FakeProxy())
+        assert live_proxy_counts() == {"widget": 1}
+        assert not second.destroyed
+        report = proxy_registry_report()["widget"]
+        assert report == {"live": 1, "generation": 1, "destroyed": 3}
+
+    def test_owners_are_independent(self):
+        keep = track_proxy("a", FakeProxy())
+        track_proxy("b", FakeProxy())
+        release_proxies("b")
+        assert not keep.destroyed
+        assert live_proxy_counts() == {"a": 1, "b": 0}
+
+    def test_plain_callables_are_tolerated(self):
+        track_proxy("plain", lambda e: None)
+        assert release_proxies("plain") == 1
+
+    def test_release_single_proxy(self):
+        proxy = track_proxy("timer", FakeProxy())
+        other = track_proxy("timer", FakeProxy())
+        assert release_proxy("timer", proxy) is True
+        assert proxy.destroyed and not other.destroyed
+        assert release_proxy("timer", proxy) is False
+        assert live_proxy_counts() == {"timer": 1}
+
+
+class TestComponents:
+    def test_spellbook_rebind_destroys_old_listener(self):
+        manager = spellcasting.SpellcastingManager()
+        first_container = MagicMock()
+        second_container = MagicMock()
+        with patch.object(spellcasting, "create_proxy", FakeProxy):
+            manager._bind_delegated_click("spellbook", first_container, manager._handle_spellbook_click)
+            old_proxy = manager._delegated_listeners["spellbook"][1]
+            manager._bind_delegated_click("spellbook", second_container, manager._handle_spellbook_click)
+        assert old_proxy.destroyed
+        assert live_proxy_counts()["spellcasting.spellbook"] == 1
+
+    def test_weapon_dropdown_rerender_keeps_count_bounded(self):
+        dropdown = MagicMock()
+        weapons = [{"name": f"Sword {i}"} for i in range(5)]
+        with patch.object(character, "get_element", return_value=dropdown), \
+             patch.object(character, "document", MagicMock()), \
+             patch.object(character, "create_proxy", FakeProxy):
+            for _ in range(10):
+                character.populate_weapon_dropdown(weapons)
+        assert live_proxy_counts()["character.weapon-dropdown"] == 5
+        assert proxy_registry_report()["character.weapon-dropdown"]["destroyed"] == 45
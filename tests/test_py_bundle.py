@@ -0,0 +1,101 @@
+"""
+Tests for the /api/py-bundle endpoint and the client-side bundle loader.
+"""
+
+import importlib.util
+import io
+import json
+import sys
+import zipfile
+import zipimport
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "static" / "assets" / "py"))
+import backend
+import character
+from backend import app
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+class TestBundleEndpoint:
+    def test_json_manifest_covers_every_module(self, client):
+        response = client.get('/api/py-bundle')
+        assert response.status_code == 200
+        manifest = response.get_json()
+        expected = {p.stem for p in (ROOT / 'static' / 'assets' / 'py').glob('*.py')}
+        assert set(manifest['modules']) == expected
+        assert manifest['hash'] == response.headers['X-Bundle-Hash']
+        # Client and server hash functions agree
+        assert character._py_bundle_hash(manifest['modules']) == manifest['hash']
+
+    def test_zip_is_importable(self, client, tmp_path):
+        response = client.get('/api/py-bundle?format=zip')
+        archive = zipfile.ZipFile(io.BytesIO(response.data))
+        assert 'proxy_registry.py' in archive.namelist()
+        bundle = tmp_path / 'bundle.zip'
+        bundle.write_bytes(response.data)
+        spec = zipimport.zipimporter(str(bundle)).find_spec('tooltip_values')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        assert hasattr(module, 'WeaponToHitValue')
+        assert response.headers['X-Bundle-Hash'] == client.get('/api/py-bundle').headers['X-Bundle-Hash']
+
+    def test_revalidation_and_caching(self, client):
+        first = client.get('/api/py-bundle', headers={'Accept-Encoding': 'gzip'})
+        assert first.headers['Content-Encoding'] == 'gzip'
+        again = client.get('/api/py-bundle', headers={'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+        assert again.status_code == 304
+        assert backend.build_py_bundle('json') is backend.build_py_bundle('json')
+
+    def test_bad_format(self, client):
+        assert client.get('/api/py-bundle?format=tar').status_code == 400
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self._text = text
+
+    def read(self):
+        return self._text
+
+
+class TestClientLoader:
+    def _install(self, manifest, tmp_path):
+        saved_path = list(sys.path)
+        try:
+            with patch.object(character, 'open_url', return_value=_FakeResponse(json.dumps(manifest))), \
+                    patch.object(character.importlib.util, 'find_spec', return_value=None):
+                installed = character._install_py_bundle(target_root=tmp_path)
+            return installed, [p for p in sys.path if p not in saved_path]
+        finally:
+            sys.path[:] = saved_path
+
+    def test_installs_modules_to_target(self, tmp_path):
+        modules = {'bundled_demo': 'VALUE = 42\n', 'character': 'raise RuntimeError\n'}
+        manifest = {'hash': character._py_bundle_hash(modules), 'modules': modules}
+        installed, added = self._install(manifest, tmp_path)
+        assert installed == ['bundled_demo']
+        target = tmp_path / manifest['hash'][:12]
+        assert added == [str(target)]
+        assert (target / 'bundled_demo.py').read_text() == 'VALUE = 42\n'
+        assert not (target / 'character.py').exists()
+
+    def test_rejects_tampered_bundle(self, tmp_path):
+        manifest = {'hash': '0' * 64, 'modules': {'bundled_demo': 'VALUE = 1\n'}}
+        assert self._install(manifest, tmp_path) == ([], [])
+
+    def test_skipped_when_modules_importable(self):
+        with patch.object(character, 'open_url') as open_url:
+            assert character._install_py_bundle() == []
+        assert not open_url.called
@@ -0,0 +1,104 @@
+"""
+Tests for the compact, checksummed spell cache format in character.py.
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+import character
+from spell_data import LOCAL_SPELLS_FALLBACK
+
+
+class QuotaExceededError(Exception):
+    pass
+
+
+class FakeStorage:
+    """localStorage stand-in with a character quota across all keys."""
+
+    def __init__(self, quota=None, items=None):
+        self.quota = quota
+        self.items = dict(items or {})
+
+    def getItem(self, key):
+        return self.items.get(key)
+
+    def setItem(self, key, value):
+        used = sum(len(v) for k, v in self.items.items() if k != key)
+        if self.quota is not None and used + len(value) > self.quota:
+            raise QuotaExceededError("quota exceeded")
+        self.items[key] = value
+
+    def removeItem(self, key):
+        self.items.pop(key, None)
+
+
+@pytest.fixture
+def spells():
+    return character.sanitize_spell_list(LOCAL_SPELLS_FALLBACK)
+
+
+def _with_storage(storage):
+    return patch.object(character, "window", SimpleNamespace(localStorage=storage))
+
+
+def test_round_trip_is_exact(spells):
+    assert character.decode_spell_cache(character.encode_spell_cache(spells)) == spells
+
+
+def test_rows_are_columnar(spells):
+    header_text, rows_text = character.encode_spell_cache(spells).split("\n", 1)
+    header = json.loads(header_text)
+    assert header["version"] == character.SPELL_CACHE_VERSION
+    assert header["count"] == len(spells)
+    assert json.loads(rows_text)[0][header["fields"].index("slug")] == spells[0]["slug"]
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda text: text[:-20] + "X" + text[-19:],
+    lambda text: text.replace(f'"version":{character.SPELL_CACHE_VERSION}', '"version":1', 1),
+    lambda text: json.dumps({"version": character.SPELL_CACHE_VERSION, "spells": []}),
+    lambda text: "",
+])
+def test_stale_or_corrupt_cache_is_rejected(spells, corrupt):
+    assert character.decode_spell_cache(corrupt(character.encode_spell_cache(spells))) is None
+
+
+def test_load_uses_current_key(spells):
+    storage = FakeStorage(items={character.SPELL_LIBRARY_STORAGE_KEY: character.encode_spell_cache(spells)})
+    with _with_storage(storage):
+        assert character.load_spell_cache() == spells
+
+
+def test_quota_frees_legacy_keys(spells):
+    full = character.encode_spell_cache(spells)
+    storage = FakeStorage(quota=len(full) + 20, items={"pysheet.spells.v4": "x" * len(full), "pysheet_spell_cache": "live"})
+    with _with_storage(storage):
+        assert character.save_spell_cache(spells) is True
+    assert "pysheet.spells.v4" not in storage.items
+    # spellcasting.py still reads and writes this key
+    assert storage.items["pysheet_spell_cache"] == "live"
+    assert character.decode_spell_cache(storage.items[character.SPELL_LIBRARY_STORAGE_KEY]) == spells
+
+
+def test_quota_drops_search_text_and_rebuilds_it(spells):
+    slim = character.encode_spell_cache(spells, ("search_blob",))
+    storage = FakeStorage(quota=len(slim) + 10)
+    with _with_storage(storage):
+        assert character.save_spell_cache(spells) is True
+        loaded = character.load_spell_cache()
+    assert [s["slug"] for s in loaded] == [s["slug"] for s in spells]
+    assert "flame-like radiance" in loaded[0]["search_blob"]
+
+
+def test_quota_failure_leaves_no_stale_entry(spells):
+    storage = FakeStorage(quota=10, items={character.SPELL_LIBRARY_STORAGE_KEY: "old"})
+    with _with_storage(storage):
+        assert character.save_spell_cache(spells) is False
+    assert character.SPELL_LIBRARY_STORAGE_KEY not in storage.items
@@ -0,0 +1,85 @@
+"""
+Tests for the spell filter index built by set_spell_library_data().
+
+The index must return exactly what the original linear scan in
+apply_spell_filters() returned, in the same order.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+from spell_data import LOCAL_SPELLS_FALLBACK, is_spell_source_allowed
+from spellcasting import (
+    SPELL_LIBRARY_STATE,
+    build_spell_filter_index,
+    query_spell_index,
+    sanitize_spell_list,
+    set_spell_library_data,
+)
+
+
+def _linear_filter(spells, classes=None, max_level=None, level=None, search_term=""):
+    """Reference implementation mirroring the old apply_spell_filters loop."""
+    result = []
+    for spell in spells:
+        if not is_spell_source_allowed(spell.get("source", "")):
+            continue
+        spell_level = spell.get("level_int", 0)
+        if max_level is not None and spell_level > max_level:
+            continue
+        if classes and not set(spell.get("classes", [])).intersection(classes):
+            continue
+        if level is not None and spell_level != level:
+            continue
+        if search_term and search_term not in spell.get("search_blob", ""):
+            continue
+        result.append(spell)
+    return result
+
+
+@pytest.fixture(scope="module")
+def spells():
+    return sanitize_spell_list(LOCAL_SPELLS_FALLBACK)
+
+
+@pytest.fixture(scope="module")
+def index(spells):
+    return build_spell_filter_index(spells)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"classes": {"cleric"}},
+        {"classes": {"bard", "wizard"}},
+        {"classes": {"cleric"}, "max_level": 1},
+        {"max_level": 0},
+        {"max_level": -1},
+        {"level": 2},
+        {"search_term": "heal"},
+        {"search_term": "ire bol"},
+        {"search_term": "concentration", "classes": {"cleric"}},
+        {"search_term": "a"},
+        {"search_term": "zzzz-not-a-spell"},
+    ],
+)
+def test_index_matches_linear_scan(spells, index, kwargs):
+    expected = _linear_filter(spells, **kwargs)
+    assert query_spell_index(index, **kwargs) == expected
+
+
+def test_set_spell_library_data_builds_index(spells):
+    set_spell_library_data(spells)
+    filter_index = SPELL_LIBRARY_STATE["filter_index"]
+    assert filter_index["spells"] is SPELL_LIBRARY_STATE["spells"]
+    assert "cleric" in filter_index["by_class"]
+
+
+def test_search_fragments_are_cached(index):
+    query_spell_index(index, search_term="cure")
+    assert "cure" in index["fragment_cache"]
@@ -0,0 +1,120 @@
+"""
+Tests for the pre-sanitized spell library served at /api/spells.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+import backend
+import character
+from backend import app
+from spell_data import LOCAL_SPELLS_FALLBACK
+
+
+RAW_SPELL = {
+    "slug": "test-arcane-spark",
+    "name": "Test Arcane Spark",
+    "level_int": 1,
+    "school": "evocation",
+    "dnd_class": "Wizard, Sorcerer",
+    "desc": "A spark.\nIt burns.",
+    "higher_level": "More sparks.",
+    "document__title": "Player's Handbook",
+}
+
+
+@pytest.fixture
+def spell_files(tmp_path):
+    data_file = tmp_path / 'spells.json'
+    with patch.object(backend, 'SPELL_DATA_FILE', data_file), \
+            patch.object(backend, 'SPELL_LIBRARY_FILE', tmp_path / 'cache' / 'spell_library.json'), \
+            patch.object(backend, 'SPELL_LIBRARY', {'key': None, 'asset': None}):
+        yield data_file
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_fallback_library_is_sanitized(client, spell_files):
+    response = client.get('/api/spells')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['source'] == 'fallback'
+    assert data['count'] == len(data['spells']) == len(character.sanitize_spell_list(LOCAL_SPELLS_FALLBACK))
+    assert data['spells'] == character.sanitize_spell_list(LOCAL_SPELLS_FALLBACK)
+    assert response.headers['X-Spell-Library-Hash'] == data['hash']
+    assert response.headers['ETag'].strip('"') == data['hash']
+
+
+def test_data_file_is_merged_with_fallback(client, spell_files):
+    spell_files.write_text(json.dumps({'results': [RAW_SPELL]}), encoding='utf-8')
+    data = client.get('/api/spells').get_json()
+    assert data['source'] == 'data'
+    spark = next(s for s in data['spells'] if s['slug'] == 'test-arcane-spark')
+    assert spark['classes'] == ['wizard', 'sorcerer']
+    assert spark['description_html'].startswith('<p>A spark.</p><p>It burns.</p>')
+    assert 'more sparks.' in spark['search_blob']
+    assert data['count'] == len(character.sanitize_spell_list(LOCAL_SPELLS_FALLBACK)) + 1
+
+
+def test_pipeline_loads_without_browser_modules(spell_files):
+    path_before = list(sys.path)
+    with patch.dict(sys.modules), patch.object(backend, 'SPELL_PIPELINE', {'mtime_ns': None, 'module': None}):
+        sys.modules.pop('character', None)
+        pipeline = backend._spell_pipeline()
+        assert 'character' not in sys.modules
+    assert sys.path == path_before
+    assert pipeline.sanitize_spell_list(LOCAL_SPELLS_FALLBACK) == character.sanitize_spell_list(LOCAL_SPELLS_FALLBACK)
+
+
+def test_unchanged_library_revalidates(client, spell_files):
+    etag = client.get('/api/spells').headers['ETag']
+    response = client.get('/api/spells', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+
+def test_persisted_library_is_not_rebuilt(client, spell_files):
+    first = client.get('/api/spells').get_json()
+    assert backend.SPELL_LIBRARY_FILE.exists()
+    with patch.object(backend, 'SPELL_LIBRARY', {'key': None, 'asset': None}), \
+            patch.object(backend, 'build_spell_library', side_effect=AssertionError('rebuilt')):
+        assert client.get('/api/spells').get_json()['hash'] == first['hash']
+
+
+def test_changed_data_file_rebuilds(client, spell_files):
+    before = client.get('/api/spells').get_json()['hash']
+    spell_files.write_text(json.dumps([RAW_SPELL]), encoding='utf-8')
+    os.utime(spell_files, (2_000_000, 2_000_000))
+    assert client.get('/api/spells').get_json()['hash'] != before
+
+
+def test_client_uses_server_records():
+    payload = {'source': 'data', 'spells': [{'slug': 'x', 'name': 'X'}]}
+
+    class _Response:
+        ok = True
+        status = 200
+
+        async def json(self):
+            return payload
+
+    async def fake_fetch(url, *args, **kwargs):
+        assert url == character.SPELL_LIBRARY_ENDPOINT
+        return _Response()
+
+    with patch.object(character, 'pyfetch', fake_fetch):
+        assert asyncio.run(character.fetch_server_spell_library()) == payload
+        payload['spells'] = [{'name': 'No slug'}]
+        assert asyncio.run(character.fetch_server_spell_library()) is None
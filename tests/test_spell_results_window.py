@@ -0,0 +1,192 @@
+"""
+Tests for the windowed spell results renderer in character.py.
+
+Only the cards near the visible part of the results list are materialized,
+and the whole filtered set stays browsable instead of being truncated.
+"""
+
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+
+import pytest
+
+import character
+from character import (
+    SPELL_CARD_ESTIMATED_HEIGHT,
+    SPELL_RENDER_MIN_WINDOW,
+    SPELL_RENDER_OVERSCAN,
+    SPELL_RESULTS_WINDOW,
+    _compute_spell_window,
+    _spell_window_offsets,
+)
+
+
+class FakeCard:
+    def __init__(self, slug="", height=100):
+        self.slug = slug
+        self.offsetHeight = height
+        self.open = False
+
+
+class FakeSpacer:
+    def __init__(self, container):
+        self.container = container
+        self.style = SimpleNamespace(height="")
+
+    @property
+    def nextElementSibling(self):
+        children = self.container.children
+        return children[children.index(self) + 1]
+
+    @property
+    def previousElementSibling(self):
+        children = self.container.children
+        return children[children.index(self) - 1]
+
+    def insertAdjacentHTML(self, where, html):
+        cards = self.container.parse(html)
+        index = self.container.children.index(self)
+        index += 1 if where == "afterend" else 0
+        self.container.children[index:index] = cards
+
+
+class FakeContainer:
+    """Just enough of a DOM element for the window renderer."""
+
+    def __init__(self, client_height=500):
+        self.clientHeight = client_height
+        self.scrollTop = 0
+        self.children = []
+        self.listeners = []
+        self.parsed = 0
+
+    def parse(self, html):
+        slugs = re.findall(r'<details data-spell-slug="([^"]+)"', html)
+        self.parsed += len(slugs)
+        return [FakeCard(slug) for slug in slugs]
+
+    @property
+    def innerHTML(self):
+        return "".join(
+            f'<details data-spell-slug="{child.slug}"></details>' if isinstance(child, FakeCard) else ""
+            for child in self.children
+        )
+
+    @innerHTML.setter
+    def innerHTML(self, value):
+        if "<details" in value or "spell-window-spacer" in value:
+            self.children = [FakeSpacer(self)] + self.parse(value) + [FakeSpacer(self)]
+        else:
+            self.children = []
+            self.message = value
+
+    def removeChild(self, child):
+        self.children.remove(child)
+
+    def addEventListener(self, name, handler, *args):
+        self.listeners.append(name)
+
+    def removeEventListener(self, name, handler, *args):
+        self.listeners.remove(name)
+
+
+def _spells(count):
+    return [{"slug": f"spell-{i}", "name": f"Spell {i}"} for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def reset_window_state():
+    SPELL_RESULTS_WINDOW["bound_container"] = None
+    SPELL_RESULTS_WINDOW["open_slugs"] = set()
+    yield
+    SPELL_RESULTS_WINDOW["bound_container"] = None
+    SPELL_RESULTS_WINDOW["spells"] = []
+
+
+def _render(container, spells):
+    with patch.object(character, "get_element", return_value=container), \
+         patch.object(character, "build_spell_card_html",
+               side_effect=lambda spell, _allowed=None: f'<details data-spell-slug="{spell["slug"]}"></details>'):
+        return character.render_spell_results(spells, {"cleric"})
+
+
+class TestWindowMath:
+    def test_offsets_use_estimate_until_measured(self):
+        offsets = _spell_window_offsets(3, {1: 200})
+        est = SPELL_CARD_ESTIMATED_HEIGHT
+        assert offsets == [0, est, est + 200, est + 200 + est]
+
+    def test_window_covers_viewport_plus_overscan(self):
+        offsets = [i * 100 for i in range(1001)]
+        start, end = _compute_spell_window(5000, 500, offsets)
+        assert start == 50 - SPELL_RENDER_OVERSCAN
+        assert start <= 50 and end >= 55
+        assert end - start < 40
+
+    def test_hidden_container_renders_minimum_window(self):
+        offsets = [i * 100 for i in range(1001)]
+        assert _compute_spell_window(0, 0, offsets) == (0, SPELL_RENDER_MIN_WINDOW)
+
+    def test_empty_list(self):
+        assert _compute_spell_window(0, 500, [0]) == (0, 0)
+
+
+class TestRenderSpellResults:
+    def test_large_result_set_is_not_truncated(self):
+        container = FakeContainer()
+        displayed, truncated, total = _render(container, _spells(1000))
+        assert (displayed, truncated, total) == (1000, False, 1000)
+        assert container.innerHTML.count("<details") < 60
+
+    def test_scrolling_moves_the_window(self):
+        container = FakeContainer()
+        _render(container, _spells(1000))
+        assert 'data-spell-slug="spell-0"' in container.innerHTML
+        container.scrollTop = 40000
+        with patch.object(character, "build_spell_card_html",
+                   side_effect=lambda spell, _allowed=None: f'<details data-spell-slug="{spell["slug"]}"></details>'):
+            character._schedule_spell_window_render()
+        assert 'data-spell-slug="spell-0"' not in container.innerHTML
+        start, end = SPELL_RESULTS_WINDOW["range"]
+        assert start > 0 and end - start < 60
+
+    def test_small_scroll_keeps_existing_cards(self):
+        container = FakeContainer()
+        _render(container, _spells(1000))
+        kept = {card.slug: card for card in container.children[1:-1]}
+        parsed = container.parsed
+        container.scrollTop = 15 * 100
+        with patch.object(character, "build_spell_card_html",
+                   side_effect=lambda spell, _allowed=None: f'<details data-spell-slug="{spell["slug"]}"></details>'):
+            character._schedule_spell_window_render()
+        start, end = SPELL_RESULTS_WINDOW["range"]
+        assert 0 < start < len(kept)
+        cards = container.children[1:-1]
+        assert [card.slug for card in cards] == [f"spell-{i}" for i in range(start, end)]
+        assert all(card is kept[card.slug] for card in cards if card.slug in kept)
+        assert container.parsed - parsed == len([card for card in cards if card.slug not in kept])
+        gap = character.SPELL_CARD_GAP_PX
+        assert container.children[0].style.height == f"{start * (100 + gap) - gap}px"
+
+    def test_listeners_bound_once_per_container(self):
+        container = FakeContainer()
+        _render(container, _spells(50))
+        _render(container, _spells(40))
+        assert sorted(container.listeners) == ["click", "scroll", "toggle"]
+
+    def test_open_cards_are_restored(self):
+        container = FakeContainer()
+        SPELL_RESULTS_WINDOW["open_slugs"] = {"spell-1"}
+        _render(container, _spells(10))
+        assert container.children[2].open is True
+        assert container.children[1].open is False
+
+    def test_empty_results_message(self):
+        container = FakeContainer()
+        assert _render(container, []) == (0, False, 0)
+        assert "No spells match" in container.message
@@ -11,7 +11,11 @@ from unittest.mock import patch, MagicMock
 
 # Import Flask app
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from backend import app, EXPORT_DIR
+import backend
+from backend import app
+
+# Exports go to a temp directory instead of the repository's exports/
+pytestmark = pytest.mark.usefixtures("isolated_exports")
 
 
 @pytest.fixture
@@ -41,8 +45,8 @@ class TestFlaskStartup:
     
     def test_export_dir_exists(self):
         """Test that export directory exists"""
-        assert EXPORT_DIR.exists()
-        assert EXPORT_DIR.is_dir()
+        assert backend.EXPORT_DIR.exists()
+        assert backend.EXPORT_DIR.is_dir()
 
 
 class TestFlaskHealthChecks:
@@ -144,7 +148,7 @@ class TestFlaskConfiguration:
         """Test that export directory is writable"""
         import os
         
-        test_file = EXPORT_DIR / 'test_write.txt'
+        test_file = backend.EXPORT_DIR / 'test_write.txt'
         try:
             with open(test_file, 'w') as f:
                 f.write('test')
@@ -199,7 +203,7 @@ class TestFlaskIntegration:
         assert data['count'] > 0
         
         # Cleanup
-        test_file = EXPORT_DIR / 'test_integration.json'
+        test_file = backend.EXPORT_DIR / 'test_integration.json'
         if test_file.exists():
             os.remove(test_file)
     
@@ -236,7 +240,7 @@ class TestFlaskIntegration:
         finally:
             # Cleanup
             for filename in files_created:
-                test_file = EXPORT_DIR / filename
+                test_file = backend.EXPORT_DIR / filename
                 if test_file.exists():
                     os.remove(test_file)
 
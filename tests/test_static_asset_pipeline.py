@@ -0,0 +1,99 @@
+"""
+Tests for the static asset pipeline: fingerprinted URLs, immutable caching,
+in-memory gzip variants and 304 revalidation.
+"""
+
+import gzip
+import re
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import backend
+from backend import app
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / 'assets' / 'css').mkdir(parents=True)
+    (tmp_path / 'assets' / 'py').mkdir(parents=True)
+    (tmp_path / 'index.html').write_text(
+        '<html><link rel="stylesheet" href="assets/css/site.css">'
+        '<py-script src="assets/py/app.py"></py-script>'
+        '<a href="https://example.com/x.css">x</a></html>',
+        encoding='utf-8',
+    )
+    (tmp_path / 'assets' / 'css' / 'site.css').write_text('body { color: red; }\n' * 200, encoding='utf-8')
+    (tmp_path / 'assets' / 'py' / 'app.py').write_text('print("hi")\n', encoding='utf-8')
+    with patch.object(backend, 'STATIC_DIR', tmp_path), patch.object(backend, 'STATIC_ASSETS', {}), \
+            patch.object(backend, 'STATIC_INDEX', {'key': None, 'asset': None}):
+        yield tmp_path
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def _asset_urls(client):
+    html = client.get('/').get_data(as_text=True)
+    return dict(re.findall(r'(?:src|href)="(assets/[^"]+?)\.([0-9a-f]{12})\.\w+"', html)), html
+
+
+def test_index_uses_fingerprinted_urls(client, static_dir):
+    hashes, html = _asset_urls(client)
+    assert set(hashes) == {'assets/css/site', 'assets/py/app'}
+    assert 'https://example.com/x.css' in html
+    response = client.get('/')
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+def test_fingerprinted_asset_is_immutable(client, static_dir):
+    hashes, _ = _asset_urls(client)
+    response = client.get(f"/assets/css/site.{hashes['assets/css/site']}.css")
+    assert response.status_code == 200
+    assert 'immutable' in response.headers['Cache-Control']
+    assert response.data == (static_dir / 'assets' / 'css' / 'site.css').read_bytes()
+
+
+def test_stale_fingerprint_is_not_immutable(client, static_dir):
+    response = client.get('/assets/css/site.000000000000.css')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+def test_changed_asset_changes_fingerprint(client, static_dir):
+    before, _ = _asset_urls(client)
+    (static_dir / 'assets' / 'css' / 'site.css').write_text('body { color: blue; }\n', encoding='utf-8')
+    after, _ = _asset_urls(client)
+    assert before['assets/css/site'] != after['assets/css/site']
+    assert before['assets/py/app'] == after['assets/py/app']
+
+
+def test_gzip_variant_and_304(client, static_dir):
+    plain = client.get('/assets/css/site.css')
+    packed = client.get('/assets/css/site.css', headers={'Accept-Encoding': 'gzip'})
+    assert packed.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(packed.data) == plain.data
+    assert packed.headers['ETag'] != plain.headers['ETag']
+    assert 'Accept-Encoding' in packed.headers['Vary']
+    revalidated = client.get('/assets/css/site.css', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': packed.headers['ETag'],
+    })
+    assert revalidated.status_code == 304
+
+
+def test_small_assets_are_not_compressed(client, static_dir):
+    response = client.get('/assets/py/app.py', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.mimetype == 'text/x-python'
+
+
+def test_missing_and_traversal(client, static_dir):
+    assert client.get('/assets/nope.css').status_code == 404
+    assert backend.load_static_asset('../backend.py') is None
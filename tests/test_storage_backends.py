@@ -0,0 +1,183 @@
+"""
+Tests for the async storage backends and the caches that use them.
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "static" / "assets" / "py"))
+import browser_logger
+import character
+import storage
+from spell_data import LOCAL_SPELLS_FALLBACK
+
+
+class FakeLocalStorage:
+    def __init__(self, items=None):
+        self.items = dict(items or {})
+
+    @property
+    def length(self):
+        return len(self.items)
+
+    def key(self, index):
+        return list(self.items)[index]
+
+    def getItem(self, key):
+        return self.items.get(key)
+
+    def setItem(self, key, value):
+        self.items[key] = value
+
+    def removeItem(self, key):
+        self.items.pop(key, None)
+
+
+class CountingStorage(storage.MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    async def set(self, store, key, value):
+        self.writes.append((store, key, value))
+        await super().set(store, key, value)
+
+
+@pytest.fixture
+def memory():
+    backend = CountingStorage()
+    previous = storage.set_storage(backend)
+    try:
+        yield backend
+    finally:
+        storage.set_storage(previous)
+
+
+@pytest.fixture
+def spells():
+    return character.sanitize_spell_list(LOCAL_SPELLS_FALLBACK)
+
+
+def test_local_storage_backend_namespaces_stores():
+    local = FakeLocalStorage({"unrelated": "1"})
+    backend = storage.LocalStorageStorage(local)
+
+    async def scenario():
+        await backend.set("kv", "pysheet.spells.v5", "index")
+        await backend.set_many("spell_descriptions", {"aid": "<p>Aid</p>", "bless": "<p>Bless</p>"})
+        assert await backend.get_many("spell_descriptions", ["bless", "nope"]) == ["<p>Bless</p>", None]
+        await backend.clear("spell_descriptions")
+        await backend.clear("kv")
+
+    asyncio.run(scenario())
+    assert local.items == {"unrelated": "1", "pysheet.spells.v5": "index"}
+
+
+def test_indexeddb_only_chosen_once_it_opens():
+    class Helper:
+        available = True
+
+        def __init__(self, opens):
+            self.opens = opens
+
+        async def usesIndexedDB(self):
+            return self.opens
+
+    for opens, kind in ((True, "indexeddb"), (False, "localstorage")):
+        fake_window = SimpleNamespace(pysheetStorage=Helper(opens), localStorage=FakeLocalStorage())
+        previous = storage.set_storage(None)
+        try:
+            with patch.object(storage, "window", fake_window):
+                assert asyncio.run(storage.get_storage()).kind == kind
+        finally:
+            storage.set_storage(previous)
+
+
+def test_write_behind_coalesces_writes(memory):
+    async def scenario():
+        for value in ("a", "b", "c"):
+            storage.write_behind("logs", "key", lambda value=value: value)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    assert memory.writes == [("logs", "key", "c")]
+
+
+def test_write_behind_without_event_loop_is_dropped(memory):
+    assert storage.write_behind("logs", "key", lambda: "x") is None
+    assert storage._PENDING_WRITES == {}
+
+
+def test_spell_descriptions_stored_per_record(memory, spells):
+    with patch.object(character, "window", None):
+        assert asyncio.run(character.save_stored_spell_cache(spells)) is True
+        loaded = asyncio.run(character.load_stored_spell_cache())
+
+    assert len(memory.stores["spell_descriptions"]) == len(spells)
+    assert [s["slug"] for s in loaded] == [s["slug"] for s in spells]
+    assert all("description_html" not in spell for spell in loaded)
+    assert "Loading description" in character.build_spell_card_html(loaded[0])
+
+    with patch.dict(character.SPELL_LIBRARY_STATE, {"spell_map": {s["slug"]: s for s in loaded}}):
+        assert asyncio.run(character.ensure_spell_description(loaded[0]["slug"])) is True
+        assert loaded[0]["description_html"] == spells[0]["description_html"]
+        assert asyncio.run(character.hydrate_spell_descriptions(loaded)) == len(spells) - 1
+    assert loaded == spells
+
+
+def test_local_storage_spell_cache_moves_to_storage(memory, spells):
+    memory.kind = "indexeddb"
+    local = FakeLocalStorage({
+        character.SPELL_LIBRARY_STORAGE_KEY: character.encode_spell_cache(spells),
+        "pysheet.spells.v4": "old",
+    })
+    with patch.object(character, "window", SimpleNamespace(localStorage=local)):
+        assert asyncio.run(character.load_stored_spell_cache()) == spells
+    assert local.items == {}
+    assert memory.stores["kv"][character.SPELL_LIBRARY_STORAGE_KEY]
+
+
+def _run_logs(scenario, local):
+    with patch.object(browser_logger, "window", SimpleNamespace(localStorage=local)), \
+            patch.dict(browser_logger._LOG_CACHE, clear=True), \
+            patch.dict(browser_logger._LOG_RESTORES, clear=True):
+        asyncio.run(scenario())
+
+
+def test_logs_restored_and_pruned_at_startup(memory):
+    key = browser_logger.BrowserLogger.STORAGE_KEY
+    earlier = {"logs": [{"timestamp": "2000-01-01T00:00:00", "message": "expired"},
+                        {"timestamp": datetime.now().isoformat(), "message": "earlier"}],
+               "errors": []}
+    memory.stores["logs"][key] = json.dumps(earlier)
+
+    async def scenario():
+        await browser_logger.BrowserLogger.restore()
+        assert browser_logger.BrowserLogger.get_stats()["total_logs"] == 1
+        browser_logger.BrowserLogger.log("now")
+        await asyncio.sleep(0.01)
+
+    _run_logs(scenario, FakeLocalStorage())
+    stored = json.loads(memory.stores["logs"][key])
+    assert [entry["message"] for entry in stored["logs"]] == ["earlier", "now"]
+
+
+def test_legacy_logs_move_out_of_local_storage(memory):
+    key = "test.logs"
+    legacy = {"logs": [{"timestamp": "2026-01-01T00:00:00", "message": "legacy"}], "errors": []}
+    local = FakeLocalStorage({key: json.dumps(legacy)})
+
+    async def scenario():
+        browser_logger.load_log_data(key)
+        await browser_logger.restore_log_data(key)
+
+    _run_logs(scenario, local)
+    assert key not in local.items
+    assert json.loads(memory.stores["logs"][key]) == legacy
@@ -3,24 +3,96 @@
 Consolidates common boilerplate for argument parsing and JSON loading.
 """
 
+from datetime import datetime
 from pathlib import Path
 import argparse
+import gzip
 import json
+import re
 from typing import Optional, Dict, Any, Callable
 
+try:
+    import zstandard  # Optional: only needed for .json.zst exports
+except ImportError:
+    zstandard = None
+
+EXPORT_GLOBS = ("*.json", "*.json.gz", "*.json.zst")
+EXPORT_TIMESTAMP_RE = re.compile(r"_(\d{8})_(\d{4})\.json(?:\.gz|\.zst)?$")
+# Per-filename write times kept by the backend's deduplicating export store:
+# a compacted snapshot plus a journal of later writes
+EXPORT_REFS_PATH = Path(".blobs") / "refs.json"
+EXPORT_REFS_JOURNAL_PATH = Path(".blobs") / "refs.log"
+
+
+def read_export_text(export_path: Path) -> str:
+    """Read an export file as text, decompressing .gz/.zst exports.
+    
+    The compression is detected from the file contents, so renamed files
+    still load.
+    """
+    data = Path(export_path).read_bytes()
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    elif data[:4] == b"\x28\xb5\x2f\xfd":
+        if zstandard is None:
+            raise ValueError("zstd export requires the zstandard package")
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data.decode("utf-8")
+
+
+def _load_export_refs(exports_dir: Path) -> Dict[str, Any]:
+    try:
+        refs = json.loads((exports_dir / EXPORT_REFS_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        refs = {}
+    refs = refs if isinstance(refs, dict) else {}
+    try:
+        journal = (exports_dir / EXPORT_REFS_JOURNAL_PATH).read_text(encoding="utf-8")
+    except OSError:
+        return refs
+    for line in journal.splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and entry.get("name"):
+            refs[entry["name"]] = entry
+    return refs
+
+
+def export_sort_time(export_path: Path, refs: Dict[str, Any]) -> float:
+    """When an export was written.
+    
+    Deduplicated exports are hard links to one blob and share its original
+    mtime, so the store's recorded time or the filename timestamp wins.
+    """
+    ref = refs.get(export_path.name)
+    if isinstance(ref, dict) and ref.get("modified"):
+        return float(ref["modified"])
+    match = EXPORT_TIMESTAMP_RE.search(export_path.name)
+    if match:
+        try:
+            return datetime.strptime(f"{match.group(1)} {match.group(2)}", "%Y%m%d %H%M").timestamp()
+        except ValueError:
+            pass
+    return export_path.stat().st_mtime
+
 
 def find_default_export(exports_dir: Path) -> Optional[Path]:
     """Find the most recent export JSON file in a directory.
     
+    Plain and compressed (.json.gz, .json.zst) exports are both considered.
+    
     Args:
         exports_dir: Directory to search for export files
         
     Returns:
         Path to most recent export JSON file, or None if no files found
     """
+    refs = _load_export_refs(exports_dir)
     files = sorted(
-        (p for p in exports_dir.glob("*.json") if p.is_file()),
-        key=lambda p: p.stat().st_mtime,
+        (p for pattern in EXPORT_GLOBS for p in exports_dir.glob(pattern) if p.is_file()),
+        key=lambda p: export_sort_time(p, refs),
         reverse=True,
     )
     return files[0] if files else None
@@ -106,7 +178,7 @@ def load_export_json(export_path: Path) -> Optional[Dict[str, Any]]:
         Parsed JSON data, or None if load fails
     """
     try:
-        return json.loads(export_path.read_text(encoding="utf-8"))
+        return json.loads(read_export_text(export_path))
     except Exception as exc:
         print(f"Failed to load export JSON: {export_path} ({exc})")
         return None